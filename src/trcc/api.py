@@ -8,6 +8,9 @@ Endpoints:
     POST /devices/{id}/send   — Send image to device LCD
     GET  /devices/{id}        — Get device details
     GET  /themes              — List available themes
+    GET  /metrics             — Current system metrics
+    GET  /metrics/history     — History tiers and recorded metric keys
+    GET  /metrics/history/{key} — One metric's history (?resolution=&since=)
 
 Security:
     - Localhost-only by default (bind 127.0.0.1)
@@ -26,7 +29,7 @@ from PIL import Image
 from pydantic import BaseModel
 
 from trcc.__version__ import __version__
-from trcc.services import DeviceService, ImageService, ThemeService
+from trcc.services import DeviceService, ImageService, SystemService, ThemeService
 
 log = logging.getLogger(__name__)
 
@@ -37,6 +40,7 @@ app = FastAPI(title="TRCC Linux", version=__version__)
 # ── Shared service instances ──────────────────────────────────────────
 
 _device_svc = DeviceService()
+_system_svc = SystemService()
 
 # ── Token auth middleware (optional, enabled via --token) ─────────────
 
@@ -78,6 +82,23 @@ class ThemeResponse(BaseModel):
     has_config: bool
 
 
+class HistoryTierResponse(BaseModel):
+    interval: float
+    points: int
+
+
+class MetricHistoryIndex(BaseModel):
+    tiers: list[HistoryTierResponse]
+    keys: list[str]
+
+
+class MetricSeriesResponse(BaseModel):
+    key: str
+    interval: float
+    times: list[float]
+    values: list[float]
+
+
 # ── Helpers ───────────────────────────────────────────────────────────
 
 def _device_to_response(idx: int, dev) -> DeviceResponse:
@@ -100,6 +121,17 @@ def _get_device_by_id(device_id: int):
     return devices[device_id]
 
 
+def _system() -> SystemService:
+    """System service with background sampling on (started on first use).
+
+    History accumulates from then on, so a dashboard can fetch it in
+    batches (``since=`` its last timestamp) instead of polling each second.
+    """
+    if _system_svc.snapshot is None:
+        _system_svc.start_sampling()
+    return _system_svc
+
+
 # ── Endpoints ────────────────────────────────────────────────────────
 
 @app.get("/health")
@@ -205,3 +237,40 @@ def list_themes(resolution: str = "320x320") -> list[ThemeResponse]:
         )
         for t in themes
     ]
+
+
+@app.get("/metrics")
+def get_metrics() -> dict[str, float]:
+    """Current system metrics (legacy keys, as used by overlays)."""
+    return _system().all_metrics
+
+
+@app.get("/metrics/history")
+def list_metric_history() -> MetricHistoryIndex:
+    """History retention tiers and the metric keys recorded so far."""
+    history = _system().history
+    return MetricHistoryIndex(
+        tiers=[HistoryTierResponse(interval=i, points=n) for i, n in history.tiers],
+        keys=history.keys(),
+    )
+
+
+@app.get("/metrics/history/{key}")
+def get_metric_history(key: str, resolution: float | None = None,
+                       since: float | None = None) -> MetricSeriesResponse:
+    """Recorded history of one metric, oldest first.
+
+    ``resolution`` (seconds per point) picks the finest tier at least that
+    coarse; ``since`` (Unix time) returns only newer points.
+    """
+    history = _system().history
+    if key not in history.keys():
+        raise HTTPException(status_code=404, detail=f"No history for metric {key}")
+    tier = history.tier_for(resolution)
+    times, values = history.series(key, resolution, since)
+    return MetricSeriesResponse(
+        key=key,
+        interval=history.tiers[tier][0],
+        times=times.tolist(),
+        values=values.astype(float).round(3).tolist(),
+    )
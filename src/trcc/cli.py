@@ -10,7 +10,7 @@ Organized into six command classes:
   ThemeCommands   — theme listing, loading, save, export, import
   LEDCommands     — LED color, mode, brightness, off, sensor source
   DiagCommands    — HID/LED diagnostics
-  SystemCommands  — setup, install, admin, info, download
+  SystemCommands  — setup, install, admin, info, download, media caches
 """
 
 import os
@@ -432,6 +432,32 @@ def _cmd_download(
         pack=pack, show_list=show_list, force=force, show_info=show_info)
 
 
+@app.command("transcode-cache")
+def _cmd_transcode_cache(
+    videos: Annotated[Optional[list[str]], typer.Argument(
+        help="Videos to pre-warm (default: downloaded cloud themes)",
+    )] = None,
+    warm: Annotated[bool, typer.Option("--warm", "-w", help="Transcode videos not yet cached")] = False,
+    prune: Annotated[bool, typer.Option("--prune", "-p", help="Evict entries over the quota")] = False,
+    clear: Annotated[bool, typer.Option("--clear", help="Remove every entry")] = False,
+    quota: Annotated[Optional[float], typer.Option("--quota", "-q", help="Quota in MB for --prune")] = None,
+) -> int:
+    """Show, pre-warm or prune the video transcode cache."""
+    return SystemCommands.transcode_cache(
+        videos=videos, warm=warm or bool(videos), prune=prune, clear=clear,
+        quota_mb=quota)
+
+
+@app.command("device-frames-cache")
+def _cmd_device_frames_cache(
+    prune: Annotated[bool, typer.Option("--prune", "-p", help="Evict entries over the quota")] = False,
+    clear: Annotated[bool, typer.Option("--clear", help="Remove every entry")] = False,
+    quota: Annotated[Optional[float], typer.Option("--quota", "-q", help="Quota in MB for --prune")] = None,
+) -> int:
+    """Show or prune the pre-encoded device frames cache."""
+    return SystemCommands.device_frames_cache(prune=prune, clear=clear, quota_mb=quota)
+
+
 @app.command("serve")
 def _cmd_serve(
     host: Annotated[str, typer.Option("--host", "-H", help="Bind address (use 0.0.0.0 for LAN)")] = "127.0.0.1",
@@ -895,16 +921,15 @@ class DisplayCommands:
                 print("Press Ctrl+C to stop.")
 
             media._state.loop = loop
+            media.paced = True
             media.play()
 
-            interval = media.frame_interval_ms / 1000.0
             start = time.monotonic()
 
             while media.is_playing:
+                media.send_cost_s = svc.send_seconds
                 frame, should_send, progress = media.tick()
-                if frame is None:
-                    break
-                if should_send:
+                if frame is not None and should_send:
                     svc.send_pil(frame, w, h)
                 if progress:
                     pct, cur, total_t = progress
@@ -912,9 +937,9 @@ class DisplayCommands:
                           end="", flush=True)
                 if duration and (time.monotonic() - start) >= duration:
                     break
-                time.sleep(interval)
+                media.wait_for_next_frame()
 
-            print("\nDone.")
+            print(f"\nDone. ({media.pacing})")
             return 0
         except KeyboardInterrupt:
             print("\nStopped.")
@@ -1097,7 +1122,7 @@ class DisplayCommands:
             from pathlib import Path
 
             from trcc.services import ImageService, OverlayService
-            from trcc.system_info import get_all_metrics
+            from trcc.system_info import get_all_metrics, get_metric_history
 
             if not os.path.exists(dc_path):
                 print(f"Error: Path not found: {dc_path}")
@@ -1119,6 +1144,7 @@ class DisplayCommands:
             display_opts = overlay.load_from_dc(dc_file)
 
             # Collect system metrics
+            overlay.history = get_metric_history()
             metrics = get_all_metrics()
             overlay.update_metrics(metrics)
             overlay.enabled = True
@@ -1176,21 +1202,14 @@ class DisplayCommands:
     def resume():
         """Send last-used theme to each detected device (headless, no GUI)."""
         try:
-            import time
-
             from trcc.conf import Settings
             from trcc.services import DeviceService, ImageService
 
             svc = DeviceService()
 
             # Wait for USB devices to appear (they may not be ready at boot)
-            devices: list = []
-            for attempt in range(10):
-                devices = svc.detect()
-                if devices:
-                    break
-                print(f"Waiting for device... ({attempt + 1}/10)")
-                time.sleep(2)
+            devices = svc.wait_for_devices(
+                timeout=20, on_wait=lambda: print("Waiting for device..."))
 
             if not devices:
                 print("No compatible TRCC device detected.")
@@ -1433,6 +1452,14 @@ class ThemeCommands:
         try:
             from pathlib import Path
 
+            from trcc.device_frames import SUFFIX as DEVICE_FRAMES_SUFFIX
+
+            if output_path.lower().endswith(DEVICE_FRAMES_SUFFIX):
+                print("Error: device frames (.tdf) are encoded for a connected LCD; "
+                      "export them from the GUI with the theme loaded (playing "
+                      "an animation also caches them, see 'trcc device-frames-cache').")
+                return 1
+
             from trcc.conf import settings
             from trcc.data_repository import DataManager
             from trcc.services import ThemeService
@@ -2262,6 +2289,93 @@ StartupWMClass=trcc-linux
             traceback.print_exc()
             return 1
 
+    @staticmethod
+    def transcode_cache(videos=None, warm=False, prune=False, clear=False,
+                        quota_mb=None):
+        """Show, pre-warm (transcode ahead of first play) or prune the cache."""
+        try:
+            from pathlib import Path
+
+            from trcc.conf import Settings, settings
+            from trcc.transcode_cache import TranscodeCache
+
+            MB = 1024 * 1024
+            cache = TranscodeCache.shared(Settings.get_transcode_cache_quota())
+            if clear:
+                removed, freed = cache.prune(0)
+                print(f"Removed {removed} entries ({freed / MB:.1f} MB)")
+                return 0
+
+            if warm:
+                w, h = settings.width or 320, settings.height or 320
+                if videos:
+                    paths = [Path(v) for v in videos]
+                else:
+                    web_dir = settings.web_dir
+                    paths = sorted(web_dir.glob('*.mp4')) if web_dir and web_dir.exists() else []
+                if not paths:
+                    print(f"No videos to transcode for {w}x{h}.")
+                failed = 0
+                for path in paths:
+                    if cache.lookup(path, (w, h), hash_source=True):
+                        print(f"  {path.name}: cached")
+                        continue
+                    try:
+                        cache.transcode(path, (w, h))
+                        print(f"  {path.name}: transcoded")
+                    except Exception as e:
+                        failed += 1
+                        print(f"  {path.name}: failed ({e})")
+                if failed:
+                    return 1
+
+            if prune:
+                quota = None if quota_mb is None else int(quota_mb * MB)
+                removed, freed = cache.prune(quota)
+                print(f"Evicted {removed} entries ({freed / MB:.1f} MB)")
+
+            entries = cache.entries()
+            used = sum(size for _, size, _ in entries)
+            print(f"Transcode cache: {len(entries)} entries, "
+                  f"{used / MB:.1f} / {cache.quota_bytes / MB:.0f} MB "
+                  f"({cache.cache_dir})")
+            return 0
+
+        except Exception as e:
+            print(f"Error: {e}")
+            return 1
+
+    @staticmethod
+    def device_frames_cache(prune=False, clear=False, quota_mb=None):
+        """Show or prune the pre-encoded device frames (.tdf) cache."""
+        try:
+            from trcc import device_frames
+            from trcc.conf import Settings
+
+            MB = 1024 * 1024
+            quota = Settings.get_device_frames_cache_quota()
+            if clear:
+                removed, freed = device_frames.prune_cache(0)
+                print(f"Removed {removed} entries ({freed / MB:.1f} MB)")
+                return 0
+
+            if prune:
+                if quota_mb is not None:
+                    quota = max(0, int(quota_mb * MB))
+                removed, freed = device_frames.prune_cache(quota)
+                print(f"Evicted {removed} entries ({freed / MB:.1f} MB)")
+
+            entries = device_frames.cache_entries()
+            used = sum(size for _, size, _ in entries)
+            print(f"Device frames cache: {len(entries)} entries, "
+                  f"{used / MB:.1f} / {quota / MB:.0f} MB "
+                  f"({device_frames.CACHE_DIR})")
+            return 0
+
+        except Exception as e:
+            print(f"Error: {e}")
+            return 1
+
 
 # =========================================================================
 # Backward-compat aliases (pyproject.toml entry points + tests)
@@ -2292,6 +2406,8 @@ install_desktop = SystemCommands.install_desktop
 uninstall = SystemCommands.uninstall
 report = SystemCommands.report
 download_themes = SystemCommands.download_themes
+transcode_cache = SystemCommands.transcode_cache
+device_frames_cache = SystemCommands.device_frames_cache
 _hex_dump = DiagCommands._hex_dump
 _hid_debug_lcd = DiagCommands._hid_debug_lcd
 _hid_debug_led = DiagCommands._hid_debug_led
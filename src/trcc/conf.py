@@ -184,6 +184,97 @@ class Settings:
                 entry['temp_unit'] = prefs['temp_unit']
         return overlay_config
 
+    @staticmethod
+    def get_frame_cache_budget() -> int:
+        """Get the pre-encoded video frame cache budget in bytes.
+
+        Stored as 'frame_cache_mb' in config (default 96).  0 disables the cache.
+        """
+        try:
+            mb = float(load_config().get('frame_cache_mb', 96))
+        except (TypeError, ValueError):
+            mb = 96
+        return max(0, int(mb * 1024 * 1024))
+
+    @staticmethod
+    def get_transcode_cache_quota() -> int:
+        """Get the on-disk video transcode cache quota in bytes.
+
+        Stored as 'transcode_cache_mb' in config (default 512).  0 disables
+        the cache.
+        """
+        try:
+            mb = float(load_config().get('transcode_cache_mb', 512))
+        except (TypeError, ValueError):
+            mb = 512
+        return max(0, int(mb * 1024 * 1024))
+
+    @staticmethod
+    def get_device_frames_cache_quota() -> int:
+        """Get the on-disk pre-encoded device frames (.tdf) cache quota in bytes.
+
+        Stored as 'device_frames_cache_mb' in config (default 1024).  Older
+        entries are evicted after each export; 0 keeps only the latest.
+        """
+        try:
+            mb = float(load_config().get('device_frames_cache_mb', 1024))
+        except (TypeError, ValueError):
+            mb = 1024
+        return max(0, int(mb * 1024 * 1024))
+
+    @staticmethod
+    def get_frame_keepalive() -> float:
+        """Get the resend interval for unchanged LCD frames in seconds.
+
+        Stored as 'frame_keepalive_s' in config (default 5).  Identical
+        frames are skipped in between; 0 sends every frame.
+        """
+        try:
+            return max(0.0, float(load_config().get('frame_keepalive_s', 5)))
+        except (TypeError, ValueError):
+            return 5.0
+
+    @staticmethod
+    def get_hid_transfer_mode() -> Optional[str]:
+        """Get the HID Type 2 frame transfer mode override.
+
+        Stored as 'hid_transfer_mode' in config: 'chunked', 'single' or
+        'async'.  Unset (default) keeps the transport's own default.
+        """
+        value = load_config().get('hid_transfer_mode')
+        return None if value is None else str(value)
+
+    @staticmethod
+    def get_bulk_async_transfers() -> bool:
+        """Get whether bulk (USBLCDNew) LCDs queue frames asynchronously.
+
+        Stored as 'bulk_async_transfers' in config (default true).  False
+        writes every frame with blocking pyusb calls.
+        """
+        return bool(load_config().get('bulk_async_transfers', True))
+
+    @staticmethod
+    def get_scsi_partial_update() -> Optional[bool]:
+        """Get the SCSI partial-update override.
+
+        Stored as 'scsi_partial_update' in config: true/false forces
+        changed-chunk-only frame writes on or off for every SCSI LCD;
+        unset (default) leaves it to the device model's registry entry.
+        """
+        value = load_config().get('scsi_partial_update')
+        return None if value is None else bool(value)
+
+    @staticmethod
+    def get_scsi_full_refresh() -> float:
+        """Get how often partial-update SCSI LCDs get a full frame, in seconds.
+
+        Stored as 'scsi_full_refresh_s' in config (default 10).
+        """
+        try:
+            return max(0.0, float(load_config().get('scsi_full_refresh_s', 10)))
+        except (TypeError, ValueError):
+            return 10.0
+
     @staticmethod
     def clear_installed_resolutions():
         """Remove all resolution-installed markers (used by uninstall)."""
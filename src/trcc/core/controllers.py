@@ -7,6 +7,7 @@ layer, and fire callbacks to update the GUI. No business logic lives here.
 from __future__ import annotations
 
 import logging
+import threading
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
@@ -17,6 +18,7 @@ from ..services import (
     ThemeService,
 )
 from ..services.display import DisplayService
+from ..services.pipeline import PipelineFrame
 from .models import (
     DeviceInfo,
     PlaybackState,
@@ -122,9 +124,6 @@ class DeviceController:
         return self._svc.selected
 
     def send_image_async(self, rgb565_data: bytes, width: int, height: int):
-        if self._svc.is_busy:
-            log.debug("send_image_async: busy, skipping")
-            return
         log.debug("send_image_async: dispatching %d bytes (%dx%d)",
                   len(rgb565_data), width, height)
         if self.on_send_started:
@@ -133,12 +132,18 @@ class DeviceController:
 
     def send_pil_async(self, image: Any, width: int, height: int,
                        byte_order: str = '>'):
-        if self._svc.is_busy:
-            return
         if self.on_send_started:
             self.on_send_started()
         self._svc.send_pil_async(image, width, height)
 
+    def send_frame_async(self, encode: Callable[[], bytes],
+                         width: int, height: int):
+        """Encode on the pipeline's encode thread, then send (latest wins)."""
+        if self.on_send_started:
+            self.on_send_started()
+        self._svc.pipeline.submit_frame(
+            PipelineFrame(width, height, encode=encode))
+
     def get_protocol_info(self):
         return self._svc.get_protocol_info()
 
@@ -219,11 +224,16 @@ class VideoController:
 class OverlayController:
     """Thin waiter for overlay rendering.
 
-    Delegates to OverlayService, fires callbacks to GUI.
+    Delegates to OverlayService, fires callbacks to GUI.  Every call that
+    renders or changes the service holds ``lock`` — LCDDeviceController
+    passes its render lock, since video ticks composite the same service
+    on the pipeline's render thread.
     """
 
-    def __init__(self, svc: OverlayService | None = None):
+    def __init__(self, svc: OverlayService | None = None,
+                 lock: Optional[threading.RLock] = None):
         self._svc = svc or OverlayService()
+        self._lock = lock or threading.RLock()
 
         # View callbacks
         self.on_config_changed: Optional[Callable[[], None]] = None
@@ -233,55 +243,76 @@ class OverlayController:
         return self._svc
 
     def set_target_size(self, width: int, height: int):
-        self._svc.set_resolution(width, height)
+        with self._lock:
+            self._svc.set_resolution(width, height)
 
     def enable(self, enabled: bool = True):
-        self._svc.enabled = enabled
+        with self._lock:
+            self._svc.enabled = enabled
 
     def is_enabled(self) -> bool:
         return self._svc.enabled
 
     def set_background(self, image: Any):
-        self._svc.set_background(image)
+        with self._lock:
+            self._svc.set_background(image)
 
     @property
     def background(self) -> Any:
         return self._svc.background
 
     def update_metrics(self, metrics: Dict[str, Any]):
-        self._svc.update_metrics(metrics)
+        with self._lock:
+            self._svc.update_metrics(metrics)
+
+    def required_metrics(self) -> set[str]:
+        return self._svc.required_metrics()
+
+    def set_history(self, history: Any) -> None:
+        """Draw graph elements from a shared MetricHistory."""
+        with self._lock:
+            self._svc.history = history
 
     def render(self, background: Optional[Any] = None, *, force: bool = False) -> Any:
-        return self._svc.render(background, force=force)
+        with self._lock:
+            return self._svc.render(background, force=force)
 
     def set_theme_mask(self, mask_image, position=None):
-        self._svc.set_mask(mask_image, position)
+        with self._lock:
+            self._svc.set_mask(mask_image, position)
 
     def get_theme_mask(self):
         return self._svc.get_mask()
 
     def set_mask_visible(self, visible: bool):
-        self._svc.set_mask_visible(visible)
+        with self._lock:
+            self._svc.set_mask_visible(visible)
 
     def set_temp_unit(self, unit: int):
-        self._svc.set_temp_unit(unit)
+        with self._lock:
+            self._svc.set_temp_unit(unit)
 
     def set_config(self, config: dict):
-        self._svc.configure(config)
+        with self._lock:
+            self._svc.configure(config)
         if self.on_config_changed:
             self.on_config_changed()
 
     def set_config_resolution(self, width: int, height: int):
-        self._svc.set_config_resolution(width, height)
+        with self._lock:
+            self._svc.set_config_resolution(width, height)
 
     def set_scale_enabled(self, enabled: bool):
-        self._svc.set_scale_enabled(enabled)
+        with self._lock:
+            self._svc.set_scale_enabled(enabled)
 
     def load_from_dc(self, dc_path: Path) -> dict:
-        return self._svc.load_from_dc(dc_path)
+        with self._lock:
+            return self._svc.load_from_dc(dc_path)
 
     def set_dc_data(self, data):
-        self._svc.set_dc_data(data)
+        with self._lock:
+            self._svc.set_dc_data(data)
 
     def get_dc_data(self):
         return self._svc.get_dc_data()
@@ -302,15 +333,20 @@ class LCDDeviceController:
         device_svc = DeviceService()
         overlay_svc = OverlayService()
         media_svc = MediaService()
+        media_svc.paced = True  # GUI timer ticks follow the frame deadlines
 
         # The head chef
         self._display = DisplayService(device_svc, overlay_svc, media_svc)
 
+        # Guards DisplayService state: video ticks render on the pipeline's
+        # render thread while the GUI thread loads themes / changes settings.
+        self._render_lock = threading.RLock()
+
         # Sub-controllers (thin waiters over the same services)
         self.themes = ThemeController()
         self.devices = DeviceController(device_svc)
         self.video = VideoController(media_svc)
-        self.overlay = OverlayController(overlay_svc)
+        self.overlay = OverlayController(overlay_svc, self._render_lock)
 
         # View callbacks
         self.on_preview_update: Optional[Callable[[Any], None]] = None
@@ -403,6 +439,7 @@ class LCDDeviceController:
         self.devices.detect_devices()
 
     def cleanup(self):
+        self.devices.svc.close()
         self._display.cleanup()
 
     # ── Resolution ────────────────────────────────────────────────────
@@ -410,7 +447,8 @@ class LCDDeviceController:
     def set_resolution(self, width: int, height: int, persist: bool = True):
         if width == self.lcd_width and height == self.lcd_height:
             return
-        self._display.set_resolution(width, height, persist=persist)
+        with self._render_lock:
+            self._display.set_resolution(width, height, persist=persist)
 
         # Re-sync theme dirs after resolution change
         self.themes.set_directories(
@@ -429,14 +467,16 @@ class LCDDeviceController:
             self.on_resolution_changed(width, height)
 
     def set_rotation(self, degrees: int):
-        image = self._display.set_rotation(degrees)
+        with self._render_lock:
+            image = self._display.set_rotation(degrees)
         if image:
             self._fire_preview(image)
             if self.auto_send:
                 self._send_frame_to_lcd(image)
 
     def set_brightness(self, percent: int):
-        image = self._display.set_brightness(percent)
+        with self._render_lock:
+            image = self._display.set_brightness(percent)
         if image:
             self._fire_preview(image)
             if self.auto_send:
@@ -445,7 +485,8 @@ class LCDDeviceController:
     # ── Theme Operations ──────────────────────────────────────────────
 
     def load_local_theme(self, theme: ThemeInfo):
-        result = self._display.load_local_theme(theme)
+        with self._render_lock:
+            result = self._display.load_local_theme(theme)
         image = result.get('image')
         if image:
             self._fire_preview(image)
@@ -458,7 +499,8 @@ class LCDDeviceController:
         self._fire_status(result.get('status', ''))
 
     def load_cloud_theme(self, theme: ThemeInfo):
-        result = self._display.load_cloud_theme(theme)
+        with self._render_lock:
+            result = self._display.load_cloud_theme(theme)
         image = result.get('image')
         if image:
             self._fire_preview(image)
@@ -471,7 +513,8 @@ class LCDDeviceController:
         self._fire_status(result.get('status', ''))
 
     def apply_mask(self, mask_dir: Path):
-        image = self._display.apply_mask(mask_dir)
+        with self._render_lock:
+            image = self._display.apply_mask(mask_dir)
         if image:
             self._fire_preview(image)
             if self.auto_send and not self._display.is_video_playing():
@@ -479,7 +522,8 @@ class LCDDeviceController:
         self._fire_status(f"Mask: {mask_dir.name}")
 
     def load_image_file(self, path: Path):
-        image = self._display.load_image_file(path)
+        with self._render_lock:
+            image = self._display.load_image_file(path)
         if image:
             self._fire_preview(image)
             if self.auto_send:
@@ -497,13 +541,16 @@ class LCDDeviceController:
     # ── Video Operations ──────────────────────────────────────────────
 
     def play_pause(self):
-        self.video.toggle_play_pause()
+        with self._render_lock:
+            self.video.toggle_play_pause()
 
     def seek_video(self, percent: float):
-        self.video.seek(percent)
+        with self._render_lock:
+            self.video.seek(percent)
 
     def video_tick(self):
-        result = self._display.video_tick()
+        with self._render_lock:
+            result = self._display.video_tick()
         if not result:
             return
 
@@ -518,6 +565,27 @@ class LCDDeviceController:
             self.devices.send_image_async(
                 rgb565, self.lcd_width, self.lcd_height)
 
+    def video_tick_async(self):
+        """Queue a video tick on the render thread (GUI timer entry point).
+
+        Render and encode run off the caller's thread; the preview
+        callback fires from the render thread.
+        """
+        self.devices.svc.pipeline.submit_render(self._render_video_frame)
+
+    def _render_video_frame(self) -> Optional[PipelineFrame]:
+        with self._render_lock:
+            result = self._display.video_tick(encode=False)
+        if not result:
+            return None
+        self._fire_preview(result['preview'])
+        w, h = self.lcd_width, self.lcd_height
+        if result.get('rgb565'):
+            return PipelineFrame(w, h, data=result['rgb565'])
+        if result.get('encode'):
+            return PipelineFrame(w, h, encode=result['encode'])
+        return None
+
     def get_video_interval(self) -> int:
         return self._display.get_video_interval()
 
@@ -527,18 +595,36 @@ class LCDDeviceController:
     # ── Device Operations ─────────────────────────────────────────────
 
     def send_current_image(self):
-        rgb565 = self._display.send_current_image()
+        with self._render_lock:
+            rgb565 = self._display.send_current_image()
         if rgb565:
             self.devices.send_image_async(
                 rgb565, self.lcd_width, self.lcd_height)
             self._fire_status("Sent to LCD")
 
     def render_overlay_and_preview(self):
-        image = self._display.render_overlay()
+        with self._render_lock:
+            image = self._display.render_overlay()
         if image:
             self._fire_preview(image)
         return image
 
+    def render_overlay_async(self, send: bool = True):
+        """Re-render the overlay on the render thread, optionally send it."""
+        def job() -> Optional[PipelineFrame]:
+            with self._render_lock:
+                image = self._display.render_overlay()
+            if not image:
+                return None
+            self._fire_preview(image)
+            if not send or not self.devices.get_selected():
+                return None
+            return PipelineFrame(
+                self.lcd_width, self.lcd_height,
+                encode=lambda: self._display._encode_for_device(image))
+
+        self.devices.svc.pipeline.submit_render(job)
+
     # ── Callbacks from sub-controllers ────────────────────────────────
 
     def _on_theme_selected(self, theme: ThemeInfo):
@@ -571,20 +657,16 @@ class LCDDeviceController:
             self.on_error(message)
 
     def _send_frame_to_lcd(self, image: Any):
-        """Send a processed image to the LCD via DeviceService."""
+        """Encode + send a processed image on the pipeline threads."""
         device = self.devices.get_selected()
         if not device:
             log.debug("Send skipped — no device selected")
             return
-        try:
-            encoded = self._display._encode_for_device(image)
-            log.debug("Sending %d bytes to %s (%dx%d)",
-                      len(encoded), device.path,
-                      self.lcd_width, self.lcd_height)
-            self.devices.send_image_async(
-                encoded, self.lcd_width, self.lcd_height)
-        except Exception as e:
-            self._fire_error(f"LCD send error: {e}")
+        log.debug("Queueing frame for %s (%dx%d)",
+                  device.path, self.lcd_width, self.lcd_height)
+        self.devices.send_frame_async(
+            lambda: self._display._encode_for_device(image),
+            self.lcd_width, self.lcd_height)
 
     # ── Compat shim: _setup_theme_dirs (used by qt_app_mvc) ──────────
 
@@ -671,6 +753,9 @@ class LEDController:
     def update_metrics(self, metrics: Dict) -> None:
         self._svc.update_metrics(metrics)
 
+    def required_metrics(self) -> set[str]:
+        return self._svc.required_metrics()
+
     def configure_for_style(self, style_id: int) -> None:
         self._svc.configure_for_style(style_id)
         self._svc._hr10_mode = (style_id == 13)
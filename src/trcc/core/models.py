@@ -7,9 +7,9 @@ These models can be used by any GUI framework (Tkinter, PyQt6, etc.)
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import AbstractSet, Any, Dict, List, Optional, Tuple
 
-from ..data_repository import ThemeDir
+from ..data_repository import THEME_BG, THEME_DC, THEME_MASK, THEME_PREVIEW, ThemeDir
 
 # =============================================================================
 # Browser Item Dataclasses (replace raw dicts in theme/mask panels)
@@ -99,35 +99,45 @@ class ThemeInfo:
     category: Optional[str] = None  # a=Gallery, b=Tech, c=HUD, etc.
 
     @classmethod
-    def from_directory(cls, path: Path, resolution: Tuple[int, int] = (320, 320)) -> 'ThemeInfo':
-        """Create ThemeInfo from a theme directory."""
+    def from_directory(cls, path: Path, resolution: Tuple[int, int] = (320, 320),
+                       files: Optional[AbstractSet[str]] = None) -> 'ThemeInfo':
+        """Create ThemeInfo from a theme directory.
+
+        Args:
+            files: Names of the files in *path*, if already known (e.g.
+                from ThemeIndex); otherwise the directory is listed once.
+        """
         td = ThemeDir(path)
+        if files is None:
+            files = ThemeDir.list_files(path)
 
         # Determine if animated — check Theme.zt first, then .mp4 files
-        if td.zt.exists():
+        if td.zt.name in files:
             is_animated = True
             animation_path = td.zt
         else:
-            mp4_files = list(path.glob('*.mp4'))
+            mp4_files = sorted(f for f in files if f.endswith('.mp4'))
             if mp4_files:
                 is_animated = True
-                animation_path = mp4_files[0]
+                animation_path = path / mp4_files[0]
             else:
                 is_animated = False
                 animation_path = None
 
+        has_bg = THEME_BG in files
+        has_mask = THEME_MASK in files
         return cls(
             name=path.name,
             path=path,
             theme_type=ThemeType.LOCAL,
-            background_path=td.bg if td.bg.exists() else None,
-            mask_path=td.mask if td.mask.exists() else None,
-            thumbnail_path=td.preview if td.preview.exists() else (td.bg if td.bg.exists() else None),
+            background_path=td.bg if has_bg else None,
+            mask_path=td.mask if has_mask else None,
+            thumbnail_path=td.preview if THEME_PREVIEW in files else (td.bg if has_bg else None),
             animation_path=animation_path,
-            config_path=td.dc if td.dc.exists() else None,
+            config_path=td.dc if THEME_DC in files else None,
             resolution=resolution,
             is_animated=is_animated,
-            is_mask_only=not td.bg.exists() and td.mask.exists(),
+            is_mask_only=not has_bg and has_mask,
         )
 
     @classmethod
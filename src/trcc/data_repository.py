@@ -7,6 +7,7 @@ and system utilities all go through this module.
 
 Classes:
     SysUtils      — cross-distro system utilities (sysfs, sg_raw, 7z)
+    SysfsReader   — pool of open sysfs attribute files, reread with pread
     ThemeDir      — standard theme directory layout + resolution lookup
     DataManager   — archive extraction, on-demand downloading, resolution tracking
     Resources     — GUI resource file finding
@@ -16,10 +17,12 @@ Config persistence lives in conf.py; device protocols in their respective module
 from __future__ import annotations
 
 import logging
+import math
 import os
 import shutil
 import subprocess
-from typing import List, Optional
+import threading
+from typing import AbstractSet, List, MutableSequence, Optional, Sequence
 
 log = logging.getLogger(__name__)
 
@@ -95,6 +98,99 @@ class SysUtils:
         return shutil.which('7z') is not None
 
 
+class SysfsReader:
+    """Keeps sysfs attribute files open and rereads them in place.
+
+    sysfs regenerates an attribute's value on every read at offset 0, so
+    one ``os.preadv(fd, [buf], 0)`` into a reused buffer replaces the
+    open/read/close of ``SysUtils.read_sysfs()``.  A handle that fails
+    (device unplugged, driver reloaded) is closed and reopened on the
+    next read, so a device that comes back is picked up transparently.
+    """
+
+    BUF_SIZE = 128   # Numeric attributes are a few bytes; sysfs caps at a page
+    MAX_OPEN = 256   # Beyond this, fall back to open/read/close
+
+    def __init__(self) -> None:
+        self._fds: dict[str, int] = {}
+        self._buf = bytearray(self.BUF_SIZE)
+        self._view = memoryview(self._buf)
+        self._lock = threading.Lock()
+
+    def read(self, path: str) -> Optional[str]:
+        """Read a sysfs attribute, return stripped content or None."""
+        with self._lock:
+            fd = self._fds.get(path)
+            if fd is not None:
+                try:
+                    n = os.preadv(fd, [self._buf], 0)
+                    return str(self._view[:n], 'utf-8', 'replace').strip()
+                except OSError:
+                    self._drop(path)  # Stale handle: reopen below
+            if len(self._fds) >= self.MAX_OPEN:
+                return SysUtils.read_sysfs(path)
+            try:
+                fd = os.open(path, os.O_RDONLY | os.O_CLOEXEC)
+            except OSError:
+                return None
+            try:
+                n = os.preadv(fd, [self._buf], 0)
+            except OSError:
+                os.close(fd)
+                return None
+            self._fds[path] = fd
+            return str(self._view[:n], 'utf-8', 'replace').strip()
+
+    def read_floats(self, paths: Sequence[str], out: MutableSequence[float]) -> None:
+        """Read numeric attributes into *out* (NaN where unreadable).
+
+        Batch form of read() for sensor sweeps: pooled handles are reread
+        under one lock acquisition and parsed straight from bytes.
+        """
+        misses: list[int] = []
+        with self._lock:
+            for i, path in enumerate(paths):
+                fd = self._fds.get(path)
+                if fd is None:
+                    misses.append(i)
+                    continue
+                try:
+                    out[i] = float(os.pread(fd, self.BUF_SIZE, 0))
+                except ValueError:
+                    out[i] = math.nan
+                except OSError:
+                    self._drop(path)
+                    misses.append(i)
+        for i in misses:  # First read or stale handle: (re)open via read()
+            try:
+                out[i] = float(self.read(paths[i]))  # type: ignore[arg-type]
+            except (TypeError, ValueError):
+                out[i] = math.nan
+
+    def _drop(self, path: str) -> None:
+        fd = self._fds.pop(path, None)
+        if fd is not None:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+    def __len__(self) -> int:
+        return len(self._fds)
+
+    def close(self) -> None:
+        """Close every pooled handle."""
+        with self._lock:
+            for path in list(self._fds):
+                self._drop(path)
+
+    def __del__(self) -> None:
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
 # =========================================================================
 # ThemeDir — standard theme directory layout
 # =========================================================================
@@ -184,6 +280,19 @@ class ThemeDir:
         """Check if directory contains valid theme files."""
         return self.preview.exists() or self.dc.exists() or self.bg.exists()
 
+    @staticmethod
+    def is_valid_listing(files: AbstractSet[str]) -> bool:
+        """is_valid() for a directory whose file names are already known."""
+        return THEME_PREVIEW in files or THEME_DC in files or THEME_BG in files
+
+    @staticmethod
+    def list_files(path: str | os.PathLike) -> frozenset[str]:
+        """Names in a directory (empty if it can't be listed)."""
+        try:
+            return frozenset(os.listdir(path))
+        except OSError:
+            return frozenset()
+
     def exists(self) -> bool:
         """Check if directory exists."""
         return self.path.exists()
@@ -42,13 +42,16 @@ Export Format (.tr files):
     byte[4]: 0xDD, 0xDC, 0xDD, 0xDC (magic header)
     Then same as above...
     Followed by embedded binary data for images
+
+Device frames (.tdf): a theme's animation pre-encoded for one LCD — see
+device_frames.py.
 """
 
 import os
 import struct
 import tempfile
 from pathlib import Path
-from typing import IO, Optional, Tuple
+from typing import IO, Any, Callable, Optional, Tuple
 
 from trcc.binary_reader import BinaryReader
 from trcc.core.models import (
@@ -57,6 +60,8 @@ from trcc.core.models import (
     DisplayElement,
     ThemeConfig,
 )
+from trcc.device_frames import SUFFIX as DEVICE_FRAMES_SUFFIX
+from trcc.device_frames import FrameFormat, write_device_frames
 
 
 class DcWriter:
@@ -410,8 +415,26 @@ class DcWriter:
     # ── Export / Import (.tr) ──
 
     @staticmethod
-    def export_theme(theme_path: str, export_path: str) -> None:
-        """Export a theme as a .tr file for sharing."""
+    def export_theme(theme_path: str, export_path: str,
+                     frame_format: Optional[FrameFormat] = None,
+                     encode: Optional[Callable[[Any], bytes]] = None,
+                     context: bytes = b'') -> None:
+        """Export a theme as a .tr file for sharing.
+
+        An *export_path* ending in .tdf instead pre-encodes the theme's
+        animation for one device (see export_device_frames), which needs
+        *frame_format* and *encode*.
+        """
+        if export_path.endswith(DEVICE_FRAMES_SUFFIX):
+            video = DcWriter._detect_video_file(theme_path)
+            if video is None:
+                raise ValueError(f"No animation in {theme_path}")
+            if frame_format is None or encode is None:
+                raise ValueError("Device frames export needs a frame format and encoder")
+            DcWriter.export_device_frames(os.path.join(theme_path, video), export_path,
+                                          frame_format, encode, context)
+            return
+
         from .dc_parser import DcParser
 
         config_file = os.path.join(theme_path, "config1.dc")
@@ -424,6 +447,33 @@ class DcWriter:
 
         DcWriter.write_tr(theme, theme_path, export_path)
 
+    @staticmethod
+    def export_device_frames(source_path: str, export_path: str,
+                             frame_format: FrameFormat,
+                             encode: Callable[[Any], bytes],
+                             context: bytes = b'') -> int:
+        """Pre-encode an animation (Theme.zt or video) into a .tdf file.
+
+        Every source frame is decoded at the format's resolution and passed
+        to *encode*, which applies the display adjustments and returns the
+        device payload.  Returns the number of frames written.
+        """
+        from .media_player import ThemeZtDecoder, VideoDecoder
+
+        size = (frame_format.width, frame_format.height)
+        if source_path.lower().endswith('.zt'):
+            decoder: Any = ThemeZtDecoder(source_path, size)
+            delays = list(decoder.delays)
+        else:
+            decoder = VideoDecoder(source_path, size)
+            delays = [round(1000 / decoder.fps)] * decoder.frame_count
+        try:
+            return write_device_frames(
+                export_path, frame_format, (encode(f) for f in decoder.frames),
+                delays, source=source_path, context=context)
+        finally:
+            decoder.close()
+
     @staticmethod
     def _parsed_to_theme_config(parsed: dict) -> ThemeConfig:
         """Convert parsed DC dict to ThemeConfig."""
@@ -11,14 +11,25 @@ Protocol:
   2. Frame send: 64-byte header + payload, bulk write.
      cmd=2 for JPEG (all PMs except 32), cmd=3 for raw RGB565 (PM=32).
      ZLP after payload as frame delimiter.
+
+Frames are sent asynchronously when pyusb runs on its libusb1 backend:
+two frame buffers are submitted through libusb's async API so the
+caller encodes frame N+1 while frame N is on the bus.  Otherwise (or
+with ``async_transfers=False`` / ``bulk_async_transfers: false`` in
+config.json) each write blocks as before.
 """
 
 from __future__ import annotations
 
+import ctypes
 import logging
 import struct
+import time
+from dataclasses import dataclass
+from typing import Any, Optional
 
 from .core.models import HandshakeResult, fbl_to_resolution, pm_to_fbl
+from .libusb_async import LibusbTransfers
 
 log = logging.getLogger(__name__)
 
@@ -61,14 +72,205 @@ _FRAME_HEADER_SIZE = 64
 _WRITE_CHUNK_SIZE = 16 * 1024  # 16 KiB per USB bulk write
 
 
+@dataclass
+class BulkStats:
+    """Frame transfer statistics of a BulkDevice."""
+
+    frames: int = 0
+    failed: int = 0
+    bytes: int = 0
+    latency_s: float = 0.0       # Sum of submit → completion times
+    last_latency_s: float = 0.0
+    busy_s: float = 0.0          # Time with a frame on the bus
+
+    def record(self, nbytes: int, latency_s: float, busy_s: float,
+               ok: bool = True) -> None:
+        self.frames += 1
+        self.failed += not ok
+        self.bytes += nbytes
+        self.latency_s += latency_s
+        self.last_latency_s = latency_s
+        self.busy_s += busy_s
+
+    @property
+    def avg_latency_ms(self) -> float:
+        return self.latency_s * 1000 / self.frames if self.frames else 0.0
+
+    @property
+    def throughput_mb_s(self) -> float:
+        """Bus throughput while frames were in flight (MB/s)."""
+        return self.bytes / self.busy_s / 1e6 if self.busy_s else 0.0
+
+
+class _FrameSlot:
+    """One frame buffer and the transfers that carry it."""
+
+    def __init__(self) -> None:
+        self.buffer = ctypes.create_string_buffer(0)
+        self.transfers: list[Any] = []
+        self.pending = 0
+        self.sent = 0
+        self.submitted_at = 0.0
+        self.error: Optional[str] = None
+
+
+class _AsyncFrameSender:
+    """Double-buffered frame writes through libusb's asynchronous API.
+
+    Each frame (header, 16 KiB payload chunks, ZLP) is copied into one of
+    two buffers and submitted as a batch of bulk transfers (see
+    libusb_async); ``send()`` returns without waiting for them.  A buffer
+    is reused only after its previous frame completed, which is where
+    that frame's outcome is collected — errors surface one frame late,
+    or at ``flush()``.
+
+    Completions are reaped when ``send()`` or ``flush()`` waits, so a
+    frame's latency is measured up to the moment the host noticed it.
+
+    If a submit fails partway through a frame, the rest of it (ZLP
+    included) is written synchronously behind the queued transfers so the
+    device never sees a truncated frame.  Once the transfers are stranded
+    the sender stops accepting frames.
+    """
+
+    BUFFERS = 2
+
+    def __init__(self, transfers: LibusbTransfers, endpoint: int,
+                 stats: BulkStats) -> None:
+        self._usb = transfers
+        self._endpoint = endpoint
+        self.stats = stats
+        self._slots = [_FrameSlot() for _ in range(self.BUFFERS)]
+        self._next = 0
+        self._owners: dict[int, _FrameSlot] = {}  # Transfer address → its slot
+        self._bus_free_at = 0.0
+
+    @classmethod
+    def for_device(cls, device: Any, endpoint: int,
+                   stats: BulkStats) -> '_AsyncFrameSender':
+        """Sender on a pyusb device opened by the libusb1 backend."""
+        return cls(LibusbTransfers.for_device(device), endpoint, stats)
+
+    def send(self, header: bytes, payload: bytes) -> bool:
+        """Queue one frame.
+
+        Returns False if it couldn't be sent or if the frame that last
+        used this buffer failed.
+        """
+        if self._usb.stranded:
+            raise RuntimeError("bulk transfers never completed; reopen the device")
+        slot = self._slots[self._next]
+        ok = self._wait(slot)
+        if self._usb.stranded:
+            return False
+        self._next = (self._next + 1) % len(self._slots)
+
+        size = len(header) + len(payload)
+        if len(slot.buffer) < size:
+            slot.buffer = ctypes.create_string_buffer(size)
+        view = memoryview(slot.buffer).cast('B')
+        view[:len(header)] = header
+        view[len(header):size] = payload
+
+        pieces = [(0, len(header))]
+        pieces += [(len(header) + off, min(_WRITE_CHUNK_SIZE, len(payload) - off))
+                   for off in range(0, len(payload), _WRITE_CHUNK_SIZE)]
+        pieces.append((size, 0))  # ZLP frame delimiter
+        while len(slot.transfers) < len(pieces):
+            transfer = self._usb.alloc()
+            slot.transfers.append(transfer)
+            self._owners[ctypes.addressof(transfer.contents)] = slot
+
+        base = ctypes.addressof(slot.buffer)
+        slot.sent = 0
+        slot.submitted_at = time.perf_counter()
+        for i, (transfer, (offset, length)) in enumerate(zip(slot.transfers, pieces)):
+            rc = self._usb.submit(transfer, self._endpoint, base + offset, length,
+                                  _WRITE_TIMEOUT_MS)
+            if rc:
+                log.warning("Bulk frame submit failed (%d); writing the rest synchronously",
+                            rc)
+                if not self._write_sync(base, pieces[i:]):
+                    slot.error = f"submit failed ({rc})"
+                    return False
+                return ok
+            slot.pending += 1
+        return ok
+
+    def _write_sync(self, base: int, pieces: list[tuple[int, int]]) -> bool:
+        """Blocking writes of *pieces*, queued behind any in-flight transfers."""
+        for offset, length in pieces:
+            rc = self._usb.write_sync(self._endpoint, base + offset, length,
+                                      _WRITE_TIMEOUT_MS)
+            if rc:
+                log.warning("Bulk synchronous write failed (%d)", rc)
+                return False
+        return True
+
+    def _wait(self, slot: _FrameSlot) -> bool:
+        """Block until *slot*'s frame completed; True if it succeeded."""
+        while slot.pending:
+            completed, error = self._usb.handle_events(slot.transfers)
+            slot.error = slot.error or error
+            if self._usb.stranded:
+                log.error("Bulk: %d transfers never completed; giving up", slot.pending)
+                return False
+            self._reap(completed)
+        ok = slot.error is None
+        if not ok:
+            log.warning("Bulk frame transfer failed: %s", slot.error)
+        slot.error = None
+        return ok
+
+    def _reap(self, completed: list[Any]) -> None:
+        now = time.perf_counter()
+        for transfer in completed:
+            slot = self._owners[ctypes.addressof(transfer.contents)]
+            t = transfer.contents
+            slot.pending -= 1
+            if t.status == LibusbTransfers.COMPLETED:
+                slot.sent += t.actual_length
+            elif slot.error is None:
+                slot.error = f"transfer status {t.status}"
+            if not slot.pending:
+                self.stats.record(slot.sent, now - slot.submitted_at,
+                                  now - max(slot.submitted_at, self._bus_free_at),
+                                  slot.error is None)
+                self._bus_free_at = now
+
+    def flush(self) -> bool:
+        """Wait for every queued frame; True if all succeeded."""
+        ok = True
+        for i in range(len(self._slots)):
+            if self._usb.stranded:
+                return False
+            ok &= self._wait(self._slots[(self._next + i) % len(self._slots)])
+        return ok
+
+    def close(self) -> None:
+        self.flush()
+        self._usb.close(owner=self)  # Stranded: leaks the frame buffers too
+        for slot in self._slots:
+            slot.transfers = []
+        self._owners.clear()
+
+
 class BulkDevice:
     """USB bulk device handler for USBLCDNew-type LCDs (87AD:70DB etc.).
 
     Uses pyusb for raw bulk endpoint I/O.  The kernel must not have
     claimed the interface (no usb-storage, no usbhid).
+
+    With ``async_transfers`` (default ``ASYNC_TRANSFERS``) frames are
+    double-buffered through libusb's async API, falling back to blocking
+    writes when that isn't available.  ``stats`` holds per-frame latency
+    and bus throughput for either path.
     """
 
-    def __init__(self, vid: int, pid: int, usb_path: str = ""):
+    ASYNC_TRANSFERS = True
+
+    def __init__(self, vid: int, pid: int, usb_path: str = "",
+                 async_transfers: Optional[bool] = None):
         self.vid = vid
         self.pid = pid
         self.usb_path = usb_path
@@ -81,6 +283,11 @@ class BulkDevice:
         self.height: int = 0
         self.use_jpeg: bool = True  # C#: all bulk use JPEG except PM=32
         self._raw_handshake: bytes = b""
+        self.async_transfers = (self.ASYNC_TRANSFERS if async_transfers is None
+                                else async_transfers)
+        self._sender: Optional[_AsyncFrameSender] = None
+        self._async_failed = False
+        self.stats = BulkStats()
 
     def _open(self):
         """Find and claim the USB device."""
@@ -209,6 +416,9 @@ class BulkDevice:
           offset 56: mode   2
           offset 60: payload length (LE u32)
         Followed by payload in 16 KiB chunks, then a ZLP delimiter.
+
+        Asynchronously sent frames return once queued; a transfer error
+        shows up as False on a later call (see _AsyncFrameSender).
         """
         if self._dev is None or self._ep_out is None:
             self.handshake()
@@ -228,18 +438,29 @@ class BulkDevice:
         struct.pack_into("<I", header, 60, data_size)    # payload length
 
         try:
+            sender = self._async_sender()
+            if sender is not None:
+                ok = sender.send(bytes(header), image_data)
+                log.debug("Bulk frame queued: %dx%d, cmd=%d, %d bytes",
+                          self.width, self.height, cmd, data_size)
+                return ok
+
+            start = time.perf_counter()
             # Send header
             self._ep_out.write(bytes(header), timeout=_WRITE_TIMEOUT_MS)  # type: ignore[union-attr]
 
-            # Send payload in chunks
+            # Send payload in chunks (memoryview slices: no per-chunk copy)
+            view = memoryview(image_data)
             offset = 0
             while offset < data_size:
-                chunk = image_data[offset:offset + _WRITE_CHUNK_SIZE]
+                chunk = view[offset:offset + _WRITE_CHUNK_SIZE]
                 self._ep_out.write(chunk, timeout=_WRITE_TIMEOUT_MS)  # type: ignore[union-attr]
                 offset += len(chunk)
 
             # ZLP frame delimiter
             self._ep_out.write(b"", timeout=_WRITE_TIMEOUT_MS)  # type: ignore[union-attr]
+            elapsed = time.perf_counter() - start
+            self.stats.record(len(header) + data_size, elapsed, elapsed)
 
             log.debug("Bulk frame sent: %dx%d, cmd=%d, %d bytes",
                       self.width, self.height, cmd, data_size)
@@ -248,8 +469,35 @@ class BulkDevice:
             log.exception("Bulk frame send failed (cmd=%d, %d bytes)", cmd, data_size)
             return False
 
+    def _async_sender(self) -> Optional[_AsyncFrameSender]:
+        """Double-buffered sender, or None to write synchronously."""
+        if not self.async_transfers or self._async_failed:
+            return None
+        if self._sender is None:
+            assert self._ep_out is not None
+            try:
+                self._sender = _AsyncFrameSender.for_device(
+                    self._dev, self._ep_out.bEndpointAddress, self.stats)  # type: ignore[union-attr]
+            except Exception as e:
+                self._async_failed = True
+                log.info("Bulk: asynchronous transfers unavailable (%s), "
+                         "using blocking writes", e)
+                return None
+        return self._sender
+
     def close(self) -> None:
         """Release USB device."""
+        if self._sender is not None:
+            try:
+                self._sender.close()
+            except Exception:
+                log.exception("Bulk: failed to drain queued frames")
+            self._sender = None
+        self._async_failed = False
+        if self.stats.frames:
+            log.info("Bulk frames: %d sent (%d failed), avg %.1f ms, %.2f MB/s",
+                     self.stats.frames, self.stats.failed,
+                     self.stats.avg_latency_ms, self.stats.throughput_mb_s)
         if self._dev is not None:
             import usb.util
             try:
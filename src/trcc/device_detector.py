@@ -46,6 +46,9 @@ class DeviceEntry:
     button_image: str = "A1CZTV"
     protocol: str = "scsi"
     device_type: int = 1  # 1=SCSI, 2=HID Type 2, 3=HID Type 3, 4=Raw USB Bulk
+    # SCSI: firmware verified to accept frames with only the changed
+    # 64 KiB chunks (see device_scsi partial updates)
+    partial_update: bool = False
 
 
 @dataclass
@@ -142,6 +145,9 @@ def enable_hid_testing():
 class DeviceDetector:
     """USB LCD/LED device detection and management."""
 
+    # USB devices as the kernel sees them (one directory per device/interface)
+    SYSFS_USB_DIR = "/sys/bus/usb/devices"
+
     @staticmethod
     def _get_all_registries() -> dict[tuple[int, int], DeviceEntry]:
         """Return combined device lookup dict (SCSI + HID LCD + LED + Bulk)."""
@@ -166,9 +172,62 @@ class DeviceDetector:
     # USB scanning
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _detected(vid: int, pid: int, usb_path: str,
+                  entry: DeviceEntry) -> DetectedDevice:
+        log.debug("Found known device: %04X:%04X %s (%s)",
+                  vid, pid, entry.vendor, entry.protocol)
+        return DetectedDevice(
+            vid=vid, pid=pid,
+            vendor_name=entry.vendor,
+            product_name=entry.product,
+            usb_path=usb_path,
+            implementation=entry.implementation,
+            model=entry.model,
+            button_image=entry.button_image,
+            protocol=entry.protocol,
+            device_type=entry.device_type,
+        )
+
+    @staticmethod
+    def find_usb_devices_sysfs() -> Optional[List[DetectedDevice]]:
+        """Find known USB devices by reading sysfs (no subprocess).
+
+        Returns None if sysfs isn't available.  ``usb_path`` is the
+        device's sysfs name (bus-port.port, e.g. "2-1.4").
+        """
+        try:
+            names = os.listdir(DeviceDetector.SYSFS_USB_DIR)
+        except OSError:
+            return None
+
+        registry = DeviceDetector._get_all_registries()
+        devices = []
+        for name in sorted(names):
+            if ':' in name:  # Interface, not a device
+                continue
+            base = os.path.join(DeviceDetector.SYSFS_USB_DIR, name)
+            try:
+                with open(os.path.join(base, 'idVendor')) as f:
+                    vid = int(f.read().strip(), 16)
+                with open(os.path.join(base, 'idProduct')) as f:
+                    pid = int(f.read().strip(), 16)
+            except (OSError, ValueError):
+                continue  # Root hub without ids, or unplugged mid-scan
+            entry = registry.get((vid, pid))
+            if entry is not None:
+                devices.append(DeviceDetector._detected(vid, pid, name, entry))
+
+        log.debug("sysfs scan found %d known device(s)", len(devices))
+        return devices
+
     @staticmethod
     def find_usb_devices() -> List[DetectedDevice]:
-        """Find all USB LCD devices using lsusb."""
+        """Find all USB LCD devices (sysfs, else lsusb)."""
+        devices = DeviceDetector.find_usb_devices_sysfs()
+        if devices is not None:
+            return devices
+
         devices = []
         log.debug("Scanning USB devices via lsusb...")
         output = DeviceDetector.run_command(['lsusb'])
@@ -178,6 +237,7 @@ class DeviceDetector:
             return devices
 
         pattern = r'Bus (\d+) Device (\d+): ID ([0-9a-f]{4}):([0-9a-f]{4})\s+(.*)'
+        all_devices = DeviceDetector._get_all_registries()
 
         for line in output.split('\n'):
             match = re.search(pattern, line, re.IGNORECASE)
@@ -188,26 +248,12 @@ class DeviceDetector:
             vid = int(vid_str, 16)
             pid = int(pid_str, 16)
 
-            all_devices = DeviceDetector._get_all_registries()
-            if (vid, pid) not in all_devices:
+            device_info = all_devices.get((vid, pid))
+            if device_info is None:
                 continue
 
-            device_info = all_devices[(vid, pid)]
             usb_path = f"{int(bus)}-{device}"
-
-            log.debug("Found known device: %04X:%04X %s (%s)",
-                      vid, pid, device_info.vendor, device_info.protocol)
-            devices.append(DetectedDevice(
-                vid=vid, pid=pid,
-                vendor_name=device_info.vendor,
-                product_name=device_info.product,
-                usb_path=usb_path,
-                implementation=device_info.implementation,
-                model=device_info.model,
-                button_image=device_info.button_image,
-                protocol=device_info.protocol,
-                device_type=device_info.device_type,
-            ))
+            devices.append(DeviceDetector._detected(vid, pid, usb_path, device_info))
 
         log.debug("USB scan found %d known device(s)", len(devices))
         return devices
@@ -128,14 +128,75 @@ class DeviceProtocol(ABC):
 # =========================================================================
 
 class ScsiProtocol(DeviceProtocol):
-    """LCD communication via SCSI protocol (sg_raw).
+    """LCD communication via SCSI protocol (SG_IO ioctl or sg_raw).
 
-    Wraps scsi_device.py. Uses subprocess per send (stateless transport).
+    Wraps device_scsi.py.  ``backend`` selects the CDB transport:
+
+    - ``"auto"``   — persistent in-process SG_IO handle, sg_raw if it can't open
+    - ``"sg_io"``  — SG_IO only
+    - ``"sg_raw"`` — subprocess per chunk (legacy, stateless)
+
+    ``partial_update`` sends only the 64 KiB chunks that changed since the
+    last frame (with a full frame every ``full_refresh_s``); see
+    ``partial_update_for`` for the per-model default.
     """
 
-    def __init__(self, device_path: str):
+    BACKENDS = ("auto", "sg_io", "sg_raw")
+
+    def __init__(self, device_path: str, backend: str = "auto",
+                 partial_update: bool = False, full_refresh_s: float = 10.0):
         super().__init__()
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown SCSI backend: {backend!r}")
         self._path = device_path
+        self._backend = backend
+        self.partial_update = partial_update
+        self.full_refresh_s = full_refresh_s
+        self._transport: Optional[Any] = None  # SgIoTransport (lazy import)
+        self._transport_resolved = backend == "sg_raw"
+
+    def _ensure_transport(self) -> None:
+        """Open the SG_IO transport once; fall back to sg_raw on failure.
+
+        A forced ``sg_io`` backend never falls back: every send retries the
+        open and fails until it succeeds.
+        """
+        if self._transport_resolved:
+            return
+        from .device_scsi import ScsiDevice, SgIoTransport
+        transport = SgIoTransport(self._path)
+        try:
+            transport.open()
+        except OSError as e:
+            if self._backend == "sg_io":
+                raise
+            log.info("SG_IO unavailable for %s (%s) — falling back to sg_raw",
+                     self._path, e)
+            self._transport_resolved = True
+            return
+        self._transport_resolved = True
+        ScsiDevice.register_transport(self._path, transport)
+        self._transport = transport
+        self._notify_state_changed("transport_open", True)
+
+    @staticmethod
+    def partial_update_for(vid: int, pid: int) -> bool:
+        """Whether to send changed chunks only: config override, else registry."""
+        from .conf import Settings
+        override = Settings.get_scsi_partial_update()
+        if override is not None:
+            return override
+        from .device_detector import KNOWN_DEVICES
+        entry = KNOWN_DEVICES.get((vid, pid))
+        return entry is not None and entry.partial_update
+
+    @property
+    def active_backend(self) -> str:
+        """Transport actually in use: 'sg_io', 'sg_raw', or 'none' while a
+        forced SG_IO transport can't be opened."""
+        if self._transport is not None:
+            return "sg_io"
+        return "none" if self._backend == "sg_io" else "sg_raw"
 
     def handshake(self) -> Optional[HandshakeResult]:
         """SCSI devices don't handshake — resolution is known at detection time."""
@@ -143,9 +204,15 @@ class ScsiProtocol(DeviceProtocol):
 
     def send_image(self, image_data: bytes, width: int, height: int) -> bool:
         try:
+            self._ensure_transport()
             from .device_scsi import send_image_to_device
             log.debug("SCSI send: %d bytes to %s (%dx%d)", len(image_data), self._path, width, height)
-            success = send_image_to_device(self._path, image_data, width, height)
+            if self.partial_update:
+                success = send_image_to_device(self._path, image_data, width, height,
+                                               partial=True,
+                                               full_refresh_s=self.full_refresh_s)
+            else:
+                success = send_image_to_device(self._path, image_data, width, height)
             self._notify_send_complete(success)
             return success
         except Exception as e:
@@ -154,18 +221,29 @@ class ScsiProtocol(DeviceProtocol):
             return False
 
     def close(self) -> None:
-        pass  # SCSI uses subprocess per call, nothing to release
+        if self._transport is not None:
+            from .device_scsi import ScsiDevice
+            ScsiDevice.unregister_transport(self._path)
+            self._transport = None
+            self._transport_resolved = self._backend == "sg_raw"
+            self._notify_state_changed("transport_open", False)
 
     def get_info(self) -> 'ProtocolInfo':
         import shutil
         sg_raw = shutil.which("sg_raw") is not None
+        sg_io = self._transport is not None
+        if sg_io:
+            active = "sg_io"
+        else:
+            active = "sg_raw" if sg_raw and self._backend != "sg_io" else "none"
         return ProtocolInfo(
             protocol="scsi",
             device_type=1,
-            protocol_display="SCSI (sg_raw)",
+            protocol_display="SCSI (SG_IO)" if sg_io else "SCSI (sg_raw)",
             device_type_display="SCSI RGB565",
-            active_backend="sg_raw" if sg_raw else "none",
-            backends={"sg_raw": sg_raw, "pyusb": False, "hidapi": False},
+            active_backend=active,
+            backends={"sg_raw": sg_raw, "sg_io": sg_io, "pyusb": False, "hidapi": False},
+            transport_open=sg_io,
         )
 
     @property
@@ -174,11 +252,14 @@ class ScsiProtocol(DeviceProtocol):
 
     @property
     def is_available(self) -> bool:
+        import os
         import shutil
+        if self._backend != "sg_raw" and os.access(self._path, os.R_OK | os.W_OK):
+            return True
         return shutil.which("sg_raw") is not None
 
     def __repr__(self) -> str:
-        return f"ScsiProtocol(path={self._path!r})"
+        return f"ScsiProtocol(path={self._path!r}, backend={self._backend!r})"
 
 
 # =========================================================================
@@ -486,12 +567,14 @@ class BulkProtocol(DeviceProtocol):
 
     Wraps bulk_device.BulkDevice.  Used for GrandVision / Mjolnir Vision
     devices (87AD:70DB) that use the USBLCDNew ThreadSendDeviceData protocol.
+    ``async_transfers`` is passed through (None keeps BulkDevice's default).
     """
 
-    def __init__(self, vid: int, pid: int):
+    def __init__(self, vid: int, pid: int, async_transfers: Optional[bool] = None):
         super().__init__()
         self._vid = vid
         self._pid = pid
+        self._async_transfers = async_transfers
         self._device: Optional[Any] = None  # BulkDevice (lazy import)
         self._handshake_result: Optional[HandshakeResult] = None
         self._last_error: Optional[Exception] = None
@@ -500,7 +583,8 @@ class BulkProtocol(DeviceProtocol):
         """Lazily create and handshake the bulk device."""
         if self._device is None:
             from .device_bulk import BulkDevice
-            self._device = BulkDevice(self._vid, self._pid)
+            self._device = BulkDevice(self._vid, self._pid,
+                                      async_transfers=self._async_transfers)
             result = self._device.handshake()
             self._handshake_result = result
             if result.resolution:
@@ -624,14 +708,21 @@ class DeviceProtocolFactory:
         implementation = getattr(device_info, 'implementation', '')
 
         if protocol == 'scsi':
-            log.info("Creating ScsiProtocol for %s", device_info.path)
-            return ScsiProtocol(device_info.path)
+            from .conf import Settings
+            partial = ScsiProtocol.partial_update_for(
+                getattr(device_info, 'vid', 0), getattr(device_info, 'pid', 0))
+            log.info("Creating ScsiProtocol for %s (partial updates %s)",
+                     device_info.path, "on" if partial else "off")
+            return ScsiProtocol(device_info.path, partial_update=partial,
+                                full_refresh_s=Settings.get_scsi_full_refresh())
         elif protocol == 'bulk':
+            from .conf import Settings
             log.info("Creating BulkProtocol for %04X:%04X",
                      device_info.vid, device_info.pid)
             return BulkProtocol(
                 vid=device_info.vid,
                 pid=device_info.pid,
+                async_transfers=Settings.get_bulk_async_transfers(),
             )
         elif protocol == 'hid':
             # LED devices use a different protocol than LCD HID devices
@@ -704,8 +795,16 @@ class DeviceProtocolFactory:
         """Create the best available USB transport (pyusb preferred, hidapi fallback)."""
         from .device_hid import HIDAPI_AVAILABLE, PYUSB_AVAILABLE
         if PYUSB_AVAILABLE:
-            from .device_hid import PyUsbTransport
-            return PyUsbTransport(vid, pid)
+            from .conf import Settings
+            from .device_hid import TRANSFER_MODES, PyUsbTransport
+            mode = Settings.get_hid_transfer_mode()
+            if mode is None:
+                return PyUsbTransport(vid, pid)
+            if mode not in TRANSFER_MODES:
+                log.warning("Ignoring unknown hid_transfer_mode %r (expected one of %s)",
+                            mode, ", ".join(TRANSFER_MODES))
+                return PyUsbTransport(vid, pid)
+            return PyUsbTransport(vid, pid, transfer_mode=mode)
         elif HIDAPI_AVAILABLE:
             from .device_hid import HidApiTransport
             return HidApiTransport(vid, pid)
@@ -866,5 +965,5 @@ class ProtocolInfo:
     def has_backend(self) -> bool:
         """Whether at least one usable backend is available."""
         if self.protocol == "scsi":
-            return self.backends.get("sg_raw", False)
+            return self.backends.get("sg_raw", False) or self.backends.get("sg_io", False)
         return self.backends.get("pyusb", False) or self.backends.get("hidapi", False)
@@ -0,0 +1,387 @@
+"""Device frames — animations stored pre-encoded in an LCD's wire format.
+
+Playing a Theme.zt or video decodes, resizes, adjusts and re-encodes
+every frame for the device on every loop.  A device-frames file (.tdf)
+holds the finished payloads instead — RGB565 in the device's byte order,
+or JPEG for bulk devices — plus a per-frame delay table.  Playback maps
+the file and hands each frame to the transport as a memoryview slice
+of the mapping, with no decode, encode or copy in Python.
+
+File layout (little-endian):
+
+    header   magic 'TRDF', version, width, height, rotation, brightness,
+             encoding, protocol, frame count, source size + mtime_ns,
+             context digest (mask and other render inputs)
+    table    frame_count x (offset u64, size u32, delay_ms u32)
+    frames   payloads, back to back
+
+A file is *current* for a source animation when the source's size and
+mtime match and it was encoded with the same FrameFormat and context.
+
+Cache entries are large (a 480x480 RGB565 loop is well over 100 MB) and
+a new one is made for every mask, brightness and rotation, so the cache
+directory is kept under a quota by evicting least recently used entries
+(a hit bumps the entry's mtime), like the transcode cache.
+
+Classes:
+    FrameFormat   — what the payloads were encoded for
+    DeviceFrames  — mmap reader (frames as memoryviews, previews as PIL)
+"""
+from __future__ import annotations
+
+import hashlib
+import io
+import logging
+import mmap
+import os
+import struct
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from .data_repository import USER_CONFIG_DIR
+
+log = logging.getLogger(__name__)
+
+CACHE_DIR = os.path.join(USER_CONFIG_DIR, 'cache', 'device-frames')
+SUFFIX = '.tdf'
+DEFAULT_QUOTA = 1024 * 1024 * 1024
+
+_MAGIC = b'TRDF'
+_VERSION = 1
+_HEADER = struct.Struct('<4sHHHHHB8sIQQ20s')
+_ENTRY = struct.Struct('<QII')
+_ENCODINGS = ('rgb565-be', 'rgb565-le', 'jpeg')
+
+
+@dataclass(frozen=True)
+class FrameFormat:
+    """Device payload format: resolution, encoding and pre-applied adjustments."""
+    width: int
+    height: int
+    encoding: str = 'rgb565-be'   # rgb565-be, rgb565-le or jpeg
+    protocol: str = 'scsi'
+    rotation: int = 0
+    brightness: int = 100
+
+    def __post_init__(self) -> None:
+        if self.encoding not in _ENCODINGS:
+            raise ValueError(f"unknown frame encoding {self.encoding!r}")
+
+    @classmethod
+    def for_device(cls, protocol: str, resolution: tuple[int, int],
+                   byte_order: str = '>', rotation: int = 0,
+                   brightness: int = 100) -> FrameFormat:
+        """Format a device expects: JPEG for bulk, RGB565 in *byte_order* otherwise."""
+        if protocol == 'bulk':
+            encoding = 'jpeg'
+        else:
+            encoding = 'rgb565-be' if byte_order == '>' else 'rgb565-le'
+        return cls(resolution[0], resolution[1], encoding, protocol,
+                   rotation, brightness)
+
+    @property
+    def frame_bytes(self) -> Optional[int]:
+        """Fixed payload size for RGB565 (None for JPEG)."""
+        if self.encoding == 'jpeg':
+            return None
+        return self.width * self.height * 2
+
+
+def context_digest(*parts: Any) -> bytes:
+    """20-byte digest of extra render inputs (e.g. mask bytes and position)."""
+    h = hashlib.sha1()
+    for part in parts:
+        if isinstance(part, (bytes, bytearray, memoryview)):
+            h.update(part)
+        else:
+            h.update(repr(part).encode())
+        h.update(b'\0')
+    return h.digest()
+
+
+def cache_path(source: str | os.PathLike, fmt: FrameFormat,
+               context: bytes = b'') -> str:
+    """Cache file for *source* encoded as *fmt* under *context*.
+
+    Keyed by the source's name, size and mtime rather than its path, so
+    copies (the display working directory) share one cache entry.
+    """
+    st = os.stat(source)
+    key = context_digest(os.path.basename(source), st.st_size, st.st_mtime_ns,
+                         fmt, context).hex()[:24]
+    return os.path.join(CACHE_DIR, f'{key}{SUFFIX}')
+
+
+def sibling_path(source: str | os.PathLike) -> str:
+    """Device-frames file shipped next to a source (Theme.zt → Theme.tdf)."""
+    root, _ = os.path.splitext(os.fspath(source))
+    return root + SUFFIX
+
+
+# =========================================================================
+# Cache quota
+# =========================================================================
+
+def cache_entries(cache_dir: Optional[str] = None) -> list[tuple[str, int, float]]:
+    """(path, bytes, mtime) of every cache entry, least recently used first."""
+    cache_dir = cache_dir or CACHE_DIR
+    result = []
+    try:
+        names = os.listdir(cache_dir)
+    except OSError:
+        return []
+    for name in names:
+        if not name.endswith(SUFFIX):
+            continue
+        path = os.path.join(cache_dir, name)
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        result.append((path, st.st_size, st.st_mtime))
+    result.sort(key=lambda e: e[2])
+    return result
+
+
+def prune_cache(quota_bytes: int = DEFAULT_QUOTA, keep: Optional[str] = None,
+                cache_dir: Optional[str] = None) -> tuple[int, int]:
+    """Evict least recently used cache entries until under *quota_bytes*.
+
+    *keep* (the entry just written) is never evicted.  Returns
+    (entries removed, bytes freed).
+    """
+    entries = cache_entries(cache_dir)
+    total = sum(size for _, size, _ in entries)
+    removed = freed = 0
+    for path, size, _ in entries:
+        if total <= quota_bytes:
+            break
+        if path == keep:
+            continue
+        try:
+            os.unlink(path)
+        except OSError as e:
+            log.debug("Device frames cache: can't remove %s: %s", path, e)
+            continue
+        total -= size
+        removed += 1
+        freed += size
+    if removed:
+        log.info("Device frames cache: evicted %d entries (%d KB)",
+                 removed, freed // 1024)
+    return removed, freed
+
+
+# =========================================================================
+# Writing
+# =========================================================================
+
+def write_device_frames(path: str | os.PathLike, fmt: FrameFormat,
+                        frames: Iterable[bytes], delays: Sequence[int],
+                        source: str | os.PathLike | None = None,
+                        context: bytes = b'') -> int:
+    """Write pre-encoded *frames* (one per entry in *delays*) atomically.
+
+    *source* records the animation the frames were made from, so readers
+    can tell when it changed.  Returns the number of frames written.
+    """
+    count = len(delays)
+    source_size = source_mtime = 0
+    if source is not None:
+        st = os.stat(source)
+        source_size, source_mtime = st.st_size, st.st_mtime_ns
+    header = _HEADER.pack(
+        _MAGIC, _VERSION, fmt.width, fmt.height, fmt.rotation, fmt.brightness,
+        _ENCODINGS.index(fmt.encoding), fmt.protocol.encode()[:8], count,
+        source_size, source_mtime, context.ljust(20, b'\0')[:20])
+
+    path = os.fspath(path)
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp = f'{path}.{os.getpid()}.tmp'
+    table = bytearray(_ENTRY.size * count)
+    written = 0
+    try:
+        with open(tmp, 'wb') as f:
+            f.write(header)
+            f.write(table)  # Filled in once the payload sizes are known
+            offset = len(header) + len(table)
+            for data in frames:
+                if written == count:
+                    raise ValueError(f"more frames than the {count} delays")
+                size = len(data)
+                if fmt.frame_bytes and size != fmt.frame_bytes:
+                    raise ValueError(
+                        f"frame {written} is {size} bytes, expected {fmt.frame_bytes}")
+                f.write(data)
+                _ENTRY.pack_into(table, written * _ENTRY.size,
+                                 offset, size, max(1, int(delays[written])))
+                offset += size
+                written += 1
+            if written != count:
+                raise ValueError(f"got {written} frames for {count} delays")
+            f.seek(len(header))
+            f.write(table)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+    return written
+
+
+# =========================================================================
+# Reading
+# =========================================================================
+
+class _Previews(Sequence):
+    """PIL previews of a DeviceFrames file, decoded from the payloads on access."""
+
+    def __init__(self, owner: DeviceFrames) -> None:
+        self._owner = owner
+
+    def __len__(self) -> int:
+        return self._owner.frame_count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return self._owner.preview(index)
+
+
+class DeviceFrames:
+    """Memory-mapped device-frames file.
+
+    ``frame(i)`` returns a zero-copy memoryview of payload *i*, valid until
+    close().  ``frames`` is a sequence of PIL previews (what the device
+    shows), so MediaService can play the file like any other animation.
+    """
+
+    def __init__(self, path: str | os.PathLike) -> None:
+        self.path = os.fspath(path)
+        with open(self.path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < _HEADER.size:
+                raise ValueError(f"{self.path}: not a device-frames file")
+            self._mm: Optional[mmap.mmap] = mmap.mmap(
+                f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._parse(size)
+        except (ValueError, struct.error):
+            self._mm.close()
+            raise
+        self._view: Optional[memoryview] = memoryview(self._mm)
+        self.frames = _Previews(self)
+
+    def _parse(self, size: int) -> None:
+        assert self._mm is not None
+        (magic, version, width, height, rotation, brightness, encoding,
+         protocol, count, self.source_size, self.source_mtime_ns,
+         self.context) = _HEADER.unpack_from(self._mm, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"{self.path}: not a version {_VERSION} device-frames file")
+        if encoding >= len(_ENCODINGS):
+            raise ValueError(f"{self.path}: unknown encoding {encoding}")
+        self.format = FrameFormat(width, height, _ENCODINGS[encoding],
+                                  protocol.rstrip(b'\0').decode(), rotation, brightness)
+        table_end = _HEADER.size + count * _ENTRY.size
+        if table_end > size:
+            raise ValueError(f"{self.path}: truncated frame table")
+        self._offsets: list[int] = []
+        self._sizes: list[int] = []
+        self.delays: list[int] = []
+        for offset, length, delay in _ENTRY.iter_unpack(self._mm[_HEADER.size:table_end]):
+            if offset < table_end or offset + length > size:
+                raise ValueError(f"{self.path}: frame outside the file")
+            self._offsets.append(offset)
+            self._sizes.append(length)
+            self.delays.append(delay)
+
+    @classmethod
+    def find(cls, source: str | os.PathLike, fmt: FrameFormat,
+             context: bytes = b'') -> Optional[DeviceFrames]:
+        """Open a current device-frames file for *source*, if one exists.
+
+        Looks next to the source (Theme.tdf beside Theme.zt) and then in
+        the cache directory.
+        """
+        try:
+            st = os.stat(source)
+        except OSError:
+            return None
+        for path in (sibling_path(source), cache_path(source, fmt, context)):
+            if not os.path.exists(path):
+                continue
+            try:
+                frames = cls(path)
+            except (OSError, ValueError) as e:
+                log.debug("Ignoring device frames %s: %s", path, e)
+                continue
+            if frames.is_current(st, fmt, context):
+                if path != sibling_path(source):
+                    try:
+                        os.utime(path)  # Most recently used
+                    except OSError:
+                        pass
+                return frames
+            frames.close()
+        return None
+
+    def is_current(self, source_stat: os.stat_result, fmt: FrameFormat,
+                   context: bytes = b'') -> bool:
+        """Made from this source version, for *fmt*, under *context*?"""
+        return (self.source_size == source_stat.st_size
+                and self.source_mtime_ns == source_stat.st_mtime_ns
+                and self.format == fmt
+                and self.context == context.ljust(20, b'\0')[:20])
+
+    @property
+    def frame_count(self) -> int:
+        return len(self._offsets)
+
+    @property
+    def fps(self) -> float:
+        if not self.delays:
+            return 24.0
+        return 1000.0 * len(self.delays) / sum(self.delays)
+
+    def frame(self, index: int) -> memoryview:
+        """Payload of frame *index* as a view into the mapping (no copy)."""
+        if self._view is None:
+            raise ValueError("device frames file is closed")
+        start = self._offsets[index]
+        return self._view[start:start + self._sizes[index]]
+
+    def preview(self, index: int) -> Any:
+        """PIL image of frame *index* as the device displays it."""
+        from PIL import Image
+
+        data = self.frame(index)
+        fmt = self.format
+        if fmt.encoding == 'jpeg':
+            with Image.open(io.BytesIO(data)) as img:
+                return img.convert('RGB')
+        import numpy as np
+
+        dtype = '>u2' if fmt.encoding == 'rgb565-be' else '<u2'
+        pixels = np.frombuffer(data, dtype=dtype).reshape(fmt.height, fmt.width)
+        rgb = np.empty((fmt.height, fmt.width, 3), dtype=np.uint8)
+        rgb[..., 0] = (pixels >> 11) << 3
+        rgb[..., 1] = ((pixels >> 5) & 0x3F) << 2
+        rgb[..., 2] = (pixels & 0x1F) << 3
+        return Image.fromarray(rgb, 'RGB')
+
+    def close(self) -> None:
+        """Release the mapping (deferred while frame views are still alive)."""
+        view, self._view = self._view, None
+        mm, self._mm = self._mm, None
+        if view is not None:
+            view.release()
+        if mm is not None:
+            try:
+                mm.close()
+            except BufferError:
+                pass  # A sent frame's view is still referenced; GC unmaps it
+        self._offsets, self._sizes = [], []
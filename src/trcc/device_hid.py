@@ -13,15 +13,24 @@ The ``UsbTransport`` ABC abstracts the raw USB I/O so that:
   • ``PyUsbTransport`` provides real USB via pyusb (libusb backend).
   • ``HidApiTransport`` provides an alternative via HIDAPI.
 
+Type 2 frames were written in 512-byte pieces, one synchronous libusb
+round trip each (as TRCC does on Windows).  ``PyUsbTransport`` now has a
+transfer mode: those 512-byte writes (``TRANSFER_CHUNKED``, the default),
+the whole padded frame as one bulk transfer or a few large ones, or libusb
+asynchronous transfers with several in flight.  Select the others with
+``hid_transfer_mode`` in config.json.
+
 Linux dependencies (install one):
   • pyusb:  ``pip install pyusb``  (needs libusb1 — ``apt install libusb-1.0-0``)
   • hidapi: ``pip install hidapi`` (needs libhidapi — ``apt install libhidapi-dev``)
 """
 
+import ctypes
 import logging
 import struct
 import time
 from abc import ABC, abstractmethod
+from collections import deque
 from dataclasses import dataclass
 from typing import Any, Optional, Set
 
@@ -33,6 +42,7 @@ from .core.models import (
     fbl_to_resolution,
     pm_to_fbl,
 )
+from .libusb_async import LibusbTransfers
 
 # hidapi is optional ([hid] extra)
 try:
@@ -104,6 +114,12 @@ DELAY_FRAME_TYPE3_S = 0.0    # Type 3 has no inter-frame delay (write+ACK is blo
 USB_CONFIGURATION = 1
 USB_INTERFACE = 0
 
+# Frame transfer modes (PyUsbTransport.write_frame)
+TRANSFER_CHUNKED = 'chunked'  # 512-byte synchronous writes (C# ThreadSendDeviceData2)
+TRANSFER_SINGLE = 'single'    # Whole frame, or transfer_size pieces, per write
+TRANSFER_ASYNC = 'async'      # transfer_size pieces, several in flight (libusb async)
+TRANSFER_MODES = (TRANSFER_CHUNKED, TRANSFER_SINGLE, TRANSFER_ASYNC)
+
 
 
 # _PM_TO_FBL_OVERRIDES, fbl_to_resolution, pm_to_fbl imported from core.models
@@ -186,7 +202,12 @@ class HidHandshakeInfo(HandshakeResult):
 # =========================================================================
 
 class UsbTransport(ABC):
-    """Abstract USB bulk transport — mockable for testing."""
+    """Abstract USB bulk transport — mockable for testing.
+
+    Transports that can move more than 512 bytes per transfer may also
+    provide ``write_frame(endpoint, packet, timeout) -> int``; Type 2
+    frames go through it instead of 512-byte ``write()`` calls.
+    """
 
     @abstractmethod
     def open(self) -> None:
@@ -226,6 +247,26 @@ def _ceil_to_512(n: int) -> int:
     )
 
 
+def frame_transfers(packet: Any, transfer_size: int) -> list:
+    """Split a padded frame *packet* into bulk transfers (memoryview slices).
+
+    *transfer_size* is rounded up to a multiple of 512 so that only the
+    last transfer can end in a short packet.
+    """
+    size = _ceil_to_512(max(1, transfer_size))
+    view = memoryview(packet)
+    return [view[offset:offset + size] for offset in range(0, len(view), size)]
+
+
+def _transfer_timeout(timeout: int, nbytes: int) -> int:
+    """Timeout for one transfer of *nbytes*: *timeout* plus 1 ms per KiB.
+
+    DEFAULT_TIMEOUT_MS is sized for a 512-byte write; a full-speed link
+    moves roughly 1 KiB per millisecond.
+    """
+    return timeout + nbytes // 1024
+
+
 # =========================================================================
 # HID device base class
 # =========================================================================
@@ -442,8 +483,9 @@ class HidDeviceType2(HidDevice):
         """Send one image frame to the device.
 
         TRCC (UCDevice.cs ThreadSendDeviceData2) sends frames in 512-byte
-        chunks via UsbHidDevice.SendMessage().  We mirror that: build the
-        padded packet, then write it in 512-byte pieces.
+        chunks via UsbHidDevice.SendMessage().  Transports with a
+        ``write_frame()`` (PyUsbTransport) send the padded packet in their
+        transfer mode; others get it in 512-byte pieces, as on Windows.
 
         Args:
             image_data: Raw image bytes (JPEG or other format the
@@ -460,11 +502,15 @@ class HidDeviceType2(HidDevice):
 
         packet = self.build_frame_packet(image_data)
 
-        # C# UCDevice.cs ThreadSendDeviceData2: sends 512-byte chunks
-        total = 0
-        for offset in range(0, len(packet), USB_BULK_ALIGNMENT):
-            chunk = packet[offset:offset + USB_BULK_ALIGNMENT]
-            total += self.transport.write(EP_WRITE_02, chunk, DEFAULT_TIMEOUT_MS)
+        write_frame = getattr(self.transport, 'write_frame', None)
+        if write_frame is not None:
+            # PyUsbTransport: one large transfer, or several in flight
+            total = write_frame(EP_WRITE_02, packet, DEFAULT_TIMEOUT_MS)
+        else:
+            # C# UCDevice.cs ThreadSendDeviceData2: sends 512-byte chunks
+            total = 0
+            for chunk in frame_transfers(packet, USB_BULK_ALIGNMENT):
+                total += self.transport.write(EP_WRITE_02, chunk, DEFAULT_TIMEOUT_MS)
 
         # C#: Thread.Sleep(1) after frame transfer
         time.sleep(DELAY_FRAME_TYPE2_S)
@@ -563,12 +609,10 @@ class HidDeviceType3(HidDevice):
             + b'\x00\x00\x00\x00'
             + struct.pack('<I', TYPE3_DATA_SIZE)
         )
-        # Pad or truncate image data to fixed size
-        if len(image_data) < TYPE3_DATA_SIZE:
-            padded = image_data + b'\x00' * (TYPE3_DATA_SIZE - len(image_data))
-        else:
-            padded = image_data[:TYPE3_DATA_SIZE]
-        return prefix + padded
+        # Pad or truncate image data to fixed size (bytes + buffer also
+        # accepts a memoryview from the RGB565 encoder without a copy)
+        pad = b'\x00' * max(0, TYPE3_DATA_SIZE - len(image_data))
+        return prefix + image_data[:TYPE3_DATA_SIZE] + pad
 
     def send_frame(self, image_data: bytes) -> bool:
         """Send one image frame and read ACK.
@@ -658,6 +702,89 @@ class HidDeviceManager:
             return False
 
 
+# =========================================================================
+# libusb asynchronous bulk writes
+# =========================================================================
+
+class _LibusbAsyncWriter:
+    """Frame writes with several bulk OUT transfers in flight.
+
+    Up to ``in_flight`` transfers are submitted at once through libusb's
+    asynchronous API (see libusb_async) and their completions reaped,
+    refilling the queue until the frame is sent.
+    """
+
+    def __init__(self, transfers: LibusbTransfers, in_flight: int) -> None:
+        self._usb = transfers
+        try:
+            self._transfers = [transfers.alloc() for _ in range(max(1, in_flight))]
+        except MemoryError:
+            transfers.close()
+            raise
+        self._stranded: Optional[bytes] = None  # Frame under unreaped transfers
+
+    @classmethod
+    def for_device(cls, device: Any, in_flight: int) -> '_LibusbAsyncWriter':
+        """Writer on a pyusb device opened by the libusb1 backend."""
+        return cls(LibusbTransfers.for_device(device), in_flight)
+
+    def write(self, endpoint: int, data: bytes, transfer_size: int, timeout: int) -> int:
+        """Send *data* as *transfer_size* transfers, keeping several in flight.
+
+        Returns bytes transferred; raises usb.core.USBError on failure
+        (after every submitted transfer has completed, unless libusb
+        stopped reaping them — then the writer keeps the frame alive
+        under them and refuses further writes).
+        """
+        if self._usb.stranded:
+            raise usb.core.USBError("Async bulk writer unusable: transfers never completed")
+        data = bytes(data)
+        length = len(data)
+        base = ctypes.cast(ctypes.c_char_p(data), ctypes.c_void_p).value or 0
+        size = _ceil_to_512(max(1, transfer_size))
+        offsets = deque(range(0, length, size))
+        free = list(self._transfers)
+        in_flight: list[Any] = []
+        total = 0
+        error: Optional[str] = None
+
+        while (offsets and error is None) or in_flight:
+            while free and offsets and error is None:
+                transfer = free.pop()
+                offset = offsets.popleft()
+                rc = self._usb.submit(transfer, endpoint, base + offset,
+                                      min(size, length - offset), timeout)
+                if rc:
+                    free.append(transfer)
+                    error = f"submit failed ({rc})"
+                    break
+                in_flight.append(transfer)
+            if not in_flight:
+                break
+            completed, event_error = self._usb.handle_events(in_flight)
+            error = error or event_error
+            if self._usb.stranded:
+                self._stranded = data  # Transfers still reference it
+                raise usb.core.USBError(f"Async bulk write failed: {error}; "
+                                        f"{len(in_flight)} transfers never completed")
+            for transfer in completed:
+                in_flight.remove(transfer)
+                free.append(transfer)
+                t = transfer.contents
+                if t.status == LibusbTransfers.COMPLETED:
+                    total += t.actual_length
+                elif error is None:
+                    error = f"transfer status {t.status}"
+
+        if error is not None:
+            raise usb.core.USBError(f"Async bulk write failed: {error}")
+        return total
+
+    def close(self) -> None:
+        self._usb.close(owner=self)
+        self._transfers = []
+
+
 # =========================================================================
 # Real transport: PyUSB  (libusb backend)
 # =========================================================================
@@ -679,10 +806,25 @@ class PyUsbTransport(UsbTransport):
     3. ClaimInterface(0)
     4. Bulk read/write to endpoints
 
+    Frames (``write_frame``) go out in ``transfer_mode``: TRANSFER_CHUNKED
+    (default) keeps the 512-byte writes of the Windows app, TRANSFER_SINGLE
+    sends the padded frame as one transfer (or ``transfer_size`` pieces),
+    TRANSFER_ASYNC queues ``transfer_size`` pieces with ``in_flight``
+    outstanding through libusb's async API (falling back to single when
+    pyusb isn't on the libusb1 backend).
+
     Requires: ``pip install pyusb`` + ``apt install libusb-1.0-0``
     """
 
-    def __init__(self, vid: int, pid: int, serial: Optional[str] = None):
+    TRANSFER_MODE = TRANSFER_CHUNKED  # Others not yet verified on every Type 2 model
+    TRANSFER_SIZE = 0                 # Single mode: bytes per transfer, 0 = whole frame
+    ASYNC_TRANSFER_SIZE = 16 * 1024   # Async mode: bytes per transfer
+    ASYNC_IN_FLIGHT = 4               # Async mode: transfers outstanding
+
+    def __init__(self, vid: int, pid: int, serial: Optional[str] = None,
+                 transfer_mode: Optional[str] = None,
+                 transfer_size: Optional[int] = None,
+                 in_flight: Optional[int] = None):
         self._vid = vid
         self._pid = pid
         self._serial = serial
@@ -692,6 +834,17 @@ class PyUsbTransport(UsbTransport):
         self._ep_out: Optional[int] = None
         self._ep_in: Optional[int] = None
 
+        self.transfer_mode = transfer_mode or self.TRANSFER_MODE
+        if self.transfer_mode not in TRANSFER_MODES:
+            raise ValueError(f"Unknown transfer mode: {self.transfer_mode!r}")
+        if transfer_size is None:
+            transfer_size = (self.ASYNC_TRANSFER_SIZE
+                             if self.transfer_mode == TRANSFER_ASYNC else self.TRANSFER_SIZE)
+        self.transfer_size = transfer_size
+        self.in_flight = in_flight or self.ASYNC_IN_FLIGHT
+        self._async: Optional[_LibusbAsyncWriter] = None
+        self._async_failed = False
+
     def open(self) -> None:
         """Find USB device, claim interface, and auto-detect endpoints.
 
@@ -746,6 +899,10 @@ class PyUsbTransport(UsbTransport):
             usbDevice.Close();
             UsbDevice.Exit();
         """
+        if self._async is not None:
+            self._async.close()
+            self._async = None
+        self._async_failed = False
         if self._device is not None:
             try:
                 usb.util.release_interface(self._device, USB_INTERFACE)  # type: ignore[union-attr]
@@ -793,6 +950,41 @@ class PyUsbTransport(UsbTransport):
         ep = self._ep_out if self._ep_out is not None else endpoint
         return self._device.write(ep, data, timeout=timeout)  # type: ignore[union-attr]
 
+    def write_frame(self, endpoint: int, packet: Any,
+                    timeout: int = DEFAULT_TIMEOUT_MS) -> int:
+        """Write one padded frame packet in ``transfer_mode``.
+
+        *timeout* is per 512 bytes; larger transfers get 1 ms per KiB on
+        top.  Returns bytes transferred.
+        """
+        if not self._is_open or self._device is None:
+            raise RuntimeError("Transport not open")
+        mode = self.transfer_mode
+        if mode == TRANSFER_CHUNKED:
+            return sum(self.write(endpoint, chunk, timeout)
+                       for chunk in frame_transfers(packet, USB_BULK_ALIGNMENT))
+
+        if mode == TRANSFER_ASYNC:
+            writer = self._async_writer()
+            if writer is not None:
+                size = self.transfer_size or self.ASYNC_TRANSFER_SIZE
+                ep = self._ep_out if self._ep_out is not None else endpoint
+                return writer.write(ep, packet, size, _transfer_timeout(timeout, size))
+
+        size = self.transfer_size or len(packet)
+        return sum(self.write(endpoint, chunk, _transfer_timeout(timeout, len(chunk)))
+                   for chunk in frame_transfers(packet, size))
+
+    def _async_writer(self) -> Optional[_LibusbAsyncWriter]:
+        """Async writer for the open device, or None (single transfers)."""
+        if self._async is None and not self._async_failed:
+            try:
+                self._async = _LibusbAsyncWriter.for_device(self._device, self.in_flight)
+            except Exception as e:
+                log.warning("Async USB transfers unavailable (%s); using single transfers", e)
+                self._async_failed = True
+        return self._async
+
     def read(self, endpoint: int, length: int, timeout: int = DEFAULT_TIMEOUT_MS) -> bytes:
         """Bulk read — uses auto-detected IN endpoint when available.
 
@@ -0,0 +1,200 @@
+"""
+USB hotplug monitor — device add/remove events instead of polling.
+
+Listens for kernel uevents and reports the ones that matter to TRCC:
+
+  • ``usb``/``usb_device`` add/remove for VID:PIDs in the device registries
+  • ``scsi_generic`` add/remove (the /dev/sgN node of a SCSI LCD appears
+    shortly after its USB device, so a rescan is needed then too)
+
+Backends, in order of preference:
+
+  • pyudev — udev's netlink group, delivered after udev rules ran (device
+    nodes exist with their final permissions).  ``pip install pyudev``.
+  • netlink — raw ``NETLINK_KOBJECT_UEVENT`` socket on the kernel group.
+    No dependencies; events can arrive before udev created the node.
+
+The monitor thread blocks in the kernel between events, so an idle
+monitor costs nothing.
+"""
+
+from __future__ import annotations
+
+import logging
+import select
+import socket
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Mapping, Optional
+
+from .device_detector import DeviceDetector
+
+try:
+    import pyudev  # pyright: ignore[reportMissingImports]
+    PYUDEV_AVAILABLE = True
+except ImportError:
+    pyudev = None
+    PYUDEV_AVAILABLE = False
+
+log = logging.getLogger(__name__)
+
+_NETLINK_KOBJECT_UEVENT = 15
+_KERNEL_GROUP = 1
+_RECV_SIZE = 64 * 1024
+_STOP_POLL_S = 0.5  # How often the monitor thread checks for stop()
+
+BACKENDS = ("auto", "pyudev", "netlink")
+
+
+@dataclass
+class HotplugEvent:
+    """A relevant device appeared or went away."""
+    action: str            # "add" or "remove"
+    subsystem: str         # "usb" or "scsi_generic"
+    vid: int = 0           # 0 for scsi_generic events
+    pid: int = 0
+    name: str = ""         # sysfs name, e.g. "2-1.4" or "sg1"
+
+
+def parse_uevent(message: bytes) -> dict[str, str]:
+    """Kernel uevent datagram (``action@devpath\\0KEY=VALUE\\0...``) → dict."""
+    props: dict[str, str] = {}
+    for field in message.split(b'\0')[1:]:
+        key, sep, value = field.partition(b'=')
+        if sep:
+            props[key.decode('ascii', 'replace')] = value.decode('utf-8', 'replace')
+    return props
+
+
+def event_from_properties(props: Mapping[str, str],
+                          registry: Optional[Mapping[tuple[int, int], Any]] = None,
+                          ) -> Optional[HotplugEvent]:
+    """HotplugEvent for a uevent's properties, or None if it's irrelevant."""
+    action = props.get('ACTION')
+    if action not in ('add', 'remove'):
+        return None
+    subsystem = props.get('SUBSYSTEM')
+    name = props.get('DEVPATH', '').rsplit('/', 1)[-1]
+
+    if subsystem == 'scsi_generic':
+        return HotplugEvent(action, subsystem, name=name)
+    if subsystem != 'usb' or props.get('DEVTYPE') != 'usb_device':
+        return None
+    # PRODUCT=<vid>/<pid>/<bcdDevice>, hex without leading zeros
+    try:
+        vid_s, pid_s, _ = props.get('PRODUCT', '').split('/')
+        vid, pid = int(vid_s, 16), int(pid_s, 16)
+    except ValueError:
+        return None
+    if registry is None:
+        registry = DeviceDetector._get_all_registries()
+    if (vid, pid) not in registry:
+        return None
+    return HotplugEvent(action, subsystem, vid, pid, name)
+
+
+class HotplugMonitor:
+    """Background thread delivering HotplugEvents to *callback*.
+
+    The callback runs on the monitor thread.  ``start()`` returns False
+    when no backend can be opened (callers keep polling then).
+    """
+
+    def __init__(self, callback: Callable[[HotplugEvent], None],
+                 backend: str = "auto"):
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown hotplug backend: {backend!r}")
+        self._callback = callback
+        self._requested = backend
+        self.backend: Optional[str] = None
+        self._source: Any = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._registry = DeviceDetector._get_all_registries()
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> bool:
+        """Open the event source and start the monitor thread."""
+        if self.is_running:
+            return True
+        try:
+            self._source, self.backend = self._open()
+        except (OSError, RuntimeError) as e:
+            log.info("Hotplug monitor unavailable: %s", e)
+            return False
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="trcc-hotplug",
+                                         daemon=True)
+        self._thread.start()
+        log.info("Hotplug monitor started (%s)", self.backend)
+        return True
+
+    def stop(self) -> None:
+        """Stop the monitor thread and close the event source."""
+        self._stop.set()
+        thread, self._thread = self._thread, None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=2 * _STOP_POLL_S + 1)
+        source, self._source = self._source, None
+        if isinstance(source, socket.socket):
+            source.close()
+
+    # ------------------------------------------------------------------
+    # Backends
+    # ------------------------------------------------------------------
+
+    def _open(self) -> tuple[Any, str]:
+        if self._requested in ("auto", "pyudev") and pyudev is not None:
+            monitor = pyudev.Monitor.from_netlink(pyudev.Context())
+            monitor.filter_by('usb', 'usb_device')
+            monitor.filter_by('scsi_generic')
+            monitor.start()
+            return monitor, "pyudev"
+        if self._requested == "pyudev":
+            raise RuntimeError("pyudev not installed")
+        if not hasattr(socket, 'AF_NETLINK'):
+            raise RuntimeError("netlink sockets not supported on this platform")
+        sock = socket.socket(socket.AF_NETLINK, socket.SOCK_DGRAM,
+                             _NETLINK_KOBJECT_UEVENT)
+        try:
+            sock.bind((0, _KERNEL_GROUP))
+        except OSError:
+            sock.close()
+            raise
+        return sock, "netlink"
+
+    def _next_properties(self) -> Optional[Mapping[str, str]]:
+        """Block up to _STOP_POLL_S for the next uevent's properties."""
+        if self.backend == "pyudev":
+            device = self._source.poll(timeout=_STOP_POLL_S)
+            if device is None:
+                return None
+            props = dict(device.properties)
+            props.setdefault('ACTION', device.action or '')
+            return props
+        ready, _, _ = select.select([self._source], [], [], _STOP_POLL_S)
+        if not ready:
+            return None
+        return parse_uevent(self._source.recv(_RECV_SIZE))
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                props = self._next_properties()
+            except (OSError, ValueError) as e:
+                if not self._stop.is_set():
+                    log.warning("Hotplug monitor stopped: %s", e)
+                return
+            if props is None:
+                continue
+            event = event_from_properties(props, self._registry)
+            if event is None:
+                continue
+            log.debug("Hotplug: %s", event)
+            try:
+                self._callback(event)
+            except Exception:
+                log.exception("Hotplug callback failed")
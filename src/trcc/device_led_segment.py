@@ -126,6 +126,20 @@ class SegmentDisplay(ABC):
             return "gpu"
         return "other"
 
+    # Metric keys read by styles without PHASES (same in every phase)
+    METRICS: Tuple[str, ...] = ()
+
+    def phase_metrics(self, phase: int) -> Tuple[str, ...]:
+        """Return the metric keys ``compute_mask()`` reads in *phase*.
+
+        Derived from the string entries of PHASES; styles without PHASES
+        return METRICS.
+        """
+        phases = getattr(self, 'PHASES', None)
+        if not phases:
+            return self.METRICS
+        return tuple(v for v in phases[phase % len(phases)] if isinstance(v, str))
+
     # ── Temperature conversion ────────────────────────────────────
 
     @staticmethod
@@ -336,6 +350,7 @@ class PA120Display(SegmentDisplay):
     BFB = 6                  # % (CPU side)
     SSD1, HSD1 = 7, 8       # °C, °F (GPU side)
     BFB1 = 9                 # % (GPU side)
+    METRICS = ('cpu_temp', 'cpu_percent', 'gpu_temp', 'gpu_usage')
 
     CPU_TEMP_DIGITS: Tuple[Tuple[int, ...], ...] = (
         (10, 11, 12, 13, 14, 15, 16),
@@ -683,6 +698,7 @@ class LF10Display(SegmentDisplay):
     GPU1 = 3
     SSD1 = 4      # °C (GPU)
     HSD1 = 5      # °F (GPU)
+    METRICS = ('cpu_temp', 'gpu_temp')
 
     DIGIT_LEDS_13: Tuple[Tuple[int, ...], ...] = (
         tuple(range(6, 19)),     # Digit 1: CPU temp hundreds (13 LEDs)
@@ -7,15 +7,31 @@ This module provides those two functions.
 SCSI send protocol is inlined here (from trcc_handshake_v2) so everything
 lives in one place under src/trcc/.  LCDDriver is used only for resolution
 auto-detection during device discovery.
+
+The ``ScsiTransport`` ABC abstracts the raw CDB I/O so that:
+  • ``SgIoTransport`` issues CDBs in-process via the SG_IO ioctl on a
+    persistent ``/dev/sgN`` handle (no fork, no temp file per chunk).
+  • Tests can inject a fake transport (no real hardware needed).
+  • Paths with no registered transport fall back to ``sg_raw`` subprocesses.
+
+Each 64 KiB frame chunk is its own command (chunk index in the command
+word), so with partial updates enabled only chunks that differ from the
+last frame written to the device are sent — plus a full frame after
+init and every ``_FULL_REFRESH_SECONDS``.  Off unless the device model
+is known to accept it (see ``DeviceEntry.partial_update``).
 """
 
 import binascii
+import ctypes
+import fcntl
 import logging
+import os
 import struct
 import subprocess
 import tempfile
 import time
-from typing import Dict, List, Set
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Set, Tuple
 
 from .core.models import RESOLUTION_TO_PM as _RESOLUTION_TO_PM
 from .core.models import HandshakeResult, fbl_to_resolution
@@ -33,6 +49,160 @@ _POST_INIT_DELAY = 0.1
 # Base command for frame data chunks; chunk index goes in bits [27:24]
 _FRAME_CMD_BASE = 0x101F5
 _CHUNK_SIZE = 0x10000  # 64 KiB per chunk (except possibly the last)
+# Partial updates: rewrite every chunk at least this often
+_FULL_REFRESH_SECONDS = 10.0
+
+# SG_IO ioctl (from <scsi/sg.h>)
+_SG_IO = 0x2285
+_SG_DXFER_TO_DEV = -2
+_SG_DXFER_FROM_DEV = -3
+_SG_INFO_OK_MASK = 0x1
+_SG_INFO_OK = 0x0
+_SG_TIMEOUT_MS = 10000  # Same budget as the sg_raw subprocess timeout
+_SG_SENSE_SIZE = 32
+
+
+# =========================================================================
+# SCSI transports
+# =========================================================================
+
+
+class _SgIoHdr(ctypes.Structure):
+    """``struct sg_io_hdr`` from <scsi/sg.h> (interface_id 'S')."""
+    _fields_ = [
+        ('interface_id', ctypes.c_int),
+        ('dxfer_direction', ctypes.c_int),
+        ('cmd_len', ctypes.c_ubyte),
+        ('mx_sb_len', ctypes.c_ubyte),
+        ('iovec_count', ctypes.c_ushort),
+        ('dxfer_len', ctypes.c_uint),
+        ('dxferp', ctypes.c_void_p),
+        ('cmdp', ctypes.c_void_p),
+        ('sbp', ctypes.c_void_p),
+        ('timeout', ctypes.c_uint),
+        ('flags', ctypes.c_uint),
+        ('pack_id', ctypes.c_int),
+        ('usr_ptr', ctypes.c_void_p),
+        ('status', ctypes.c_ubyte),
+        ('masked_status', ctypes.c_ubyte),
+        ('msg_status', ctypes.c_ubyte),
+        ('sb_len_wr', ctypes.c_ubyte),
+        ('host_status', ctypes.c_ushort),
+        ('driver_status', ctypes.c_ushort),
+        ('resid', ctypes.c_int),
+        ('duration', ctypes.c_uint),
+        ('info', ctypes.c_uint),
+    ]
+
+
+class ScsiTransport(ABC):
+    """Abstract SCSI CDB transport — mockable for testing."""
+
+    @abstractmethod
+    def open(self) -> None:
+        """Open the SCSI generic device."""
+
+    @abstractmethod
+    def close(self) -> None:
+        """Release the device handle."""
+
+    @abstractmethod
+    def read(self, cdb: bytes, length: int) -> bytes:
+        """Issue a data-in CDB.  Returns data read (empty on failure)."""
+
+    @abstractmethod
+    def write(self, cdb: bytes, data) -> bool:
+        """Issue a data-out CDB with *data* as payload.  Returns success."""
+
+    @property
+    @abstractmethod
+    def is_open(self) -> bool:
+        """Whether the device handle is currently open."""
+
+
+class SgIoTransport(ScsiTransport):
+    """In-process SCSI transport via the Linux SG_IO ioctl.
+
+    Keeps one ``/dev/sgN`` file descriptor open and reuses a single
+    64 KiB payload buffer, so each frame chunk costs one ioctl instead of
+    a fork/exec of ``sg_raw`` plus a temp file.
+    """
+
+    def __init__(self, device_path: str):
+        self.device_path = device_path
+        self._fd: Optional[int] = None
+        self._buf = bytearray(max(_CHUNK_SIZE, 0xE100))
+        self._buf_c = (ctypes.c_char * len(self._buf)).from_buffer(self._buf)
+        self._cdb = (ctypes.c_ubyte * 16)()
+        self._sense = (ctypes.c_ubyte * _SG_SENSE_SIZE)()
+
+    def open(self) -> None:
+        if self._fd is None:
+            self._fd = os.open(self.device_path, os.O_RDWR | os.O_NONBLOCK)
+            log.debug("SG_IO transport opened %s (fd=%d)", self.device_path, self._fd)
+
+    def close(self) -> None:
+        if self._fd is not None:
+            try:
+                os.close(self._fd)
+            except OSError:
+                pass
+            self._fd = None
+
+    @property
+    def is_open(self) -> bool:
+        return self._fd is not None
+
+    def _ensure_buffer(self, size: int) -> None:
+        if size > len(self._buf):
+            self._buf = bytearray(size)
+            self._buf_c = (ctypes.c_char * size).from_buffer(self._buf)
+
+    def _ioctl(self, cdb: bytes, direction: int, length: int) -> bool:
+        """Run one SG_IO request against the shared payload buffer."""
+        self.open()
+        assert self._fd is not None
+        cmd_len = min(len(cdb), 16)
+        ctypes.memmove(self._cdb, bytes(cdb[:cmd_len]), cmd_len)
+
+        hdr = _SgIoHdr()
+        hdr.interface_id = ord('S')
+        hdr.dxfer_direction = direction
+        hdr.cmd_len = cmd_len
+        hdr.mx_sb_len = _SG_SENSE_SIZE
+        hdr.dxfer_len = length
+        hdr.dxferp = ctypes.addressof(self._buf_c)
+        hdr.cmdp = ctypes.addressof(self._cdb)
+        hdr.sbp = ctypes.addressof(self._sense)
+        hdr.timeout = _SG_TIMEOUT_MS
+
+        try:
+            fcntl.ioctl(self._fd, _SG_IO, hdr)
+        except OSError:
+            # Device unplugged or reset — reopen on next request
+            self.close()
+            raise
+
+        if (hdr.info & _SG_INFO_OK_MASK) != _SG_INFO_OK:
+            log.debug("SG_IO %s failed: status=0x%02x host=0x%04x driver=0x%04x",
+                      self.device_path, hdr.status, hdr.host_status, hdr.driver_status)
+            return False
+        return True
+
+    def read(self, cdb: bytes, length: int) -> bytes:
+        self._ensure_buffer(length)
+        if not self._ioctl(cdb, _SG_DXFER_FROM_DEV, length):
+            return b''
+        return bytes(self._buf[:length])
+
+    def write(self, cdb: bytes, data) -> bool:
+        size = len(data)
+        self._ensure_buffer(size)
+        self._buf[:size] = data
+        return self._ioctl(cdb, _SG_DXFER_TO_DEV, size)
+
+    def __repr__(self) -> str:
+        return f"SgIoTransport(path={self.device_path!r}, open={self.is_open})"
 
 
 # =========================================================================
@@ -41,15 +211,25 @@ _CHUNK_SIZE = 0x10000  # 64 KiB per chunk (except possibly the last)
 
 
 class ScsiDevice:
-    """SCSI LCD device handler wrapping sg_raw subprocess calls."""
+    """SCSI LCD device handler.
+
+    CDBs go through the ``ScsiTransport`` registered for the device path
+    (see ``register_transport``); unregistered paths use sg_raw subprocesses.
+    """
 
     # Track which devices have been initialized (poll + init sent)
     _initialized_devices: Set[str] = set()
+    # Persistent transports by device path (absent = sg_raw fallback)
+    _transports: Dict[str, ScsiTransport] = {}
+    # Last frame written per device path (partial updates): (frame, full write time)
+    _last_frames: Dict[str, Tuple[bytes, float]] = {}
 
-    def __init__(self, device_path: str, width: int = 320, height: int = 320):
+    def __init__(self, device_path: str, width: int = 320, height: int = 320,
+                 partial_update: bool = False):
         self.device_path = device_path
         self.width = width
         self.height = height
+        self.partial_update = partial_update
         self._initialized = False
 
     # --- Low-level SCSI helpers (Mode 3 protocol) ---
@@ -87,9 +267,27 @@ class ScsiDevice:
         crc = ScsiDevice._crc32(header_16)
         return header_16 + struct.pack('<I', crc)
 
+    @staticmethod
+    def register_transport(dev: str, transport: ScsiTransport) -> None:
+        """Route all CDBs for *dev* through *transport* instead of sg_raw."""
+        old = ScsiDevice._transports.get(dev)
+        if old is not None and old is not transport:
+            old.close()
+        ScsiDevice._transports[dev] = transport
+
+    @staticmethod
+    def unregister_transport(dev: str) -> None:
+        """Close and drop the transport for *dev* (reverts to sg_raw)."""
+        transport = ScsiDevice._transports.pop(dev, None)
+        if transport is not None:
+            transport.close()
+
     @staticmethod
     def _scsi_read(dev: str, cdb: bytes, length: int) -> bytes:
-        """Execute SCSI READ via sg_raw."""
+        """Execute SCSI READ via the registered transport, else sg_raw."""
+        transport = ScsiDevice._transports.get(dev)
+        if transport is not None:
+            return transport.read(cdb, length)
         SysUtils.require_sg_raw()
         cdb_hex = ' '.join(f'{b:02x}' for b in cdb)
         cmd = ['sg_raw', '-r', str(length), dev] + cdb_hex.split()
@@ -98,7 +296,10 @@ class ScsiDevice:
 
     @staticmethod
     def _scsi_write(dev: str, header: bytes, data: bytes) -> bool:
-        """Execute SCSI WRITE via sg_raw with temp file for payload."""
+        """Execute SCSI WRITE via the registered transport, else sg_raw with temp file."""
+        transport = ScsiDevice._transports.get(dev)
+        if transport is not None:
+            return transport.write(header[:16], data)
         SysUtils.require_sg_raw()
         cdb_hex = ' '.join(f'{b:02x}' for b in list(header[:16]))
 
@@ -150,18 +351,49 @@ class ScsiDevice:
         return fbl
 
     @staticmethod
-    def _send_frame(dev: str, rgb565_data: bytes, width: int = 320, height: int = 320):
-        """Send one RGB565 frame in SCSI chunks sized for the resolution."""
+    def _send_frame(dev: str, rgb565_data: bytes, width: int = 320, height: int = 320,
+                    partial: bool = False,
+                    full_refresh_s: float = _FULL_REFRESH_SECONDS) -> int:
+        """Send one RGB565 frame in SCSI chunks sized for the resolution.
+
+        With *partial*, chunks identical to the last frame written to
+        *dev* are skipped unless a full refresh is due (first frame, size
+        change, or *full_refresh_s* elapsed).  Returns chunks written;
+        raises OSError if a chunk write fails.
+        """
         chunks = ScsiDevice._get_frame_chunks(width, height)
         total_size = sum(size for _, size in chunks)
         if len(rgb565_data) < total_size:
-            rgb565_data += b'\x00' * (total_size - len(rgb565_data))
-
-        offset = 0
+            rgb565_data = bytes(rgb565_data) + b'\x00' * (total_size - len(rgb565_data))
+
+        last: Optional[bytes] = None
+        now = time.monotonic()
+        if partial:
+            # Snapshot: the caller may reuse its buffer for the next frame
+            rgb565_data = bytes(rgb565_data[:total_size])
+            last, refreshed_at = ScsiDevice._last_frames.get(dev, (None, 0.0))
+            if last is None or len(last) != total_size or now - refreshed_at >= full_refresh_s:
+                last, refreshed_at = None, now
+
+        # memoryview slices avoid copying each 64 KiB chunk out of the frame;
+        # startswith() compares a chunk in place (memcmp, no slice copies)
+        view = memoryview(rgb565_data)
+        last_view = memoryview(last) if last is not None else None
+        offset = written = 0
         for cmd, size in chunks:
-            header = ScsiDevice._build_header(cmd, size)
-            ScsiDevice._scsi_write(dev, header, rgb565_data[offset:offset + size])
-            offset += size
+            end = offset + size
+            if last_view is None or not rgb565_data.startswith(last_view[offset:end], offset):
+                header = ScsiDevice._build_header(cmd, size)
+                if not ScsiDevice._scsi_write(dev, header, view[offset:end]):
+                    ScsiDevice._last_frames.pop(dev, None)  # Screen state unknown
+                    raise OSError(f"SCSI write of frame chunk {cmd >> 24} failed")
+                written += 1
+            offset = end
+
+        if partial:
+            ScsiDevice._last_frames[dev] = (rgb565_data, refreshed_at)
+            log.debug("SCSI partial update %s: %d/%d chunks", dev, written, len(chunks))
+        return written
 
     # --- Instance methods ---
 
@@ -172,6 +404,7 @@ class ScsiDevice:
         the actual LCD resolution via fbl_to_resolution().
         """
         fbl = ScsiDevice._init_device(self.device_path)
+        ScsiDevice._last_frames.pop(self.device_path, None)
         resolution = fbl_to_resolution(fbl)
         self.width, self.height = resolution
         self._initialized = True
@@ -181,13 +414,20 @@ class ScsiDevice:
         """Send one RGB565 frame."""
         if not self._initialized:
             self.handshake()
-        ScsiDevice._send_frame(self.device_path, rgb565_data, self.width, self.height)
+        try:
+            ScsiDevice._send_frame(self.device_path, rgb565_data, self.width, self.height,
+                                   partial=self.partial_update)
+        except OSError as e:
+            log.error("SCSI send failed (%s): %s", self.device_path, e)
+            return False
         return True
 
     def close(self) -> None:
-        """Mark as uninitialized (no persistent resources to release)."""
+        """Mark as uninitialized and release any persistent transport."""
         self._initialized = False
         ScsiDevice._initialized_devices.discard(self.device_path)
+        ScsiDevice._last_frames.pop(self.device_path, None)
+        ScsiDevice.unregister_transport(self.device_path)
 
 
 # =========================================================================
@@ -318,6 +558,8 @@ def send_image_to_device(
     rgb565_data: bytes,
     width: int,
     height: int,
+    partial: bool = False,
+    full_refresh_s: float = _FULL_REFRESH_SECONDS,
 ) -> bool:
     """Send RGB565 image data to an LCD device via SCSI.
 
@@ -329,6 +571,8 @@ def send_image_to_device(
         rgb565_data: Raw RGB565 pixel bytes (big-endian, width*height*2 bytes)
         width: Image width in pixels
         height: Image height in pixels
+        partial: Only write chunks that changed since the last frame
+        full_refresh_s: With *partial*, rewrite all chunks this often
 
     Returns:
         True if the send succeeded.
@@ -337,11 +581,14 @@ def send_image_to_device(
         if device_path not in ScsiDevice._initialized_devices:
             ScsiDevice._init_device(device_path)
             ScsiDevice._initialized_devices.add(device_path)
+            ScsiDevice._last_frames.pop(device_path, None)  # Full frame after init
 
-        ScsiDevice._send_frame(device_path, rgb565_data, width, height)
+        ScsiDevice._send_frame(device_path, rgb565_data, width, height,
+                               partial=partial, full_refresh_s=full_refresh_s)
         return True
     except Exception as e:
         log.error("SCSI send failed (%s): %s", device_path, e)
         # Allow re-init on next attempt
         ScsiDevice._initialized_devices.discard(device_path)
+        ScsiDevice._last_frames.pop(device_path, None)
         return False
@@ -0,0 +1,139 @@
+"""
+libusb asynchronous bulk transfers on a pyusb device.
+
+pyusb only offers synchronous transfers, so each one waits for the
+previous to complete and the endpoint idles in between.  LibusbTransfers
+drives the libusb handle pyusb's libusb1 backend opened through libusb's
+asynchronous API instead: callers allocate transfers, submit slices of
+their own buffers and reap completions with ``handle_events()``.
+
+Used by the HID Type 2 writer (device_hid) and the bulk frame sender
+(device_bulk); both keep several transfers in flight per frame.
+
+``libusb_handle_events()`` failures are bounded: after MAX_EVENT_ERRORS
+in a row the caller's in-flight transfers are cancelled, and if even
+those are never reaped the helper is *stranded*.  A stranded helper's
+transfers may still be written to and completed by libusb, so on close
+it leaks them — keeping their owner (and its buffers) alive — rather
+than free memory libusb still references.
+
+Relies on pyusb's libusb1 backend internals (``_LibUSB``,
+``_libusb_transfer``, ``_libusb_transfer_cb_fn_p``); ``for_device()``
+raises RuntimeError on any other backend so callers can fall back to
+synchronous writes.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import logging
+from typing import Any, Iterable, Optional
+
+log = logging.getLogger(__name__)
+
+
+class LibusbTransfers:
+    """Bulk OUT transfers queued through libusb's asynchronous API."""
+
+    TYPE_BULK = 2      # LIBUSB_TRANSFER_TYPE_BULK
+    COMPLETED = 0      # LIBUSB_TRANSFER_COMPLETED
+    INTERRUPTED = -10  # LIBUSB_ERROR_INTERRUPTED
+
+    MAX_EVENT_ERRORS = 3  # libusb_handle_events failures in a row before cancelling
+    _abandoned: list[Any] = []  # Owners of stranded transfers, kept alive for libusb
+
+    def __init__(self, lib: Any, ctx: Any, handle: Any) -> None:
+        from usb.backend import libusb1
+
+        self._lib = lib
+        self._ctx = ctx
+        self._handle = handle
+        self._transfers: dict[int, Any] = {}  # Struct address → transfer pointer
+        self._callback = libusb1._libusb_transfer_cb_fn_p(self._on_complete)
+        self._completed: list[int] = []
+        self._event_errors = 0
+        self.stranded = False  # Transfers that never completed still own buffers
+
+    @classmethod
+    def for_device(cls, device: Any) -> LibusbTransfers:
+        """Transfers on a pyusb device opened by the libusb1 backend."""
+        from usb.backend import libusb1
+
+        backend = device._ctx.backend
+        if not isinstance(backend, libusb1._LibUSB):
+            raise RuntimeError("asynchronous transfers need pyusb's libusb1 backend")
+        device._ctx.managed_open()
+        return cls(backend.lib, backend.ctx, device._ctx.handle.handle)
+
+    def _on_complete(self, transfer_p: Any) -> None:
+        self._completed.append(ctypes.addressof(transfer_p.contents))
+
+    def alloc(self) -> Any:
+        """A new transfer, freed by close()."""
+        transfer = self._lib.libusb_alloc_transfer(0)
+        if not transfer:
+            raise MemoryError("libusb_alloc_transfer failed")
+        self._transfers[ctypes.addressof(transfer.contents)] = transfer
+        return transfer
+
+    def submit(self, transfer: Any, endpoint: int, address: int, length: int,
+               timeout: int) -> int:
+        """Queue *length* bytes at *address* on *transfer*; returns libusb's rc."""
+        t = transfer.contents
+        t.dev_handle = self._handle
+        t.flags = 0
+        t.endpoint = endpoint
+        t.type = self.TYPE_BULK
+        t.timeout = timeout
+        t.buffer = address
+        t.length = length
+        t.num_iso_packets = 0
+        t.callback = self._callback
+        return self._lib.libusb_submit_transfer(transfer)
+
+    def write_sync(self, endpoint: int, address: int, length: int, timeout: int) -> int:
+        """Blocking write of *length* bytes at *address*; returns libusb's rc."""
+        transferred = ctypes.c_int()
+        return self._lib.libusb_bulk_transfer(
+            self._handle, endpoint,
+            ctypes.cast(address, ctypes.POINTER(ctypes.c_ubyte)), length,
+            ctypes.byref(transferred), timeout)
+
+    def handle_events(self, in_flight: Iterable[Any]) -> tuple[list[Any], Optional[str]]:
+        """One ``libusb_handle_events()`` pass; returns (completed, error).
+
+        *completed* are the transfers reaped by this pass (check their
+        ``status`` and ``actual_length``).  *error* is set when the pass
+        cancelled *in_flight* after MAX_EVENT_ERRORS failures in a row,
+        and when it gave up on them (``stranded``) after twice as many.
+        """
+        error = None
+        rc = self._lib.libusb_handle_events(self._ctx)
+        if rc and rc != self.INTERRUPTED:
+            self._event_errors += 1
+            in_flight = list(in_flight)
+            log.warning("libusb_handle_events failed (%d) with %d transfers pending",
+                        rc, len(in_flight))
+            if self._event_errors == self.MAX_EVENT_ERRORS:
+                error = f"libusb_handle_events failed ({rc})"
+                for transfer in in_flight:
+                    self._lib.libusb_cancel_transfer(transfer)  # Idle ones: NOT_FOUND
+            elif self._event_errors >= 2 * self.MAX_EVENT_ERRORS:
+                error = f"{len(in_flight)} transfers never completed"
+                self.stranded = True
+        elif not rc:
+            self._event_errors = 0
+        completed = [self._transfers[address] for address in self._completed]
+        self._completed.clear()
+        return completed, error
+
+    def close(self, owner: Any = None) -> None:
+        """Free every transfer — or, when stranded, keep *owner* alive instead."""
+        if self.stranded:
+            # libusb may still complete them (and call our callback)
+            log.warning("Leaking libusb transfers that never completed")
+            LibusbTransfers._abandoned.append(owner if owner is not None else self)
+            return
+        for transfer in self._transfers.values():
+            self._lib.libusb_free_transfer(transfer)
+        self._transfers.clear()
@@ -5,16 +5,28 @@ No playback state (play/pause/stop/seek). That belongs in MediaService.
 
 Decoders:
     VideoDecoder   — FFmpeg pipe → list of PIL frames + fps
-    ThemeZtDecoder — Theme.zt binary → list of PIL frames + per-frame delays
+    VideoStream    — FFmpeg pipe → bounded frame buffer (background reader)
+    ThemeZtDecoder — Theme.zt binary (mmap) → lazily decoded frames + per-frame delays
+
+FramePool runs per-frame work (JPEG decode, resize, encode) on several
+cores with ordered delivery; the decoders and the video-cut export share it.
 """
 
 from __future__ import annotations
 
 import io
 import logging
+import mmap
 import os
+import queue
 import struct
 import subprocess
+import threading
+from collections import OrderedDict, deque
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
+from typing import Any
 
 from PIL import Image
 
@@ -35,16 +47,80 @@ def _check_ffmpeg() -> bool:
 FFMPEG_AVAILABLE = _check_ffmpeg()
 
 
+class FramePool:
+    """Thread pool for per-frame work: JPEG decode, resize, encode.
+
+    Pillow releases the GIL while it decodes, resamples and encodes, so
+    frames prepared on several threads use several cores.  ``map()``
+    delivers results in input order and keeps at most ``window`` frames
+    in flight, so memory stays bounded on long clips.  With one worker,
+    ``map()`` runs inline on the caller's thread.
+    """
+
+    DEFAULT_WORKERS = min(8, os.cpu_count() or 1)
+
+    _shared: FramePool | None = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, workers: int | None = None) -> None:
+        self.workers = max(1, workers or self.DEFAULT_WORKERS)
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls) -> FramePool:
+        """Process-wide pool with DEFAULT_WORKERS threads."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix='trcc-frames')
+            return self._executor.submit(fn, *args)
+
+    def map(self, fn: Callable[[Any], Any], items: Iterable[Any],
+            window: int | None = None) -> Iterator[Any]:
+        """``fn(item)`` for every item, in order, computed in parallel."""
+        if self.workers == 1:
+            for item in items:
+                yield fn(item)
+            return
+        window = max(1, window or self.workers * 2)
+        pending: deque[Future] = deque()
+        try:
+            for item in items:
+                pending.append(self.submit(fn, item))
+                if len(pending) >= window:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:  # Consumer stopped early or fn raised
+                future.cancel()
+
+    def close(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
 class VideoDecoder:
     """Decode video frames via FFmpeg pipe. No playback state."""
 
-    def __init__(self, video_path: str, target_size: tuple[int, int] = (320, 320)) -> None:
+    def __init__(self, video_path: str, target_size: tuple[int, int] = (320, 320),
+                 pool: FramePool | None = None) -> None:
         if not FFMPEG_AVAILABLE:
             raise RuntimeError(
                 "FFmpeg not available. Install: sudo dnf install ffmpeg"
             )
         self.frames: list[Image.Image] = []
         self.fps: int = 16  # Windows: originalImageHz = 16
+        self._pool = pool or FramePool.shared()
 
         self._decode(video_path, target_size)
 
@@ -62,13 +138,13 @@ class VideoDecoder:
         if result.returncode != 0:
             raise RuntimeError(f"FFmpeg failed: {result.stderr.decode()[:200]}")
 
-        raw = result.stdout
+        # FFmpeg already scaled; the pool only splits the pipe into images
+        raw = memoryview(result.stdout)
         frame_size = w * h * 3
-        for i in range(0, len(raw), frame_size):
-            chunk = raw[i:i + frame_size]
-            if len(chunk) < frame_size:
-                break
-            self.frames.append(Image.frombytes('RGB', (w, h), chunk))
+        offsets = range(0, len(raw) - frame_size + 1, frame_size)
+        self.frames = list(self._pool.map(
+            lambda i: Image.frombytes('RGB', (w, h), raw[i:i + frame_size]),
+            offsets))
 
     @property
     def frame_count(self) -> int:
@@ -120,6 +196,307 @@ class VideoDecoder:
         return extracted
 
 
+class VideoStream:
+    """Stream video frames from an FFmpeg pipe. No playback state.
+
+    A background thread reads raw RGB frames from FFmpeg's stdout into a
+    bounded buffer of ``buffer_frames`` images, blocking FFmpeg when the
+    buffer is full — memory stays flat regardless of clip length.
+    Seeking (and looping, via ``restart()``) kills the pipe and reopens
+    it at the requested frame offset.
+    """
+
+    DEFAULT_BUFFER_FRAMES = 16
+    _PUT_POLL_S = 0.1
+
+    def __init__(self, video_path: str, target_size: tuple[int, int] = (320, 320),
+                 fps: int = 16, buffer_frames: int = DEFAULT_BUFFER_FRAMES) -> None:
+        if not FFMPEG_AVAILABLE:
+            raise RuntimeError(
+                "FFmpeg not available. Install: sudo dnf install ffmpeg"
+            )
+        self.video_path = video_path
+        self.target_size = target_size
+        self.fps: int = fps
+        self.buffer_frames = max(1, buffer_frames)
+        self.frame_count: int = self._probe_frame_count(video_path, fps)
+
+        self._queue: queue.Queue = queue.Queue(maxsize=self.buffer_frames)
+        self._proc: subprocess.Popen | None = None
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+        self._pending: Image.Image | None = None
+        self._eof = False
+        self.position = 0  # Index of the frame the next read() returns
+
+        self._start(0)
+
+    @staticmethod
+    def _probe_frame_count(video_path: str, fps: int) -> int:
+        """Estimate output frame count from container duration (0 if unknown)."""
+        try:
+            result = subprocess.run([
+                'ffprobe', '-v', 'error',
+                '-show_entries', 'format=duration',
+                '-of', 'default=noprint_wrappers=1:nokey=1',
+                video_path,
+            ], capture_output=True, timeout=10)
+            duration = float(result.stdout.decode().strip() or 0)
+            return max(0, round(duration * fps))
+        except Exception:
+            return 0
+
+    def _start(self, frame_index: int) -> None:
+        """Launch FFmpeg at *frame_index* and the reader thread."""
+        w, h = self.target_size
+        cmd = ['ffmpeg']
+        if frame_index > 0:
+            cmd.extend(['-ss', f'{frame_index / self.fps:.3f}'])
+        cmd.extend([
+            '-i', self.video_path,
+            '-r', str(self.fps),
+            '-vf', f'scale={w}:{h}',
+            '-f', 'rawvideo', '-pix_fmt', 'rgb24',
+            '-loglevel', 'error', 'pipe:1',
+        ])
+        self._stop = threading.Event()
+        self._queue = queue.Queue(maxsize=self.buffer_frames)
+        self._pending = None
+        self._eof = False
+        self.position = frame_index
+        self._proc = subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+        )
+        self._thread = threading.Thread(
+            target=self._reader, args=(self._proc, self._queue, self._stop),
+            name='trcc-video-stream', daemon=True,
+        )
+        self._thread.start()
+
+    def _reader(self, proc: subprocess.Popen, buf: queue.Queue,
+                stop: threading.Event) -> None:
+        """Reader thread: pipe → frames → bounded buffer, then EOF sentinel."""
+        w, h = self.target_size
+        frame_size = w * h * 3
+        stdout = proc.stdout
+        assert stdout is not None
+        try:
+            while not stop.is_set():
+                chunk = stdout.read(frame_size)
+                if len(chunk) < frame_size:
+                    break
+                if not self._put(buf, Image.frombytes('RGB', (w, h), chunk), stop):
+                    return
+        except (OSError, ValueError):
+            pass  # Pipe closed by stop()
+        if not stop.is_set():
+            rc = proc.wait()
+            if rc != 0:
+                log.error("FFmpeg stream exited with %d for %s", rc, self.video_path)
+        self._put(buf, None, stop)
+
+    def _put(self, buf: queue.Queue, item: Image.Image | None,
+             stop: threading.Event) -> bool:
+        """Blocking put that gives up once *stop* is set."""
+        while not stop.is_set():
+            try:
+                buf.put(item, timeout=self._PUT_POLL_S)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _kill(self) -> None:
+        """Stop the reader thread and FFmpeg process."""
+        self._stop.set()
+        proc, self._proc = self._proc, None
+        if proc is not None:
+            try:
+                proc.kill()  # Reader's pending read() returns EOF
+            except OSError:
+                pass
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        if proc is not None:
+            if proc.stdout:
+                proc.stdout.close()
+            proc.wait()
+
+    def read(self, timeout: float | None = 5.0) -> Image.Image | None:
+        """Return the next frame, or None at end of stream / on timeout."""
+        if self._pending is not None:
+            frame, self._pending = self._pending, None
+        elif self._eof or self._proc is None:
+            return None
+        else:
+            try:
+                frame = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                log.warning("Video stream stalled at frame %d", self.position)
+                return None
+            if frame is None:
+                self._eof = True
+                return None
+        self.position += 1
+        return frame
+
+    def peek(self, timeout: float | None = 5.0) -> Image.Image | None:
+        """Return the next frame without consuming it."""
+        if self._pending is None:
+            frame = self.read(timeout)
+            if frame is None:
+                return None
+            self.position -= 1
+            self._pending = frame
+        return self._pending
+
+    def seek(self, frame_index: int) -> None:
+        """Restart the pipe so the next read() returns *frame_index*."""
+        self._kill()
+        self._start(max(0, frame_index))
+
+    def restart(self) -> None:
+        """Reopen the pipe at frame 0 (loop)."""
+        self.seek(0)
+
+    @property
+    def at_end(self) -> bool:
+        return self._eof and self._pending is None
+
+    def close(self) -> None:
+        self._kill()
+        self._pending = None
+
+
+class ZtFrames(Sequence):
+    """Frames of a memory-mapped Theme.zt, decoded on demand.
+
+    Indexing decodes one JPEG (resize + RGB convert) and keeps the result
+    in a small LRU; each access also queues the next ``read_ahead`` frames
+    (wrapping, for looped playback) on a FramePool, so sequential
+    playback finds its frames already decoded.  Random access (seek)
+    costs a single decode regardless of animation length.
+    """
+
+    def __init__(self, mm: mmap.mmap, offsets: list[int], sizes: list[int],
+                 target_size: tuple[int, int] | None = None,
+                 cache_frames: int = 8, read_ahead: int = 2,
+                 pool: FramePool | None = None) -> None:
+        self._mm: mmap.mmap | None = mm
+        self._offsets = offsets
+        self._sizes = sizes
+        self.target_size = target_size
+        self.read_ahead = max(0, read_ahead)
+        self.cache_frames = max(1, cache_frames, self.read_ahead + 1)
+        self._cache: OrderedDict[int, Image.Image] = OrderedDict()
+        self._inflight: dict[int, Future] = {}
+        self._lock = threading.Lock()
+        self._pool = pool or FramePool.shared()
+        self.decodes = 0
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        count = len(self._offsets)
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError(f"frame {index} out of range ({count} frames)")
+        frame = self._get(index)
+        self._prefetch(index)
+        return frame
+
+    def _get(self, index: int) -> Image.Image:
+        with self._lock:
+            frame = self._cache.get(index)
+            if frame is not None:
+                self._cache.move_to_end(index)
+                return frame
+            future = self._inflight.get(index)
+        if future is not None:
+            try:
+                return future.result()
+            except Exception:
+                pass  # Decode it here instead (and raise from here)
+        frame = self._decode(index)
+        self._store(index, frame)
+        return frame
+
+    def _decode(self, index: int) -> Image.Image:
+        with self._lock:
+            if self._mm is None:
+                raise ValueError("Theme.zt reader is closed")
+            start = self._offsets[index]
+            data = self._mm[start:start + self._sizes[index]]
+        img = Image.open(io.BytesIO(data))
+        if self.target_size and img.size != self.target_size:
+            img = img.resize(self.target_size, Image.Resampling.LANCZOS)
+        if img.mode != 'RGB':
+            img = img.convert('RGB')
+        img.load()
+        self.decodes += 1
+        return img
+
+    def _store(self, index: int, frame: Image.Image) -> None:
+        with self._lock:
+            self._cache[index] = frame
+            self._cache.move_to_end(index)
+            while len(self._cache) > self.cache_frames:
+                self._cache.popitem(last=False)
+
+    def _prefetch(self, index: int) -> None:
+        count = len(self._offsets)
+        if not self.read_ahead or count < 2:
+            return
+        with self._lock:
+            if self._mm is None:
+                return
+            for step in range(1, min(self.read_ahead, count - 1) + 1):
+                ahead = (index + step) % count
+                if ahead in self._cache or ahead in self._inflight:
+                    continue
+                self._inflight[ahead] = self._pool.submit(self._read_ahead, ahead)
+
+    def _read_ahead(self, index: int) -> Image.Image:
+        try:
+            frame = self._decode(index)
+            self._store(index, frame)
+            return frame
+        finally:
+            with self._lock:
+                self._inflight.pop(index, None)
+
+    def decode_all(self) -> list[Image.Image]:
+        """Every frame, decoded in parallel on the pool (bypasses the LRU)."""
+        return list(self._pool.map(self._decode, range(len(self._offsets))))
+
+    def wait(self) -> None:
+        """Block until queued read-ahead decodes have finished."""
+        with self._lock:
+            futures = list(self._inflight.values())
+        wait_futures(futures)
+
+    def close(self) -> None:
+        with self._lock:
+            futures = list(self._inflight.values())
+            self._inflight.clear()
+        for future in futures:
+            future.cancel()
+        wait_futures(futures)
+        with self._lock:
+            for frame in self._cache.values():
+                frame.close()
+            self._cache.clear()
+            self._offsets, self._sizes = [], []
+            if self._mm is not None:
+                self._mm.close()
+                self._mm = None
+
+
 class ThemeZtDecoder:
     """Decode Theme.zt animation files. No playback state.
 
@@ -128,31 +505,31 @@ class ThemeZtDecoder:
     - int32: frame_count
     - int32[frame_count]: timestamps in ms
     - for each frame: int32 size + JPEG bytes
+
+    The file is memory-mapped and only its headers are read up front;
+    ``frames`` is a ZtFrames sequence that decodes JPEGs as they are
+    indexed, so opening cost and memory don't grow with frame count.
     """
 
-    def __init__(self, zt_path: str, target_size: tuple[int, int] | None = None) -> None:
-        self.frames: list[Image.Image] = []
+    CACHE_FRAMES = 8  # Decoded frames kept (LRU)
+    READ_AHEAD = 2    # Frames decoded ahead of the last access
+
+    def __init__(self, zt_path: str, target_size: tuple[int, int] | None = None,
+                 pool: FramePool | None = None) -> None:
         self.timestamps: list[int] = []
         self.delays: list[int] = []
 
         with open(zt_path, 'rb') as f:
-            magic = struct.unpack('B', f.read(1))[0]
-            if magic != 0xDC:
-                raise ValueError(f"Invalid Theme.zt magic: 0x{magic:02X}, expected 0xDC")
-
-            frame_count = struct.unpack('<i', f.read(4))[0]
-
-            for _ in range(frame_count):
-                self.timestamps.append(struct.unpack('<i', f.read(4))[0])
-
-            for _ in range(frame_count):
-                size = struct.unpack('<i', f.read(4))[0]
-                img = Image.open(io.BytesIO(f.read(size)))
-                if target_size and img.size != target_size:
-                    img = img.resize(target_size, Image.Resampling.LANCZOS)
-                if img.mode != 'RGB':
-                    img = img.convert('RGB')
-                self.frames.append(img)
+            if not os.fstat(f.fileno()).st_size:
+                raise ValueError("Invalid Theme.zt: empty file")
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            offsets, sizes = self._index(mm)
+        except (ValueError, struct.error):
+            mm.close()
+            raise
+        self.frames = ZtFrames(mm, offsets, sizes, target_size,
+                               self.CACHE_FRAMES, self.READ_AHEAD, pool)
 
         # Calculate delays from timestamps
         for i in range(len(self.timestamps)):
@@ -162,6 +539,35 @@ class ThemeZtDecoder:
                 delay = self.delays[-1] if self.delays else 42  # ~24fps default
             self.delays.append(max(1, delay))
 
+    def _index(self, mm: mmap.mmap) -> tuple[list[int], list[int]]:
+        """Read timestamps and each frame's (offset, size) in one pass."""
+        magic = mm[0]
+        if magic != 0xDC:
+            raise ValueError(f"Invalid Theme.zt magic: 0x{magic:02X}, expected 0xDC")
+
+        frame_count = struct.unpack_from('<i', mm, 1)[0]
+        self.timestamps = list(struct.unpack_from(f'<{frame_count}i', mm, 5))
+
+        offsets: list[int] = []
+        sizes: list[int] = []
+        pos = 5 + 4 * frame_count
+        end = len(mm)
+        for _ in range(frame_count):
+            if pos + 4 > end:
+                break
+            size = struct.unpack_from('<i', mm, pos)[0]
+            pos += 4
+            if size < 0 or pos + size > end:
+                break
+            offsets.append(pos)
+            sizes.append(size)
+            pos += size
+        if len(offsets) < frame_count:
+            log.warning("Theme.zt truncated: %d of %d frames readable",
+                        len(offsets), frame_count)
+            del self.timestamps[len(offsets):]
+        return offsets, sizes
+
     @property
     def frame_count(self) -> int:
         return len(self.frames)
@@ -175,10 +581,7 @@ class ThemeZtDecoder:
         return 1000.0 / avg_delay if avg_delay > 0 else 24.0
 
     def close(self) -> None:
-        for frame in self.frames:
-            if hasattr(frame, 'close'):
-                frame.close()
-        self.frames = []
+        self.frames.close()
 
 
 # Backward-compat aliases
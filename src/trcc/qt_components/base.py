@@ -28,6 +28,7 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from ..thumbnail_cache import ThumbnailAtlas, render_thumbnail
 from .constants import Colors, Layout, Sizes, Styles
 
 log = logging.getLogger(__name__)
@@ -108,14 +109,20 @@ class ImageLabel(QLabel):
         if pil_image is None:
             self.clear()
             return
+        self.set_qimage(self.prepare_image(pil_image, fast=fast))
 
+    def prepare_image(self, pil_image, fast: bool = False) -> QImage:
+        """Resize + convert a PIL Image for display. Safe off the GUI thread."""
         if pil_image.size != (self._width, self._height):
             resampling = Image.Resampling.BILINEAR if fast else Image.Resampling.LANCZOS
             pil_image = pil_image.resize(
                 (self._width, self._height), resampling
             )
+        return pil_to_qimage(pil_image)
 
-        self.setPixmap(pil_to_pixmap(pil_image))
+    def set_qimage(self, qimage: QImage):
+        """Show an image prepared by prepare_image() (GUI thread)."""
+        self.setPixmap(QPixmap.fromImage(qimage))
 
     def mousePressEvent(self, event):
         """Handle mouse click."""
@@ -145,7 +152,14 @@ def pil_to_pixmap(pil_image):
     """
     if pil_image is None:
         return QPixmap()
+    return QPixmap.fromImage(pil_to_qimage(pil_image))
 
+
+def pil_to_qimage(pil_image) -> QImage:
+    """Convert PIL Image to a QImage that owns its pixels.
+
+    Unlike QPixmap, QImage may be built outside the GUI thread.
+    """
     # Convert to RGB if needed
     if pil_image.mode == 'RGBA':
         bg = Image.new('RGB', pil_image.size, (0, 0, 0))
@@ -162,7 +176,7 @@ def pil_to_pixmap(pil_image):
         pil_image.width * 3,
         QImage.Format.Format_RGB888
     )
-    return QPixmap.fromImage(qimage)
+    return qimage.copy()  # Detach from the temporary bytes buffer
 
 
 def pixmap_to_pil(pixmap):
@@ -345,15 +359,23 @@ class BaseThumbnail(ClickableFrame):
     - _get_image_path(info) -> str | None
     - _get_extra_style() -> str | None  (for non-local dashed border etc.)
     - _show_placeholder()
+
+    The image loads on the first paint, i.e. once the cell scrolls into
+    view.  With an ``atlas`` set (see BaseThemeBrowser._thumbnail_atlas),
+    cached thumbnails come from the atlas and missing ones are rendered
+    on its thread pool while the cell stays blank.
     """
 
     clicked = Signal(object)
+    _thumbnail_built = Signal(object)  # RGB bytes or None, from a pool thread
 
     def __init__(self, item_info, parent=None):
         super().__init__(parent)
         self.item_info = item_info
         self.is_local: bool = getattr(item_info, 'is_local', True)
         self.selected = False
+        self.atlas: ThumbnailAtlas | None = None
+        self._thumbnail_requested = False
 
         self.setFixedSize(Sizes.THUMB_W, Sizes.THUMB_H)
         self.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -380,7 +402,7 @@ class BaseThumbnail(ClickableFrame):
         self.name_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self.name_label)
 
-        self._load_thumbnail()
+        self._thumbnail_built.connect(self._set_thumbnail)
 
     def _get_display_name(self, info) -> str:
         """Extract display name from item. Override for custom field."""
@@ -396,25 +418,45 @@ class BaseThumbnail(ClickableFrame):
             return Styles.thumb_non_local(type(self).__name__)
         return None
 
+    def paintEvent(self, event):
+        if not self._thumbnail_requested:
+            self._thumbnail_requested = True
+            self._load_thumbnail()
+        super().paintEvent(event)
+
     def _load_thumbnail(self):
         """Load thumbnail image into thumb_label."""
         path = self._get_image_path(self.item_info)
-        if path and Path(path).exists():
-            try:
-                img = Image.open(path)
-                size = (Sizes.THUMB_IMAGE, Sizes.THUMB_IMAGE)
-                img.thumbnail(size, Image.Resampling.LANCZOS)
-                bg = Image.new('RGB', size, (0, 0, 0))
-                offset = ((size[0] - img.width) // 2,
-                          (size[1] - img.height) // 2)
-                bg.paste(img, offset)
-                self.thumb_label.setPixmap(pil_to_pixmap(bg))
-            except Exception as e:
-                log.warning("Failed to load thumbnail: %s", e)
-                self._show_placeholder()
-        else:
+        if not path or not Path(path).exists():
+            self._show_placeholder()
+            return
+        if self.atlas is not None:
+            data = self.atlas.request(path, self._on_thumbnail_built)
+            if data is not None:
+                self._set_thumbnail(data)
+            return
+        try:
+            self._set_thumbnail(render_thumbnail(path, Sizes.THUMB_IMAGE))
+        except Exception as e:
+            log.warning("Failed to load thumbnail: %s", e)
             self._show_placeholder()
 
+    def _on_thumbnail_built(self, data: bytes | None):
+        """Atlas callback (pool thread) — hand the result to the GUI thread."""
+        try:
+            self._thumbnail_built.emit(data)
+        except RuntimeError:
+            pass  # Widget deleted while the thumbnail was rendering
+
+    def _set_thumbnail(self, data: bytes | None):
+        """Show packed RGB thumbnail bytes, or the placeholder for None."""
+        if data is None:
+            self._show_placeholder()
+            return
+        size = Sizes.THUMB_IMAGE
+        qimg = QImage(data, size, size, size * 3, QImage.Format.Format_RGB888)
+        self.thumb_label.setPixmap(QPixmap.fromImage(qimg))
+
     def _show_placeholder(self):
         """Show a labeled placeholder when thumbnail image is missing."""
         try:
@@ -468,6 +510,7 @@ class BaseThemeBrowser(BasePanel):
     - _create_filter_buttons(): Create filter/category buttons above grid
     - _create_thumbnail(item_info) -> BaseThumbnail: Factory method
     - _no_items_message() -> str: Empty state message
+    - _thumbnail_atlas() -> ThumbnailAtlas | None: Thumbnail cache
     """
 
     theme_selected = Signal(object)
@@ -537,6 +580,10 @@ class BaseThemeBrowser(BasePanel):
         """Override to provide custom empty-state message."""
         return "No items found"
 
+    def _thumbnail_atlas(self) -> ThumbnailAtlas | None:
+        """Override to cache thumbnails in an atlas (None renders uncached)."""
+        return None
+
     def _clear_grid(self):
         """Clear all widgets from the grid."""
         for widget in self.item_widgets:
@@ -552,10 +599,12 @@ class BaseThemeBrowser(BasePanel):
             self._show_empty_message()
             return
 
+        atlas = self._thumbnail_atlas()
         for i, item_info in enumerate(items):
             row = i // Sizes.GRID_COLS
             col = i % Sizes.GRID_COLS
             thumb = self._create_thumbnail(item_info)
+            thumb.atlas = atlas
             thumb.clicked.connect(self._on_item_clicked)
             self.grid_layout.addWidget(thumb, row, col)
             self.item_widgets.append(thumb)
@@ -41,7 +41,14 @@ from ..core.controllers import LEDDeviceController, create_controller
 from ..core.models import DeviceInfo, PlaybackState, ThemeInfo
 from ..dc_writer import CarouselConfig, read_carousel_config, write_carousel_config
 from ..device_scsi import find_lcd_devices
-from ..system_info import get_all_metrics
+from ..system_info import (
+    get_all_metrics,
+    get_metric_history,
+    start_sampling,
+    stop_sampling,
+    subscribe_metrics,
+    unsubscribe_metrics,
+)
 from ..system_sensors import SensorEnumerator
 
 # Import view components
@@ -66,6 +73,17 @@ log = logging.getLogger(__name__)
 
 LOCALE_TO_LANG = Layout.LOCALE_TO_LANG
 
+# Metric keys shown by the LED panel's own readouts (besides what the
+# LED device itself needs), by LED style
+_DISK_METRICS = ('disk_temp', 'disk_activity', 'disk_read', 'disk_write')
+_LED_PANEL_METRICS: dict[int, tuple[str, ...]] = {
+    **dict.fromkeys((1, 2, 3, 5, 6, 7, 8, 11), (
+        'cpu_temp', 'cpu_freq', 'cpu_percent',
+        'gpu_temp', 'gpu_clock', 'gpu_usage')),
+    4: ('mem_temp', 'mem_clock', 'mem_percent'),
+    10: _DISK_METRICS,
+}
+
 
 def detect_language() -> str:
     """Detect system language and return Windows asset suffix."""
@@ -102,6 +120,12 @@ class TRCCMainWindowMVC(QMainWindow):
     # Signal emitted from background handshake thread → main thread
     _handshake_done = Signal(object, object)  # (DeviceInfo, resolution tuple or None)
 
+    # Preview QImage prepared on the render thread → main thread
+    _preview_ready = Signal(object)
+
+    # USB add/remove from the hotplug monitor thread → main thread
+    _device_hotplug = Signal(object)
+
     _instance: 'TRCCMainWindowMVC | None' = None
 
     def __new__(cls, *args, **kwargs):
@@ -136,19 +160,27 @@ class TRCCMainWindowMVC(QMainWindow):
         self.controller = create_controller(self._data_dir)
 
         # Animation timer (view owns timer, controller owns logic)
+        # Precise: ticks land within ~1ms, so paced playback rarely has to
+        # drop or hold a frame to stay on its deadlines.
         self._animation_timer = QTimer(self)
+        self._animation_timer.setTimerType(Qt.TimerType.PreciseTimer)
         self._animation_timer.timeout.connect(self._on_animation_tick)
 
-        # Metrics timer for live overlay updates (1s interval)
+        # Metrics timer for live overlay updates (1s interval).  Sensors are
+        # sampled on a background thread; the timer only reads the snapshot.
         self._metrics_timer = QTimer(self)
         self._metrics_timer.timeout.connect(self._on_metrics_tick)
+        start_sampling()
+        self.controller.overlay.set_history(get_metric_history())
 
-        # Device hot-plug poll timer (5s interval)
+        # Device hot-plug: USB add/remove events, else a 5s poll timer
         self._device_timer = QTimer(self)
         self._device_timer.timeout.connect(self._on_device_poll)
+        self._device_hotplug.connect(self._on_device_hotplug)
 
         # Handshake result signal (background thread → main thread)
         self._handshake_done.connect(self._on_handshake_done)
+        self._preview_ready.connect(self._on_preview_ready)
 
         # Screencast timer (~6.67 FPS, matches Windows TPXSCount >= 3 at 50ms)
         self._screencast_timer = QTimer(self)
@@ -219,9 +251,10 @@ class TRCCMainWindowMVC(QMainWindow):
         # System tray icon
         self._setup_systray()
 
-        # Detect devices immediately, then poll every 5s
+        # Detect devices immediately, then on hotplug events (or every 5s)
         self._on_device_poll()
-        self._device_timer.start(5000)
+        if not self.controller.devices.svc.start_hotplug(on_event=self._device_hotplug.emit):
+            self._device_timer.start(5000)
 
         # Device may have been auto-selected during create_controller() before
         # view callbacks were wired. Re-trigger the view's _on_device_selected
@@ -788,8 +821,19 @@ class TRCCMainWindowMVC(QMainWindow):
         self.controller.overlay.on_config_changed = self._on_overlay_config_changed
 
     def _on_controller_preview_update(self, image):
-        """Handle preview image update from controller."""
-        self.uc_preview.set_image(image, fast=self.controller.is_video_playing())
+        """Handle preview image update from controller.
+
+        Called on the pipeline's render thread during playback: the PIL
+        scaling + conversion happens there, only the QPixmap upload is
+        queued to the GUI thread.
+        """
+        qimage = self.uc_preview.prepare_image(
+            image, fast=self.controller.is_video_playing())
+        self._preview_ready.emit(qimage)
+
+    def _on_preview_ready(self, qimage):
+        """Show a prepared preview frame (GUI thread)."""
+        self.uc_preview.set_qimage(qimage)
 
     def _on_controller_status_update(self, text):
         """Handle status update from controller."""
@@ -1366,7 +1410,7 @@ class TRCCMainWindowMVC(QMainWindow):
         """Handle export theme button click."""
         path, _ = QFileDialog.getSaveFileName(
             self, "Export Theme", "",
-            "Theme files (*.tr);;JSON (*.json);;All Files (*)"
+            "Theme files (*.tr);;Device frames (*.tdf);;JSON (*.json);;All Files (*)"
         )
         if path:
             success, msg = self.controller.export_config(Path(path))
@@ -1734,9 +1778,11 @@ class TRCCMainWindowMVC(QMainWindow):
         lcd_w, lcd_h = self.controller.lcd_width, self.controller.lcd_height
         pil_img = pil_img.resize((lcd_w, lcd_h), PILImage.Resampling.LANCZOS)
 
-        # Apply overlay if enabled
-        if self.controller.overlay.is_enabled():
-            pil_img = self.controller.overlay.render(pil_img)
+        # Apply overlay if enabled (the metrics tick composites on the
+        # pipeline's render thread — share its lock)
+        with self.controller._render_lock:
+            if self.controller.overlay.is_enabled():
+                pil_img = self.controller.overlay.render(pil_img)
 
         self.uc_preview.set_image(pil_img)
         self.controller._send_frame_to_lcd(pil_img)
@@ -1799,6 +1845,7 @@ class TRCCMainWindowMVC(QMainWindow):
         self._led_timer.stop()
         self._drive_metrics_timer.stop()
         self._led_active = False
+        unsubscribe_metrics('led')
         if self._led_controller:
             self._led_controller.cleanup()
 
@@ -1913,7 +1960,7 @@ class TRCCMainWindowMVC(QMainWindow):
         if not self._led_controller:
             return
         try:
-            from ..system_info import get_all_metrics
+            self._subscribe_led_metrics()
             metrics = get_all_metrics()
         except Exception:
             return
@@ -1958,6 +2005,15 @@ class TRCCMainWindowMVC(QMainWindow):
             self.uc_led_control._preview.set_timer(
                 now.month, now.day, hour, now.minute, dow)
 
+    def _subscribe_led_metrics(self):
+        """Limit sensor reads to what the LED device and panel display."""
+        keys = set(self._led_controller.led.required_metrics()) if (
+            self._led_controller) else set()
+        keys.update(_LED_PANEL_METRICS.get(self._led_style_id, ()))
+        if self.uc_led_control.is_hr10:
+            keys.update(_DISK_METRICS)
+        subscribe_metrics('led', keys)
+
     def _on_led_colors_update(self, colors):
         """Forward computed LED colors to the unified LED panel."""
         self.uc_led_control.set_led_colors(colors)
@@ -1994,6 +2050,7 @@ class TRCCMainWindowMVC(QMainWindow):
             return
         try:
             from ..system_info import get_disk_stats, get_disk_temperature
+            self._subscribe_led_metrics()
             metrics = get_disk_stats()
             temp = get_disk_temperature()
             if temp is not None:
@@ -2122,6 +2179,19 @@ class TRCCMainWindowMVC(QMainWindow):
         except Exception as e:
             log.error("Device poll error: %s", e)
 
+    def _on_device_hotplug(self, event):
+        """USB add/remove, after DeviceService rescanned (main thread).
+
+        The service drops a removed selection for the next device; the
+        view follows it, then the sidebar is refreshed.
+        """
+        selected = self.controller.devices.get_selected()
+        if (event.action == 'remove' and selected is not None
+                and Settings.device_config_key(selected.device_index, selected.vid,
+                                               selected.pid) != self._active_device_key):
+            self.controller.devices.select_device(selected)
+        self._on_device_poll()
+
     def _on_rotation_change(self, index):
         """Handle rotation combobox change (Windows UpDateUCComboBox1).
 
@@ -2161,8 +2231,8 @@ class TRCCMainWindowMVC(QMainWindow):
             self.brightness_btn.setStyleSheet(Styles.TEXT_BUTTON)
 
     def _on_animation_tick(self):
-        """Handle animation timer tick - forward to controller."""
-        self.controller.video_tick()
+        """Handle animation timer tick - render/encode/send on the pipeline."""
+        self.controller.video_tick_async()
 
     def _on_metrics_tick(self):
         """Collect system metrics and re-render overlay, send to LCD.
@@ -2172,6 +2242,7 @@ class TRCCMainWindowMVC(QMainWindow):
         when background mode is active OR overlay is enabled.
         """
         try:
+            subscribe_metrics('overlay', self.controller.overlay.required_metrics())
             metrics = get_all_metrics()
         except Exception:
             return
@@ -2181,9 +2252,9 @@ class TRCCMainWindowMVC(QMainWindow):
             or self._background_active
         )
         if should_render:
-            img = self.controller.render_overlay_and_preview()
-            if img and self.controller.auto_send and not self.controller.video.is_playing():
-                self.controller._send_frame_to_lcd(img)
+            self.controller.render_overlay_async(
+                send=self.controller.auto_send
+                and not self.controller.video.is_playing())
 
     def start_metrics(self):
         """Start live metrics collection for overlay display."""
@@ -2196,6 +2267,7 @@ class TRCCMainWindowMVC(QMainWindow):
         log.info("Metrics timer stopped")
         self.controller.overlay.enable(False)
         self._metrics_timer.stop()
+        unsubscribe_metrics('overlay')
 
     # =========================================================================
     # Borderless Window Drag
@@ -2245,8 +2317,10 @@ class TRCCMainWindowMVC(QMainWindow):
         self._stop_pipewire()
         self._metrics_timer.stop()
         self._device_timer.stop()
+        self.controller.devices.svc.stop_hotplug()
         self._led_timer.stop()
         self._drive_metrics_timer.stop()
+        stop_sampling()
         if self._led_controller:
             self._led_controller.cleanup()
         self.uc_system_info.stop_updates()
@@ -11,7 +11,7 @@ from PySide6.QtCore import Qt, QTimer, Signal
 from PySide6.QtGui import QColor, QPalette
 from PySide6.QtWidgets import QFrame, QHBoxLayout, QLabel, QScrollArea, QVBoxLayout, QWidget
 
-from ..system_info import get_all_metrics
+from ..system_info import get_all_metrics, subscribe_metrics, unsubscribe_metrics
 
 log = logging.getLogger(__name__)
 
@@ -241,12 +241,15 @@ class UCActivitySidebar(QWidget):
 
     def start_updates(self, interval_ms=1000):
         """Start periodic sensor value updates."""
+        subscribe_metrics('activity_sidebar',
+                          (item.metric_key for item in self._sensor_items))
         self._update_values()
         self._update_timer.start(interval_ms)
 
     def stop_updates(self):
         """Stop sensor value updates."""
         self._update_timer.stop()
+        unsubscribe_metrics('activity_sidebar')
 
     def _update_values(self):
         """Update all sensor values from system_info."""
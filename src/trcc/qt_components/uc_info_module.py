@@ -9,7 +9,7 @@ from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QColor, QPalette
 from PySide6.QtWidgets import QFrame, QHBoxLayout, QLabel, QVBoxLayout, QWidget
 
-from ..system_info import get_all_metrics
+from ..system_info import get_all_metrics, subscribe_metrics, unsubscribe_metrics
 
 # Default sensors: (metric_key, label, color)
 DEFAULT_SENSORS = [
@@ -92,12 +92,14 @@ class UCInfoModule(QWidget):
 
     def start_updates(self, interval_ms=1000):
         """Start periodic sensor updates."""
+        subscribe_metrics('info_module', self._sensor_boxes)
         self._update_values()
         self._timer.start(interval_ms)
 
     def stop_updates(self):
         """Stop sensor updates."""
         self._timer.stop()
+        unsubscribe_metrics('info_module')
 
     def _update_values(self):
         """Update all sensor values from system_info."""
@@ -164,6 +164,14 @@ class UCPreview(BasePanel):
         """Set preview from PIL Image."""
         self.preview_label.set_pil_image(pil_image, fast=fast)
 
+    def prepare_image(self, pil_image, fast: bool = False):
+        """Scale + convert a PIL Image to a QImage. Safe off the GUI thread."""
+        return self.preview_label.prepare_image(pil_image, fast=fast)
+
+    def set_qimage(self, qimage):
+        """Show a QImage from prepare_image()."""
+        self.preview_label.set_qimage(qimage)
+
     def set_status(self, text):
         self.status_label.setText(text)
 
@@ -20,6 +20,8 @@ from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import QLabel, QLineEdit, QPushButton
 
 from ..core.models import LocalThemeItem
+from ..theme_index import ThemeIndex
+from ..thumbnail_cache import ThumbnailAtlas
 from .assets import load_pixmap
 from .base import BaseThemeBrowser, BaseThumbnail
 from .constants import Layout, Styles
@@ -193,6 +195,11 @@ class UCThemeLocal(BaseThemeBrowser):
     def _no_items_message(self) -> str:
         return "No themes found"
 
+    def _thumbnail_atlas(self) -> ThumbnailAtlas | None:
+        if not self.theme_directory:
+            return None
+        return ThumbnailAtlas.for_dir('local', self.theme_directory)
+
     def set_theme_directory(self, path):
         self.theme_directory = Path(path) if path else None
         self.load_themes()
@@ -228,16 +235,21 @@ class UCThemeLocal(BaseThemeBrowser):
             return (is_user, p.name)
 
         for scan_dir in dirs_to_scan:
-            for item in sorted(scan_dir.iterdir(), key=_sort_key):
-                if item.is_dir() and item.name not in seen_names:
+            # Indexed listing, kept fresh by inotify while the browser lives
+            index = ThemeIndex.for_dir(scan_dir)
+            index.watch()
+            listing = index.dirs()
+            for item in sorted((scan_dir / name for name in listing), key=_sort_key):
+                files = listing[item.name]
+                if item.name not in seen_names:
                     thumb = item / 'Theme.png'
                     bg = item / '00.png'
-                    if thumb.exists() or bg.exists():
+                    if thumb.name in files or bg.name in files:
                         seen_names.add(item.name)
                         all_items.append(LocalThemeItem(
                             name=item.name,
                             path=str(item),
-                            thumbnail=str(thumb if thumb.exists() else bg),
+                            thumbnail=str(thumb if thumb.name in files else bg),
                             is_user=item.name.startswith('User') or item.name.startswith('Custom'),
                         ))
 
@@ -15,6 +15,7 @@ from PySide6.QtCore import Signal
 from trcc.data_repository import DataManager
 
 from ..core.models import MaskItem
+from ..thumbnail_cache import ThumbnailAtlas
 from .base import BaseThumbnail, DownloadableThemeBrowser
 
 log = logging.getLogger(__name__)
@@ -67,6 +68,11 @@ class UCThemeMask(DownloadableThemeBrowser):
     def _no_items_message(self) -> str:
         return "No masks found\n\nMasks can be downloaded by clicking on cloud mask thumbnails"
 
+    def _thumbnail_atlas(self) -> ThumbnailAtlas | None:
+        if not self.mask_directory:
+            return None
+        return ThumbnailAtlas.for_dir('mask', self.mask_directory)
+
     def set_mask_directory(self, path):
         """Set the mask directory and load masks."""
         self.mask_directory = Path(path) if path else None
@@ -21,6 +21,8 @@ from PySide6.QtCore import QSize
 from PySide6.QtGui import QMovie
 
 from ..core.models import CloudThemeItem
+from ..theme_index import ThemeIndex
+from ..thumbnail_cache import ThumbnailAtlas
 from .base import BaseThumbnail, DownloadableThemeBrowser
 from .constants import Layout, Sizes
 
@@ -122,6 +124,11 @@ class UCThemeWeb(DownloadableThemeBrowser):
     def _no_items_message(self) -> str:
         return "No cloud themes found\n\nDownload with: trcc download themes-320"
 
+    def _thumbnail_atlas(self) -> ThumbnailAtlas | None:
+        if not self.web_directory:
+            return None
+        return ThumbnailAtlas.for_dir('cloud', self.web_directory)
+
     def set_web_directory(self, path):
         """Set the Web directory (bundled PNGs + downloaded MP4s) and load themes."""
         self.web_directory = Path(path) if path else None
@@ -173,15 +180,20 @@ class UCThemeWeb(DownloadableThemeBrowser):
         # Extract PNGs from .7z if needed
         self._ensure_previews_extracted()
 
+        # One indexed listing of the directory, kept fresh by inotify
+        index = ThemeIndex.for_dir(self.web_directory)
+        index.watch()
+        files = sorted(f for f in index.files() if not f.startswith('.'))
+
         # Find cached MP4s (already downloaded)
-        cached = set()
-        for mp4 in self.web_directory.glob('*.mp4'):
-            cached.add(mp4.stem)
+        cached = {f[:-4] for f in files if f.endswith('.mp4')}
 
         # Scan for preview PNGs (matches Windows CheakWebFile)
         known_ids = []
-        for png in sorted(self.web_directory.glob('*.png')):
-            theme_id = png.stem
+        for png in files:
+            if not png.endswith('.png'):
+                continue
+            theme_id = png[:-4]
             if self.current_category != 'all':
                 if self.current_category not in theme_id:
                     continue
@@ -196,7 +208,7 @@ class UCThemeWeb(DownloadableThemeBrowser):
                 name=theme_id,
                 id=theme_id,
                 video=str(self.web_directory / f"{theme_id}.mp4") if is_local else None,
-                preview=str(preview_path) if preview_path.exists() else None,
+                preview=str(preview_path),
                 is_local=is_local,
             ))
 
@@ -25,7 +25,7 @@ from PySide6.QtGui import (
 )
 from PySide6.QtWidgets import QLabel, QProgressBar, QWidget
 
-from trcc.media_player import FFMPEG_AVAILABLE
+from trcc.media_player import FFMPEG_AVAILABLE, FramePool
 from trcc.services import ImageService
 
 from .assets import load_pixmap
@@ -81,6 +81,15 @@ def _format_time(ms):
 # Export worker thread
 # ============================================================================
 
+def _bmp_to_jpeg(bmp_path: str) -> bytes:
+    """Encode one extracted frame as a Theme.zt JPEG and delete the BMP."""
+    with PILImage.open(bmp_path) as img:
+        buf = BytesIO()
+        img.save(buf, format='JPEG', quality=85)
+    os.remove(bmp_path)
+    return buf.getvalue()
+
+
 class ExportWorker(QThread):
     """Background thread for FFmpeg frame extraction + Theme.zt assembly."""
 
@@ -151,14 +160,10 @@ class ExportWorker(QThread):
         self.progress.emit(20, f"Converting {total} frames...")
         jpeg_data_list = []
 
-        for i, bmp_name in enumerate(bmp_files):
-            bmp_path = os.path.join(frames_dir, bmp_name)
-            img = PILImage.open(bmp_path)
-            buf = BytesIO()
-            img.save(buf, format='JPEG', quality=85)
-            jpeg_data_list.append(buf.getvalue())
-
-            os.remove(bmp_path)
+        # Encode on all cores; results come back in frame order
+        paths = [os.path.join(frames_dir, name) for name in bmp_files]
+        for i, jpeg_bytes in enumerate(FramePool.shared().map(_bmp_to_jpeg, paths)):
+            jpeg_data_list.append(jpeg_bytes)
             pct = 20 + int(60 * (i + 1) / total)
             if i % 10 == 0:
                 self.progress.emit(pct, f"Converting {i+1}/{total}...")
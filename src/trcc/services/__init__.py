@@ -8,6 +8,7 @@ Business logic shared by all driving adapters:
 
 from .device import DeviceService
 from .display import DisplayService
+from .history import MetricHistory
 from .image import ImageService
 from .led import LEDService
 from .media import MediaService
@@ -21,6 +22,7 @@ __all__ = [
     'ImageService',
     'LEDService',
     'MediaService',
+    'MetricHistory',
     'OverlayService',
     'SystemService',
     'ThemeService',
@@ -7,21 +7,88 @@ from __future__ import annotations
 
 import logging
 import threading
-from typing import Any, Optional
+import time
+import zlib
+from typing import Any, Callable, Optional
 
 from ..core.models import DeviceInfo, LCDDeviceConfig
+from .pipeline import FramePipeline, PipelineFrame
+
+try:
+    import xxhash  # pyright: ignore[reportMissingImports]
+    XXHASH_AVAILABLE = True
+except ImportError:
+    xxhash = None
+    XXHASH_AVAILABLE = False
 
 log = logging.getLogger(__name__)
 
 
+class FrameDeduplicator:
+    """Skips sending frames byte-identical to a device's last sent frame.
+
+    A static theme with a clock re-encodes the same bytes on every metrics
+    tick for most of each minute.  The last successfully sent payload of
+    each device is kept as a fingerprint (length + xxh3-64 when xxhash is
+    installed, CRC-32 otherwise) over the whole payload — sampling would
+    miss a changed digit.  An unchanged frame is still resent after
+    ``keepalive_s`` seconds (0 disables suppression).
+    """
+
+    KEEPALIVE_S = 5.0
+
+    def __init__(self, keepalive_s: Optional[float] = None) -> None:
+        self.keepalive_s = self.KEEPALIVE_S if keepalive_s is None else max(0.0, keepalive_s)
+        self._last: dict[str, tuple[tuple[int, int], float]] = {}  # key → (fingerprint, sent at)
+        self.sent = 0
+        self.suppressed = 0
+
+    @staticmethod
+    def fingerprint(data: Any) -> tuple[int, int]:
+        """Cheap content fingerprint of an encoded payload (bytes or buffer)."""
+        if xxhash is not None:
+            return len(data), xxhash.xxh3_64_intdigest(data)
+        return len(data), zlib.crc32(data)
+
+    def is_duplicate(self, key: str, fp: tuple[int, int]) -> bool:
+        """True (and counted as suppressed) if *fp* needn't be sent to *key*."""
+        last = self._last.get(key)
+        if (last is None or not self.keepalive_s or last[0] != fp
+                or time.monotonic() - last[1] >= self.keepalive_s):
+            return False
+        self.suppressed += 1
+        return True
+
+    def record(self, key: str, fp: tuple[int, int]) -> None:
+        """Remember *fp* as the frame now on *key*'s screen."""
+        self._last[key] = (fp, time.monotonic())
+        self.sent += 1
+
+    def forget(self, key: Optional[str] = None) -> None:
+        """Force the next frame to *key* (or every device) to be sent."""
+        if key is None:
+            self._last.clear()
+        else:
+            self._last.pop(key, None)
+
+
 class DeviceService:
     """Device lifecycle: detect, select, handshake, send."""
 
+    # Weight of the newest sample in the transfer-time moving average
+    SEND_TIME_SMOOTHING = 0.2
+
     def __init__(self) -> None:
         self._devices: list[DeviceInfo] = []
         self._selected: DeviceInfo | None = None
         self._send_lock = threading.Lock()
         self._send_busy = False
+        self._pipeline: FramePipeline | None = None
+        self._send_seconds = 0.0  # Moving average of successful transfers
+        from ..conf import Settings
+        self.dedup = FrameDeduplicator(Settings.get_frame_keepalive())
+        self._hotplug: Any = None  # HotplugMonitor while running
+        self._on_hotplug: Optional[Callable[[Any], None]] = None
 
     # ── Detection ────────────────────────────────────────────────────
 
@@ -62,11 +129,79 @@ class DeviceService:
 
         return self._devices
 
+    # ── Hotplug ──────────────────────────────────────────────────────
+
+    def start_hotplug(self, on_event: Optional[Callable[[Any], None]] = None) -> bool:
+        """Rescan on USB add/remove events instead of polling.
+
+        *on_event* (HotplugEvent) runs on the monitor thread after the
+        rescan.  Returns False if no hotplug backend is available.
+        """
+        from ..device_hotplug import HotplugMonitor
+
+        self._on_hotplug = on_event
+        if self._hotplug is None:
+            self._hotplug = HotplugMonitor(self._handle_hotplug)
+        return self._hotplug.start()
+
+    def stop_hotplug(self) -> None:
+        if self._hotplug is not None:
+            self._hotplug.stop()
+            self._hotplug = None
+
+    @property
+    def hotplug_active(self) -> bool:
+        return self._hotplug is not None and self._hotplug.is_running
+
+    def _handle_hotplug(self, event: Any) -> None:
+        log.info("DeviceService: %s %s %04X:%04X %s", event.action,
+                 event.subsystem, event.vid, event.pid, event.name)
+        selected = self._selected
+        self.detect()
+        if selected is not None and selected.path not in {d.path for d in self._devices}:
+            log.info("DeviceService: selected device %s removed", selected.path)
+            self._selected = self._devices[0] if self._devices else None
+            self.dedup.forget(selected.path)
+        if self._on_hotplug is not None:
+            self._on_hotplug(event)
+
+    def wait_for_devices(self, timeout: float = 20.0,
+                         on_wait: Optional[Callable[[], None]] = None,
+                         ) -> list[DeviceInfo]:
+        """Detect devices, waiting up to *timeout* seconds for one to appear.
+
+        Wakes on hotplug events; polls every 2 s if no monitor is available.
+        *on_wait* is called once if the first scan finds nothing.
+        """
+        devices = self.detect()
+        if devices or timeout <= 0:
+            return devices
+        if on_wait is not None:
+            on_wait()
+        arrived = threading.Event()
+        monitoring = self.start_hotplug(lambda _event: arrived.set())
+        if monitoring:
+            self.detect()  # A device may have arrived before the monitor started
+        deadline = time.monotonic() + timeout
+        try:
+            while not self._devices and (remaining := deadline - time.monotonic()) > 0:
+                if monitoring:
+                    arrived.wait(remaining)  # Handler rescans before setting
+                    arrived.clear()
+                else:
+                    time.sleep(min(2.0, remaining))
+                    self.detect()
+        finally:
+            if monitoring:
+                self.stop_hotplug()
+        return self._devices
+
     # ── Selection ────────────────────────────────────────────────────
 
     def select(self, device: DeviceInfo) -> None:
         """Select a device."""
         self._selected = device
+        self.dedup.forget(device.path)
 
     @property
     def selected(self) -> DeviceInfo | None:
@@ -90,6 +225,7 @@ class DeviceService:
             from ..device_factory import DeviceProtocolFactory
 
             protocol = DeviceProtocolFactory.get_protocol(device)
+            self.dedup.forget(device.path)  # Screen content unknown after a handshake
             if hasattr(protocol, 'handshake'):
                 return protocol.handshake()
         except Exception as e:
@@ -101,7 +237,9 @@ class DeviceService:
     def send_rgb565(self, data: bytes, width: int, height: int) -> bool:
         """Send pre-converted RGB565 bytes to selected device.
 
-        Thread-safe: only one send at a time.
+        Thread-safe: only one send at a time.  A frame identical to the
+        last one sent to the device is skipped (see FrameDeduplicator) and
+        reported as sent.
         """
         with self._send_lock:
             if self._send_busy:
@@ -109,7 +247,13 @@ class DeviceService:
                 return False
             self._send_busy = True
 
+        key = self._selected.path if self._selected else ''
         try:
+            fp = self.dedup.fingerprint(data)
+            if self.dedup.is_duplicate(key, fp):
+                log.debug("send_rgb565: unchanged frame, skipped")
+                return True
+
             from ..device_factory import DeviceProtocolFactory
 
             log.debug("send_rgb565: device=%s protocol=%s %dx%d (%d bytes)",
@@ -117,22 +261,44 @@ class DeviceService:
                       self._selected.protocol if self._selected else 'None',
                       width, height, len(data))
             protocol = DeviceProtocolFactory.get_protocol(self._selected)
+            start = time.perf_counter()
             success = protocol.send_image(data, width, height)
+            if success:
+                self._record_send(time.perf_counter() - start)
+                self.dedup.record(key, fp)
+            else:
+                self.dedup.forget(key)
             log.debug("send_rgb565: send_image returned %s", success)
             return success
         except Exception as e:
             log.error("Device send error: %s", e)
+            self.dedup.forget(key)
             return False
         finally:
             with self._send_lock:
                 self._send_busy = False
 
+    def _record_send(self, seconds: float) -> None:
+        if self._send_seconds:
+            seconds = self._send_seconds + self.SEND_TIME_SMOOTHING * (
+                seconds - self._send_seconds)
+        self._send_seconds = seconds
+
+    @property
+    def send_seconds(self) -> float:
+        """Average seconds per transfer to the device (0 until measured)."""
+        return self._send_seconds
+
     def send_image(self, image: Any, width: int, height: int,
                    byte_order: str = '>') -> bool:
-        """Convert PIL Image to RGB565 and send to device."""
+        """Convert PIL Image to RGB565 and send to device.
+
+        Encodes straight into this thread's reusable encoder buffer — safe
+        because the send below completes before this thread encodes again.
+        """
         from .image import ImageService
 
-        rgb565 = ImageService.to_rgb565(image, byte_order)
+        rgb565 = ImageService.to_rgb565_view(image, byte_order)
         return self.send_rgb565(rgb565, width, height)
 
     def send_pil(self, image: Any, width: int, height: int) -> bool:
@@ -149,34 +315,58 @@ class DeviceService:
             jpeg = ImageService.to_jpeg(image)
             return self.send_rgb565(jpeg, width, height)
 
-        byte_order = ImageService.byte_order_for(
-            protocol,
+        return self.send_image(image, width, height, self._byte_order())
+
+    def encode_pil(self, image: Any) -> bytes:
+        """Encode PIL Image for the selected device (JPEG or RGB565 bytes).
+
+        Returns an independent bytes copy, safe to hand to another thread.
+        """
+        from .image import ImageService
+
+        device = self._selected
+        if device and device.protocol == 'bulk':
+            return ImageService.to_jpeg(image)
+        return ImageService.to_rgb565(image, self._byte_order())
+
+    def _byte_order(self) -> str:
+        from .image import ImageService
+
+        device = self._selected
+        return ImageService.byte_order_for(
+            device.protocol if device else 'scsi',
             device.resolution if device else (320, 320),
         )
-        return self.send_image(image, width, height, byte_order)
 
-    def send_rgb565_async(self, data: bytes, width: int, height: int) -> None:
-        """Send RGB565 bytes in a background thread. Thread-safe."""
-        if self.is_busy:
-            log.debug("send_rgb565_async: busy, skipping")
-            return
+    # ── Async send (pipeline) ────────────────────────────────────────
 
-        log.debug("send_rgb565_async: starting worker thread (%d bytes)", len(data))
+    @property
+    def pipeline(self) -> FramePipeline:
+        """Long-lived render/encode/transmit pipeline (created on first use)."""
+        if self._pipeline is None:
+            self._pipeline = FramePipeline(
+                lambda data, w, h: self.send_rgb565(data, w, h))
+        return self._pipeline
 
-        def worker():
-            self.send_rgb565(data, width, height)
+    def send_rgb565_async(self, data: bytes, width: int, height: int) -> None:
+        """Queue encoded bytes for the transmit thread. Thread-safe.
 
-        threading.Thread(target=worker, daemon=True).start()
+        Latest wins: a frame still waiting when the next one arrives is
+        replaced, never queued behind it.
+        """
+        log.debug("send_rgb565_async: queued %d bytes", len(data))
+        self.pipeline.submit_encoded(data, width, height)
 
     def send_pil_async(self, image: Any, width: int, height: int) -> None:
-        """Convert PIL to RGB565 and send in background thread."""
-        if self.is_busy:
-            return
-
-        def worker():
-            self.send_pil(image, width, height)
-
-        threading.Thread(target=worker, daemon=True).start()
+        """Encode PIL Image on the encode thread, then send. Thread-safe."""
+        self.pipeline.submit_frame(PipelineFrame(
+            width, height, encode=lambda: self.encode_pil(image)))
+
+    def close(self) -> None:
+        """Stop the send pipeline (discarding unsent frames) and hotplug monitor."""
+        if self._pipeline is not None:
+            self._pipeline.stop()
+        self.stop_hotplug()
 
     @property
     def is_busy(self) -> bool:
@@ -10,10 +10,12 @@ import json
 import logging
 import shutil
 import tempfile
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Tuple
 
-from ..conf import settings
+from ..conf import Settings, settings
 from ..data_repository import DataManager, ThemeDir
 from .device import DeviceService
 from .image import ImageService
@@ -24,6 +26,83 @@ from .theme import ThemeService
 log = logging.getLogger(__name__)
 
 
+class FrameCache:
+    """Device-ready video frames keyed by frame index, LRU under a byte budget.
+
+    Every entry belongs to one render context (source, resolution, rotation,
+    brightness, mask, protocol).  ``bind()`` with a different context drops
+    all entries, so a hit always means the bytes would be re-encoded
+    identically.  Thread-safe: frames may be stored from the encode thread.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._context: Any = None
+        self._entries: OrderedDict[int, tuple[Any, bytes, int]] = OrderedDict()
+        self._nbytes = 0
+
+    def bind(self, context: Any) -> None:
+        """Switch render context, invalidating entries if it changed."""
+        with self._lock:
+            if context != self._context:
+                self._clear()
+                self._context = context
+
+    def get(self, index: int) -> tuple[Any, bytes] | None:
+        """Return (preview, data) for *index*, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(index)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(index)
+            self.hits += 1
+            return entry[0], entry[1]
+
+    def put(self, index: int, preview: Any, data: bytes,
+            context: Any = None) -> None:
+        """Store a frame; *preview* may be None when it equals the source frame.
+
+        With *context*, the frame is only stored if that context is still
+        bound (it may have changed while the frame was being encoded).
+        """
+        size = len(data)
+        if preview is not None:
+            size += preview.width * preview.height * len(preview.getbands())
+        with self._lock:
+            if size > self.max_bytes:
+                return
+            if context is not None and context != self._context:
+                return
+            old = self._entries.pop(index, None)
+            if old is not None:
+                self._nbytes -= old[2]
+            self._entries[index] = (preview, data, size)
+            self._nbytes += size
+            while self._nbytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._nbytes -= evicted[2]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._clear()
+
+    def _clear(self) -> None:
+        self._entries.clear()
+        self._nbytes = 0
+        self._context = None
+
+    @property
+    def nbytes(self) -> int:
+        return self._nbytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
 class DisplayService:
     """Display pipeline: theme → overlay → brightness/rotation → LCD frame.
 
@@ -49,6 +128,15 @@ class DisplayService:
         self.auto_send = True
         self.rotation = 0         # directionB: 0, 90, 180, 270
         self.brightness = 50      # myLddVal mapped: L1=25, L2=50, L3=100
+        self.frame_cache = FrameCache(settings.get_frame_cache_budget())
+        self._mask_digest: tuple[Any, bytes] | None = None  # (mask, digest)
+
+        # Device frames cache fill: after an animation's first loop its
+        # .tdf is written on a background thread (see _note_loop)
+        self._loop_position: tuple[Any, int] = (None, -1)  # (source, index)
+        self._filled_keys: set[tuple] = set()
+        self._fill_thread: threading.Thread | None = None
+        self._fill_done = False
 
         # Theme directories
         self._local_dir: Path | None = None
@@ -95,6 +183,7 @@ class DisplayService:
 
     def cleanup(self) -> None:
         """Clean up working directory on exit."""
+        self.frame_cache.clear()
         if self.working_dir and self.working_dir.exists():
             shutil.rmtree(self.working_dir, ignore_errors=True)
 
@@ -300,6 +389,7 @@ class DisplayService:
 
     def _load_and_play_video(self, path: Path) -> None:
         """Load video, set first frame as current image, start playback."""
+        self.frame_cache.clear()
         self.media.load(path)
         first_frame = self.media.get_frame(0)
         if first_frame:
@@ -389,31 +479,169 @@ class DisplayService:
 
     # ── Video playback ────────────────────────────────────────────────
 
-    def video_tick(self) -> dict | None:
-        """Advance one video frame. Returns dict or None if not playing."""
+    def video_tick(self, encode: bool = True) -> dict | None:
+        """Advance one video frame. Returns dict or None if not playing.
+
+        Frames that render identically on every loop (no text overlay)
+        are served from ``frame_cache`` after the first pass.
+
+        Args:
+            encode: Encode the frame here.  When False and the frame must
+                be sent but isn't cached, ``'rgb565'`` is None and
+                ``'encode'`` holds a callable that encodes (and caches)
+                it — for the pipeline's encode thread.
+        """
+        self.media.send_cost_s = self.devices.send_seconds
         frame, should_send, progress = self.media.tick()
         if not frame:
             return None
 
         self.current_image = frame
+        send = should_send and self.auto_send
+
+        context = self._frame_cache_context()
+        index = self.media.frame_index
+        self._note_loop(index)
+        native = None
+        if context is not None:
+            self.frame_cache.bind(context)
+            cached = self.frame_cache.get(index)
+            if cached is not None:
+                preview, data = cached
+                return {  # Steady state: no render, no encode
+                    'preview': frame if preview is None else preview,
+                    'progress': progress,
+                    'rgb565': data if send else None,
+                }
+        render = context if context is not None else self._render_context()
+        if render is not None and index >= 0:
+            native = self.media.device_frame(index, *self._device_frame_key(render))
+
+        if native is not None and self.media.is_device_native:
+            processed = frame  # Playing a .tdf: frames are already adjusted
+        else:
+            if self.overlay.enabled:
+                frame = self.overlay.render(frame)
+            processed = self._apply_adjustments(frame)
+
+        result: dict[str, Any] = {'preview': processed, 'progress': progress,
+                                  'rgb565': None}
+        if send and native is not None:
+            result['rgb565'] = native  # Slice of the mapped .tdf, no encode
+        elif send:
+            preview = None if processed is self.current_image else processed
+            encoder = self._frame_encoder(processed, index, preview, context)
+            if encode:
+                result['rgb565'] = encoder()
+            else:
+                result['encode'] = encoder
+
+        return result
+
+    def _frame_encoder(self, image: Any, index: int, preview: Any,
+                       context: tuple | None):
+        """Callable that encodes *image* and stores it in the frame cache."""
+        def encode() -> bytes:
+            data = self._encode_for_device(image)
+            if context is not None:
+                self.frame_cache.put(index, preview, data, context=context)
+            return data
+        return encode
+
+    def _frame_cache_context(self) -> tuple | None:
+        """Everything that shapes a cached frame's bytes, or None if uncacheable.
+
+        Text/metric elements change between loops, so only plain and
+        mask-only overlays are cached.  The mask image itself is part of
+        the context (tuple comparison checks identity first, so this is
+        cheap while the mask is unchanged).
+        """
+        if not self.frame_cache.max_bytes or self.media.frame_index < 0:
+            return None
+        return self._render_context()
 
+    def _render_context(self) -> tuple | None:
+        """Render inputs of the current video frames (see _frame_cache_context)."""
+        mask = None
         if self.overlay.enabled:
-            frame = self.overlay.render(frame)
+            if self.overlay.config:
+                return None
+            if self.overlay.theme_mask and self.overlay.theme_mask_visible:
+                mask = (self.overlay.theme_mask,
+                        self.overlay.theme_mask_position,
+                        self.overlay._get_scale_factor())
+        device = self.devices.selected
+        protocol = device.protocol if device else 'scsi'
+        return (self.media.source_path, self.lcd_size, self.rotation,
+                self.brightness, mask, protocol,
+                device.resolution if device else None)
+
+    def _note_loop(self, index: int) -> None:
+        """Fill the device-frames cache once the animation has looped.
+
+        The first time playback wraps around, a .tdf of the animation is
+        written on a background thread (unless one is current already or
+        the overlay can't be baked in); the next tick after it finishes
+        picks it up.
+        """
+        if self._fill_done:
+            self._fill_done = False
+            self.media.reset_device_frames()
+        source = self.media.source_path
+        last_source, last_index = self._loop_position
+        self._loop_position = (source, index)
+        if (source != last_source or index < 0 or index >= last_index
+                or self.media.is_device_native):
+            return
+        render = self._render_context()
+        if render is None:
+            return
+        fmt, digest = self._device_frame_key(render)
+        key = (source, fmt, digest)
+        if (key in self._filled_keys
+                or (self._fill_thread is not None and self._fill_thread.is_alive())):
+            return
+        self._filled_keys.add(key)
+        if (not Settings.get_device_frames_cache_quota()
+                or self.media.device_frame(0, fmt, digest) is not None):
+            return
+        export = self._device_frames_export()
+        if isinstance(export, str):
+            return
 
-        processed = self._apply_adjustments(frame)
+        def fill() -> None:
+            ok, msg = export()
+            log.info("Device frames cache: %s", msg)
+            self._fill_done = ok
 
-        result: dict[str, Any] = {'preview': processed, 'progress': progress}
+        self._fill_thread = threading.Thread(target=fill, name="trcc-device-frames",
+                                             daemon=True)
+        self._fill_thread.start()
 
-        if should_send and self.auto_send:
-            result['rgb565'] = self._encode_for_device(processed)
-        else:
-            result['rgb565'] = None
+    def _device_frame_key(self, context: tuple) -> tuple[Any, bytes]:
+        """(FrameFormat, context digest) a pre-encoded .tdf must match.
 
-        return result
+        *context* is a _frame_cache_context() tuple; the mask, if any, is
+        reduced to a digest of its pixels and placement.
+        """
+        from ..device_frames import FrameFormat, context_digest
+
+        _, lcd_size, rotation, brightness, mask, protocol, resolution = context
+        fmt = FrameFormat.for_device(
+            protocol, resolution or lcd_size,
+            ImageService.byte_order_for(protocol, resolution or (320, 320)),
+            rotation, brightness)
+        if mask is None:
+            return fmt, b''
+        if self._mask_digest is None or self._mask_digest[0] != mask:
+            image, position, scale = mask
+            self._mask_digest = (mask, context_digest(
+                image.mode, image.size, image.tobytes(), position, scale))
+        return fmt, self._mask_digest[1]
 
     def get_video_interval(self) -> int:
-        """Get video frame interval in ms for timer setup."""
-        return self.media.frame_interval_ms
+        """Get video timer interval in ms (paced ticks hold or drop frames)."""
+        return self.media.tick_interval_ms
 
     def is_video_playing(self) -> bool:
         """Check if video is currently playing."""
@@ -437,7 +665,11 @@ class DisplayService:
         C# protocol: bulk devices (USBLCDNew) use JPEG (cmd=2),
         SCSI/HID use raw RGB565.
         """
-        device = self.devices.selected
+        return self._encode_for(img, self.devices.selected)
+
+    @staticmethod
+    def _encode_for(img: Any, device: Any) -> bytes:
+        """Encode *img* for *device* (None: SCSI, 320x320) — see _encode_for_device."""
         protocol = device.protocol if device else 'scsi'
 
         if protocol == 'bulk':
@@ -485,15 +717,75 @@ class DisplayService:
         """Get current overlay config for saving."""
         return self.overlay.config
 
+    # ── Device frames export ──────────────────────────────────────────
+
+    def export_device_frames(self, export_path: Path | None = None) -> Tuple[bool, str]:
+        """Pre-encode the loaded animation for the selected device (.tdf).
+
+        Without *export_path* the file goes to the device-frames cache,
+        where playback picks it up, and the cache is pruned to its quota.
+        Mask-only and plain themes can be baked in; text overlays change
+        between loops and can't.
+        """
+        export = self._device_frames_export(export_path)
+        if isinstance(export, str):
+            return False, export
+        result = export()
+        self.media.reset_device_frames()  # Look again on the next tick
+        return result
+
+    def _device_frames_export(self, export_path: Path | None = None):
+        """Callable writing the loaded animation's .tdf, or why it can't be made.
+
+        The callable works on a snapshot of the mask, adjustments and
+        device, so it may run on another thread while playback goes on.
+        """
+        from ..dc_writer import DcWriter
+        from ..device_frames import cache_path, prune_cache
+
+        source = self.media.source_path
+        if source is None or not source.exists():
+            return "No animation loaded"
+        if self.media.is_device_native:
+            return "Already pre-encoded"
+        context = self._render_context()
+        if context is None:
+            return "Themes with text overlays can't be pre-encoded"
+        fmt, digest = self._device_frame_key(context)
+        path = export_path or Path(cache_path(source, fmt, digest))
+
+        overlay = self.overlay.mask_copy() if self.overlay.enabled else None
+        brightness, rotation = self.brightness, self.rotation
+        device = self.devices.selected
+
+        def encode(frame: Any) -> bytes:
+            if overlay is not None:
+                frame = overlay.render(frame)
+            frame = ImageService.apply_brightness(frame, brightness)
+            frame = ImageService.apply_rotation(frame, rotation)
+            return self._encode_for(frame, device)
+
+        def export() -> Tuple[bool, str]:
+            try:
+                count = DcWriter.export_device_frames(
+                    str(source), str(path), fmt, encode, digest)
+            except Exception as e:
+                return False, f"Export failed: {e}"
+            if export_path is None:
+                prune_cache(Settings.get_device_frames_cache_quota(), keep=str(path))
+            return True, f"Pre-encoded {count} frames: {path.name}"
+        return export
+
     # ── Theme export / import (delegates to ThemeService) ─────────────
 
     def export_config(self, export_path: Path) -> Tuple[bool, str]:
-        """Export current theme as .tr or JSON file."""
+        """Export current theme as .tr, device frames (.tdf) or JSON file."""
         if not self.current_theme_path:
             return False, "No theme loaded"
 
-        if str(export_path).endswith('.tr'):
-            return ThemeService.export_tr(self.current_theme_path, export_path)
+        if export_path.suffix.lower() in ('.tr', '.tdf'):
+            return ThemeService.export_tr(self.current_theme_path, export_path,
+                                          device_frames=self.export_device_frames)
 
         # JSON export
         config = {
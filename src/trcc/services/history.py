@@ -0,0 +1,221 @@
+"""Metric history — fixed-memory time series per sensor metric.
+
+Pure Python + numpy, no Qt dependencies.
+Each metric key gets one ring buffer per retention tier.  A tier stores
+the average of every sample that falls into one of its buckets, so the
+finest tier holds seconds and coarser tiers hold minutes or hours at the
+same cost per point.  Memory is allocated once per key and never grows.
+"""
+from __future__ import annotations
+
+import math
+import threading
+import time
+from typing import Iterable, Mapping, Optional
+
+import numpy as np
+
+
+class RingBuffer:
+    """Fixed-capacity (time, value) series on preallocated numpy arrays."""
+
+    def __init__(self, capacity: int) -> None:
+        if capacity <= 0:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+        self.capacity = capacity
+        self._times = np.zeros(capacity, dtype=np.float64)
+        self._values = np.zeros(capacity, dtype=np.float32)
+        self._head = 0    # Next write index
+        self._count = 0   # Valid points (<= capacity)
+        self.appended = 0  # Points ever appended (grows past capacity)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, t: float, value: float) -> None:
+        """Add a point, overwriting the oldest one when full."""
+        self._times[self._head] = t
+        self._values[self._head] = value
+        self._head = (self._head + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+        self.appended += 1
+
+    def replace_last(self, t: float, value: float) -> None:
+        """Overwrite the newest point (append if empty)."""
+        if not self._count:
+            self.append(t, value)
+            return
+        last = (self._head - 1) % self.capacity
+        self._times[last] = t
+        self._values[last] = value
+
+    def last(self) -> Optional[tuple[float, float]]:
+        """Newest (time, value), or None if empty."""
+        if not self._count:
+            return None
+        last = (self._head - 1) % self.capacity
+        return float(self._times[last]), float(self._values[last])
+
+    def _order(self, count: int) -> np.ndarray:
+        """Indices of the newest *count* points, oldest first."""
+        start = self._head - count
+        return np.arange(start, self._head) % self.capacity
+
+    def tail(self, count: int) -> np.ndarray:
+        """Values of the newest *count* points, oldest first (a copy)."""
+        count = min(count, self._count)
+        if count <= 0:
+            return np.empty(0, dtype=self._values.dtype)
+        return self._values[self._order(count)]
+
+    def arrays(self, since: Optional[float] = None) -> tuple[np.ndarray, np.ndarray]:
+        """(times, values) oldest first, limited to times > *since* (copies)."""
+        order = self._order(self._count)
+        times = self._times[order]
+        values = self._values[order]
+        if since is not None:
+            start = int(np.searchsorted(times, since, side='right'))
+            times, values = times[start:], values[start:]
+        return times, values
+
+
+class _Series:
+    """One metric: a ring buffer per tier plus each tier's open bucket."""
+
+    __slots__ = ('buffers', 'bucket', 'total', 'count', 'version')
+
+    def __init__(self, tiers: tuple[tuple[float, int], ...]) -> None:
+        self.buffers = [RingBuffer(capacity) for _, capacity in tiers]
+        self.bucket = [-1] * len(tiers)   # Bucket index of the newest point
+        self.total = [0.0] * len(tiers)   # Running sum of the open bucket
+        self.count = [0] * len(tiers)
+        self.version = 0                  # Bumped on every recorded sample
+
+
+class MetricHistory:
+    """Ring-buffered history for a set of metric keys.
+
+    ``tiers`` is ``((interval_s, points), ...)`` from finest to coarsest;
+    the default keeps 5 minutes at 1 s, 1 hour at 10 s and 24 hours at
+    1 min, about 25 KB per metric.  Recording several samples within one
+    bucket averages them, so callers may record at any rate.
+
+    Thread-safe: the sensor sampler records while the GUI and the REST
+    API read.
+    """
+
+    DEFAULT_TIERS: tuple[tuple[float, int], ...] = (
+        (1.0, 300),
+        (10.0, 360),
+        (60.0, 1440),
+    )
+
+    def __init__(self, tiers: Optional[Iterable[tuple[float, int]]] = None) -> None:
+        if tiers is None:
+            tiers = self.DEFAULT_TIERS
+        tiers = tuple((float(i), int(n)) for i, n in tiers)
+        if not tiers:
+            raise ValueError("MetricHistory needs at least one tier")
+        if any(i <= 0 or n <= 0 for i, n in tiers):
+            raise ValueError(f"tier intervals and sizes must be positive: {tiers}")
+        self.tiers = tuple(sorted(tiers))
+        self._series: dict[str, _Series] = {}
+        self._lock = threading.Lock()
+
+    # ── Recording ────────────────────────────────────────────────────
+
+    def record(self, metrics: Mapping[str, float],
+               now: Optional[float] = None) -> None:
+        """Add one sample per metric, timestamped *now* (Unix time)."""
+        if now is None:
+            now = time.time()
+        with self._lock:
+            for key, value in metrics.items():
+                try:
+                    value = float(value)
+                except (TypeError, ValueError):
+                    continue
+                if math.isnan(value):
+                    continue
+                series = self._series.get(key)
+                if series is None:
+                    series = self._series[key] = _Series(self.tiers)
+                self._add(series, now, value)
+
+    def _add(self, series: _Series, now: float, value: float) -> None:
+        for tier, (interval, _) in enumerate(self.tiers):
+            bucket = int(now // interval)
+            buf = series.buffers[tier]
+            if bucket == series.bucket[tier]:
+                series.total[tier] += value
+                series.count[tier] += 1
+                buf.replace_last(bucket * interval,
+                                 series.total[tier] / series.count[tier])
+            elif bucket > series.bucket[tier]:
+                series.bucket[tier] = bucket
+                series.total[tier] = value
+                series.count[tier] = 1
+                buf.append(bucket * interval, value)
+            # Older than the newest bucket (clock stepped back): drop
+        series.version += 1
+
+    def clear(self) -> None:
+        """Forget every series."""
+        with self._lock:
+            self._series.clear()
+
+    # ── Reading ──────────────────────────────────────────────────────
+
+    def keys(self) -> list[str]:
+        """Metric keys with at least one sample."""
+        with self._lock:
+            return sorted(self._series)
+
+    def tier_for(self, resolution: Optional[float] = None) -> int:
+        """Finest tier whose interval is at least *resolution* seconds.
+
+        None (or anything finer than the finest tier) picks tier 0;
+        anything coarser than the coarsest picks the last tier.
+        """
+        if resolution is None:
+            return 0
+        for tier, (interval, _) in enumerate(self.tiers):
+            if interval >= resolution:
+                return tier
+        return len(self.tiers) - 1
+
+    def series(self, key: str, resolution: Optional[float] = None,
+               since: Optional[float] = None) -> tuple[np.ndarray, np.ndarray]:
+        """(times, values) for *key*, oldest first.
+
+        Args:
+            resolution: Seconds per point; picks the tier via tier_for().
+            since: Only points with a bucket time after this Unix time.
+        """
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                return (np.empty(0, dtype=np.float64),
+                        np.empty(0, dtype=np.float32))
+            return series.buffers[self.tier_for(resolution)].arrays(since)
+
+    def tail(self, key: str, count: int, tier: int = 0) -> np.ndarray:
+        """Newest *count* values of *key* in *tier*, oldest first."""
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                return np.empty(0, dtype=np.float32)
+            return series.buffers[tier].tail(count)
+
+    def position(self, key: str, tier: int = 0) -> tuple[int, int]:
+        """(points ever appended, version) for *key* in *tier*.
+
+        The appended count tells a reader how many new points arrived
+        since it last looked; the version also changes when the newest
+        point was averaged in place.
+        """
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                return 0, 0
+            return series.buffers[tier].appended, series.version
@@ -8,19 +8,201 @@ from __future__ import annotations
 
 import io
 import struct
+import sys
+import threading
 from typing import Any
 
 import numpy as np
 from PIL import Image as PILImage
 
+try:
+    import simplejpeg  # pyright: ignore[reportMissingImports]
+    SIMPLEJPEG_AVAILABLE = True
+except ImportError:
+    simplejpeg = None
+    SIMPLEJPEG_AVAILABLE = False
+
 # Cap decompression to 4x the largest LCD (1920x720). Prevents decompression
 # bombs from crafted theme images causing OOM.
 PILImage.MAX_IMAGE_PIXELS = 1920 * 720 * 4  # 5,529,600 pixels
 
 
+class Rgb565Encoder:
+    """Reusable RGB888 → RGB565 packer for one (width, height, byte_order).
+
+    Owns a preallocated uint16 output buffer and packs each frame into it
+    with in-place ufuncs, so the only full-frame allocation per call is
+    PIL's own pixel export.  ``encode()`` returns a memoryview over that
+    buffer — it is overwritten by the next ``encode()``, so copy it
+    (``bytes(view)``) before handing it to another thread.
+    """
+
+    def __init__(self, width: int, height: int, byte_order: str = '>'):
+        if byte_order not in ('>', '<'):
+            raise ValueError(f"byte_order must be '>' or '<', got {byte_order!r}")
+        self.width = width
+        self.height = height
+        self.byte_order = byte_order
+        self._swap = (byte_order == '>') != (sys.byteorder == 'big')
+        self._out = np.empty((height, width), dtype=np.uint16)
+        self._tmp = np.empty((height, width), dtype=np.uint16)
+        self._view = memoryview(self._out).cast('B')
+
+    @property
+    def key(self) -> tuple[int, int, str]:
+        return (self.width, self.height, self.byte_order)
+
+    @property
+    def nbytes(self) -> int:
+        return self.width * self.height * 2
+
+    def encode(self, img: Any) -> memoryview:
+        """Pack a PIL Image into the shared buffer and return a view of it."""
+        if img.size != (self.width, self.height):
+            raise ValueError(
+                f"Image is {img.size[0]}x{img.size[1]}, "
+                f"encoder is {self.width}x{self.height}")
+        if img.mode != 'RGB':
+            img = img.convert('RGB')
+
+        arr = np.asarray(img)
+        out, tmp = self._out, self._tmp
+        # R: top 5 bits → [15:11]
+        np.right_shift(arr[:, :, 0], 3, out=out, casting='unsafe')
+        np.left_shift(out, 11, out=out)
+        # G: top 6 bits → [10:5]
+        np.right_shift(arr[:, :, 1], 2, out=tmp, casting='unsafe')
+        np.left_shift(tmp, 5, out=tmp)
+        np.bitwise_or(out, tmp, out=out)
+        # B: top 5 bits → [4:0]
+        np.right_shift(arr[:, :, 2], 3, out=tmp, casting='unsafe')
+        np.bitwise_or(out, tmp, out=out)
+        if self._swap:
+            out.byteswap(inplace=True)
+        return self._view
+
+
+class JpegEncoder:
+    """Rate-controlled JPEG encoder for one frame stream.
+
+    C# CompressionImage() encodes at quality 95, then 90, 85, ... until the
+    frame fits under the size cap — up to 19 encodes for a busy frame.
+    Consecutive frames of a stream compress alike, so this starts at the
+    quality that fit the previous frame (one encode in steady state),
+    probes one step up when that frame left headroom, and binary-searches
+    the lower steps when the prediction doesn't fit.  Qualities stay on
+    the same 5-point ladder as the C# loop.
+
+    Uses simplejpeg (libjpeg-turbo, no BytesIO round trip) when installed.
+    """
+
+    STEP = 5
+    MIN_QUALITY = 5
+    HEADROOM = 0.8  # Probe a step up when the last frame used < 80% of the cap
+
+    def __init__(self, use_simplejpeg: bool = SIMPLEJPEG_AVAILABLE):
+        self.use_simplejpeg = use_simplejpeg and SIMPLEJPEG_AVAILABLE
+        self.quality: int | None = None  # Quality the last frame was sent at
+        self._last_size = 0
+        self.frames = 0
+        self.encodes = 0
+
+    def encode(self, img: Any, quality: int = 95, max_size: int = 450_000) -> bytes:
+        """Encode at the highest ladder quality predicted to fit *max_size*."""
+        if img.mode != 'RGB':
+            img = img.convert('RGB')
+        ladder = list(range(quality, self.MIN_QUALITY - 1, -self.STEP))
+        if not ladder or ladder[-1] != self.MIN_QUALITY:
+            ladder.append(self.MIN_QUALITY)  # C# fallback: minimum quality
+
+        tried: dict[int, bytes] = {}
+
+        def fits(i: int) -> bool:
+            if i not in tried:
+                tried[i] = self._encode_at(img, ladder[i])
+            return len(tried[i]) < max_size
+
+        start = 0
+        if self.quality in ladder:
+            start = ladder.index(self.quality)
+            if start > 0 and self._last_size < max_size * self.HEADROOM:
+                start -= 1
+
+        if fits(start):
+            best = start
+        else:
+            # Highest quality below the prediction that fits
+            best = len(ladder) - 1
+            lo, hi = start + 1, len(ladder) - 1
+            while lo <= hi:
+                mid = (lo + hi) // 2
+                if fits(mid):
+                    best, hi = mid, mid - 1
+                else:
+                    lo = mid + 1
+            fits(best)
+
+        data = tried[best]
+        self.quality = ladder[best]
+        self._last_size = len(data)
+        self.frames += 1
+        return data
+
+    def _encode_at(self, img: Any, quality: int) -> bytes:
+        self.encodes += 1
+        if self.use_simplejpeg:
+            return simplejpeg.encode_jpeg(
+                np.asarray(img), quality=quality,
+                colorspace='RGB', colorsubsampling='420')
+        buf = io.BytesIO()
+        img.save(buf, format='JPEG', quality=quality)
+        return buf.getvalue()
+
+    @property
+    def encodes_per_frame(self) -> float:
+        return self.encodes / self.frames if self.frames else 0.0
+
+
 class ImageService:
     """Stateless image processing utilities."""
 
+    # Per-thread encoder cache: a view returned on one thread is never
+    # overwritten by an encode on another.
+    _encoders = threading.local()
+
+    @staticmethod
+    def rgb565_encoder(width: int, height: int, byte_order: str = '>') -> Rgb565Encoder:
+        """Get this thread's cached Rgb565Encoder for a resolution + byte order."""
+        cache = getattr(ImageService._encoders, 'cache', None)
+        if cache is None:
+            cache = ImageService._encoders.cache = {}
+        key = (width, height, byte_order)
+        enc = cache.get(key)
+        if enc is None:
+            enc = cache[key] = Rgb565Encoder(width, height, byte_order)
+        return enc
+
+    @staticmethod
+    def jpeg_encoder(width: int, height: int) -> JpegEncoder:
+        """Get this thread's JpegEncoder for a resolution (one per stream)."""
+        cache = getattr(ImageService._encoders, 'jpeg', None)
+        if cache is None:
+            cache = ImageService._encoders.jpeg = {}
+        enc = cache.get((width, height))
+        if enc is None:
+            enc = cache[(width, height)] = JpegEncoder()
+        return enc
+
+    @staticmethod
+    def to_rgb565_view(img: Any, byte_order: str = '>') -> memoryview:
+        """Convert PIL Image to RGB565 without copying out of the encoder buffer.
+
+        The view is only valid until the next encode of the same size on
+        this thread — send it synchronously or use to_rgb565().
+        """
+        return ImageService.rgb565_encoder(
+            img.width, img.height, byte_order).encode(img)
+
     @staticmethod
     def to_rgb565(img: Any, byte_order: str = '>') -> bytes:
         """Convert PIL Image to RGB565 bytes.
@@ -32,38 +214,19 @@ class ImageService:
             img: PIL Image.
             byte_order: '>' for big-endian, '<' for little-endian.
         """
-        if img.mode != 'RGB':
-            img = img.convert('RGB')
-
-        arr = np.array(img, dtype=np.uint16)
-        r = (arr[:, :, 0] >> 3) & 0x1F
-        g = (arr[:, :, 1] >> 2) & 0x3F
-        b = (arr[:, :, 2] >> 3) & 0x1F
-        rgb565 = (r << 11) | (g << 5) | b
-        return rgb565.astype(f'{byte_order}u2').tobytes()
+        return ImageService.to_rgb565_view(img, byte_order).tobytes()
 
     @staticmethod
     def to_jpeg(img: Any, quality: int = 95, max_size: int = 450_000) -> bytes:
         """Compress PIL Image to JPEG bytes.
 
-        Matches C# CompressionImage(): starts at *quality*, reduces by 5
-        until output < *max_size*.  USBLCDNew bulk devices expect JPEG
-        (cmd=2) instead of raw RGB565.
+        Like C# CompressionImage(): picks a quality from *quality*,
+        *quality*-5, ... that comes in under *max_size* (5 if none does),
+        but rate-controlled per thread and resolution — see JpegEncoder.
+        USBLCDNew bulk devices expect JPEG (cmd=2) instead of raw RGB565.
         """
-        if img.mode != 'RGB':
-            img = img.convert('RGB')
-
-        for q in range(quality, 4, -5):
-            buf = io.BytesIO()
-            img.save(buf, format='JPEG', quality=q)
-            data = buf.getvalue()
-            if len(data) < max_size:
-                return data
-
-        # Fallback: minimum quality
-        buf = io.BytesIO()
-        img.save(buf, format='JPEG', quality=5)
-        return buf.getvalue()
+        return ImageService.jpeg_encoder(img.width, img.height).encode(
+            img, quality, max_size)
 
     @staticmethod
     def apply_rotation(image: Any, rotation: int) -> Any:
@@ -7,7 +7,7 @@ and LEDDeviceController (config, protocol factory).
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from ..core.models import LEDMode, LEDState, LEDZoneState
 
@@ -136,6 +136,28 @@ class LEDService:
         """Update cached sensor metrics for temp/load-linked modes."""
         self._metrics = metrics
 
+    def required_metrics(self) -> Set[str]:
+        """Metric keys the current modes and segment display read.
+
+        Temp/load-linked modes need their source's temperature or load;
+        segment displays need the metrics of the phases the sensor
+        source lets them rotate through.
+        """
+        if self.state.zone_count > 1 and self.state.zones:
+            modes = {zone.mode for zone in self.state.zones if zone.on}
+        else:
+            modes = {self.state.mode}
+        keys: Set[str] = set()
+        if LEDMode.TEMP_LINKED in modes:
+            keys.add(f"{self.state.temp_source}_temp")
+        if LEDMode.LOAD_LINKED in modes:
+            keys.add("cpu_percent" if self.state.load_source == "cpu" else "gpu_usage")
+        if self._segment_mode and self._seg_display:
+            for phase in range(self._seg_display.phase_count):
+                if self._phase_allowed(phase):
+                    keys.update(self._seg_display.phase_metrics(phase))
+        return keys
+
     def configure_for_style(self, style_id: int) -> None:
         """Configure state for a specific LED device style."""
         from ..device_led import LED_STYLES
@@ -6,20 +6,117 @@ Owns all playback state — decoders are pure frame sources.
 from __future__ import annotations
 
 import logging
+import time
+from collections import deque
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 from ..core.models import PlaybackState, VideoState
 
 log = logging.getLogger(__name__)
 
 
+@dataclass
+class PacingStats:
+    """Presentation timing since playback (re)started."""
+    presented: int = 0
+    dropped: int = 0        # Skipped to catch up with the clock
+    duplicated: int = 0     # Ticks with no new frame due (previous frame held)
+    fps: float = 0.0        # Achieved presentation rate over the recent window
+    jitter_ms: float = 0.0  # Mean |presentation - deadline| over the window
+
+    def __str__(self) -> str:
+        return (f"{self.fps:.1f} fps, jitter {self.jitter_ms:.1f} ms, "
+                f"{self.dropped} dropped, {self.duplicated} duplicated")
+
+
+class FramePacer:
+    """Absolute frame deadlines on the monotonic clock.
+
+    Each deadline is the previous one plus that frame's delay, so late
+    ticks and slow sends never accumulate into drift: a late tick shows
+    the frame due *now* (dropping the ones it missed), an early tick
+    keeps the current frame up.
+    """
+
+    EARLY_TOLERANCE = 0.25  # Fraction of a frame delay a tick may come early
+    MAX_LAG_S = 1.0         # Further behind than this: resync, don't fast-forward
+    WINDOW = 32             # Presentations in the fps/jitter window
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self.clock = clock
+        self._deadline = 0.0
+        self._times: deque[float] = deque(maxlen=self.WINDOW)
+        self._errors: deque[float] = deque(maxlen=self.WINDOW)
+        self.stats = PacingStats()
+
+    def reset(self) -> None:
+        """Start a new timeline: the next frame is due now."""
+        self._deadline = self.clock()
+        self._times.clear()
+        self._errors.clear()
+        self.stats = PacingStats()
+
+    def resync(self, now: float) -> None:
+        """Move the timeline to *now* (after a seek or stall), keeping stats."""
+        self._deadline = now
+
+    @property
+    def next_deadline(self) -> float:
+        return self._deadline
+
+    def due(self, now: float, delay_s: float) -> bool:
+        """Is the next frame (shown for *delay_s*) due at *now*?"""
+        return now >= self._deadline - delay_s * self.EARLY_TOLERANCE
+
+    def behind(self, now: float, delay_s: float) -> bool:
+        """Is the frame after the next one already due (drop the next)?"""
+        return now >= self._deadline + delay_s
+
+    def skip(self, delay_s: float) -> None:
+        self._deadline += delay_s
+        self.stats.dropped += 1
+
+    def hold(self) -> None:
+        self.stats.duplicated += 1
+
+    def present(self, now: float, delay_s: float) -> None:
+        """Record a frame shown at *now*; its successor is due *delay_s* later."""
+        self._errors.append(abs(now - self._deadline))
+        self._times.append(now)
+        self._deadline += delay_s
+        stats = self.stats
+        stats.presented += 1
+        stats.jitter_ms = 1000 * sum(self._errors) / len(self._errors)
+        span = self._times[-1] - self._times[0]
+        if span > 0:
+            stats.fps = (len(self._times) - 1) / span
+
+    def wait(self) -> None:
+        """Sleep until the next deadline."""
+        delay = self._deadline - self.clock()
+        if delay > 0:
+            time.sleep(delay)
+
+
 class MediaService:
     """Video/animation lifecycle: load, play, pause, stop, advance."""
 
-    # LCD send interval: send every Nth frame.
+    # LCD send interval: send every Nth frame.  When paced, frames also
+    # skip the send while the previous transfer's measured cost
+    # (send_cost_s) hasn't elapsed — a slow transport gets fewer frames
+    # rather than a growing backlog.
     LCD_SEND_INTERVAL = 1
 
+    # Stream non-.zt video through a bounded buffer instead of decoding
+    # the whole clip into memory up front.
+    STREAM_VIDEO = True
+
+    # Play non-.zt video from the on-disk transcode cache when it has an
+    # entry, and fill the entry in the background on first play.
+    TRANSCODE_VIDEO = True
+
     def __init__(self) -> None:
         self._state = VideoState()
         self._frames: list[Any] = []
@@ -27,8 +124,21 @@ class MediaService:
         self._source_path: Path | None = None
         self._target_size: tuple[int, int] = (320, 320)
         self._decoder: Any = None
+        self._stream: Any = None  # VideoStream when streaming
+        # Pre-encoded device frames (.tdf) for the loaded source, looked up
+        # per (format, context) by device_frame()
+        self._device_frames: Any = None
+        self._device_key: tuple | None = None
+        self._transcode_quota: int | None = None  # Read from config on first use
         self._frame_counter = 0
         self._progress_counter = 0
+        self._frame_index = -1  # Index of the frame advance_frame() last returned
+        # Paced playback: tick() follows the wall clock (frames are dropped
+        # or held to stay on time) instead of advancing once per call.
+        self.paced = False
+        self._pacer = FramePacer()
+        self.send_cost_s = 0.0  # Measured seconds per LCD transfer (0 = unknown)
+        self._last_send_at = 0.0
 
     # ── Target size ──────────────────────────────────────────────────
 
@@ -37,23 +147,46 @@ class MediaService:
 
     # ── Load ─────────────────────────────────────────────────────────
 
-    def load(self, path: Path, preload: bool = True) -> bool:
-        """Load video/animation file (.mp4, .gif, .zt).
+    def load(self, path: Path, preload: bool = True,
+             stream: bool | None = None) -> bool:
+        """Load video/animation file (.mp4, .gif, .zt, .tdf).
+
+        Args:
+            stream: Stream video frames from FFmpeg through a bounded
+                buffer (default: STREAM_VIDEO).  Ignored for .zt and
+                .tdf files.
 
         Returns True if loaded successfully.
         """
         self.stop()
+        self._close_device_frames()
+        if self._decoder is not None:
+            self._decoder.close()  # mmap, read-ahead, FFmpeg pipe of the previous source
+        self._decoder = self._stream = None
         self._source_path = path
-        self._frames.clear()
-        self._delays.clear()
+        self._frames = []
+        self._delays = []
+        self._frame_index = -1
 
         try:
-            from ..media_player import ThemeZtDecoder, VideoDecoder
+            from ..device_frames import SUFFIX as DEVICE_FRAMES_SUFFIX
+            from ..device_frames import DeviceFrames
+            from ..media_player import ThemeZtDecoder, VideoDecoder, VideoStream
 
             suffix = path.suffix.lower()
+            if stream is None:
+                stream = self.STREAM_VIDEO
             if suffix == '.zt':
                 self._decoder = ThemeZtDecoder(str(path), self._target_size)
                 self._delays = list(self._decoder.delays)
+            elif suffix == DEVICE_FRAMES_SUFFIX:
+                self._decoder = DeviceFrames(path)
+                self._delays = list(self._decoder.delays)
+            elif (transcoded := self._transcoded(path)) is not None:
+                self._decoder = ThemeZtDecoder(transcoded, self._target_size)
+                self._delays = list(self._decoder.delays)
+            elif stream:
+                self._decoder = self._stream = VideoStream(str(path), self._target_size)
             else:
                 self._decoder = VideoDecoder(str(path), self._target_size)
 
@@ -62,25 +195,50 @@ class MediaService:
             self._state.current_frame = 0
             self._state.state = PlaybackState.STOPPED
 
-            if preload:
-                self._frames = list(self._decoder.frames)
+            if preload and self._stream is None:
+                # Share the decoder's sequence — no second copy of every
+                # frame (.zt frames are decoded as they are indexed)
+                self._frames = self._decoder.frames
 
             return True
         except Exception as e:
             log.error("Failed to load video: %s", e)
             return False
 
+    def _transcoded(self, path: Path) -> str | None:
+        """Transcode-cache entry for video *path*, queueing one on a miss."""
+        if not self.TRANSCODE_VIDEO:
+            return None
+        from ..transcode_cache import TranscodeCache
+
+        if self._transcode_quota is None:
+            from ..conf import Settings
+            self._transcode_quota = Settings.get_transcode_cache_quota()
+        if not self._transcode_quota:
+            return None
+        cache = TranscodeCache.shared(self._transcode_quota)
+        entry = cache.lookup(path, self._target_size)
+        if entry is None:
+            cache.request(path, self._target_size)
+        else:
+            log.info("Playing %s from transcode cache", path.name)
+        return entry
+
     # ── Playback control ─────────────────────────────────────────────
 
     def play(self) -> None:
-        if self._frames:
+        if self.has_frames:
             self._state.state = PlaybackState.PLAYING
             self._frame_counter = 0
+            self._last_send_at = 0.0
+            self._pacer.reset()
 
     def pause(self) -> None:
+        self._log_pacing()
         self._state.state = PlaybackState.PAUSED
 
     def stop(self) -> None:
+        self._log_pacing()
         self._state.state = PlaybackState.STOPPED
         self._state.current_frame = 0
 
@@ -95,6 +253,9 @@ class MediaService:
             frame = int((percent / 100) * self._state.total_frames)
             self._state.current_frame = max(
                 0, min(frame, self._state.total_frames - 1))
+            if self._stream is not None:
+                self._stream.seek(self._state.current_frame)
+            self._pacer.resync(self._pacer.clock())
 
     # ── Frame access ─────────────────────────────────────────────────
 
@@ -102,10 +263,64 @@ class MediaService:
         """Get frame at index (or current frame)."""
         if index is None:
             index = self._state.current_frame
+        if self._stream is not None:
+            if index != self._stream.position:
+                self._stream.seek(index)
+            return self._stream.peek()
         if 0 <= index < len(self._frames):
             return self._frames[index]
         return None
 
+    def device_frame(self, index: int, fmt: Any,
+                     context: bytes = b'') -> memoryview | None:
+        """Pre-encoded payload of frame *index* for a device, if available.
+
+        Uses the loaded .tdf itself, or a current device-frames file made
+        from the loaded source (see DeviceFrames.find), when it was
+        encoded as *fmt* under *context*.  The lookup is redone only when
+        the format or context changes.  Returns a view into the mapped
+        file, or None.
+        """
+        key = (fmt, context)
+        if key != self._device_key:
+            self._close_device_frames()
+            self._device_key = key
+            self._device_frames = self._find_device_frames(fmt, context)
+            if self._device_frames is not None:
+                log.info("Playing pre-encoded device frames: %s",
+                         self._device_frames.path)
+        frames = self._device_frames
+        if frames is None or not 0 <= index < frames.frame_count:
+            return None
+        return frames.frame(index)
+
+    def _find_device_frames(self, fmt: Any, context: bytes) -> Any:
+        from ..device_frames import DeviceFrames
+
+        if self._source_path is None:
+            return None
+        if isinstance(self._decoder, DeviceFrames):
+            if self._decoder.format == fmt:
+                return self._decoder
+            return None
+        return DeviceFrames.find(self._source_path, fmt, context)
+
+    def reset_device_frames(self) -> None:
+        """Forget the device-frames lookup (e.g. after writing a new .tdf)."""
+        self._close_device_frames()
+
+    def _close_device_frames(self) -> None:
+        frames, self._device_frames = self._device_frames, None
+        self._device_key = None
+        if frames is not None and frames is not self._decoder:
+            frames.close()
+
+    @property
+    def is_device_native(self) -> bool:
+        """Is the loaded source itself a device-frames (.tdf) file?"""
+        from ..device_frames import DeviceFrames
+        return isinstance(self._decoder, DeviceFrames)
+
     def advance_frame(self) -> Any | None:
         """Advance to next frame and return it.
 
@@ -114,7 +329,11 @@ class MediaService:
         if self._state.state != PlaybackState.PLAYING:
             return None
 
+        if self._stream is not None:
+            return self._advance_stream()
+
         frame = self.get_frame()
+        self._frame_index = self._state.current_frame
 
         self._state.current_frame += 1
         if self._state.current_frame >= self._state.total_frames:
@@ -125,6 +344,49 @@ class MediaService:
 
         return frame
 
+    def _skip_frame(self) -> bool:
+        """Step past the current frame without decoding it (paced drops).
+
+        Returns False if playback stopped.
+        """
+        if self._stream is not None:
+            return self.advance_frame() is not None
+        if self._state.state != PlaybackState.PLAYING:
+            return False
+        self._frame_index = self._state.current_frame
+        self._state.current_frame += 1
+        if self._state.current_frame >= self._state.total_frames:
+            if self._state.loop:
+                self._state.current_frame = 0
+            else:
+                self._state.state = PlaybackState.STOPPED
+                return False
+        return True
+
+    def _advance_stream(self) -> Any | None:
+        """Read the next streamed frame; reopen the pipe at end of clip."""
+        stream = self._stream
+        if stream.position != self._state.current_frame:
+            stream.seek(self._state.current_frame)
+        frame = stream.read()
+        if frame is None and stream.at_end:
+            # Actual length is only known once FFmpeg hits EOF
+            if stream.position > 0:
+                self._state.total_frames = stream.position
+            if not self._state.loop or stream.position == 0:
+                self._state.state = PlaybackState.STOPPED
+                self._state.current_frame = 0
+                return None
+            stream.restart()
+            frame = stream.read()
+        if frame is None:
+            return None
+        self._state.current_frame = stream.position
+        self._frame_index = stream.position - 1
+        if self._state.current_frame > self._state.total_frames:
+            self._state.total_frames = self._state.current_frame
+        return frame
+
     def tick(self) -> tuple[Any | None, bool, tuple[float, str, str] | None]:
         """Called by timer to advance one frame.
 
@@ -134,7 +396,7 @@ class MediaService:
         if not self.is_playing:
             return None, False, None
 
-        frame = self.advance_frame()
+        frame = self._advance_paced() if self.paced else self.advance_frame()
         if not frame:
             return None, False, None
 
@@ -152,12 +414,59 @@ class MediaService:
         # LCD send with frame skipping
         should_send = False
         self._frame_counter += 1
-        if self._frame_counter >= self.LCD_SEND_INTERVAL:
+        if self._frame_counter >= self.LCD_SEND_INTERVAL and self._transport_ready():
             self._frame_counter = 0
             should_send = True
 
         return frame, should_send, progress_info
 
+    # ── Pacing ───────────────────────────────────────────────────────
+
+    def _advance_paced(self) -> Any | None:
+        """Advance to the frame due now, or None if the current one still is."""
+        pacer = self._pacer
+        now = pacer.clock()
+        if now - pacer.next_deadline > pacer.MAX_LAG_S:
+            pacer.resync(now)  # Stalled (suspend, debugger): don't fast-forward
+        delay = self._frame_delay_s(self._state.current_frame)
+        if not pacer.due(now, delay):
+            pacer.hold()
+            return None
+        while pacer.behind(now, delay):
+            if not self._skip_frame():
+                return None
+            pacer.skip(delay)
+            delay = self._frame_delay_s(self._state.current_frame)
+        frame = self.advance_frame()
+        if frame is not None:
+            pacer.present(now, delay)
+        return frame
+
+    def _frame_delay_s(self, index: int) -> float:
+        """How long frame *index* stays on screen (.zt delays or 1/fps)."""
+        if 0 <= index < len(self._delays):
+            return self._delays[index] / 1000
+        fps = self._state.fps
+        return 1 / fps if fps > 0 else 0.0625
+
+    def _transport_ready(self) -> bool:
+        """Has the last send's measured transfer time elapsed?"""
+        if not self.paced:
+            return True
+        now = self._pacer.clock()
+        if self.send_cost_s > 0 and now - self._last_send_at < self.send_cost_s:
+            return False
+        self._last_send_at = now
+        return True
+
+    def wait_for_next_frame(self) -> None:
+        """Sleep until the next frame is due (paced playback loops)."""
+        self._pacer.wait()
+
+    def _log_pacing(self) -> None:
+        if self.paced and self.is_playing and self._pacer.stats.presented:
+            log.debug("Playback pacing: %s", self._pacer.stats)
+
     # ── Properties ───────────────────────────────────────────────────
 
     @property
@@ -168,6 +477,23 @@ class MediaService:
     def frame_interval_ms(self) -> int:
         return self._state.frame_interval_ms
 
+    @property
+    def tick_interval_ms(self) -> int:
+        """Timer interval for paced playback: the shortest frame delay."""
+        if self._delays:
+            return max(1, min(self._delays))
+        return self._state.frame_interval_ms
+
+    @property
+    def pacing(self) -> PacingStats:
+        """Achieved fps, jitter and drop/duplicate counts for paced playback."""
+        return self._pacer.stats
+
+    @property
+    def frame_index(self) -> int:
+        """Index of the frame last returned by advance_frame() (-1 if none)."""
+        return self._frame_index
+
     @property
     def source_path(self) -> Path | None:
         return self._source_path
@@ -186,7 +512,11 @@ class MediaService:
 
     @property
     def has_frames(self) -> bool:
-        return bool(self._frames)
+        return bool(self._frames) or self._stream is not None
+
+    @property
+    def is_streaming(self) -> bool:
+        return self._stream is not None
 
     @property
     def state(self) -> VideoState:
@@ -194,8 +524,10 @@ class MediaService:
 
     def close(self) -> None:
         """Release decoder resources."""
+        self._close_device_frames()
         if self._decoder:
             self._decoder.close()
             self._decoder = None
-        self._frames.clear()
-        self._delays.clear()
+        self._stream = None
+        self._frames = []
+        self._delays = []
@@ -7,17 +7,137 @@ Font resolution delegated to FontResolver infrastructure.
 from __future__ import annotations
 
 import logging
+import math
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 from PIL import Image, ImageDraw
 
 from ..font_resolver import FontResolver
+from .history import MetricHistory
 from .system import SystemService
 
 log = logging.getLogger(__name__)
 
 
+class MetricGraph:
+    """Sparkline, bar or area graph of one metric, drawn from MetricHistory.
+
+    The graph keeps its coverage bitmap between frames.  When new points
+    arrive it shifts the bitmap left and draws only the new columns (plus
+    the previous newest point, which may have been averaged in place); it
+    redraws everything only when the value range changes or the whole
+    window scrolled by.  The newest point sits at the right edge.
+    """
+
+    STYLES = ('sparkline', 'bar', 'area')
+    AREA_FILL = 96  # Coverage under an area graph's line (line is 255)
+
+    def __init__(self, metric: str, style: str, width: int, height: int,
+                 lo: float | None = None, hi: float | None = None,
+                 step: int | None = None, tier: int = 0) -> None:
+        if style not in self.STYLES:
+            raise ValueError(f"Unknown graph style {style!r}")
+        self.metric = metric
+        self.style = style
+        self.width = max(1, width)
+        self.height = max(1, height)
+        self.lo, self.hi = lo, hi
+        self.step = max(1, step or (3 if style == 'bar' else 1))  # px per point
+        self.points = max(1, self.width // self.step)
+        self.tier = tier
+        self.mask = np.zeros((self.height, self.width), dtype=np.uint8)
+        self.version = 0  # Bumped whenever the bitmap changes
+        self.full_redraws = 0
+        self._seen = (0, 0)  # MetricHistory.position() at the last draw
+        self._range: tuple[float, float] | None = None
+        self._image: Any = None
+
+    def update(self, history: MetricHistory) -> bool:
+        """Bring the bitmap up to date with *history*. Returns True if it changed."""
+        position = history.position(self.metric, self.tier)
+        if position == self._seen:
+            return False
+        # One point more than fits: the leftmost sparkline segment needs it
+        values = history.tail(self.metric, self.points + 1, self.tier)
+        if not len(values):
+            return False
+        new = position[0] - self._seen[0]
+        self._seen = position
+        start = max(len(values) - self.points, 0)  # First visible point
+
+        value_range = self._value_range(values[start:])
+        if value_range != self._range or new >= self.points or not self.version:
+            self._range = value_range
+            self.mask[:] = 0
+            first = start
+            self.full_redraws += 1
+        else:
+            shift = new * self.step
+            if shift:
+                self.mask[:, :-shift] = self.mask[:, shift:]
+            first = max(len(values) - new - 1, start)
+            self.mask[:, self._column(first, len(values))[0]:] = 0
+
+        for i in range(first, len(values)):
+            self._draw_point(values, i)
+        self.version += 1
+        self._image = None
+        return True
+
+    @property
+    def image(self) -> Any:
+        """The bitmap as an L-mode PIL mask (rebuilt only after a change)."""
+        if self._image is None:
+            self._image = Image.fromarray(self.mask.copy(), 'L')
+        return self._image
+
+    def _value_range(self, values: np.ndarray) -> tuple[float, float]:
+        """Fixed min/max from the config, else zero to a 1-2-5 step above the peak."""
+        lo = self.lo if self.lo is not None else min(0.0, float(values.min()))
+        if self.hi is not None:
+            hi = self.hi
+        else:
+            peak = float(values.max())
+            hi = self._nice_ceil(peak) if peak > 0 else 1.0
+        if hi <= lo:
+            hi = lo + 1.0
+        return lo, hi
+
+    @staticmethod
+    def _nice_ceil(value: float) -> float:
+        """Smallest 1, 2 or 5 x 10^n at or above *value* (stable auto-scale)."""
+        magnitude = 10.0 ** math.floor(math.log10(value))
+        for factor in (1.0, 2.0, 5.0, 10.0):
+            if value <= factor * magnitude:
+                return factor * magnitude
+        return 10.0 * magnitude
+
+    def _column(self, i: int, count: int) -> tuple[int, int]:
+        """Pixel columns [x0, x1) of point *i* out of *count* (right-aligned)."""
+        x1 = self.width - (count - 1 - i) * self.step
+        return max(x1 - self.step, 0), x1
+
+    def _y(self, value: float) -> int:
+        lo, hi = self._range or (0.0, 1.0)
+        frac = min(max((value - lo) / (hi - lo), 0.0), 1.0)
+        return round((1.0 - frac) * (self.height - 1))
+
+    def _draw_point(self, values: np.ndarray, i: int) -> None:
+        x0, x1 = self._column(i, len(values))
+        y = self._y(float(values[i]))
+        if self.style == 'bar':
+            x1 = max(x1 - 1, x0 + 1) if self.step > 1 else x1  # 1 px gap
+            self.mask[y:, x0:x1] = 255
+            return
+        if self.style == 'area':
+            self.mask[y:, x0:x1] = self.AREA_FILL
+        prev = self._y(float(values[i - 1])) if i else y
+        self.mask[min(y, prev):max(y, prev) + 1, x0:x1] = 255
+
+
 class OverlayService:
     """Overlay rendering: config, mask, metrics → composited image.
 
@@ -27,12 +147,17 @@ class OverlayService:
     - Text overlays with customizable position, color, font
     - Time/date with multiple format options
     - Hardware metrics (CPU, GPU, etc.)
+    - Sparkline / bar / area graphs of a metric's history
     - Dynamic font/coordinate scaling across resolutions
     """
 
     # Base resolution for scaling (most common device)
     BASE_RESOLUTION = 320
 
+    # Rendered text masks kept for reuse (values cycle through few strings)
+    GLYPH_CACHE_SIZE = 512
+    _GLYPH_PAD = 2  # px around textbbox so anti-aliased edges never clip
+
     def __init__(self, width: int = 320, height: int = 320) -> None:
         # Rendering state (public — tests + callers access these directly)
         self.width = width
@@ -62,6 +187,25 @@ class OverlayService:
         self._metrics: dict[str, Any] = {}
         self._dc_data: dict[str, Any] | None = None
 
+        # Incremental compositor: base (background + mask) → glyphs → frame
+        self._base: Any = None
+        self._base_key: tuple | None = None
+        self._base_bg: Any = None
+        self._base_mask: Any = None
+        self._frame: Any = None
+        self._drawn: list[tuple | None] = []  # (signature, bbox) per element
+        self._glyphs: OrderedDict[tuple, tuple[Any, int, int]] = OrderedDict()
+        self.dirty_rects: list[tuple[int, int, int, int]] = []
+
+        # Mask scaled to the display + premultiplied planes, built once
+        self._mask_prep: tuple | None = None  # (key, premul, inv_alpha, pos)
+
+        # Graph elements read this history (SystemService.history); without
+        # one, update_metrics() feeds a private history of the graphed keys.
+        self.history: MetricHistory | None = None
+        self._own_history: MetricHistory | None = None
+        self._graphs: dict[str, tuple[tuple, MetricGraph]] = {}  # key → (spec, graph)
+
     # ── Resolution ───────────────────────────────────────────────────
 
     def set_resolution(self, w: int, h: int) -> None:
@@ -69,6 +213,9 @@ class OverlayService:
         self.width = w
         self.height = h
         self._fonts.clear_cache()
+        self._glyphs.clear()
+        self._mask_prep = None
+        self._graphs.clear()
         self.background = None
 
     # ── Enable / disable ─────────────────────────────────────────────
@@ -121,11 +268,14 @@ class OverlayService:
         designed for one resolution on a device with a different resolution.
         """
         self._config_resolution = (w, h)
+        self._mask_prep = None
 
     def set_scale_enabled(self, enabled: bool) -> None:
         """Enable or disable dynamic font/coordinate scaling."""
         self._scale_enabled = enabled
         self._fonts.clear_cache()
+        self._glyphs.clear()
+        self._mask_prep = None
 
     def _get_scale_factor(self) -> float:
         """Calculate scale factor from config resolution to display resolution.
@@ -200,6 +350,7 @@ class OverlayService:
         Masks are kept at original size (not stretched) and positioned
         at the bottom by default for partial overlays.
         """
+        self._mask_prep = None
         if image is None:
             self.theme_mask = None
             self.theme_mask_position = (0, 0)
@@ -217,6 +368,23 @@ class OverlayService:
         else:
             self.theme_mask_position = (0, 0)
 
+        self._prepare_mask()
+
+    def mask_copy(self) -> OverlayService:
+        """New overlay with just this one's mask layer (no elements).
+
+        Renders mask-only frames identically without sharing any state,
+        so it can be used off the render thread.
+        """
+        copy = OverlayService(self.width, self.height)
+        copy.enabled = self.enabled
+        copy.theme_mask_visible = self.theme_mask_visible
+        copy._config_resolution = self._config_resolution
+        copy._scale_enabled = self._scale_enabled
+        if self.theme_mask is not None:
+            copy.set_theme_mask(self.theme_mask, self.theme_mask_position)
+        return copy
+
     def get_mask(self) -> tuple[Any, tuple[int, int] | None]:
         """Get current theme mask image and position."""
         return self.theme_mask, self.theme_mask_position
@@ -236,6 +404,38 @@ class OverlayService:
     def update_metrics(self, metrics: dict) -> None:
         """Update system metrics for hardware overlay elements."""
         self._metrics = metrics
+        if self.history is None:
+            graphed = self._graph_metrics()
+            if graphed:
+                self._graph_history().record(
+                    {key: metrics[key] for key in graphed if key in metrics})
+
+    def required_metrics(self) -> set[str]:
+        """Metric keys the enabled config elements display."""
+        if not isinstance(self.config, dict):
+            return set()
+        return {
+            cfg['metric'] for cfg in self.config.values()
+            if isinstance(cfg, dict) and cfg.get('enabled', True)
+            and 'text' not in cfg and 'metric' in cfg
+        }
+
+    def _graph_metrics(self) -> set[str]:
+        """Metric keys of the enabled graph elements."""
+        if not isinstance(self.config, dict):
+            return set()
+        return {
+            cfg['metric'] for cfg in self.config.values()
+            if isinstance(cfg, dict) and cfg.get('enabled', True)
+            and 'graph' in cfg and 'metric' in cfg
+        }
+
+    def _graph_history(self) -> MetricHistory:
+        if self.history is not None:
+            return self.history
+        if self._own_history is None:
+            self._own_history = MetricHistory()
+        return self._own_history
 
     # ── Font resolution (delegated to FontResolver) ─────────────────
 
@@ -260,7 +460,7 @@ class OverlayService:
     # ── Render ───────────────────────────────────────────────────────
 
     def render(self, background: Any = None, metrics: dict | None = None,
-               **_kw: Any) -> Any:
+               force: bool = False, **_kw: Any) -> Any:
         """Render overlay onto background.
 
         Callers gate on `.enabled` before calling — this method always renders.
@@ -268,17 +468,26 @@ class OverlayService:
         Args:
             background: Optional PIL Image (uses stored background if None).
             metrics: System metrics dict (uses stored metrics if None).
+            force: Recomposite every element, not just the changed ones.
 
         Returns:
             PIL Image with overlay rendered.
         """
         if background:
             self.set_background(background)
+        if force:
+            self._frame = None
         m = metrics if metrics is not None else self._metrics
         return self._render_overlay(m)
 
     def _render_overlay(self, metrics: dict | None = None) -> Any:
-        """Core PIL compositing — background + mask + text overlays.
+        """Incremental compositing — background + mask + text overlays.
+
+        Three layers: a cached base (background + mask, rebuilt only when
+        either changes), cached glyph masks per (text, font), and the
+        composited frame.  Each call re-blits only elements whose text,
+        position, font or color changed, restoring the base under their
+        old and new boxes; ``dirty_rects`` reports the boxes touched.
 
         Optimized for video playback — returns background directly when
         there's nothing to overlay (no mask, no config).
@@ -291,48 +500,148 @@ class OverlayService:
             or (self.config and isinstance(self.config, dict))
         )
         if not has_overlays and self.background:
+            self.dirty_rects = []
             return self.background
 
-        # Create base image
+        base = self._get_base()
+        full = (0, 0, base.width, base.height)
+
+        if not self.config or not isinstance(self.config, dict):
+            self._frame = None
+            self.dirty_rects = [full]
+            return base.copy()
+
+        elements = self._layout_elements(metrics)
+
+        if self._frame is None or len(elements) != len(self._drawn):
+            # Full redraw (new base, new layout, or forced)
+            frame = base.copy()
+            for elem in elements:
+                if elem is not None:
+                    self._blit(frame, elem, 0, 0)
+            self._frame = frame
+            self.dirty_rects = [full]
+        else:
+            rects = []
+            for old, new in zip(self._drawn, elements):
+                if old == new:
+                    continue
+                for elem in (old, new):
+                    if elem is not None:
+                        rect = self._clip(elem[1], full)
+                        if rect is not None:
+                            rects.append(rect)
+            for rect in rects:
+                # Rebuild the rect from base so overlapping elements
+                # stay in draw order with single-pass anti-aliasing.
+                region = base.crop(rect)
+                for elem in elements:
+                    if elem is not None and self._clip(elem[1], rect):
+                        self._blit(region, elem, rect[0], rect[1])
+                self._frame.paste(region, rect[:2])
+            self.dirty_rects = rects
+
+        self._drawn = elements
+        return self._frame.copy()
+
+    def _get_base(self) -> Any:
+        """Background + mask as RGB, rebuilt only when an input changes."""
+        mask = self.theme_mask if self.theme_mask and self.theme_mask_visible else None
+        key = (self.width, self.height, self.theme_mask_position,
+               self._get_scale_factor())
+        if (self._base is not None
+                and self._base_key == key
+                and self._base_bg is self.background
+                and self._base_mask is mask):
+            return self._base
+
         if self.background is None:
-            img = Image.new('RGBA', (self.width, self.height), (0, 0, 0, 0))
+            pixels = np.zeros((self.height, self.width, 3), dtype=np.uint8)
         else:
-            img = self.background.copy()
-            if img.mode != 'RGBA':
-                img = img.convert('RGBA')
-
-        # Apply theme mask (Windows: isDrawMbImage check)
-        if self.theme_mask and self.theme_mask_visible:
-            scale = self._get_scale_factor()
-            if abs(scale - 1.0) > 0.01:
-                mask_w = int(self.theme_mask.width * scale)
-                mask_h = int(self.theme_mask.height * scale)
-                scaled_mask = self.theme_mask.resize(
-                    (mask_w, mask_h), Image.Resampling.LANCZOS)
-                pos_x = int(self.theme_mask_position[0] * scale)
-                pos_y = int(self.theme_mask_position[1] * scale)
-                img.paste(scaled_mask, (pos_x, pos_y), scaled_mask)
-            else:
-                img.paste(self.theme_mask, self.theme_mask_position, self.theme_mask)
+            bg = self.background
+            pixels = np.array(bg if bg.mode == 'RGB' else bg.convert('RGB'))
+
+        # Apply theme mask (Windows: isDrawMbImage check).  Text is drawn
+        # on RGB afterwards (matches Windows GenerateImage) — drawing on
+        # RGBA makes PIL replace alpha at anti-aliased edges.
+        if mask is not None:
+            self._composite_mask(pixels)
+        img = Image.fromarray(pixels)
+
+        self._base = img
+        self._base_key = key
+        self._base_bg = self.background
+        self._base_mask = mask
+        self._frame = None
+        return img
+
+    def _prepare_mask(self) -> tuple[Any, Any, tuple[int, int]]:
+        """Scaled mask as premultiplied planes, rebuilt only when inputs change.
 
-        # Convert to RGB before drawing text (matches Windows GenerateImage).
-        # Drawing on RGBA causes PIL to replace alpha at anti-aliased edges;
-        # compositing RGBA onto black creates dark fringes.
-        if img.mode == 'RGBA':
-            img = img.convert('RGB')
+        Returns (premul, inv_alpha, position) where premul = rgb * a + 128
+        and inv_alpha = 255 - a (uint16), so compositing is one
+        multiply-add per pixel instead of a LANCZOS resize + paste.
+        """
+        mask = self.theme_mask
+        scale = self._get_scale_factor()
+        key = (self.theme_mask_position, scale)
+        prep = self._mask_prep
+        if prep is not None and prep[0] is mask and prep[1] == key:
+            return prep[2], prep[3], prep[4]
+
+        if abs(scale - 1.0) > 0.01:
+            mask_w = int(mask.width * scale)
+            mask_h = int(mask.height * scale)
+            scaled = mask.resize((mask_w, mask_h), Image.Resampling.LANCZOS)
+            pos = (int(self.theme_mask_position[0] * scale),
+                   int(self.theme_mask_position[1] * scale))
+        else:
+            scaled = mask
+            pos = tuple(self.theme_mask_position)
 
-        # Draw text overlays
-        draw = ImageDraw.Draw(img)
+        rgba = np.asarray(scaled, dtype=np.uint16)
+        alpha = rgba[:, :, 3:4]
+        premul = rgba[:, :, :3] * alpha + 128
+        inv_alpha = 255 - alpha
+        self._mask_prep = (mask, key, premul, inv_alpha, pos)
+        return premul, inv_alpha, pos
 
-        if not self.config or not isinstance(self.config, dict):
-            return img
+    def _composite_mask(self, pixels: Any) -> None:
+        """Blend the prepared mask into an RGB uint8 array in place.
 
+        Same integer math as PIL's paste-with-mask (DIV255 with rounding),
+        so the result is pixel-identical to ``img.paste(mask, pos, mask)``.
+        """
+        premul, inv_alpha, (x, y) = self._prepare_mask()
+        mask_h, mask_w = premul.shape[:2]
+        img_h, img_w = pixels.shape[:2]
+        x0, y0 = max(x, 0), max(y, 0)
+        x1, y1 = min(x + mask_w, img_w), min(y + mask_h, img_h)
+        if x0 >= x1 or y0 >= y1:
+            return
+        region = pixels[y0:y1, x0:x1]
+        src = (slice(y0 - y, y1 - y), slice(x0 - x, x1 - x))
+        tmp = region * inv_alpha[src] + premul[src]
+        tmp += tmp >> 8
+        tmp >>= 8
+        region[...] = tmp
+
+    def _layout_elements(self, metrics: dict) -> list[tuple | None]:
+        """Resolve each config element to ((text, x, y, font, color), bbox).
+
+        Graph elements resolve to ((graph, x, y, version, color), bbox),
+        so a graph is recomposited only when its bitmap changed.
+        None marks a hidden element (disabled, flashing, or no text).
+        """
         scale = self._get_scale_factor()
+        elements: list[tuple | None] = []
 
         for elem_idx, (key, cfg) in enumerate(self.config.items()):
             if not isinstance(cfg, dict) or not cfg.get('enabled', True):
+                elements.append(None)
                 continue
             if elem_idx == self.flash_skip_index:
+                elements.append(None)
                 continue
 
             base_x = cfg.get('x', 10)
@@ -340,11 +649,17 @@ class OverlayService:
             font_cfg = cfg.get('font', {})
             base_font_size = font_cfg.get('size', 24) if isinstance(font_cfg, dict) else 24
             color = cfg.get('color', '#FFFFFF')
+            if isinstance(color, list):
+                color = tuple(color)
 
             x = int(base_x * scale)
             y = int(base_y * scale)
             font_size = max(8, int(base_font_size * scale))
 
+            if 'graph' in cfg:
+                elements.append(self._layout_graph(key, cfg, x, y, scale, color))
+                continue
+
             # Get text to render
             if 'text' in cfg:
                 text = str(cfg['text'])
@@ -359,14 +674,99 @@ class OverlayService:
                 else:
                     text = "N/A"
             else:
+                elements.append(None)
                 continue
 
             bold = font_cfg.get('style') == 'bold' if isinstance(font_cfg, dict) else False
             font_name = font_cfg.get('name') if isinstance(font_cfg, dict) else None
             font = self.get_font(font_size, bold=bold, font_name=font_name)
-            draw.text((x, y), text, fill=color, font=font, anchor='mm')
 
-        return img
+            glyph, dx, dy = self._get_glyph(text, font)
+            bbox = (x + dx, y + dy, x + dx + glyph.width, y + dy + glyph.height)
+            elements.append(((text, x, y, font, color), bbox))
+
+        return elements
+
+    def _layout_graph(self, key: str, cfg: dict, x: int, y: int,
+                      scale: float, color: Any) -> tuple | None:
+        """Graph element anchored top-left at (x, y); None if it can't draw yet.
+
+        Config: ``graph`` (sparkline/bar/area), ``metric``, ``width``,
+        ``height``, optional ``min``/``max`` (auto-scaled otherwise),
+        ``step`` (px per point) and ``resolution`` (seconds per point,
+        picks the history tier).
+        """
+        style, metric = cfg['graph'], cfg.get('metric')
+        if style not in MetricGraph.STYLES or not metric:
+            return None
+        history = self._graph_history()
+        width = max(1, int(cfg.get('width', 100) * scale))
+        height = max(1, int(cfg.get('height', 40) * scale))
+        step = cfg.get('step')
+        spec = (metric, style, width, height, cfg.get('min'), cfg.get('max'),
+                max(1, int(step * scale)) if step else None,
+                history.tier_for(cfg.get('resolution')), id(history))
+        cached = self._graphs.get(key)
+        if cached is None or cached[0] != spec:
+            graph = MetricGraph(metric, style, width, height, lo=spec[4],
+                                hi=spec[5], step=spec[6], tier=spec[7])
+            self._graphs[key] = (spec, graph)
+        else:
+            graph = cached[1]
+        graph.update(history)
+        if not graph.version:
+            return None
+        return ((graph, x, y, graph.version, color), (x, y, x + width, y + height))
+
+    def _get_glyph(self, text: str, font: Any) -> tuple[Any, int, int]:
+        """Anti-aliased coverage mask for *text* centred ('mm') on the origin.
+
+        Returns (L-mode mask, dx, dy): paste at (x + dx, y + dy) with the
+        element color to get exactly what ``draw.text((x, y), anchor='mm')``
+        would draw.  Color is applied at paste time, so one mask serves
+        every color.
+        """
+        key = (text, font)
+        glyph = self._glyphs.get(key)
+        if glyph is not None:
+            self._glyphs.move_to_end(key)
+            return glyph
+
+        probe = ImageDraw.Draw(Image.new('L', (1, 1)))
+        left, top, right, bottom = probe.textbbox((0, 0), text, font=font, anchor='mm')
+        ox = -math.floor(left) + self._GLYPH_PAD
+        oy = -math.floor(top) + self._GLYPH_PAD
+        mask = Image.new('L', (math.ceil(right) + ox + self._GLYPH_PAD,
+                               math.ceil(bottom) + oy + self._GLYPH_PAD))
+        ImageDraw.Draw(mask).text((ox, oy), text, fill=255, font=font, anchor='mm')
+
+        glyph = (mask, -ox, -oy)
+        self._glyphs[key] = glyph
+        if len(self._glyphs) > self.GLYPH_CACHE_SIZE:
+            self._glyphs.popitem(last=False)
+        return glyph
+
+    def _blit(self, target: Any, elem: tuple, off_x: int, off_y: int) -> None:
+        """Paste one element's glyph onto *target* whose origin is (off_x, off_y)."""
+        (text, _x, _y, font, color), bbox = elem
+        if isinstance(text, MetricGraph):
+            mask = text.image
+        else:
+            mask = self._get_glyph(text, font)[0]
+        left, top = bbox[0] - off_x, bbox[1] - off_y
+        target.paste(color, (left, top, left + mask.width, top + mask.height), mask)
+
+    @staticmethod
+    def _clip(rect: tuple[int, int, int, int],
+              bounds: tuple[int, int, int, int]) -> tuple[int, int, int, int] | None:
+        """Intersection of two (l, t, r, b) boxes, or None if they don't overlap."""
+        left = max(rect[0], bounds[0])
+        top = max(rect[1], bounds[1])
+        right = min(rect[2], bounds[2])
+        bottom = min(rect[3], bounds[3])
+        if left >= right or top >= bottom:
+            return None
+        return (left, top, right, bottom)
 
     # ── DC data (lossless round-trip) ────────────────────────────────
 
@@ -389,3 +789,6 @@ class OverlayService:
         self.theme_mask = None
         self.theme_mask_position = (0, 0)
         self.theme_mask_visible = True
+        self._base = self._frame = None
+        self._drawn = []
+        self._graphs.clear()
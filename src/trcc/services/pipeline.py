@@ -0,0 +1,241 @@
+"""Render → encode → transmit pipeline on long-lived worker threads.
+
+Pure Python, no Qt dependencies.
+Each stage runs on its own thread and hands frames to the next through a
+single-slot "latest wins" mailbox: if a stage falls behind, the pending
+frame is replaced by the newer one (coalesced) instead of queueing up
+stale frames.  Encoding frame N+1 overlaps the USB write of frame N.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+log = logging.getLogger(__name__)
+
+_CLOSED = object()  # Mailbox.get() result once the mailbox is closed
+
+
+class Mailbox:
+    """Single-slot handoff between two pipeline stages; newest item wins."""
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition()
+        self._item: Any = None
+        self._full = False
+        self._closed = False
+
+    def put(self, item: Any) -> bool:
+        """Store *item*, replacing any unconsumed one.
+
+        Returns True if an older item was replaced (coalesced).
+        Items put after ``close()`` are discarded.
+        """
+        with self._cond:
+            if self._closed:
+                return False
+            replaced = self._full
+            self._item = item
+            self._full = True
+            self._cond.notify()
+            return replaced
+
+    def get(self) -> Any:
+        """Block until an item arrives; returns ``_CLOSED`` once closed."""
+        with self._cond:
+            while not self._full and not self._closed:
+                self._cond.wait()
+            if not self._full:
+                return _CLOSED
+            item, self._item = self._item, None
+            self._full = False
+            return item
+
+    def close(self) -> bool:
+        """Wake the consumer for shutdown. Returns True if an item was discarded."""
+        with self._cond:
+            discarded = self._full
+            self._item = None
+            self._full = False
+            self._closed = True
+            self._cond.notify_all()
+            return discarded
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+
+@dataclass
+class PipelineFrame:
+    """One frame on its way to the device.
+
+    Either ``data`` is already device-ready, or ``encode`` produces it
+    on the encode thread (it must return an immutable ``bytes`` copy —
+    the transmit stage sends it while the next frame is being encoded).
+    """
+    width: int
+    height: int
+    data: Optional[bytes] = None
+    encode: Optional[Callable[[], Optional[bytes]]] = None
+
+
+@dataclass
+class PipelineStats:
+    """Frame counters since the pipeline was created."""
+    submitted: int = 0
+    sent: int = 0
+    coalesced: int = 0   # Superseded by a newer frame before reaching the device
+    dropped: int = 0     # Lost to render/encode errors, failed sends or shutdown
+
+
+class FramePipeline:
+    """Long-lived render, encode and transmit stages.
+
+    Usage:
+        pipeline = FramePipeline(device_service.send_rgb565)
+        pipeline.submit_render(job)        # job() → PipelineFrame | None
+        pipeline.submit_frame(frame)       # skip render
+        pipeline.submit_encoded(data, w, h)  # skip render + encode
+
+    Threads start on first submit.  ``stop()`` discards pending frames.
+    """
+
+    def __init__(self, transmit: Callable[[bytes, int, int], bool],
+                 name: str = 'trcc-pipeline') -> None:
+        self._transmit = transmit
+        self._name = name
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._in_flight = 0
+        self._threads: list[threading.Thread] = []
+        self._render_box = Mailbox()
+        self._encode_box = Mailbox()
+        self._send_box = Mailbox()
+        self.stats = PipelineStats()
+
+    # ── Lifecycle ────────────────────────────────────────────────────
+
+    @property
+    def running(self) -> bool:
+        return bool(self._threads)
+
+    def start(self) -> None:
+        """Start the stage threads (no-op if already running)."""
+        with self._lock:
+            if self._threads:
+                return
+            stages = (
+                ('render', self._render_box, self._render_stage),
+                ('encode', self._encode_box, self._encode_stage),
+                ('send', self._send_box, self._send_stage),
+            )
+            for stage, box, handler in stages:
+                thread = threading.Thread(
+                    target=self._run, args=(stage, box, handler),
+                    name=f'{self._name}-{stage}', daemon=True,
+                )
+                self._threads.append(thread)
+                thread.start()
+        log.debug("%s: started", self._name)
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """Stop all stages, discarding frames that haven't been sent."""
+        with self._lock:
+            threads, self._threads = self._threads, []
+        if not threads:
+            return
+        for box in (self._render_box, self._encode_box, self._send_box):
+            if box.close():
+                self._finish(dropped=1)
+        for thread in threads:
+            thread.join(timeout)
+        self._render_box = Mailbox()
+        self._encode_box = Mailbox()
+        self._send_box = Mailbox()
+        log.debug("%s: stopped (%s)", self._name, self.stats)
+
+    def wait_idle(self, timeout: float | None = None) -> bool:
+        """Block until every submitted frame is sent or dropped."""
+        with self._idle:
+            return self._idle.wait_for(lambda: self._in_flight == 0, timeout)
+
+    # ── Submit ───────────────────────────────────────────────────────
+
+    def submit_render(self, job: Callable[[], Optional[PipelineFrame]]) -> None:
+        """Run *job* on the render thread; it returns a frame or None."""
+        self._submit(self._render_box, job)
+
+    def submit_frame(self, frame: PipelineFrame) -> None:
+        """Hand a rendered frame to the encode (or transmit) stage."""
+        box = self._send_box if frame.data is not None else self._encode_box
+        self._submit(box, frame)
+
+    def submit_encoded(self, data: bytes, width: int, height: int) -> None:
+        """Hand device-ready bytes straight to the transmit stage."""
+        self._submit(self._send_box, PipelineFrame(width, height, data=data))
+
+    def _submit(self, box: Mailbox, item: Any) -> None:
+        self.start()
+        with self._lock:
+            self.stats.submitted += 1
+            self._in_flight += 1
+        self._forward(box, item)
+
+    def _forward(self, box: Mailbox, item: Any) -> None:
+        """Put *item* into *box*, accounting for the frame it replaced."""
+        if box.closed:
+            self._finish(dropped=1)  # Pipeline stopped under us
+        elif box.put(item):
+            self._finish(coalesced=1)
+
+    def _finish(self, sent: int = 0, coalesced: int = 0, dropped: int = 0,
+                skipped: int = 0) -> None:
+        """Retire frames from the in-flight count and update counters."""
+        with self._idle:
+            self.stats.sent += sent
+            self.stats.coalesced += coalesced
+            self.stats.dropped += dropped
+            self._in_flight -= sent + coalesced + dropped + skipped
+            if self._in_flight <= 0:
+                self._in_flight = 0
+                self._idle.notify_all()
+
+    # ── Stages ───────────────────────────────────────────────────────
+
+    def _run(self, stage: str, box: Mailbox,
+             handler: Callable[[Any], None]) -> None:
+        while True:
+            item = box.get()
+            if item is _CLOSED:
+                return
+            try:
+                handler(item)
+            except Exception:
+                log.exception("%s: %s stage failed", self._name, stage)
+                self._finish(dropped=1)
+
+    def _render_stage(self, job: Callable[[], Optional[PipelineFrame]]) -> None:
+        frame = job()
+        if frame is None:
+            self._finish(skipped=1)  # Preview-only tick: nothing to send
+            return
+        box = self._send_box if frame.data is not None else self._encode_box
+        self._forward(box, frame)
+
+    def _encode_stage(self, frame: PipelineFrame) -> None:
+        assert frame.encode is not None
+        frame.data = frame.encode()
+        if not frame.data:
+            self._finish(dropped=1)
+            return
+        self._forward(self._send_box, frame)
+
+    def _send_stage(self, frame: PipelineFrame) -> None:
+        assert frame.data is not None
+        if self._transmit(frame.data, frame.width, frame.height):
+            self._finish(sent=1)
+        else:
+            self._finish(dropped=1)
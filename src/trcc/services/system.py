@@ -13,14 +13,17 @@ import os
 import re
 import subprocess
 from datetime import datetime
-from typing import TYPE_CHECKING, Dict, Optional
+from functools import partial
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Mapping, Optional
 
 from ..core.models import DATE_FORMATS, TIME_FORMATS, WEEKDAYS
 from ..data_repository import SysUtils
+from .history import MetricHistory
 
 if TYPE_CHECKING:
     from ..core.models import SensorInfo
     from ..system_config import PanelConfig
+    from ..system_sensors import SensorSampler, SensorSnapshot
 
 log = logging.getLogger(__name__)
 
@@ -28,12 +31,22 @@ log = logging.getLogger(__name__)
 class SystemService:
     """Unified system monitoring: sensor discovery, metrics, panel config."""
 
-    def __init__(self) -> None:
+    # Sampling interval (s) for the subprocess fallbacks (lm_sensors,
+    # dmidecode, smartctl) while background sampling is on.
+    FALLBACK_INTERVAL = 10.0
+
+    def __init__(self, history_tiers: Optional[Iterable[tuple[float, int]]] = None) -> None:
         from ..system_sensors import SensorEnumerator
 
         self._enumerator = SensorEnumerator()
         self._discovered = False
         self._defaults: Optional[Dict[str, str]] = None
+        self._sampler: Optional[SensorSampler] = None
+        self._subscriptions: Dict[str, frozenset[str]] = {}
+        self._wanted: Optional[frozenset[str]] = None  # None = everything
+        # Sensor metrics over time: fed by every sampling pass, or by
+        # all_metrics when not sampling.  See MetricHistory for tiers.
+        self.history = MetricHistory(history_tiers)
 
     # ── Sensor discovery ──────────────────────────────────────────────
 
@@ -42,6 +55,8 @@ class SystemService:
         sensors = self._enumerator.discover()
         self._discovered = True
         self._defaults = None  # Reset cached defaults
+        if self._subscriptions:
+            self._apply_subscriptions()  # Sensor IDs may have moved
         return sensors
 
     def _ensure_discovered(self) -> None:
@@ -66,16 +81,107 @@ class SystemService:
         self._ensure_discovered()
         return self._enumerator
 
+    # ── Subscriptions ─────────────────────────────────────────────────
+
+    def subscribe(self, owner: str, keys: Iterable[str]) -> None:
+        """Declare the legacy metric keys *owner* displays.
+
+        While anyone is subscribed, only the sensors behind the union of
+        subscribed keys are read, and only their fallbacks run.  With no
+        subscribers every sensor is read, as before.  Re-subscribing
+        replaces the owner's keys; an unchanged set is a no-op, so callers
+        can re-declare on every tick.
+        """
+        keys = frozenset(keys)
+        if self._subscriptions.get(owner) == keys:
+            return
+        self._subscriptions[owner] = keys
+        self._apply_subscriptions()
+
+    def unsubscribe(self, owner: str) -> None:
+        """Drop *owner*'s subscription (no-op if it has none)."""
+        if self._subscriptions.pop(owner, None) is not None:
+            self._apply_subscriptions()
+
+    @property
+    def wanted_metrics(self) -> Optional[frozenset[str]]:
+        """Union of the subscribed metric keys, or None if nobody subscribed."""
+        return self._wanted
+
+    def _apply_subscriptions(self) -> None:
+        """Compile the enumerator's read plan from the subscriptions."""
+        if not self._subscriptions:
+            self._wanted = None
+            self._enumerator.set_read_plan(None)
+            return
+        wanted = frozenset().union(*self._subscriptions.values())
+        defaults = self._ensure_defaults()
+        self._wanted = wanted
+        self._enumerator.set_read_plan(
+            defaults[key] for key in wanted if key in defaults)
+        log.debug("Metric subscriptions: %s", sorted(wanted))
+
+    # ── Background sampling ───────────────────────────────────────────
+
+    def start_sampling(self) -> None:
+        """Poll sensors on a background thread; reads use the latest snapshot.
+
+        Each source family is read at its own interval
+        (SensorEnumerator.SOURCE_INTERVALS), so a slow NVML or drivetemp
+        read never blocks a caller of all_metrics / read_all.
+        """
+        from ..system_sensors import SensorSampler
+
+        self._ensure_defaults()
+        if self._sampler is None:
+            sources: dict[str, tuple[float, Callable[[dict[str, float]], None]]] = {
+                source: (interval, partial(self._enumerator.read_source, source))
+                for source, interval in self._enumerator.SOURCE_INTERVALS.items()
+            }
+            sources['fallback'] = (self.FALLBACK_INTERVAL, self._sample_fallbacks)
+            self._sampler = SensorSampler(sources, on_sample=self._record_snapshot)
+        self._sampler.start()
+        log.debug("Sensor sampling started")
+
+    def stop_sampling(self) -> None:
+        """Stop background sampling; reads go back to the hardware."""
+        if self._sampler is not None:
+            self._sampler.stop()
+            self._sampler = None
+
+    @property
+    def snapshot(self) -> Optional[SensorSnapshot]:
+        """Latest sampled readings, or None when not sampling."""
+        sampler = self._sampler
+        return sampler.snapshot if sampler is not None else None
+
+    def _sample_fallbacks(self, readings: dict[str, float]) -> None:
+        """Sampler source: fallbacks for keys the enumerator didn't provide."""
+        defaults = self._ensure_defaults()
+        wanted = self._wanted
+        for key, fallback in self._fallbacks():
+            if wanted is not None and key not in wanted:
+                continue
+            sensor_id = defaults.get(key)
+            if sensor_id and sensor_id in readings:
+                continue
+            if (v := fallback()) is not None:
+                readings[f'fallback:{key}'] = v
+
     # ── Readings ──────────────────────────────────────────────────────
 
     def read_all(self) -> dict[str, float]:
         """Read current values for all discovered sensors."""
         self._ensure_discovered()
+        if (snapshot := self.snapshot) is not None:
+            return dict(snapshot.readings)
         return self._enumerator.read_all()
 
     def read_one(self, sensor_id: str) -> Optional[float]:
         """Read a single sensor by ID."""
         self._ensure_discovered()
+        if (snapshot := self.snapshot) is not None:
+            return snapshot.readings.get(sensor_id)
         return self._enumerator.read_one(sensor_id)
 
     # ── Legacy key mapping ────────────────────────────────────────────
@@ -92,7 +198,7 @@ class SystemService:
         defaults = self._ensure_defaults()
         sensor_id = defaults.get(legacy_key)
         if sensor_id:
-            return self._enumerator.read_one(sensor_id)
+            return self.read_one(sensor_id)
         return None
 
     # ── Metric properties ─────────────────────────────────────────────
@@ -186,7 +292,12 @@ class SystemService:
 
     @property
     def all_metrics(self) -> Dict[str, float]:
-        """All system metrics as a flat dict."""
+        """All system metrics as a flat dict.
+
+        With subscriptions (see subscribe()), sensor metrics are limited to
+        the subscribed keys; date/time keys are always present.  Without
+        background sampling each call also records them in ``history``.
+        """
         metrics: Dict[str, float] = {}
 
         # Date and time
@@ -202,15 +313,52 @@ class SystemService:
         metrics['time'] = 0
         metrics['weekday'] = 0
 
+        snapshot = self.snapshot
+        if snapshot is not None:
+            sensors = self._snapshot_metrics(snapshot.readings)
+        else:
+            sensors = self._read_metrics()
+            self.history.record(sensors)
+        metrics.update(sensors)
+        return metrics
+
+    def _read_metrics(self) -> Dict[str, float]:
+        """Sensor metrics straight from the hardware, with fallbacks."""
         # Batch read ALL sensors once
         defaults = self._ensure_defaults()
         readings = self._enumerator.read_all()
-        for legacy_key, sensor_id in defaults.items():
-            if sensor_id in readings:
-                metrics[legacy_key] = readings[sensor_id]
+        metrics = {legacy_key: readings[sensor_id]
+                   for legacy_key, sensor_id in defaults.items()
+                   if sensor_id in readings}
 
         # Fallbacks for metrics the enumerator couldn't provide
-        _fallbacks = [
+        wanted = self._wanted
+        for key, fallback in self._fallbacks():
+            if key not in metrics and (wanted is None or key in wanted):
+                if (v := fallback()) is not None:
+                    metrics[key] = v
+        return metrics
+
+    def _snapshot_metrics(self, readings: Mapping[str, float]) -> Dict[str, float]:
+        """Sensor metrics from sampled readings (fallbacks already sampled)."""
+        defaults = self._ensure_defaults()
+        metrics = {legacy_key: readings[sensor_id]
+                   for legacy_key, sensor_id in defaults.items()
+                   if sensor_id in readings}
+        wanted = self._wanted
+        for key, _ in self._fallbacks():
+            if key not in metrics and (wanted is None or key in wanted):
+                if (v := readings.get(f'fallback:{key}')) is not None:
+                    metrics[key] = v
+        return metrics
+
+    def _record_snapshot(self, snapshot: SensorSnapshot) -> None:
+        """Sampler callback: append each sampling pass to the history."""
+        self.history.record(self._snapshot_metrics(snapshot.readings))
+
+    def _fallbacks(self) -> list[tuple[str, Callable[[], Optional[float]]]]:
+        """Legacy keys with a subprocess / procfs fallback reader."""
+        return [
             ('cpu_temp', self._fallback_cpu_temp),
             ('cpu_percent', self._fallback_cpu_usage),
             ('cpu_freq', self._fallback_cpu_freq),
@@ -218,12 +366,6 @@ class SystemService:
             ('mem_clock', self._fallback_mem_clock),
             ('disk_temp', self._fallback_disk_temp),
         ]
-        for key, fallback in _fallbacks:
-            if key not in metrics:
-                if (v := fallback()) is not None:
-                    metrics[key] = v
-
-        return metrics
 
     # ── Formatting ────────────────────────────────────────────────────
 
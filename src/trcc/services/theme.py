@@ -9,10 +9,11 @@ import json
 import logging
 import shutil
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 from ..core.models import ThemeData, ThemeInfo, ThemeType
 from ..data_repository import ThemeDir
+from ..theme_index import ThemeIndex
 
 log = logging.getLogger(__name__)
 
@@ -122,6 +123,9 @@ class ThemeService:
     ) -> list[ThemeInfo]:
         """Load themes from a local directory.
 
+        Listings come from the directory's ThemeIndex, so only theme
+        directories that changed since the last call are read again.
+
         Args:
             theme_dir: Path to Theme{W}{H}/ directory.
             resolution: LCD resolution tuple.
@@ -131,14 +135,15 @@ class ThemeService:
             List of ThemeInfo objects.
         """
         themes: list[ThemeInfo] = []
-        if not theme_dir or not theme_dir.exists():
+        if not theme_dir:
             return themes
 
-        for item in sorted(theme_dir.iterdir()):
-            if item.is_dir() and ThemeDir(item).is_valid():
-                theme = ThemeInfo.from_directory(item, resolution)
-                if ThemeService._passes_filter(theme, filter_mode):
-                    themes.append(theme)
+        listing = ThemeIndex.for_dir(theme_dir).theme_dirs()
+        for name in sorted(listing):
+            theme = ThemeInfo.from_directory(
+                theme_dir / name, resolution, files=listing[name])
+            if ThemeService._passes_filter(theme, filter_mode):
+                themes.append(theme)
 
         return themes
 
@@ -154,14 +159,17 @@ class ThemeService:
             category: Category filter ('a', 'b', etc.) or None for all.
         """
         themes: list[ThemeInfo] = []
-        if not web_dir or not web_dir.exists():
+        if not web_dir:
             return themes
 
-        for video_file in sorted(web_dir.glob('*.mp4')):
-            preview_path = web_dir / f"{video_file.stem}.png"
+        files = ThemeIndex.for_dir(web_dir).files()
+        for video_name in sorted(f for f in files
+                                 if f.endswith('.mp4') and not f.startswith('.')):
+            video_file = web_dir / video_name
+            preview_name = f"{video_file.stem}.png"
             theme = ThemeInfo.from_video(
                 video_file,
-                preview_path if preview_path.exists() else None,
+                web_dir / preview_name if preview_name in files else None,
             )
             if category and category != 'all':
                 if theme.category != category:
@@ -330,8 +338,21 @@ class ThemeService:
     # ── Export / Import ──────────────────────────────────────────────
 
     @staticmethod
-    def export_tr(theme_path: Path, export_path: Path) -> tuple[bool, str]:
-        """Export theme as .tr file."""
+    def export_tr(theme_path: Path, export_path: Path,
+                  device_frames: Callable[[Path], tuple[bool, str]] | None = None,
+                  ) -> tuple[bool, str]:
+        """Export theme as .tr file.
+
+        A .tdf *export_path* is handed to *device_frames* (see
+        DisplayService.export_device_frames), which knows the device's
+        frame format and encoder.
+        """
+        from ..device_frames import SUFFIX as DEVICE_FRAMES_SUFFIX
+
+        if export_path.suffix.lower() == DEVICE_FRAMES_SUFFIX:
+            if device_frames is None:
+                return False, "Device frames (.tdf) need a connected device to encode for"
+            return device_frames(export_path)
         try:
             from ..dc_writer import export_theme
 
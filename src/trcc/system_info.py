@@ -29,5 +29,14 @@ get_disk_temperature = lambda: _instance.disk_temperature  # noqa: E731
 get_network_stats = lambda: _instance.network_stats  # noqa: E731
 get_fan_speeds = lambda: _instance.fan_speeds  # noqa: E731
 get_all_metrics = lambda: _instance.all_metrics  # noqa: E731
+start_sampling = _instance.start_sampling
+stop_sampling = _instance.stop_sampling
+subscribe_metrics = _instance.subscribe
+unsubscribe_metrics = _instance.unsubscribe
 format_metric = SystemService.format_metric
 find_hwmon_by_name = SystemService.find_hwmon_by_name
+
+
+def get_metric_history():
+    """Shared MetricHistory recorded by the sampling thread."""
+    return _instance.history
@@ -15,16 +15,30 @@ Sensor IDs follow the format:
     psutil:{metric}           e.g., psutil:cpu_percent
     rapl:{domain}             e.g., rapl:package-0
     computed:{metric}         e.g., computed:disk_read
+
+SensorSampler polls the sources on a background thread, each at its own
+cadence, and publishes immutable SensorSnapshot objects.
+
+Discovery compiles a ReadPlan: hwmon/DRM files become parallel arrays
+(paths, divisors, slots) and each sweep fills a float64 vector indexed by
+sensor slot.  SensorEnumerator.set_read_plan() narrows reads to the
+sensors something actually displays (see SystemService.subscribe).
 """
 
+import logging
+import math
+import threading
 import time
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import Callable, Iterable, Mapping, Optional
 
+import numpy as np
 import psutil
 
 from trcc.core.models import SensorInfo
-from trcc.data_repository import SysUtils
+from trcc.data_repository import SysfsReader, SysUtils
 
 try:
     import pynvml  # pyright: ignore[reportMissingImports]
@@ -34,6 +48,8 @@ except Exception:
     pynvml = None  # type: ignore[assignment]
     NVML_AVAILABLE = False
 
+log = logging.getLogger(__name__)
+
 
 # Maps hwmon input prefix to (category, unit)
 _HWMON_TYPES = {
@@ -53,6 +69,30 @@ _HWMON_DIVISORS = {
     'freq': 1000000.0,  # Hz → MHz
 }
 
+
+def _hwmon_divisor(sensor_id: str) -> float:
+    """Value divisor for an hwmon sensor, from its input prefix (temp1 → temp)."""
+    prefix = sensor_id.rsplit(':', 1)[-1]
+    for pfx, div in _HWMON_DIVISORS.items():
+        if prefix.startswith(pfx):
+            return div
+    return 1.0
+
+# hwmon drivers for disk and DIMM temperatures: slow-changing, and reads can
+# be slow themselves (drivetemp issues an ATA command per read)
+_SLOW_HWMON_DRIVERS = {'drivetemp', 'nvme', 'spd5118', 'jc42', 'ee1004'}
+
+# NVML fields read per GPU (the metric part of nvidia:{gpu}:{metric})
+_NVML_FIELDS = frozenset({
+    'temp', 'gpu_util', 'mem_util', 'clock', 'mem_clock', 'power', 'fan',
+    'vram_used', 'vram_total',
+})
+_PSUTIL_FIELDS = frozenset({'cpu_percent', 'cpu_freq', 'mem_percent', 'mem_available'})
+_COMPUTED_FIELDS = frozenset({
+    'disk_read', 'disk_write', 'disk_activity',
+    'net_up', 'net_down', 'net_total_up', 'net_total_down',
+})
+
 # GPU vendor IDs (PCI sysfs)
 _GPU_VENDOR_NVIDIA = '10de'
 _GPU_VENDOR_AMD = '1002'
@@ -91,23 +131,87 @@ def _detect_gpu_vendors() -> list[str]:
     return vendors
 
 
+@dataclass(frozen=True)
+class SysfsBatch:
+    """Parallel arrays for one sysfs read loop (hwmon or DRM values)."""
+    ids: tuple[str, ...]
+    paths: tuple[str, ...]
+    divisors: np.ndarray   # float64: raw file value / divisor = reading
+    slots: np.ndarray      # intp: positions in SensorEnumerator.values
+    raw: np.ndarray        # float64 scratch, refilled every read
+
+    @classmethod
+    def build(cls, entries: list[tuple[str, str, float, int]]) -> 'SysfsBatch':
+        """From (sensor_id, path, divisor, slot) tuples."""
+        return cls(
+            ids=tuple(e[0] for e in entries),
+            paths=tuple(e[1] for e in entries),
+            divisors=np.array([e[2] for e in entries], dtype=np.float64),
+            slots=np.array([e[3] for e in entries], dtype=np.intp),
+            raw=np.empty(len(entries), dtype=np.float64),
+        )
+
+
+@dataclass(frozen=True)
+class ReadPlan:
+    """Compiled set of sensors that reads touch.
+
+    Built from the discovered sensors (all of them, or the subset given to
+    SensorEnumerator.set_read_plan()); every reader skips what isn't
+    listed here (sysfs files, NVML queries, psutil calls).
+    """
+    ids: Optional[frozenset[str]]         # What it was compiled for (None = all)
+    hwmon: SysfsBatch
+    hwmon_slow: SysfsBatch
+    drm: SysfsBatch
+    rapl: Mapping[str, str]               # sensor_id -> energy_uj path
+    nvidia: Mapping[int, frozenset[str]]  # gpu index -> NVML fields
+    psutil: frozenset[str]                # psutil:{metric} metrics
+    computed: frozenset[str]              # computed:{metric} metrics
+    sources: tuple[str, ...]              # Source families with anything to read
+
+
 class SensorEnumerator:
     """Discovers and reads all available hardware sensors on the system."""
 
+    # Source families read_source() understands, with their sampling
+    # interval in seconds (used by SensorSampler; read_all() reads them all).
+    SOURCE_INTERVALS: dict[str, float] = {
+        'hwmon': 1.0,
+        'hwmon_slow': 10.0,   # Disk / DIMM temperatures
+        'nvidia': 1.0,
+        'nvidia_mem': 5.0,    # VRAM used / total
+        'psutil': 1.0,
+        'rapl': 1.0,
+        'drm': 1.0,
+        'computed': 1.0,
+    }
+
     def __init__(self):
         self._sensors: list[SensorInfo] = []
         self._hwmon_paths: dict[str, str] = {}   # sensor_id -> sysfs path
+        self._hwmon_slow: set[str] = set()      # sensor_ids read at 'hwmon_slow' rate
+        self._sysfs = SysfsReader()              # Open handles for hwmon/DRM/RAPL reads
         self._nvidia_handles: dict[int, object] = {}  # gpu_index -> handle
         self._drm_paths: dict[str, str] = {}     # sensor_id -> drm sysfs path
         self._rapl_paths: dict[str, str] = {}     # sensor_id -> energy_uj path
         self._rapl_prev: dict[str, tuple[float, float]] = {}  # id -> (energy, time)
         self._net_prev: Optional[tuple] = None     # (counters, time)
         self._disk_prev: Optional[tuple] = None    # (counters, time)
+        self._plan_ids: Optional[frozenset[str]] = None  # set_read_plan() argument
+        self._plan: Optional[ReadPlan] = None      # None = not compiled yet
+        # Compiled index (see _compile): a slot per sensor in the values vector
+        self._slots: dict[str, int] = {}
+        self._values = np.empty(0, dtype=np.float64)
+        self._sysfs_index: dict[str, tuple[str, float, int]] = {}  # id -> (path, divisor, slot)
+        self._single_plans: dict[str, ReadPlan] = {}  # read_one() plans
 
     def discover(self) -> list[SensorInfo]:
         """Scan the system for all available sensors. Call once at startup."""
         self._sensors = []
+        self._sysfs.close()
         self._hwmon_paths = {}
+        self._hwmon_slow = set()
         self._nvidia_handles = {}
         self._drm_paths = {}
         self._rapl_paths = {}
@@ -119,6 +223,7 @@ class SensorEnumerator:
         self._discover_rapl()
         self._discover_computed()
 
+        self._compile()
         return self._sensors
 
     def get_sensors(self) -> list[SensorInfo]:
@@ -129,69 +234,201 @@ class SensorEnumerator:
         """Filter sensors by category."""
         return [s for s in self._sensors if s.category == category]
 
-    def read_all(self) -> dict[str, float]:
-        """Read current values for ALL discovered sensors."""
-        readings: dict[str, float] = {}
+    # =========================================================================
+    # Read plan
+    # =========================================================================
 
-        # hwmon sensors
-        for sid, path in self._hwmon_paths.items():
-            val = SysUtils.read_sysfs(path)
-            if val is not None:
-                try:
-                    raw = float(val)
-                    # Determine divisor from sensor type prefix
-                    prefix = sid.split(':')[-1]  # e.g., "temp1"
-                    for pfx, div in _HWMON_DIVISORS.items():
-                        if prefix.startswith(pfx):
-                            readings[sid] = raw / div
-                            break
-                    else:
-                        readings[sid] = raw
-                except ValueError:
-                    pass
+    def set_read_plan(self, sensor_ids: Optional[Iterable[str]]) -> None:
+        """Read only *sensor_ids* from now on (None: every discovered sensor).
 
-        # NVIDIA sensors
-        self._read_nvidia(readings)
+        The subset is compiled once here (and again after discover()), so
+        read_all() / read_source() cost scales with what is displayed.
+        read_one() still reads any sensor on demand.
+        """
+        self._plan_ids = None if sensor_ids is None else frozenset(sensor_ids)
+        if self._plan is None:
+            self._compile()
+        else:
+            self._plan = self._compile_plan(self._plan_ids)
+        if self._plan_ids is not None:
+            log.debug("Sensor read plan: %d of %d sensors",
+                      len(self._plan_ids), len(self._sensors))
+
+    @property
+    def read_plan(self) -> Optional[ReadPlan]:
+        """The compiled read plan, or None when reading everything."""
+        return self._plan if self._plan_ids is not None else None
+
+    def _current_plan(self) -> ReadPlan:
+        plan = self._plan
+        if plan is None:
+            plan = self._compile()
+        return plan
+
+    def _compile(self) -> ReadPlan:
+        """Index the discovered sensors and compile the read plan.
+
+        Each sensor gets a slot in the float64 values vector; hwmon and
+        DRM sensors also get their (path, divisor, slot) precomputed, so
+        reads do no sensor-ID parsing.
+        """
+        ids = [s.id for s in self._sensors]
+        ids += [*self._hwmon_paths, *self._drm_paths, *self._rapl_paths]
+        self._slots = {sid: i for i, sid in enumerate(dict.fromkeys(ids))}
+        self._values = np.full(len(self._slots), np.nan)
+        self._sysfs_index = {
+            sid: (path, _hwmon_divisor(sid), self._slots[sid])
+            for sid, path in self._hwmon_paths.items()
+        }
+        for sid, path in self._drm_paths.items():
+            self._sysfs_index.setdefault(sid, (path, 1.0, self._slots[sid]))
+        self._single_plans = {}
+        self._plan = self._compile_plan(self._plan_ids)
+        return self._plan
+
+    def _compile_plan(self, sensor_ids: Optional[frozenset[str]]) -> ReadPlan:
+        def wanted(sid: str) -> bool:
+            return sensor_ids is None or sid in sensor_ids
+
+        def batch(paths: dict[str, str], keep=lambda sid: True) -> SysfsBatch:
+            return SysfsBatch.build([
+                (sid, *self._sysfs_index[sid])
+                for sid in paths if wanted(sid) and keep(sid)
+            ])
+
+        if sensor_ids is None:
+            nvidia = {i: _NVML_FIELDS for i in self._nvidia_handles}
+            psutil_fields = _PSUTIL_FIELDS
+            computed = _COMPUTED_FIELDS
+        else:
+            gpus: dict[int, set[str]] = {}
+            psutil_fields, computed = frozenset(), frozenset()
+            for sid in sensor_ids:
+                source, _, metric = sid.partition(':')
+                if source == 'nvidia':
+                    gpu, _, metric = metric.partition(':')
+                    if gpu.isdigit() and metric in _NVML_FIELDS:
+                        gpus.setdefault(int(gpu), set()).add(metric)
+                elif source == 'psutil' and metric in _PSUTIL_FIELDS:
+                    psutil_fields |= {metric}
+                elif source == 'computed' and metric in _COMPUTED_FIELDS:
+                    computed |= {metric}
+            nvidia = {i: frozenset(f) for i, f in gpus.items()}
+
+        slow = self._hwmon_slow
+        plan = dict(
+            hwmon=batch(self._hwmon_paths, lambda sid: sid not in slow),
+            hwmon_slow=batch(self._hwmon_paths, lambda sid: sid in slow),
+            drm=batch(self._drm_paths),
+            rapl={sid: p for sid, p in self._rapl_paths.items() if wanted(sid)},
+            nvidia=nvidia,
+            psutil=psutil_fields,
+            computed=computed,
+        )
+        nvml_mem = any('vram_used' in f or 'vram_total' in f for f in nvidia.values())
+        sources = tuple(source for source, todo in (
+            ('hwmon', plan['hwmon'].ids),
+            ('hwmon_slow', plan['hwmon_slow'].ids),
+            ('nvidia', nvidia),
+            ('nvidia_mem', nvml_mem),
+            ('psutil', psutil_fields),
+            ('rapl', plan['rapl']),
+            ('drm', plan['drm'].ids),
+            ('computed', computed),
+        ) if todo)
+        return ReadPlan(ids=sensor_ids, sources=sources, **plan)
 
-        # psutil sensors
-        self._read_psutil(readings)
+    # =========================================================================
+    # Reading
+    # =========================================================================
 
-        # RAPL power
-        self._read_rapl(readings)
+    @property
+    def values(self) -> np.ndarray:
+        """Latest reading of every sensor by slot (NaN = none yet); read-only."""
+        view = self._values.view()
+        view.flags.writeable = False
+        return view
+
+    def slot(self, sensor_id: str) -> Optional[int]:
+        """Index of *sensor_id* in ``values``, or None if unknown."""
+        self._current_plan()
+        return self._slots.get(sensor_id)
+
+    def latest(self, sensor_id: str) -> Optional[float]:
+        """Last value a read stored for *sensor_id* (no hardware access)."""
+        slot = self.slot(sensor_id)
+        if slot is None:
+            return None
+        value = float(self._values[slot])
+        return None if math.isnan(value) else value
 
-        # DRM sensors (AMD/Intel GPU)
-        self._read_drm(readings)
+    def read_all(self) -> dict[str, float]:
+        """Read current values for all discovered sensors in the read plan."""
+        readings: dict[str, float] = {}
+        for source in self.SOURCE_INTERVALS:
+            self.read_source(source, readings)
+        return readings
 
-        # Computed I/O rates
-        self._read_computed(readings)
+    def read_source(self, source: str, readings: dict[str, float]) -> None:
+        """Add the current values of one source family to *readings*."""
+        self._read_source(source, readings, self._current_plan())
 
-        return readings
+    def _read_source(self, source: str, readings: dict[str, float],
+                     plan: ReadPlan) -> None:
+        if source == 'hwmon':
+            self._read_batch(plan.hwmon, readings)
+            return
+        if source == 'hwmon_slow':
+            self._read_batch(plan.hwmon_slow, readings)
+            return
+        if source == 'drm':
+            self._read_batch(plan.drm, readings)
+            return
+
+        out: dict[str, float] = {}
+        if source == 'nvidia':
+            self._read_nvidia_core(out, plan)
+        elif source == 'nvidia_mem':
+            self._read_nvidia_memory(out, plan)
+        elif source == 'psutil':
+            self._read_psutil(out, plan)
+        elif source == 'rapl':
+            self._read_rapl(out, plan)
+        elif source == 'computed':
+            self._read_computed(out, plan)
+        else:
+            raise ValueError(f"Unknown sensor source: {source}")
+        slots, values = self._slots, self._values
+        for sid, value in out.items():
+            if (slot := slots.get(sid)) is not None:
+                values[slot] = value
+        readings.update(out)
 
     def read_one(self, sensor_id: str) -> Optional[float]:
-        """Read a single sensor by ID."""
-        if sensor_id in self._hwmon_paths:
-            val = SysUtils.read_sysfs(self._hwmon_paths[sensor_id])
-            if val is not None:
-                try:
-                    raw = float(val)
-                    prefix = sensor_id.split(':')[-1]
-                    for pfx, div in _HWMON_DIVISORS.items():
-                        if prefix.startswith(pfx):
-                            return raw / div
-                    return raw
-                except ValueError:
-                    return None
-
-        if sensor_id in self._drm_paths:
-            val = SysUtils.read_sysfs(self._drm_paths[sensor_id])
-            if val is not None:
-                try:
-                    return float(val)
-                except ValueError:
-                    return None
+        """Read a single sensor by ID.
 
-        # For other sources, read_all is more efficient
-        readings = self.read_all()
+        An O(1) lookup: sysfs sensors reread their one file; other sensors
+        run only the call behind them (cached one-sensor plan), never a
+        full sweep.
+        """
+        self._current_plan()
+        entry = self._sysfs_index.get(sensor_id)
+        if entry is not None:
+            path, divisor, slot = entry
+            try:
+                value = float(self._sysfs.read(path)) / divisor  # type: ignore[arg-type]
+            except (TypeError, ValueError):
+                return None
+            self._values[slot] = value
+            return value
+
+        plan = self._single_plans.get(sensor_id)
+        if plan is None:
+            plan = self._single_plans[sensor_id] = self._compile_plan(
+                frozenset((sensor_id,)))
+        readings: dict[str, float] = {}
+        for source in plan.sources:
+            self._read_source(source, readings, plan)
         return readings.get(sensor_id)
 
     # =========================================================================
@@ -246,6 +483,8 @@ class SensorEnumerator:
                     category=category, unit=unit, source='hwmon'
                 ))
                 self._hwmon_paths[sensor_id] = str(input_file)
+                if driver_name in _SLOW_HWMON_DRIVERS:
+                    self._hwmon_slow.add(sensor_id)
 
     def _discover_nvidia(self):
         """Discover NVIDIA GPU sensors via pynvml."""
@@ -390,85 +629,133 @@ class SensorEnumerator:
     # Reading methods
     # =========================================================================
 
-    def _read_nvidia(self, readings: dict[str, float]):
+    def _read_hwmon(self, readings: dict[str, float], slow: bool,
+                    plan: Optional[ReadPlan] = None):
+        """Read hwmon sensors (the slow drivers, or all the others)."""
+        plan = plan or self._current_plan()
+        self._read_batch(plan.hwmon_slow if slow else plan.hwmon, readings)
+
+    def _read_batch(self, batch: SysfsBatch, readings: dict[str, float]):
+        """Read a compiled sysfs batch into the values vector and *readings*."""
+        if not batch.ids:
+            return
+        raw = batch.raw
+        self._sysfs.read_floats(batch.paths, raw)  # NaN = unreadable
+        np.divide(raw, batch.divisors, out=raw)
+        self._values[batch.slots] = raw
+        for sid, value in zip(batch.ids, raw.tolist()):
+            if value == value:  # Not NaN
+                readings[sid] = value
+
+    def _read_nvidia(self, readings: dict[str, float],
+                     plan: Optional[ReadPlan] = None):
         """Read all NVIDIA GPU sensors."""
+        self._read_nvidia_core(readings, plan)
+        self._read_nvidia_memory(readings, plan)
+
+    def _read_nvidia_core(self, readings: dict[str, float],
+                          plan: Optional[ReadPlan] = None):
+        """Read NVIDIA temperature, utilization, clocks, power and fan."""
         if not NVML_AVAILABLE or pynvml is None:
             return
 
         for i, handle in self._nvidia_handles.items():
+            fields = (plan or self._current_plan()).nvidia.get(i)
+            if not fields:
+                continue
             prefix = f"nvidia:{i}"
+            if 'temp' in fields:
+                try:
+                    readings[f"{prefix}:temp"] = float(
+                        pynvml.nvmlDeviceGetTemperature(handle, pynvml.NVML_TEMPERATURE_GPU))
+                except Exception:
+                    pass
+            if 'gpu_util' in fields or 'mem_util' in fields:
+                try:
+                    util = pynvml.nvmlDeviceGetUtilizationRates(handle)
+                    readings[f"{prefix}:gpu_util"] = float(util.gpu)
+                    readings[f"{prefix}:mem_util"] = float(util.memory)
+                except Exception:
+                    pass
+            if 'clock' in fields:
+                try:
+                    readings[f"{prefix}:clock"] = float(
+                        pynvml.nvmlDeviceGetClockInfo(handle, pynvml.NVML_CLOCK_GRAPHICS))
+                except Exception:
+                    pass
+            if 'mem_clock' in fields:
+                try:
+                    readings[f"{prefix}:mem_clock"] = float(
+                        pynvml.nvmlDeviceGetClockInfo(handle, pynvml.NVML_CLOCK_MEM))
+                except Exception:
+                    pass
+            if 'power' in fields:
+                try:
+                    readings[f"{prefix}:power"] = pynvml.nvmlDeviceGetPowerUsage(handle) / 1000.0
+                except Exception:
+                    pass
+            if 'fan' in fields:
+                try:
+                    readings[f"{prefix}:fan"] = float(pynvml.nvmlDeviceGetFanSpeed(handle))
+                except Exception:
+                    pass
+
+    def _read_nvidia_memory(self, readings: dict[str, float],
+                            plan: Optional[ReadPlan] = None):
+        """Read NVIDIA VRAM used / total."""
+        if not NVML_AVAILABLE or pynvml is None:
+            return
+
+        for i, handle in self._nvidia_handles.items():
+            fields = (plan or self._current_plan()).nvidia.get(i)
+            if not fields or not ('vram_used' in fields or 'vram_total' in fields):
+                continue
             try:
-                readings[f"{prefix}:temp"] = float(
-                    pynvml.nvmlDeviceGetTemperature(handle, pynvml.NVML_TEMPERATURE_GPU))
-            except Exception:
-                pass
-            try:
-                util = pynvml.nvmlDeviceGetUtilizationRates(handle)
-                readings[f"{prefix}:gpu_util"] = float(util.gpu)
-                readings[f"{prefix}:mem_util"] = float(util.memory)
-            except Exception:
-                pass
-            try:
-                readings[f"{prefix}:clock"] = float(
-                    pynvml.nvmlDeviceGetClockInfo(handle, pynvml.NVML_CLOCK_GRAPHICS))
-            except Exception:
-                pass
-            try:
-                readings[f"{prefix}:mem_clock"] = float(
-                    pynvml.nvmlDeviceGetClockInfo(handle, pynvml.NVML_CLOCK_MEM))
+                mem = pynvml.nvmlDeviceGetMemoryInfo(handle)
+                readings[f"nvidia:{i}:vram_used"] = int(mem.used) / (1024 * 1024)
+                readings[f"nvidia:{i}:vram_total"] = int(mem.total) / (1024 * 1024)
             except Exception:
                 pass
+
+    def _read_drm(self, readings: dict[str, float],
+                  plan: Optional[ReadPlan] = None):
+        """Read DRM sysfs sensors (AMD gpu_busy, Intel freq)."""
+        plan = plan or self._current_plan()
+        self._read_batch(plan.drm, readings)
+
+    def _read_psutil(self, readings: dict[str, float],
+                     plan: Optional[ReadPlan] = None):
+        """Read psutil-based sensors."""
+        fields = (plan or self._current_plan()).psutil
+
+        if 'cpu_percent' in fields:
             try:
-                readings[f"{prefix}:power"] = pynvml.nvmlDeviceGetPowerUsage(handle) / 1000.0
+                readings['psutil:cpu_percent'] = psutil.cpu_percent(interval=None)
             except Exception:
                 pass
+        if 'cpu_freq' in fields:
             try:
-                mem = pynvml.nvmlDeviceGetMemoryInfo(handle)
-                readings[f"{prefix}:vram_used"] = int(mem.used) / (1024 * 1024)
-                readings[f"{prefix}:vram_total"] = int(mem.total) / (1024 * 1024)
+                freq = psutil.cpu_freq()
+                if freq:
+                    readings['psutil:cpu_freq'] = freq.current
             except Exception:
                 pass
+        if 'mem_percent' in fields or 'mem_available' in fields:
             try:
-                readings[f"{prefix}:fan"] = float(pynvml.nvmlDeviceGetFanSpeed(handle))
+                mem = psutil.virtual_memory()
+                readings['psutil:mem_percent'] = mem.percent
+                readings['psutil:mem_available'] = mem.available / (1024 * 1024)
             except Exception:
                 pass
 
-    def _read_drm(self, readings: dict[str, float]):
-        """Read DRM sysfs sensors (AMD gpu_busy, Intel freq)."""
-        for sid, path in self._drm_paths.items():
-            val = SysUtils.read_sysfs(path)
-            if val is not None:
-                try:
-                    readings[sid] = float(val)
-                except ValueError:
-                    pass
-
-    def _read_psutil(self, readings: dict[str, float]):
-        """Read psutil-based sensors."""
-
-        try:
-            readings['psutil:cpu_percent'] = psutil.cpu_percent(interval=None)
-        except Exception:
-            pass
-        try:
-            freq = psutil.cpu_freq()
-            if freq:
-                readings['psutil:cpu_freq'] = freq.current
-        except Exception:
-            pass
-        try:
-            mem = psutil.virtual_memory()
-            readings['psutil:mem_percent'] = mem.percent
-            readings['psutil:mem_available'] = mem.available / (1024 * 1024)
-        except Exception:
-            pass
-
-    def _read_rapl(self, readings: dict[str, float]):
+    def _read_rapl(self, readings: dict[str, float],
+                   plan: Optional[ReadPlan] = None):
         """Read Intel RAPL power (energy delta → watts)."""
         now = time.monotonic()
 
-        for sid, path in self._rapl_paths.items():
-            val = SysUtils.read_sysfs(path)
+        paths = (plan or self._current_plan()).rapl
+        for sid, path in paths.items():
+            val = self._sysfs.read(path)
             if val is None:
                 continue
             try:
@@ -487,48 +774,51 @@ class SensorEnumerator:
 
             self._rapl_prev[sid] = (energy_uj, now)
 
-    def _read_computed(self, readings: dict[str, float]):
+    def _read_computed(self, readings: dict[str, float],
+                       plan: Optional[ReadPlan] = None):
         """Read computed I/O rate sensors (disk, network)."""
-
+        fields = (plan or self._current_plan()).computed
         now = time.monotonic()
 
         # Disk I/O
-        try:
-            disk = psutil.disk_io_counters()
-            if disk and self._disk_prev:
-                prev_disk, prev_time = self._disk_prev
-                dt = now - prev_time
-                if dt > 0:
-                    read_bytes = disk.read_bytes - prev_disk.read_bytes
-                    write_bytes = disk.write_bytes - prev_disk.write_bytes
-                    readings['computed:disk_read'] = read_bytes / (dt * 1024 * 1024)
-                    readings['computed:disk_write'] = write_bytes / (dt * 1024 * 1024)
-                    # Activity: approximate from busy_time if available
-                    if hasattr(disk, 'busy_time') and hasattr(prev_disk, 'busy_time'):
-                        busy_ms = disk.busy_time - prev_disk.busy_time
-                        readings['computed:disk_activity'] = min(100.0, busy_ms / (dt * 10))
-            if disk:
-                self._disk_prev = (disk, now)
-        except Exception:
-            pass
-
-        # Network I/O
-        try:
-            net = psutil.net_io_counters()
-            if net:
-                readings['computed:net_total_up'] = net.bytes_sent / (1024 * 1024)
-                readings['computed:net_total_down'] = net.bytes_recv / (1024 * 1024)
-                if self._net_prev:
-                    prev_net, prev_time = self._net_prev
+        if any(f.startswith('disk_') for f in fields):
+            try:
+                disk = psutil.disk_io_counters()
+                if disk and self._disk_prev:
+                    prev_disk, prev_time = self._disk_prev
                     dt = now - prev_time
                     if dt > 0:
-                        readings['computed:net_up'] = (
-                            (net.bytes_sent - prev_net.bytes_sent) / (dt * 1024))
-                        readings['computed:net_down'] = (
-                            (net.bytes_recv - prev_net.bytes_recv) / (dt * 1024))
-                self._net_prev = (net, now)
-        except Exception:
-            pass
+                        read_bytes = disk.read_bytes - prev_disk.read_bytes
+                        write_bytes = disk.write_bytes - prev_disk.write_bytes
+                        readings['computed:disk_read'] = read_bytes / (dt * 1024 * 1024)
+                        readings['computed:disk_write'] = write_bytes / (dt * 1024 * 1024)
+                        # Activity: approximate from busy_time if available
+                        if hasattr(disk, 'busy_time') and hasattr(prev_disk, 'busy_time'):
+                            busy_ms = disk.busy_time - prev_disk.busy_time
+                            readings['computed:disk_activity'] = min(100.0, busy_ms / (dt * 10))
+                if disk:
+                    self._disk_prev = (disk, now)
+            except Exception:
+                pass
+
+        # Network I/O
+        if any(f.startswith('net_') for f in fields):
+            try:
+                net = psutil.net_io_counters()
+                if net:
+                    readings['computed:net_total_up'] = net.bytes_sent / (1024 * 1024)
+                    readings['computed:net_total_down'] = net.bytes_recv / (1024 * 1024)
+                    if self._net_prev:
+                        prev_net, prev_time = self._net_prev
+                        dt = now - prev_time
+                        if dt > 0:
+                            readings['computed:net_up'] = (
+                                (net.bytes_sent - prev_net.bytes_sent) / (dt * 1024))
+                            readings['computed:net_down'] = (
+                                (net.bytes_recv - prev_net.bytes_recv) / (dt * 1024))
+                    self._net_prev = (net, now)
+            except Exception:
+                pass
 
     # =========================================================================
     # Default sensor mapping (legacy compat)
@@ -631,6 +921,106 @@ class SensorEnumerator:
         return SensorEnumerator._default_map
 
 
+# =========================================================================
+# Background sampling
+# =========================================================================
+
+@dataclass(frozen=True)
+class SensorSnapshot:
+    """Immutable set of readings published by SensorSampler."""
+    readings: Mapping[str, float] = field(
+        default_factory=lambda: MappingProxyType({}))
+    sampled_at: Mapping[str, float] = field(      # source -> monotonic time
+        default_factory=lambda: MappingProxyType({}))
+    published: float = 0.0                         # monotonic time, 0 = never
+
+
+class SensorSampler:
+    """Background thread polling sensor sources, each at its own interval.
+
+    A source is ``name -> (interval_s, read)`` where ``read(readings)``
+    adds its values to the dict.  Sources are read in declaration order,
+    so a later source sees the readings of the earlier ones.  After each
+    pass the sampler swaps in a new SensorSnapshot; readers just grab
+    ``snapshot`` (a single reference read, no lock) and never wait on a
+    slow sensor.  ``on_sample`` is called with every published snapshot,
+    on the sampler thread.
+    """
+
+    MIN_WAIT_S = 0.01  # Floor between passes, even with a zero interval
+
+    def __init__(self, sources: dict[str, tuple[float, Callable[[dict[str, float]], None]]],
+                 name: str = 'trcc-sensors',
+                 on_sample: Callable[[SensorSnapshot], None] | None = None) -> None:
+        self._sources = dict(sources)
+        self._on_sample = on_sample
+        self._name = name
+        self._next_due = {source: 0.0 for source in self._sources}
+        self._keys: dict[str, set[str]] = {source: set() for source in self._sources}
+        self._snapshot = SensorSnapshot()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def snapshot(self) -> SensorSnapshot:
+        """Latest published readings."""
+        return self._snapshot
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start the sampler thread (no-op if already running)."""
+        if self.running:
+            return
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, args=(self._stop,), name=self._name, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """Stop the sampler thread; the last snapshot stays readable."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def sample(self, now: float | None = None) -> SensorSnapshot:
+        """Read every source that is due and publish the result."""
+        if now is None:
+            now = time.monotonic()
+        readings = dict(self._snapshot.readings)
+        sampled_at = dict(self._snapshot.sampled_at)
+        for source, (interval, read) in self._sources.items():
+            if now < self._next_due[source]:
+                continue
+            self._next_due[source] = now + interval
+            for key in self._keys[source]:
+                readings.pop(key, None)  # Sensors that vanished since last read
+            before = set(readings)
+            try:
+                read(readings)
+            except Exception:
+                log.exception("Sensor source %s failed", source)
+            self._keys[source] = set(readings) - before
+            sampled_at[source] = now
+        self._snapshot = snapshot = SensorSnapshot(
+            MappingProxyType(readings), MappingProxyType(sampled_at), now)
+        if self._on_sample is not None:
+            try:
+                self._on_sample(snapshot)
+            except Exception:
+                log.exception("Sensor sample callback failed")
+        return snapshot
+
+    def _run(self, stop: threading.Event) -> None:
+        while not stop.is_set():
+            self.sample()
+            wait = min(self._next_due.values(), default=0.0) - time.monotonic()
+            stop.wait(max(wait, self.MIN_WAIT_S))
+
+
 # Backward-compat alias
 def map_defaults(enumerator: SensorEnumerator) -> dict[str, str]:
     """Legacy wrapper — delegates to enumerator.map_defaults()."""
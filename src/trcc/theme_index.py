@@ -0,0 +1,461 @@
+"""Persistent theme index — cached directory listings for the theme browsers.
+
+Listing a theme directory used to cost a handful of stat() calls plus a
+glob per theme, on every tab switch.  ThemeIndex keeps the file names of
+a theme root (one resolution) and of each theme subdirectory on disk,
+keyed by directory mtime:
+
+- refresh() stats the root and each theme directory, and lists again only
+  the directories whose mtime changed (adding, removing or renaming a file
+  always bumps its directory's mtime).
+- watch() adds inotify watches; from then on refresh() drains the queued
+  events and rescans only what the kernel reported, so listing unchanged
+  themes costs one non-blocking read instead of a stat per directory.
+
+Classes:
+    ThemeIndex  — mtime-keyed listing of one theme root, persisted as JSON
+    DirWatcher  — minimal inotify watch set (ctypes, no extra dependency)
+"""
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import errno
+import hashlib
+import json
+import logging
+import os
+import struct
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from .data_repository import USER_CONFIG_DIR, ThemeDir
+
+log = logging.getLogger(__name__)
+
+INDEX_DIR = os.path.join(USER_CONFIG_DIR, 'cache', 'theme-index')
+
+
+# =========================================================================
+# DirWatcher — inotify, drained by non-blocking poll() (no thread)
+# =========================================================================
+
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_IN_MOVED_FROM = 0x040
+_IN_MOVED_TO = 0x080
+_IN_CREATE = 0x100
+_IN_DELETE = 0x200
+_IN_DELETE_SELF = 0x400
+_IN_MOVE_SELF = 0x800
+_IN_Q_OVERFLOW = 0x4000
+_IN_IGNORED = 0x8000
+_IN_ONLYDIR = 0x01000000
+_WATCH_MASK = (_IN_CREATE | _IN_DELETE | _IN_MOVED_FROM | _IN_MOVED_TO
+               | _IN_DELETE_SELF | _IN_MOVE_SELF | _IN_ONLYDIR)
+_EVENT = struct.Struct('iIII')  # wd, mask, cookie, len
+
+try:
+    _libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+    _inotify_init1 = _libc.inotify_init1
+    _inotify_add_watch = _libc.inotify_add_watch
+    _inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    _inotify_rm_watch = _libc.inotify_rm_watch
+    INOTIFY_AVAILABLE = True
+except (OSError, AttributeError):
+    INOTIFY_AVAILABLE = False
+
+
+class DirWatcher:
+    """Report name changes (create/delete/rename) in a set of directories.
+
+    The kernel queues events as they happen; ``poll()`` drains the queue
+    without blocking and returns the directories whose listing changed.
+    Polling right before a listing sees every change made before it, so
+    no background thread (and no event-delivery race) is involved.
+    ``None`` in the result means events were lost (queue overflow) and
+    every directory should be considered stale.
+    """
+
+    def __init__(self) -> None:
+        if not INOTIFY_AVAILABLE:
+            raise OSError(errno.ENOSYS, "inotify not available")
+        fd = _inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        self._fd = fd
+        self._wds: dict[int, str] = {}
+        self._paths: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def add(self, path: str) -> bool:
+        """Watch *path* (no-op if already watched). False if the kernel refused."""
+        with self._lock:
+            if path in self._paths or self._fd < 0:
+                return path in self._paths
+            wd = _inotify_add_watch(self._fd, os.fsencode(path), _WATCH_MASK)
+            if wd < 0:
+                log.debug("inotify_add_watch(%s): %s", path,
+                          os.strerror(ctypes.get_errno()))
+                return False
+            self._wds[wd] = path
+            self._paths[path] = wd
+            return True
+
+    def remove(self, path: str) -> None:
+        with self._lock:
+            wd = self._paths.pop(path, None)
+            if wd is not None:
+                self._wds.pop(wd, None)
+                if self._fd >= 0:
+                    _inotify_rm_watch(self._fd, wd)
+
+    @property
+    def watched(self) -> set[str]:
+        with self._lock:
+            return set(self._paths)
+
+    @property
+    def closed(self) -> bool:
+        return self._fd < 0
+
+    def poll(self) -> set[Optional[str]]:
+        """Drain queued events; return the directories that changed."""
+        changed: set[Optional[str]] = set()
+        with self._lock:
+            while self._fd >= 0:
+                try:
+                    data = os.read(self._fd, 64 * 1024)
+                except BlockingIOError:
+                    break
+                except OSError as e:
+                    log.debug("inotify read failed: %s", e)
+                    changed.add(None)
+                    break
+                self._parse(data, changed)
+        return changed
+
+    def _parse(self, data: bytes, changed: set[Optional[str]]) -> None:
+        offset = 0
+        while offset + _EVENT.size <= len(data):
+            wd, mask, _cookie, length = _EVENT.unpack_from(data, offset)
+            offset += _EVENT.size + length
+            if mask & _IN_Q_OVERFLOW:
+                changed.add(None)
+                continue
+            path = self._wds.get(wd)
+            if path is None:
+                continue
+            if mask & _IN_IGNORED:  # Watch gone (directory deleted/unmounted)
+                del self._wds[wd]
+                self._paths.pop(path, None)
+            changed.add(path)
+
+    def close(self) -> None:
+        """Release the inotify descriptor (drops every watch)."""
+        with self._lock:
+            if self._fd >= 0:
+                os.close(self._fd)
+                self._fd = -1
+            self._wds.clear()
+            self._paths.clear()
+
+    def __del__(self) -> None:
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+# =========================================================================
+# ThemeIndex
+# =========================================================================
+
+class ThemeIndex:
+    """Listing of a theme root and its theme directories, cached on disk.
+
+    Usage:
+        index = ThemeIndex.for_dir(theme_root)
+        for name, files in index.dirs().items(): ...   # subdirectory listings
+        index.files()                                   # files in the root
+
+    One shared instance per root (``for_dir``), so watches added by the
+    GUI serve every later listing.  Thread-safe.
+    """
+
+    VERSION = 1
+    # A directory modified this recently may change again within the same
+    # mtime tick (coarse timestamps on some filesystems); don't trust it.
+    RACY_SECONDS = 2.0
+
+    _instances: dict[str, ThemeIndex] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, root: str | os.PathLike,
+                 index_dir: Optional[str] = None) -> None:
+        self.root = Path(root)
+        self._index_dir = index_dir or INDEX_DIR
+        self._mtime = -1
+        self._files: frozenset[str] = frozenset()
+        self._dirs: dict[str, tuple[int, frozenset[str]]] = {}  # name → (mtime, files)
+        self._loaded = False
+        self._watcher: Optional[DirWatcher] = None
+        self._full_refresh = False  # Next watched refresh must stat everything
+        self._lock = threading.RLock()
+        self.rescans = 0  # Directories listed since creation (for tests/stats)
+
+    @classmethod
+    def for_dir(cls, root: str | os.PathLike) -> ThemeIndex:
+        """Shared index for *root* (one per absolute path)."""
+        key = os.path.abspath(root)
+        with cls._instances_lock:
+            index = cls._instances.get(key)
+            if index is None:
+                index = cls._instances[key] = cls(key)
+            return index
+
+    # ── Queries ──────────────────────────────────────────────────────
+
+    def dirs(self) -> dict[str, frozenset[str]]:
+        """Subdirectory name → file names, after refresh()."""
+        with self._lock:
+            self.refresh()
+            return {name: files for name, (_, files) in self._dirs.items()}
+
+    def files(self) -> frozenset[str]:
+        """File (and directory) names directly in the root, after refresh()."""
+        with self._lock:
+            self.refresh()
+            return self._files
+
+    def theme_dirs(self) -> dict[str, frozenset[str]]:
+        """Subdirectories that look like themes (ThemeDir.is_valid)."""
+        return {name: files for name, files in self.dirs().items()
+                if ThemeDir.is_valid_listing(files)}
+
+    # ── Refresh ──────────────────────────────────────────────────────
+
+    def refresh(self) -> bool:
+        """Bring the index up to date. Returns True if anything changed."""
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            watcher = self._watcher
+            if watcher is not None and not watcher.closed:
+                stale = self._watched_changes(watcher)
+                if stale is not None:
+                    if not stale:
+                        return False
+                    changed = self._refresh_names(stale)
+                    self._save_if(changed)
+                    return changed
+            changed = self._refresh_all()
+            self._save_if(changed)
+            return changed
+
+    def _watched_changes(self, watcher: DirWatcher) -> Optional[set[Optional[str]]]:
+        """Names (None = root) to recheck, or None if everything must be."""
+        stale: set[Optional[str]] = set()
+        for path in watcher.poll():
+            if path is None:
+                self._full_refresh = True
+            elif path == str(self.root):
+                stale.add(None)
+            else:
+                stale.add(os.path.basename(path))
+        if self._full_refresh:
+            self._full_refresh = False
+            return None
+        # Too-recent mtimes: listed before their watch may have existed
+        stale.update(name for name, (mtime, _) in self._dirs.items() if mtime < 0)
+        if self._mtime < 0:
+            stale.add(None)
+        return stale
+
+    def _refresh_all(self) -> bool:
+        """Stat the root and every theme directory; list only what changed."""
+        mtime = self._stat_mtime(self.root)
+        if mtime is None:
+            changed = bool(self._dirs or self._files)
+            self._mtime, self._files, self._dirs = -1, frozenset(), {}
+            return changed
+        if mtime != self._mtime:
+            return self._rescan_root(mtime)
+        changed = False
+        for name in list(self._dirs):
+            changed |= self._refresh_dir(name)
+        return changed
+
+    def _refresh_names(self, stale: set[Optional[str]]) -> bool:
+        """List the reported directories again, whatever their mtime says."""
+        changed = False
+        if None in stale:
+            mtime = self._stat_mtime(self.root)
+            changed = (self._rescan_root(mtime) if mtime is not None
+                       else self._refresh_all())
+        for name in stale:
+            if name is not None and name in self._dirs:
+                changed |= self._refresh_dir(name, force=True)
+        return changed
+
+    def _rescan_root(self, mtime: int) -> bool:
+        """List the root; reuse entries of subdirectories whose mtime held."""
+        self.rescans += 1
+        files: set[str] = set()
+        dirs: dict[str, tuple[int, frozenset[str]]] = {}
+        try:
+            with os.scandir(self.root) as it:
+                for entry in it:
+                    files.add(entry.name)
+                    if entry.name.startswith('.') or not entry.is_dir():
+                        continue
+                    try:
+                        sub_mtime = entry.stat().st_mtime_ns
+                    except OSError:
+                        continue
+                    cached = self._dirs.get(entry.name)
+                    if cached is not None and cached[0] == sub_mtime >= 0:
+                        dirs[entry.name] = cached
+                    else:
+                        dirs[entry.name] = self._list_dir(entry.path, sub_mtime)
+        except OSError as e:
+            log.debug("ThemeIndex: can't list %s: %s", self.root, e)
+            return False
+        mtime = self._trusted(mtime)
+        changed = (mtime, files, dirs) != (self._mtime, self._files, self._dirs)
+        self._mtime = mtime
+        self._files = frozenset(files)
+        self._dirs = dirs
+        self._sync_watches()
+        return changed
+
+    def _refresh_dir(self, name: str, force: bool = False) -> bool:
+        path = self.root / name
+        mtime = self._stat_mtime(path)
+        if mtime is None:
+            del self._dirs[name]
+            return True
+        cached = self._dirs[name]
+        if cached[0] == mtime >= 0 and not force:
+            return False
+        entry = self._list_dir(path, mtime)
+        self._dirs[name] = entry
+        return entry != cached
+
+    def _list_dir(self, path: str | os.PathLike, mtime: int) -> tuple[int, frozenset[str]]:
+        self.rescans += 1
+        return self._trusted(mtime), ThemeDir.list_files(path)
+
+    def _trusted(self, mtime: int) -> int:
+        """*mtime*, or -1 (always rescan) if it is too recent to rely on."""
+        if time.time() - mtime / 1e9 < self.RACY_SECONDS:
+            return -1
+        return mtime
+
+    @staticmethod
+    def _stat_mtime(path: Path) -> Optional[int]:
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+
+    # ── Persistence ──────────────────────────────────────────────────
+
+    @property
+    def index_path(self) -> str:
+        digest = hashlib.sha1(os.fsencode(os.path.abspath(self.root))).hexdigest()[:16]
+        return os.path.join(self._index_dir, f'{self.root.name or "root"}-{digest}.json')
+
+    def _load(self) -> None:
+        self._loaded = True
+        try:
+            with open(self.index_path, encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') != self.VERSION or data.get('root') != str(self.root):
+                return
+            self._mtime = int(data['mtime'])
+            self._files = frozenset(data['files'])
+            self._dirs = {name: (int(mtime), frozenset(files))
+                          for name, (mtime, files) in data['dirs'].items()}
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            log.debug("ThemeIndex: ignoring unreadable index %s: %s", self.index_path, e)
+            self._mtime, self._files, self._dirs = -1, frozenset(), {}
+
+    def _save_if(self, changed: bool) -> None:
+        if changed:
+            self.save()
+
+    def save(self) -> None:
+        """Write the index atomically (best effort)."""
+        data = {
+            'version': self.VERSION,
+            'root': str(self.root),
+            'mtime': self._mtime,
+            'files': sorted(self._files),
+            'dirs': {name: [mtime, sorted(files)]
+                     for name, (mtime, files) in sorted(self._dirs.items())},
+        }
+        path = self.index_path
+        tmp = f'{path}.{os.getpid()}.tmp'
+        try:
+            os.makedirs(self._index_dir, exist_ok=True)
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(data, f, separators=(',', ':'))
+            os.replace(tmp, path)
+        except OSError as e:
+            log.debug("ThemeIndex: can't write %s: %s", path, e)
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+
+    # ── Watching ─────────────────────────────────────────────────────
+
+    def watch(self) -> bool:
+        """Keep the index fresh with inotify. False if unavailable."""
+        with self._lock:
+            if self._watcher is not None and not self._watcher.closed:
+                return True
+            if not self._loaded:
+                self._load()
+            try:
+                self._watcher = DirWatcher()
+            except OSError as e:
+                log.debug("ThemeIndex: no inotify (%s), using mtimes", e)
+                self._watcher = None
+                return False
+            # Watches first, then a full refresh: a change in between is
+            # either in the listing or in the event queue.
+            self._sync_watches()
+            self._full_refresh = True
+            return self._watcher is not None
+
+    def unwatch(self) -> None:
+        with self._lock:
+            watcher, self._watcher = self._watcher, None
+            if watcher is not None:
+                watcher.close()
+
+    @property
+    def watching(self) -> bool:
+        return self._watcher is not None and not self._watcher.closed
+
+    def _sync_watches(self) -> None:
+        watcher = self._watcher
+        if watcher is None:
+            return
+        wanted = {str(self.root)} | {str(self.root / name) for name in self._dirs}
+        watched = watcher.watched
+        for path in watched - wanted:
+            watcher.remove(path)
+        for path in wanted - watched:
+            if not watcher.add(path):
+                # Can't watch it (gone, or out of watches): back to mtimes
+                self._watcher = None
+                watcher.close()
+                return
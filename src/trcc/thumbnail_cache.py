@@ -0,0 +1,309 @@
+"""Thumbnail atlas — pre-scaled browser thumbnails packed into one file.
+
+The theme, cloud and mask browsers used to open and LANCZOS-scale every
+full-size preview PNG each time a grid was rebuilt.  A ThumbnailAtlas
+stores the finished 120x120 RGB thumbnails of one browser directory
+(one category at one resolution) as fixed-size slots in a single data
+file, memory-mapped for reading, with a small JSON index beside it:
+
+    <name>.atlas   slot 0 | slot 1 | ...   (size * size * 3 bytes each)
+    <name>.json    {path: [slot, mtime_ns, file size]}
+
+A slot is valid while its source file keeps the same mtime and size;
+a changed source is re-rendered into the same slot.  Missing thumbnails
+are rendered on a shared thread pool and handed back through a callback,
+so a browser can show placeholders at once and fill cells in as they
+finish.
+
+Pure Python + Pillow, no Qt dependencies.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import mmap
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+from PIL import Image
+
+from .data_repository import USER_CONFIG_DIR
+
+log = logging.getLogger(__name__)
+
+CACHE_DIR = os.path.join(USER_CONFIG_DIR, 'cache', 'thumbnails')
+THUMB_SIZE = 120
+
+
+def render_thumbnail(path: str, size: int = THUMB_SIZE) -> bytes:
+    """Scale an image to fit *size* x *size*, centered on black (RGB bytes)."""
+    with Image.open(path) as img:
+        img.thumbnail((size, size), Image.Resampling.LANCZOS)
+        bg = Image.new('RGB', (size, size), (0, 0, 0))
+        bg.paste(img, ((size - img.width) // 2, (size - img.height) // 2))
+    return bg.tobytes()
+
+
+class ThumbnailAtlas:
+    """Packed, mtime-keyed thumbnail slots for one browser directory.
+
+    Thread-safe: the GUI thread reads while pool workers write.
+    """
+
+    VERSION = 1
+    MAX_WORKERS = 4
+
+    _instances: dict[str, ThumbnailAtlas] = {}
+    _instances_lock = threading.Lock()
+    _executor: Optional[ThreadPoolExecutor] = None
+
+    def __init__(self, name: str, cache_dir: Optional[str] = None,
+                 size: int = THUMB_SIZE) -> None:
+        self.name = name
+        self.size = size
+        self.slot_bytes = size * size * 3
+        self._cache_dir = cache_dir or CACHE_DIR
+        self._slots: dict[str, tuple[int, int, int]] = {}  # path → (slot, mtime_ns, size)
+        self._free: list[int] = []
+        self._next_slot = 0
+        self._loaded = False
+        self._dirty = False
+        self._map: Optional[mmap.mmap] = None
+        self._wfd = -1
+        self._pending: dict[str, list[Callable[[Optional[bytes]], None]]] = {}
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.builds = 0
+
+    @classmethod
+    def for_dir(cls, category: str, directory: str | os.PathLike) -> ThumbnailAtlas:
+        """Shared atlas for *directory* in a browser *category* (local/cloud/mask)."""
+        path = os.path.abspath(directory)
+        digest = hashlib.sha1(os.fsencode(path)).hexdigest()[:8]
+        name = f'{category}-{os.path.basename(path) or "root"}-{digest}'
+        with cls._instances_lock:
+            atlas = cls._instances.get(name)
+            if atlas is None:
+                atlas = cls._instances[name] = cls(name)
+            return atlas
+
+    @property
+    def data_path(self) -> str:
+        return os.path.join(self._cache_dir, f'{self.name}.atlas')
+
+    @property
+    def index_path(self) -> str:
+        return os.path.join(self._cache_dir, f'{self.name}.json')
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._ensure_loaded()
+            return len(self._slots)
+
+    # ── Lookup ───────────────────────────────────────────────────────
+
+    def get(self, path: str) -> Optional[bytes]:
+        """Cached RGB thumbnail of *path*, or None if missing or stale."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            self._forget(path)
+            return None
+        with self._lock:
+            self._ensure_loaded()
+            entry = self._slots.get(path)
+            if entry is None or entry[1:] != (st.st_mtime_ns, st.st_size):
+                return None
+            data = self._read_slot(entry[0])
+            if data is not None:
+                self.hits += 1
+            return data
+
+    def load(self, path: str) -> bytes:
+        """Cached thumbnail of *path*, rendering and storing it on a miss."""
+        data = self.get(path)
+        if data is None:
+            data = self._build(path)
+            self.save()
+        return data
+
+    def request(self, path: str,
+                callback: Callable[[Optional[bytes]], None]) -> Optional[bytes]:
+        """Cached thumbnail of *path*, or None and render it in the background.
+
+        On a miss, *callback* is later called from a pool thread with the
+        RGB bytes, or with None if the image can't be decoded.  Concurrent
+        requests for the same path share one render.
+        """
+        data = self.get(path)
+        if data is not None:
+            return data
+        with self._lock:
+            waiting = self._pending.get(path)
+            if waiting is not None:
+                waiting.append(callback)
+                return None
+            self._pending[path] = [callback]
+        self._pool().submit(self._build_pending, path)
+        return None
+
+    # ── Building ─────────────────────────────────────────────────────
+
+    @classmethod
+    def _pool(cls) -> ThreadPoolExecutor:
+        with cls._instances_lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(
+                    max_workers=min(cls.MAX_WORKERS, os.cpu_count() or 1),
+                    thread_name_prefix='trcc-thumbs')
+            return cls._executor
+
+    def _build(self, path: str) -> bytes:
+        st = os.stat(path)
+        data = render_thumbnail(path, self.size)
+        self.put(path, data, st.st_mtime_ns, st.st_size)
+        return data
+
+    def _build_pending(self, path: str) -> None:
+        try:
+            data: Optional[bytes] = self._build(path)
+        except Exception as e:
+            log.warning("Failed to load thumbnail %s: %s", path, e)
+            data = None
+        with self._lock:
+            callbacks = self._pending.pop(path, [])
+            idle = not self._pending
+        if idle:
+            self.save()
+        for callback in callbacks:
+            try:
+                callback(data)
+            except Exception:
+                log.exception("Thumbnail callback failed for %s", path)
+
+    def put(self, path: str, data: bytes, mtime_ns: int, size: int) -> None:
+        """Store *data* as the thumbnail of *path* at (mtime_ns, size)."""
+        if len(data) != self.slot_bytes:
+            raise ValueError(
+                f"thumbnail is {len(data)} bytes, expected {self.slot_bytes}")
+        with self._lock:
+            self._ensure_loaded()
+            entry = self._slots.get(path)
+            if entry is not None:
+                slot = entry[0]
+            elif self._free:
+                slot = self._free.pop()
+            else:
+                slot = self._next_slot
+                self._next_slot += 1
+            try:
+                if self._wfd < 0:
+                    os.makedirs(self._cache_dir, exist_ok=True)
+                    self._wfd = os.open(self.data_path, os.O_RDWR | os.O_CREAT, 0o644)
+                os.pwrite(self._wfd, data, slot * self.slot_bytes)
+            except OSError as e:
+                log.debug("ThumbnailAtlas: can't write %s: %s", self.data_path, e)
+                if entry is None:
+                    self._free.append(slot)
+                return
+            self._slots[path] = (slot, mtime_ns, size)
+            self._dirty = True
+            self.builds += 1
+
+    def _forget(self, path: str) -> None:
+        """Drop the slot of a source that no longer exists."""
+        with self._lock:
+            self._ensure_loaded()
+            entry = self._slots.pop(path, None)
+            if entry is not None:
+                self._free.append(entry[0])
+                self._dirty = True
+
+    # ── Data file ────────────────────────────────────────────────────
+
+    def _read_slot(self, slot: int) -> Optional[bytes]:
+        start = slot * self.slot_bytes
+        end = start + self.slot_bytes
+        if self._map is None or len(self._map) < end:
+            self._remap()  # The file grew since it was mapped
+            if self._map is None or len(self._map) < end:
+                return None
+        return self._map[start:end]
+
+    def _remap(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        try:
+            with open(self.data_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size:
+                    self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except OSError as e:
+            log.debug("ThumbnailAtlas: can't map %s: %s", self.data_path, e)
+
+    def close(self) -> None:
+        """Write the index and release the mapping and file descriptor."""
+        with self._lock:
+            self.save()
+            if self._map is not None:
+                self._map.close()
+                self._map = None
+            if self._wfd >= 0:
+                os.close(self._wfd)
+                self._wfd = -1
+
+    # ── Persistence ──────────────────────────────────────────────────
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            with open(self.index_path, encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') != self.VERSION or data.get('size') != self.size:
+                return
+            length = os.path.getsize(self.data_path)
+            slots = {path: (int(slot), int(mtime), int(size))
+                     for path, (slot, mtime, size) in data['slots'].items()}
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            log.debug("ThumbnailAtlas: ignoring unreadable index %s: %s",
+                      self.index_path, e)
+            return
+        # Slots past the end of the data file were never fully written
+        self._slots = {path: entry for path, entry in slots.items()
+                       if (entry[0] + 1) * self.slot_bytes <= length}
+        used = {entry[0] for entry in self._slots.values()}
+        self._next_slot = max(used, default=-1) + 1
+        self._free = sorted(set(range(self._next_slot)) - used, reverse=True)
+
+    def save(self) -> None:
+        """Write the index atomically if it changed (best effort)."""
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {
+                'version': self.VERSION,
+                'size': self.size,
+                'slots': {path: list(entry)
+                          for path, entry in sorted(self._slots.items())},
+            }
+            path = self.index_path
+            tmp = f'{path}.{os.getpid()}.tmp'
+            try:
+                os.makedirs(self._cache_dir, exist_ok=True)
+                with open(tmp, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, separators=(',', ':'))
+                os.replace(tmp, path)
+                self._dirty = False
+            except OSError as e:
+                log.debug("ThumbnailAtlas: can't write %s: %s", path, e)
+                try:
+                    os.unlink(tmp)
+                except OSError:
+                    pass
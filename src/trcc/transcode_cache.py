@@ -0,0 +1,352 @@
+"""Transcode cache — videos decoded and scaled once, replayed from disk.
+
+Cloud themes are .mp4 files.  MediaService used to run FFmpeg on the
+video every time one was selected (and again on every loop while
+streaming), scaling it to the LCD resolution from scratch each time.
+A TranscodeCache entry holds the result: the video's frames at one
+target size and frame rate, stored as a Theme.zt (JPEG frames plus
+timestamps) so ThemeZtDecoder can memory-map it and decode frames
+lazily, with seeking by index.
+
+Entries are content-addressed:
+
+    <sha1 of the video, 16 hex>-<w>x<h>-<fps>fps.zt
+
+so re-downloaded or copied videos share an entry.  Hashing a video
+means reading all of it, so lookups go through an index of
+(path, size, mtime_ns) → digest kept in the cache directory; a video not
+in the index is a miss, and its digest is computed on the transcode
+worker.  The first play of a video transcodes it on that background
+thread while FFmpeg streams as before; later plays load the entry.
+Total size is kept under a quota by evicting least recently used
+entries (a hit bumps the entry's mtime).
+
+Classes:
+    TranscodeCache — lookup / background transcode / LRU prune
+"""
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import logging
+import os
+import struct
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from PIL import Image
+
+from .data_repository import USER_CONFIG_DIR
+
+log = logging.getLogger(__name__)
+
+CACHE_DIR = os.path.join(USER_CONFIG_DIR, 'cache', 'transcode')
+SUFFIX = '.zt'
+INDEX_NAME = 'index.json'
+
+
+class TranscodeCache:
+    """Content-addressed, quota-bounded cache of transcoded videos."""
+
+    DEFAULT_FPS = 16                    # Windows: originalImageHz = 16
+    DEFAULT_QUOTA = 512 * 1024 * 1024
+    QUALITY = 90                        # JPEG quality of stored frames
+    TIMEOUT_S = 600
+
+    _shared: Optional[TranscodeCache] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, cache_dir: Optional[str] = None,
+                 quota_bytes: Optional[int] = None) -> None:
+        self.cache_dir = cache_dir or CACHE_DIR
+        self.quota_bytes = (self.DEFAULT_QUOTA if quota_bytes is None
+                            else max(0, quota_bytes))
+        self._pending: set[tuple[str, tuple[int, int], int]] = set()
+        self._lock = threading.Lock()
+        self._index: Optional[dict[str, list]] = None  # path → [size, mtime_ns, sha1]
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def shared(cls, quota_bytes: Optional[int] = None) -> TranscodeCache:
+        """Process-wide cache in CACHE_DIR (*quota_bytes* updates its quota)."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            if quota_bytes is not None:
+                cls._shared.quota_bytes = max(0, quota_bytes)
+            return cls._shared
+
+    # ── Keys ─────────────────────────────────────────────────────────
+
+    def _load_index(self) -> dict[str, list]:
+        """The digest index, read from the cache directory once (call locked)."""
+        if self._index is None:
+            try:
+                with open(os.path.join(self.cache_dir, INDEX_NAME)) as f:
+                    index = json.load(f)
+                self._index = index if isinstance(index, dict) else {}
+            except (OSError, ValueError):
+                self._index = {}
+        return self._index
+
+    def known_digest(self, source: str | os.PathLike) -> Optional[str]:
+        """Indexed SHA-1 of *source* if this version of it was hashed before.
+
+        Costs a stat; never reads the video.
+        """
+        path = os.path.abspath(source)
+        st = os.stat(path)
+        with self._lock:
+            entry = self._load_index().get(path)
+        if (isinstance(entry, list) and len(entry) == 3
+                and entry[:2] == [st.st_size, st.st_mtime_ns]):
+            return entry[2]
+        return None
+
+    def source_digest(self, source: str | os.PathLike) -> str:
+        """SHA-1 of the video's contents, hashed once per path, size and mtime."""
+        digest = self.known_digest(source)
+        if digest is not None:
+            return digest
+        path = os.path.abspath(source)
+        st = os.stat(path)
+        h = hashlib.sha1()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                h.update(chunk)
+        digest = h.hexdigest()
+        with self._lock:
+            index = self._load_index()
+            index[path] = [st.st_size, st.st_mtime_ns, digest]
+            self._save_index(index)
+        return digest
+
+    def _save_index(self, index: dict[str, list]) -> None:
+        """Write the digest index atomically (call locked)."""
+        path = os.path.join(self.cache_dir, INDEX_NAME)
+        tmp = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(tmp, 'w') as f:
+                json.dump(index, f)
+            os.replace(tmp, path)
+        except OSError as e:
+            log.debug("TranscodeCache: can't save index: %s", e)
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+
+    def _entry_name(self, digest: str, size: tuple[int, int], fps: int) -> str:
+        return os.path.join(self.cache_dir,
+                            f'{digest[:16]}-{size[0]}x{size[1]}-{fps}fps{SUFFIX}')
+
+    def entry_path(self, source: str | os.PathLike, size: tuple[int, int],
+                   fps: int = DEFAULT_FPS) -> str:
+        """Cache file for *source* transcoded to *size* at *fps*.
+
+        Hashes the video unless it's indexed — not for the GUI thread.
+        """
+        return self._entry_name(self.source_digest(source), size, fps)
+
+    # ── Lookup ───────────────────────────────────────────────────────
+
+    def lookup(self, source: str | os.PathLike, size: tuple[int, int],
+               fps: int = DEFAULT_FPS, hash_source: bool = False) -> Optional[str]:
+        """Path of the cached transcode of *source*, or None.
+
+        Only indexed videos can hit unless *hash_source* (which reads the
+        whole video when it isn't indexed yet).
+        """
+        try:
+            if hash_source:
+                path = self.entry_path(source, size, fps)
+            else:
+                digest = self.known_digest(source)
+                if digest is None:
+                    raise FileNotFoundError(source)
+                path = self._entry_name(digest, size, fps)
+            os.utime(path)  # Most recently used
+        except OSError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return path
+
+    def request(self, source: str | os.PathLike, size: tuple[int, int],
+                fps: int = DEFAULT_FPS) -> bool:
+        """Transcode *source* on a background thread unless cached or queued.
+
+        The video is hashed on the worker, which skips the transcode when
+        a copy of it is already cached.  Returns True if the job was queued.
+        """
+        try:
+            digest = self.known_digest(source)
+        except OSError:
+            return False
+        if digest is not None and os.path.exists(self._entry_name(digest, size, fps)):
+            return False
+        key = (os.path.abspath(source), size, fps)
+        with self._lock:
+            if key in self._pending:
+                return False
+            self._pending.add(key)
+            if self._executor is None:
+                # One at a time: FFmpeg already uses several cores
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix='trcc-transcode')
+            self._executor.submit(self._transcode_pending, key,
+                                  os.fspath(source), size, fps)
+        return True
+
+    def _transcode_pending(self, key: tuple[str, tuple[int, int], int], source: str,
+                           size: tuple[int, int], fps: int) -> None:
+        try:
+            if not os.path.exists(self.entry_path(source, size, fps)):
+                self.transcode(source, size, fps)
+        except Exception as e:
+            log.warning("Transcode of %s failed: %s", source, e)
+        finally:
+            with self._lock:
+                self._pending.discard(key)
+
+    # ── Transcoding ──────────────────────────────────────────────────
+
+    def transcode(self, source: str | os.PathLike, size: tuple[int, int],
+                  fps: int = DEFAULT_FPS) -> str:
+        """Decode and scale *source* with FFmpeg into a cache entry.
+
+        Frames are JPEG-encoded on the shared FramePool as they arrive
+        from the pipe.  Returns the entry's path.
+        """
+        from .media_player import FFMPEG_AVAILABLE, FramePool
+
+        if not FFMPEG_AVAILABLE:
+            raise RuntimeError("FFmpeg not available. Install: sudo dnf install ffmpeg")
+        source = os.fspath(source)
+        path = self.entry_path(source, size, fps)
+        w, h = size
+        proc = subprocess.Popen([
+            'ffmpeg', '-i', source,
+            '-r', str(fps),
+            '-vf', f'scale={w}:{h}',
+            '-f', 'rawvideo', '-pix_fmt', 'rgb24',
+            '-loglevel', 'error', 'pipe:1',
+        ], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        try:
+            assert proc.stdout is not None
+            frame_size = w * h * 3
+            chunks = iter(lambda: proc.stdout.read(frame_size), b'')
+            jpegs = list(FramePool.shared().map(
+                lambda raw: self._encode(raw, size),
+                (c for c in chunks if len(c) == frame_size)))
+            rc = proc.wait(timeout=self.TIMEOUT_S)
+        finally:
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+            if proc.stdout is not None:
+                proc.stdout.close()
+        if rc != 0:
+            raise RuntimeError(f"FFmpeg exited with {rc}")
+        if not jpegs:
+            raise RuntimeError("FFmpeg produced no frames")
+
+        self._write(path, jpegs, fps)
+        log.info("Transcoded %s → %s (%d frames, %d KB)", source,
+                 os.path.basename(path), len(jpegs), os.path.getsize(path) // 1024)
+        self.prune(keep=path)
+        return path
+
+    def _encode(self, raw: bytes, size: tuple[int, int]) -> bytes:
+        buf = io.BytesIO()
+        Image.frombytes('RGB', size, raw).save(buf, format='JPEG',
+                                               quality=self.QUALITY)
+        return buf.getvalue()
+
+    def _write(self, path: str, jpegs: list[bytes], fps: int) -> None:
+        """Write a Theme.zt atomically (see ThemeZtDecoder for the layout)."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        count = len(jpegs)
+        try:
+            with open(tmp, 'wb') as f:
+                f.write(struct.pack('<Bi', 0xDC, count))
+                f.write(struct.pack(f'<{count}i',
+                                    *(i * 1000 // fps for i in range(count))))
+                for jpeg in jpegs:
+                    f.write(struct.pack('<i', len(jpeg)))
+                    f.write(jpeg)
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
+    # ── Quota ────────────────────────────────────────────────────────
+
+    def entries(self) -> list[tuple[str, int, float]]:
+        """(path, bytes, mtime) of every entry, least recently used first."""
+        result = []
+        try:
+            names = os.listdir(self.cache_dir)
+        except OSError:
+            return []
+        for name in names:
+            if not name.endswith(SUFFIX):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            result.append((path, st.st_size, st.st_mtime))
+        result.sort(key=lambda e: e[2])
+        return result
+
+    def usage(self) -> int:
+        """Total bytes used by cache entries."""
+        return sum(size for _, size, _ in self.entries())
+
+    def prune(self, quota_bytes: Optional[int] = None,
+              keep: Optional[str] = None) -> tuple[int, int]:
+        """Evict least recently used entries until under the quota.
+
+        *keep* (the entry just written) is never evicted.  Returns
+        (entries removed, bytes freed).
+        """
+        quota = self.quota_bytes if quota_bytes is None else max(0, quota_bytes)
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        removed = freed = 0
+        for path, size, _ in entries:
+            if total <= quota:
+                break
+            if path == keep:
+                continue
+            try:
+                os.unlink(path)
+            except OSError as e:
+                log.debug("TranscodeCache: can't remove %s: %s", path, e)
+                continue
+            total -= size
+            removed += 1
+            freed += size
+        if removed:
+            log.info("Transcode cache: evicted %d entries (%d KB)",
+                     removed, freed // 1024)
+        return removed, freed
+
+    def close(self) -> None:
+        """Wait for queued transcodes and stop the worker thread."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
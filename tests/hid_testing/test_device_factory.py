@@ -224,6 +224,25 @@ class TestScsiProtocol:
         result = s.send_image(b'\x00', 320, 320)
         assert result is False
 
+    @patch("trcc.device_scsi.send_image_to_device", return_value=True)
+    def test_partial_update_passed_through(self, mock_scsi_send):
+        s = ScsiProtocol("/dev/sg0", partial_update=True, full_refresh_s=3.0)
+        s.send_image(b'\x00', 320, 320)
+        mock_scsi_send.assert_called_once_with("/dev/sg0", b'\x00', 320, 320,
+                                               partial=True, full_refresh_s=3.0)
+
+    def test_partial_update_from_registry(self):
+        from trcc.device_detector import KNOWN_DEVICES
+        with patch("trcc.conf.Settings.get_scsi_partial_update", return_value=None):
+            assert ScsiProtocol.partial_update_for(0x87CD, 0x70DB) is False
+            with patch.object(KNOWN_DEVICES[(0x87CD, 0x70DB)], "partial_update", True):
+                assert ScsiProtocol.partial_update_for(0x87CD, 0x70DB) is True
+            assert ScsiProtocol.partial_update_for(0x1234, 0x5678) is False
+
+    def test_partial_update_config_override(self):
+        with patch("trcc.conf.Settings.get_scsi_partial_update", return_value=True):
+            assert ScsiProtocol.partial_update_for(0x1234, 0x5678) is True
+
     def test_close_is_noop(self):
         s = ScsiProtocol("/dev/sg0")
         s.close()  # Should not raise
@@ -236,6 +255,55 @@ class TestScsiProtocol:
         assert info.is_scsi is True
         assert "SCSI" in info.protocol_display
 
+    def test_invalid_backend_rejected(self):
+        with pytest.raises(ValueError):
+            ScsiProtocol("/dev/sg0", backend="bogus")
+
+    @patch("trcc.device_scsi.send_image_to_device", return_value=True)
+    def test_auto_backend_falls_back_to_sg_raw(self, _):
+        s = ScsiProtocol("/nonexistent/sg99")
+        assert s.send_image(b'\x00', 320, 320) is True
+        assert s.active_backend == "sg_raw"
+
+    @patch("trcc.device_scsi.send_image_to_device", return_value=True)
+    @patch("trcc.device_scsi.SgIoTransport.open")
+    def test_auto_backend_registers_sg_io(self, _open, _send):
+        from trcc.device_scsi import ScsiDevice
+        s = ScsiProtocol("/dev/sg0")
+        try:
+            s.send_image(b'\x00', 320, 320)
+            assert s.active_backend == "sg_io"
+            assert "/dev/sg0" in ScsiDevice._transports
+            assert s.get_info().active_backend == "sg_io"
+        finally:
+            s.close()
+        assert "/dev/sg0" not in ScsiDevice._transports
+
+    @patch("trcc.device_scsi.SgIoTransport.open", side_effect=PermissionError(13, "denied"))
+    def test_forced_sg_io_reports_error(self, _):
+        s = ScsiProtocol("/dev/sg0", backend="sg_io")
+        assert s.send_image(b'\x00', 320, 320) is False
+
+    @patch("trcc.device_scsi.send_image_to_device", return_value=True)
+    @patch("trcc.device_scsi.SgIoTransport.open", side_effect=PermissionError(13, "denied"))
+    def test_forced_sg_io_never_falls_back(self, _open, send):
+        s = ScsiProtocol("/dev/sg0", backend="sg_io")
+        assert s.send_image(b'\x00', 320, 320) is False
+        assert s.send_image(b'\x00', 320, 320) is False
+        assert _open.call_count == 2
+        send.assert_not_called()
+        assert s.active_backend == "none"
+        assert s.get_info().active_backend == "none"
+
+    @patch("trcc.device_scsi.send_image_to_device", return_value=True)
+    @patch("trcc.device_scsi.SgIoTransport.open", side_effect=PermissionError(13, "denied"))
+    def test_auto_backend_tries_sg_io_once(self, _open, send):
+        s = ScsiProtocol("/dev/sg0")
+        assert s.send_image(b'\x00', 320, 320) is True
+        assert s.send_image(b'\x00', 320, 320) is True
+        assert _open.call_count == 1
+        assert send.call_count == 2
+
     def test_is_available_checks_sg_raw(self):
         s = ScsiProtocol("/dev/sg0")
         # is_available depends on system state, just verify it returns bool
@@ -277,6 +345,20 @@ class TestHidProtocol:
         mock_transport.open.assert_called_once()
         mock_send_hid.assert_called_once_with(mock_transport, b'\x00' * 100, 2)
 
+    @patch("trcc.device_hid.PYUSB_AVAILABLE", True)
+    @patch("trcc.device_hid.PyUsbTransport")
+    @patch("trcc.conf.Settings.get_hid_transfer_mode", return_value="async")
+    def test_configured_transfer_mode(self, _mode, MockPyUsb):
+        DeviceProtocolFactory.create_usb_transport(0x0416, 0x5302)
+        MockPyUsb.assert_called_once_with(0x0416, 0x5302, transfer_mode="async")
+
+    @patch("trcc.device_hid.PYUSB_AVAILABLE", True)
+    @patch("trcc.device_hid.PyUsbTransport")
+    @patch("trcc.conf.Settings.get_hid_transfer_mode", return_value="turbo")
+    def test_unknown_transfer_mode_ignored(self, _mode, MockPyUsb):
+        DeviceProtocolFactory.create_usb_transport(0x0416, 0x5302)
+        MockPyUsb.assert_called_once_with(0x0416, 0x5302)
+
     @patch("trcc.device_hid.PYUSB_AVAILABLE", False)
     @patch("trcc.device_hid.HIDAPI_AVAILABLE", True)
     @patch("trcc.device_hid.HidApiTransport")
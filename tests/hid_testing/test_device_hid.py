@@ -3,7 +3,9 @@
 No real USB hardware required — all USB I/O is mocked via UsbTransport.
 """
 
+import ctypes
 import struct
+from collections import deque
 from unittest.mock import MagicMock, call, patch
 
 import pytest
@@ -16,6 +18,9 @@ from trcc.device_hid import (
     EP_WRITE_02,
     HIDAPI_AVAILABLE,
     PYUSB_AVAILABLE,
+    TRANSFER_ASYNC,
+    TRANSFER_CHUNKED,
+    TRANSFER_SINGLE,
     TYPE2_INIT_SIZE,
     TYPE2_MAGIC,
     TYPE2_PID,
@@ -37,10 +42,14 @@ from trcc.device_hid import (
     HidDeviceType2,
     HidDeviceType3,
     HidHandshakeInfo,
+    PyUsbTransport,
     UsbTransport,
     _ceil_to_512,
+    _LibusbAsyncWriter,
     find_hid_devices,
+    frame_transfers,
 )
+from trcc.libusb_async import LibusbTransfers
 
 # Patch time.sleep globally for all tests in this module so handshake/frame
 # delays don't slow the suite down.
@@ -658,6 +667,14 @@ class TestType3FrameSend:
         assert len(pkt) == TYPE3_FRAME_TOTAL
         assert pkt[16:] == data
 
+    def test_frame_packet_accepts_memoryview(self):
+        """RGB565 encoder views are framed without converting first."""
+        data = b'\xAB' * 100
+        pkt = HidDeviceType3.build_frame_packet(memoryview(data))
+        assert isinstance(pkt, bytes)
+        assert pkt[16:116] == data
+        assert len(pkt) == TYPE3_FRAME_TOTAL
+
     def test_send_frame_writes_then_reads_ack(self):
         dev, transport = self._init_device()
         dev.send_frame(b'\xFF' * 100)
@@ -924,6 +941,211 @@ class TestPyUsbTransport:
             assert not t.is_open
 
 
+# =========================================================================
+# Type 2 frame transfers (recording fakes)
+# =========================================================================
+
+class RecordingTransport(UsbTransport):
+    """UsbTransport that records every write (no write_frame)."""
+
+    def __init__(self):
+        self.writes = []
+
+    def open(self):
+        pass
+
+    def close(self):
+        pass
+
+    def write(self, endpoint, data, timeout=100):
+        self.writes.append((endpoint, bytes(data), timeout))
+        return len(data)
+
+    def read(self, endpoint, length, timeout=100):
+        return b''
+
+    @property
+    def is_open(self):
+        return True
+
+
+class FakeLibusb:
+    """libusb async API double: one transfer completes per handle_events()."""
+
+    def __init__(self, fail_at=None, event_errors=0):
+        from usb.backend import libusb1
+        self._struct = libusb1._libusb_transfer
+        self.fail_at = fail_at
+        self.event_errors = event_errors  # handle_events() calls that fail first
+        self.queue = deque()
+        self.submitted = []
+        self.cancelled = []
+        self.reaped_cancelled = 0
+        self.max_in_flight = 0
+        self.freed = 0
+
+    def libusb_alloc_transfer(self, iso_packets):
+        return ctypes.pointer(self._struct())
+
+    def libusb_free_transfer(self, transfer):
+        self.freed += 1
+
+    def libusb_submit_transfer(self, transfer):
+        t = transfer.contents
+        self.submitted.append(ctypes.string_at(t.buffer, t.length))
+        self.queue.append(transfer)
+        self.max_in_flight = max(self.max_in_flight, len(self.queue))
+        return 0
+
+    def libusb_cancel_transfer(self, transfer):
+        self.cancelled.append(transfer)
+        return 0
+
+    def libusb_handle_events(self, ctx):
+        if self.event_errors:
+            self.event_errors -= 1
+            return -1  # LIBUSB_ERROR_IO
+        transfer = self.queue.popleft()
+        t = transfer.contents
+        failed = len(self.submitted) - len(self.queue) - 1 == self.fail_at
+        if any(c is transfer for c in self.cancelled):
+            self.cancelled = [c for c in self.cancelled if c is not transfer]
+            self.reaped_cancelled += 1
+            failed = True
+        t.status = 1 if failed else 0  # LIBUSB_TRANSFER_ERROR
+        t.actual_length = 0 if failed else t.length
+        t.callback(transfer)
+        return 0
+
+
+def _open_pyusb(**kwargs):
+    """PyUsbTransport on a mock device whose writes are recorded."""
+    dev = MagicMock()
+    dev.is_kernel_driver_active.return_value = False
+    writes = []
+    dev.write.side_effect = lambda ep, data, timeout: (
+        writes.append((ep, bytes(data), timeout)) or len(data))
+    with patch("trcc.device_hid.usb.core.find", return_value=dev), \
+         patch("trcc.device_hid.usb.util.claim_interface"):
+        t = PyUsbTransport(TYPE2_VID, TYPE2_PID, **kwargs)
+        t.open()
+    t._ep_out = None  # Mock descriptors: keep the caller's endpoint
+    return t, writes
+
+
+def _type2(transport):
+    dev = HidDeviceType2(transport)
+    dev._initialized = True
+    return dev
+
+
+class TestType2TransferModes:
+    """Type 2 framing over each transfer mode."""
+
+    IMAGE = bytes(range(256)) * 400  # 102400 bytes → 102912-byte packet
+
+    def _packet(self):
+        return HidDeviceType2.build_frame_packet(self.IMAGE)
+
+    def test_frame_transfers_split(self):
+        pieces = frame_transfers(b'\x01' * 5120, 2000)  # Rounded up to 2048
+        assert [len(p) for p in pieces] == [2048, 2048, 1024]
+        assert b''.join(pieces) == b'\x01' * 5120
+
+    def test_generic_transport_gets_512_byte_writes(self):
+        transport = RecordingTransport()
+        assert _type2(transport).send_frame(self.IMAGE) is True
+        assert {len(data) for _, data, _ in transport.writes} == {512}
+        assert len(transport.writes) == len(self._packet()) // 512
+        assert b''.join(data for _, data, _ in transport.writes) == self._packet()
+
+    def test_single_mode_one_transfer(self):
+        transport, writes = _open_pyusb(transfer_mode=TRANSFER_SINGLE)
+        assert _type2(transport).send_frame(self.IMAGE) is True
+        assert len(writes) == 1
+        ep, data, timeout = writes[0]
+        assert (ep, data) == (EP_WRITE_02, self._packet())
+        assert timeout == 100 + len(data) // 1024
+
+    def test_single_mode_large_pieces(self):
+        transport, writes = _open_pyusb(transfer_mode=TRANSFER_SINGLE,
+                                        transfer_size=32 * 1024)
+        _type2(transport).send_frame(self.IMAGE)
+        assert [len(d) for _, d, _ in writes] == [32768, 32768, 32768, 4608]
+        assert b''.join(d for _, d, _ in writes) == self._packet()
+
+    def test_chunked_mode_compat(self):
+        transport, writes = _open_pyusb(transfer_mode=TRANSFER_CHUNKED)
+        _type2(transport).send_frame(self.IMAGE)
+        assert len(writes) == len(self._packet()) // 512
+        assert {t for _, _, t in writes} == {100}
+
+    def test_async_mode_keeps_transfers_in_flight(self):
+        lib = FakeLibusb()
+        transport, writes = _open_pyusb(transfer_mode=TRANSFER_ASYNC,
+                                        transfer_size=8192, in_flight=3)
+        writer = _LibusbAsyncWriter(LibusbTransfers(lib, None, None), transport.in_flight)
+        with patch.object(_LibusbAsyncWriter, 'for_device', return_value=writer):
+            assert _type2(transport).send_frame(self.IMAGE) is True
+        assert writes == []
+        assert lib.max_in_flight == 3
+        assert len(lib.submitted) == 13
+        assert b''.join(lib.submitted) == self._packet()
+        transport.close()
+        assert lib.freed == 3
+
+    def test_async_failure_raises_after_draining(self):
+        import usb.core
+        lib = FakeLibusb(fail_at=2)
+        writer = _LibusbAsyncWriter(LibusbTransfers(lib, None, None), 4)
+        with pytest.raises(usb.core.USBError):
+            writer.write(EP_WRITE_02, self._packet(), 8192, 100)
+        assert not lib.queue
+        assert len(lib.submitted) < 13  # Stopped submitting after the failure
+
+    def test_async_event_errors_cancel_pending(self):
+        import usb.core
+        lib = FakeLibusb(event_errors=LibusbTransfers.MAX_EVENT_ERRORS)
+        writer = _LibusbAsyncWriter(LibusbTransfers(lib, None, None), 4)
+        with pytest.raises(usb.core.USBError):
+            writer.write(EP_WRITE_02, self._packet(), 8192, 100)
+        assert lib.reaped_cancelled == 4
+        assert not lib.queue
+        assert writer.write(EP_WRITE_02, self._packet(), 8192, 100) == len(self._packet())
+
+    def test_async_gives_up_when_events_keep_failing(self):
+        import usb.core
+        lib = FakeLibusb(event_errors=1000)
+        writer = _LibusbAsyncWriter(LibusbTransfers(lib, None, None), 4)
+        with pytest.raises(usb.core.USBError):
+            writer.write(EP_WRITE_02, self._packet(), 8192, 100)
+        assert lib.event_errors == 1000 - 2 * LibusbTransfers.MAX_EVENT_ERRORS
+        with pytest.raises(usb.core.USBError):  # Transfers still own their buffers
+            writer.write(EP_WRITE_02, self._packet(), 8192, 100)
+        writer.close()
+        assert lib.freed == 0
+        assert writer in LibusbTransfers._abandoned  # Callback outlives the transport
+        LibusbTransfers._abandoned.remove(writer)
+
+    def test_default_mode_is_chunked(self):
+        transport, writes = _open_pyusb()
+        assert transport.transfer_mode == TRANSFER_CHUNKED
+        _type2(transport).send_frame(self.IMAGE)
+        assert {len(d) for _, d, _ in writes} == {512}
+
+    def test_async_falls_back_to_single(self):
+        transport, writes = _open_pyusb(transfer_mode=TRANSFER_ASYNC)
+        dev = _type2(transport)
+        dev.send_frame(self.IMAGE)  # Mock device: not the libusb1 backend
+        dev.send_frame(self.IMAGE)
+        assert len(writes) == 2 * len(self._packet()) // 16384 + 2
+        assert transport._async_failed
+
+    def test_unknown_mode_rejected(self):
+        with pytest.raises(ValueError):
+            PyUsbTransport(TYPE2_VID, TYPE2_PID, transfer_mode='turbo')
+
+
 # =========================================================================
 # HidApiTransport (mocked hidapi)
 # =========================================================================
@@ -403,6 +403,37 @@ class TestLEDServiceConfigureForStyle:
         cb.assert_called_once()
 
 
+# =========================================================================
+# Tests: LEDService — required_metrics
+# =========================================================================
+
+class TestLEDServiceRequiredMetrics:
+    """required_metrics() lists what the active modes read."""
+
+    def test_static_needs_nothing(self, led_svc):
+        led_svc.set_mode(LEDMode.STATIC)
+        assert led_svc.required_metrics() == set()
+
+    def test_temp_linked_uses_source(self, led_svc):
+        led_svc.set_mode(LEDMode.TEMP_LINKED)
+        assert led_svc.required_metrics() == {"cpu_temp"}
+        led_svc.set_sensor_source("gpu")
+        assert led_svc.required_metrics() == {"gpu_temp"}
+
+    def test_load_linked_uses_source(self, led_svc):
+        led_svc.set_mode(LEDMode.LOAD_LINKED)
+        assert led_svc.required_metrics() == {"cpu_percent"}
+        led_svc.set_sensor_source("gpu")
+        assert led_svc.required_metrics() == {"gpu_usage"}
+
+    def test_multi_zone_skips_zones_that_are_off(self):
+        model = LEDService(state=LEDState(zone_count=2))
+        model.set_zone_mode(0, LEDMode.TEMP_LINKED)
+        model.set_zone_mode(1, LEDMode.LOAD_LINKED)
+        model.state.zones[1].on = False
+        assert model.required_metrics() == {"cpu_temp"}
+
+
 # =========================================================================
 # Tests: LEDService — tick dispatch
 # =========================================================================
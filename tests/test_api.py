@@ -2,12 +2,12 @@
 
 import io
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, PropertyMock, patch
 
 from fastapi.testclient import TestClient
 from PIL import Image
 
-from trcc.api import _device_svc, app, configure_auth
+from trcc.api import _device_svc, _system_svc, app, configure_auth
 from trcc.core.models import DeviceInfo
 
 
@@ -243,3 +243,52 @@ class TestThemesEndpoint(unittest.TestCase):
 
 if __name__ == '__main__':
     unittest.main()
+
+
+class TestMetricsEndpoints(unittest.TestCase):
+    """GET /metrics and /metrics/history."""
+
+    def setUp(self):
+        configure_auth(None)
+        self.client = TestClient(app)
+        patcher = patch.object(_system_svc, 'start_sampling')
+        self.start_sampling = patcher.start()
+        self.addCleanup(patcher.stop)
+        _system_svc.history.clear()
+        self.addCleanup(_system_svc.history.clear)
+        for t in range(5):
+            _system_svc.history.record({'cpu_temp': 40.0 + t}, now=1000.0 + t)
+
+    def test_metrics_starts_sampling(self):
+        with patch('trcc.services.system.SystemService.all_metrics',
+                   new_callable=PropertyMock, return_value={'cpu_temp': 45.0}):
+            resp = self.client.get("/metrics")
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.json(), {'cpu_temp': 45.0})
+        self.start_sampling.assert_called_once()
+
+    def test_history_index(self):
+        resp = self.client.get("/metrics/history")
+        self.assertEqual(resp.status_code, 200)
+        data = resp.json()
+        self.assertEqual(data["keys"], ["cpu_temp"])
+        self.assertEqual(data["tiers"][0], {"interval": 1.0, "points": 300})
+
+    def test_history_series_since(self):
+        resp = self.client.get("/metrics/history/cpu_temp", params={"since": 1002})
+        self.assertEqual(resp.status_code, 200)
+        data = resp.json()
+        self.assertEqual(data["interval"], 1.0)
+        self.assertEqual(data["times"], [1003.0, 1004.0])
+        self.assertEqual(data["values"], [43.0, 44.0])
+
+    def test_history_series_resolution(self):
+        resp = self.client.get("/metrics/history/cpu_temp", params={"resolution": 60})
+        data = resp.json()
+        self.assertEqual(data["interval"], 60.0)
+        self.assertEqual(data["times"], [960.0])
+        self.assertEqual(data["values"], [42.0])
+
+    def test_history_unknown_metric(self):
+        resp = self.client.get("/metrics/history/nope")
+        self.assertEqual(resp.status_code, 404)
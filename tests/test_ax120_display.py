@@ -667,6 +667,31 @@ class TestCrossStyleConsistency:
             assert d is not None
             assert d.phase_count >= 1
 
+    def test_phase_metrics_cover_compute_mask_reads(self):
+        """compute_mask() only reads keys phase_metrics() declares."""
+        for style_id in range(1, 12):
+            d = get_display(style_id)
+            for phase in range(d.phase_count):
+                read: set = set()
+
+                class Recorder(dict):
+                    def get(self, key, default=None):
+                        read.add(key)
+                        return default
+
+                d.compute_mask(Recorder(), phase, "C")
+                assert read <= set(d.phase_metrics(phase)), f"Style {style_id}"
+
+    def test_phase_metrics_from_phases(self):
+        assert LF8Display().phase_metrics(1) == (
+            'gpu_temp', 'gpu_watt', 'gpu_mhz', 'gpu_usage')
+        assert LC1Display().phase_metrics(4) == ('mem_clock',)  # Wraps
+
+    def test_phase_metrics_without_phases(self):
+        assert PA120Display().phase_metrics(0) == (
+            'cpu_temp', 'cpu_percent', 'gpu_temp', 'gpu_usage')
+        assert LC2Display().phase_metrics(0) == ()
+
 
 # =========================================================================
 # LEDService segment mode integration
@@ -719,6 +744,15 @@ class TestLEDServiceSegmentMode:
             svc.tick()
         assert svc._seg_phase == 0
 
+    def test_required_metrics_follow_sensor_source(self):
+        svc = self._make_service(1)  # Rotates through CPU phases only
+        assert svc.required_metrics() == {'cpu_temp', 'cpu_percent'}
+        svc.set_sensor_source('gpu')
+        assert svc.required_metrics() == {'gpu_temp', 'gpu_usage'}
+
+    def test_required_metrics_clock_style(self):
+        assert self._make_service(9).required_metrics() == set()
+
     def test_update_segment_mask(self):
         svc = self._make_service(1)
         svc.update_metrics({'cpu_temp': 65})
@@ -13,6 +13,8 @@ Tests cover:
 - DisplayCommands.send_color() hex parsing
 - SystemCommands.show_info() with mocked system_info
 - SystemCommands.download_themes() dispatch to theme_downloader
+- SystemCommands.transcode_cache() warm / prune / clear
+- SystemCommands.device_frames_cache() prune / clear
 - conf.get_selected_device() / conf.save_selected_device() helpers
 """
 
@@ -34,6 +36,7 @@ from trcc.cli import (
     _get_service,
     _probe_device,
     detect,
+    device_frames_cache,
     download_themes,
     export_theme,
     gui,
@@ -65,6 +68,7 @@ from trcc.cli import (
     set_rotation,
     setup_udev,
     show_info,
+    transcode_cache,
     uninstall,
 )
 from trcc.cli import test_display as cli_test_display
@@ -301,6 +305,86 @@ class TestDownloadThemes(unittest.TestCase):
         self.assertEqual(result, 0)
 
 
+class TestTranscodeCacheCommand(unittest.TestCase):
+    """Test transcode_cache() against a temporary cache."""
+
+    def setUp(self):
+        from trcc.transcode_cache import TranscodeCache
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = Path(tmp.name)
+        self.cache = TranscodeCache(str(self.tmp / 'cache'))
+        patcher = patch.object(TranscodeCache, '_shared', self.cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _entry(self, name, size):
+        os.makedirs(self.cache.cache_dir, exist_ok=True)
+        path = os.path.join(self.cache.cache_dir, name)
+        with open(path, 'wb') as f:
+            f.write(b'\0' * size)
+        return path
+
+    def test_warm_transcodes_uncached(self):
+        video = self.tmp / 'a001.mp4'
+        video.write_bytes(b'mp4')
+        with patch.object(self.cache, 'transcode') as tc:
+            result = transcode_cache(videos=[str(video)], warm=True)
+        self.assertEqual(result, 0)
+        tc.assert_called_once()
+
+    def test_warm_failure_returns_error(self):
+        video = self.tmp / 'a001.mp4'
+        video.write_bytes(b'mp4')
+        with patch.object(self.cache, 'transcode', side_effect=RuntimeError('x')):
+            self.assertEqual(transcode_cache(videos=[str(video)], warm=True), 1)
+
+    def test_prune_to_quota(self):
+        old = self._entry('old.zt', 2048)
+        os.utime(old, (1, 1))
+        new = self._entry('new.zt', 2048)
+        self.assertEqual(transcode_cache(prune=True, quota_mb=3 / 1024), 0)
+        self.assertFalse(os.path.exists(old))
+        self.assertTrue(os.path.exists(new))
+
+    def test_clear(self):
+        self._entry('a.zt', 10)
+        self.assertEqual(transcode_cache(clear=True), 0)
+        self.assertEqual(self.cache.entries(), [])
+
+
+class TestDeviceFramesCacheCommand(unittest.TestCase):
+    """Test device_frames_cache() against a temporary cache."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.cache_dir = os.path.join(tmp.name, 'device-frames')
+        os.makedirs(self.cache_dir)
+        patcher = patch('trcc.device_frames.CACHE_DIR', self.cache_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _entry(self, name, size):
+        path = os.path.join(self.cache_dir, name)
+        with open(path, 'wb') as f:
+            f.write(b'\0' * size)
+        return path
+
+    def test_prune_to_quota(self):
+        old = self._entry('old.tdf', 2048)
+        os.utime(old, (1, 1))
+        new = self._entry('new.tdf', 2048)
+        self.assertEqual(device_frames_cache(prune=True, quota_mb=3 / 1024), 0)
+        self.assertFalse(os.path.exists(old))
+        self.assertTrue(os.path.exists(new))
+
+    def test_clear(self):
+        self._entry('a.tdf', 10)
+        self.assertEqual(device_frames_cache(clear=True), 0)
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+
 # -- gui() -------------------------------------------------------------------
 
 class TestGui(unittest.TestCase):
@@ -917,9 +1001,8 @@ class TestResume(unittest.TestCase):
     def test_no_devices(self):
         """No devices after retries -> returns 1."""
         svc = MagicMock()
-        svc.detect.return_value = []
-        with patch('trcc.services.DeviceService', return_value=svc), \
-             patch('time.sleep'):
+        svc.wait_for_devices.return_value = []
+        with patch('trcc.services.DeviceService', return_value=svc):
             result = resume()
         self.assertEqual(result, 1)
 
@@ -927,7 +1010,7 @@ class TestResume(unittest.TestCase):
         """Device with no saved theme -> returns 1."""
         dev = _make_device_info()
         svc = MagicMock()
-        svc.detect.return_value = [dev]
+        svc.wait_for_devices.return_value = [dev]
         with patch('trcc.services.DeviceService', return_value=svc), \
              patch('trcc.conf.Settings.device_config_key', return_value='0:87cd_70db'), \
              patch('trcc.conf.Settings.get_device_config', return_value={}):
@@ -946,7 +1029,7 @@ class TestResume(unittest.TestCase):
 
             dev = _make_device_info()
             svc = MagicMock()
-            svc.detect.return_value = [dev]
+            svc.wait_for_devices.return_value = [dev]
             svc.send_pil.return_value = True
 
             with patch('trcc.services.DeviceService', return_value=svc), \
@@ -971,7 +1054,7 @@ class TestResume(unittest.TestCase):
 
             dev = _make_device_info()
             svc = MagicMock()
-            svc.detect.return_value = [dev]
+            svc.wait_for_devices.return_value = [dev]
             svc.send_pil.return_value = True
 
             with patch('trcc.services.DeviceService', return_value=svc), \
@@ -988,7 +1071,7 @@ class TestResume(unittest.TestCase):
         """HID devices are skipped, only SCSI resumed."""
         hid_dev = _make_device_info(path='hid:0416:8001', name='LED', protocol='hid')
         svc = MagicMock()
-        svc.detect.return_value = [hid_dev]
+        svc.wait_for_devices.return_value = [hid_dev]
         with patch('trcc.services.DeviceService', return_value=svc):
             result = resume()
         self.assertEqual(result, 1)
@@ -997,7 +1080,7 @@ class TestResume(unittest.TestCase):
         """Theme path doesn't exist on disk -> skipped."""
         dev = _make_device_info()
         svc = MagicMock()
-        svc.detect.return_value = [dev]
+        svc.wait_for_devices.return_value = [dev]
         with patch('trcc.services.DeviceService', return_value=svc), \
              patch('trcc.conf.Settings.device_config_key', return_value='0:87cd_70db'), \
              patch('trcc.conf.Settings.get_device_config', return_value={
@@ -2056,6 +2139,14 @@ class TestThemeExport(unittest.TestCase):
             self.assertEqual(result, 0)
             mock_exp.assert_called_once()
 
+    def test_export_tdf_rejected(self):
+        """Device frames need a device to encode for."""
+        with patch('trcc.services.theme.ThemeService.export_tr') as mock_exp, \
+             patch('builtins.print') as mock_print:
+            self.assertEqual(ThemeCommands.export_theme('MyTheme', '/tmp/out.tdf'), 1)
+        mock_exp.assert_not_called()
+        self.assertIn('.tdf', mock_print.call_args[0][0])
+
 
 class TestThemeImport(unittest.TestCase):
     """Tests for ThemeCommands.import_theme()."""
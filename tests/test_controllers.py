@@ -189,12 +189,12 @@ class TestDeviceController(unittest.TestCase):
 
         self.assertTrue(started)
 
-    def test_send_skipped_when_busy(self):
-        started = []
-        self.ctrl.on_send_started = lambda: started.append(True)
+    def test_send_queued_when_busy(self):
+        """A busy device no longer drops the frame — the pipeline coalesces."""
         self.ctrl._svc._send_busy = True
-        self.ctrl.send_image_async(b'\x00', 1, 1)
-        self.assertEqual(started, [])
+        with patch.object(self.ctrl._svc, 'send_rgb565_async') as mock_async:
+            self.ctrl.send_image_async(b'\x00', 1, 1)
+        mock_async.assert_called_once_with(b'\x00', 1, 1)
 
     def test_detect_devices_delegates(self):
         with patch.object(self.ctrl._svc, 'detect') as m:
@@ -488,6 +488,10 @@ class TestLCDDeviceController(unittest.TestCase):
         self.assertEqual(self.ctrl.lcd_width, 320)
         self.assertEqual(self.ctrl.lcd_height, 320)
 
+    def test_overlay_shares_render_lock(self):
+        """Overlay calls from the GUI thread serialize with render-thread ticks."""
+        self.assertIs(self.ctrl.overlay._lock, self.ctrl._render_lock)
+
     def test_working_dir_created(self):
         self.assertTrue(self.ctrl.working_dir.exists())
         self.assertTrue(self.ctrl.working_dir.is_dir())
@@ -814,6 +818,23 @@ class TestFormCZTVVideoAndSend(unittest.TestCase):
             self.ctrl.video_tick()
             mock_send.assert_called_once_with(rgb565, 320, 320)
 
+    def test_video_tick_async_renders_on_pipeline_thread(self):
+        import threading
+        threads = []
+        self.ctrl.on_preview_update = lambda img: threads.append(threading.current_thread())
+        fake_result = {'preview': _make_test_image(), 'rgb565': None, 'progress': None,
+                       'encode': lambda: b'\x01' * 100}
+        svc = self.ctrl.devices.svc
+
+        with patch.object(self.ctrl._display, 'video_tick', return_value=fake_result), \
+             patch.object(svc, 'send_rgb565', return_value=True) as mock_send:
+            self.ctrl.video_tick_async()
+            self.assertTrue(svc.pipeline.wait_idle(2))
+
+        self.assertEqual(len(threads), 1)
+        self.assertIsNot(threads[0], threading.current_thread())
+        mock_send.assert_called_once_with(b'\x01' * 100, 320, 320)
+
     def test_get_video_interval(self):
         ms = self.ctrl.get_video_interval()
         self.assertIsInstance(ms, int)
@@ -840,12 +861,12 @@ class TestFormCZTVVideoAndSend(unittest.TestCase):
         dev = DeviceInfo(name='LCD', path='/dev/sg0')
         self.ctrl.devices._svc.select(dev)
 
-        with patch.object(self.ctrl.devices, 'send_image_async') as mock_send:
+        with patch.object(self.ctrl.devices, 'send_frame_async') as mock_send:
             self.ctrl._send_frame_to_lcd(_make_test_image())
             mock_send.assert_called_once()
-            args = mock_send.call_args
-            self.assertEqual(args[0][1], 320)
-            self.assertEqual(args[0][2], 320)
+            encode, width, height = mock_send.call_args[0]
+            self.assertEqual((width, height), (320, 320))
+            self.assertEqual(len(encode()), 320 * 320 * 2)  # Deferred RGB565
 
 
 # =============================================================================
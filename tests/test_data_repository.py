@@ -3,6 +3,7 @@ Tests for data_repository.py (directory/extraction helpers) and conf.py (config
 """
 
 import json
+import math
 import os
 import tempfile
 import unittest
@@ -13,6 +14,7 @@ from trcc.conf import Settings, load_config, save_config
 from trcc.data_repository import (
     DataManager,
     Resources,
+    SysfsReader,
     ThemeDir,
     _find_data_dir,
 )
@@ -554,3 +556,68 @@ class TestFindResourceDefault(unittest.TestCase):
         with patch('os.path.exists', return_value=False):
             result = Resources.find('nonexistent.file')
             self.assertIsNone(result)
+
+
+class TestSysfsReader(unittest.TestCase):
+    """Pooled handles reread with pread."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = os.path.join(self.tmp.name, 'temp1_input')
+        self._write('42000\n')
+        self.reader = SysfsReader()
+        self.addCleanup(self.reader.close)
+
+    def _write(self, text):
+        # In place, like sysfs: the pooled fd must see the new value
+        with open(self.path, 'r+' if os.path.exists(self.path) else 'w') as f:
+            f.write(text)
+            f.truncate()
+
+    def test_reads_and_keeps_handle(self):
+        self.assertEqual(self.reader.read(self.path), '42000')
+        self.assertEqual(len(self.reader), 1)
+        self._write('43500\n')
+        with patch('os.open') as mock_open:
+            self.assertEqual(self.reader.read(self.path), '43500')
+        mock_open.assert_not_called()
+
+    def test_missing_file(self):
+        self.assertIsNone(self.reader.read(os.path.join(self.tmp.name, 'nope')))
+        self.assertEqual(len(self.reader), 0)
+
+    def test_reopens_after_stale_handle(self):
+        self.reader.read(self.path)
+        os.close(self.reader._fds[self.path])  # Device went away
+        os.remove(self.path)
+        self.assertIsNone(self.reader.read(self.path))
+        self.assertEqual(len(self.reader), 0)
+        self._write('50000\n')  # ...and came back
+        self.assertEqual(self.reader.read(self.path), '50000')
+        self.assertEqual(len(self.reader), 1)
+
+    def test_read_floats(self):
+        bad = os.path.join(self.tmp.name, 'name')
+        with open(bad, 'w') as f:
+            f.write('coretemp\n')
+        paths = [self.path, os.path.join(self.tmp.name, 'nope'), bad]
+        out = [0.0] * 3
+        self.reader.read_floats(paths, out)  # Opens via read()
+        self.assertEqual(out[0], 42000.0)
+        self.assertTrue(math.isnan(out[1]) and math.isnan(out[2]))
+        self._write('43500\n')
+        with patch('os.open') as mock_open:
+            self.reader.read_floats(paths[:1], out)  # Pooled: pread only
+        mock_open.assert_not_called()
+        self.assertEqual(out[0], 43500.0)
+
+    def test_pool_limit_falls_back(self):
+        self.reader.MAX_OPEN = 0
+        self.assertEqual(self.reader.read(self.path), '42000')
+        self.assertEqual(len(self.reader), 0)
+
+    def test_close(self):
+        self.reader.read(self.path)
+        self.reader.close()
+        self.assertEqual(len(self.reader), 0)
@@ -564,6 +564,53 @@ class TestTrVideoRoundtrip(unittest.TestCase):
             self.assertFalse(os.path.exists(os.path.join(import_dir, 'Theme.zt')))
 
 
+# ── Device frames (.tdf) export ──────────────────────────────────────────────
+
+class TestDeviceFramesExport(unittest.TestCase):
+    """export_theme() to a .tdf pre-encodes the theme's animation."""
+
+    def _make_theme_zt(self, path, colors):
+        import io
+
+        from PIL import Image
+        with open(path, 'wb') as f:
+            f.write(struct.pack('B', 0xDC))
+            f.write(struct.pack('<i', len(colors)))
+            for i in range(len(colors)):
+                f.write(struct.pack('<i', i * 40))
+            for color in colors:
+                buf = io.BytesIO()
+                Image.new('RGB', (16, 16), color).save(buf, format='JPEG')
+                f.write(struct.pack('<i', buf.tell()))
+                f.write(buf.getvalue())
+
+    def test_export_zt_to_tdf(self):
+        from trcc.device_frames import DeviceFrames, FrameFormat
+        fmt = FrameFormat(8, 8)
+        with tempfile.TemporaryDirectory() as src, \
+             tempfile.TemporaryDirectory() as dst:
+            self._make_theme_zt(os.path.join(src, 'Theme.zt'),
+                                [(255, 0, 0), (0, 0, 255)])
+            path = os.path.join(dst, 'Theme.tdf')
+            export_theme(src, path, fmt, lambda img: img.tobytes()[:128])
+            frames = DeviceFrames(path)
+            try:
+                self.assertEqual(frames.format, fmt)
+                self.assertEqual(frames.delays, [40, 40])
+                self.assertTrue(frames.is_current(
+                    os.stat(os.path.join(src, 'Theme.zt')), fmt))
+                self.assertGreater(frames.frame(0)[0], 200)  # Red, downscaled
+            finally:
+                frames.close()
+
+    def test_export_without_animation(self):
+        from trcc.device_frames import FrameFormat
+        with tempfile.TemporaryDirectory() as src:
+            with self.assertRaises(ValueError):
+                export_theme(src, os.path.join(src, 'x.tdf'),
+                             FrameFormat(8, 8), bytes)
+
+
 # ── Targeted coverage: edge paths ────────────────────────────────────────────
 
 class TestWriteStringMultiByte(unittest.TestCase):
@@ -6,11 +6,13 @@ Tests cover:
 - Handshake protocol (64-byte write, 1024-byte read, PM/SUB extraction)
 - Resolution mapping from PM byte
 - Frame send (header + RGB565 data + ZLP logic)
+- Double-buffered async frame send + stats
 - Close / resource cleanup
 - HandshakeResult usage
 - Integration with device_factory.BulkProtocol
 """
 
+import ctypes
 import os
 import struct
 import sys
@@ -24,8 +26,12 @@ from trcc.device_bulk import (
     _HANDSHAKE_PAYLOAD,
     _HANDSHAKE_READ_SIZE,
     _HANDSHAKE_TIMEOUT_MS,
+    _WRITE_CHUNK_SIZE,
     BulkDevice,
+    BulkStats,
+    _AsyncFrameSender,
 )
+from trcc.libusb_async import LibusbTransfers
 
 
 def _make_handshake_response(pm: int = 100, sub: int = 0, length: int = 1024) -> bytes:
@@ -468,6 +474,189 @@ class TestBulkDeviceSendFrame(unittest.TestCase):
         bd.handshake.assert_called_once()
 
 
+class FakeLibusb:
+    """libusb async API double: records submissions, completes them in order."""
+
+    def __init__(self, fail_status: int = 0, submit_fail_at: int = -1,
+                 event_errors: int = 0):
+        from usb.backend import libusb1
+        self._struct = libusb1._libusb_transfer
+        self.queue: list = []
+        self.submitted: list[bytes] = []
+        self.written: list[bytes] = []  # libusb_bulk_transfer (synchronous)
+        self.fail_status = fail_status
+        self.submit_fail_at = submit_fail_at
+        self.event_errors = event_errors  # handle_events() calls that fail first
+        self.cancelled: list = []
+        self.freed = 0
+
+    def libusb_alloc_transfer(self, iso_packets):
+        return ctypes.pointer(self._struct())
+
+    def libusb_free_transfer(self, transfer):
+        self.freed += 1
+
+    def libusb_submit_transfer(self, transfer):
+        if len(self.submitted) == self.submit_fail_at:
+            return -4  # LIBUSB_ERROR_NO_DEVICE
+        t = transfer.contents
+        self.submitted.append(ctypes.string_at(t.buffer, t.length))
+        self.queue.append(transfer)
+        return 0
+
+    def libusb_bulk_transfer(self, handle, endpoint, data, length, transferred, timeout):
+        self.written.append(ctypes.string_at(data, length))
+        return 0
+
+    def libusb_cancel_transfer(self, transfer):
+        if any(q is transfer for q in self.queue):
+            self.cancelled.append(transfer)
+            return 0
+        return -5  # LIBUSB_ERROR_NOT_FOUND
+
+    def libusb_handle_events(self, ctx):
+        if self.event_errors:
+            self.event_errors -= 1
+            return -1  # LIBUSB_ERROR_IO
+        transfer = self.queue.pop(0)
+        t = transfer.contents
+        t.status = self.fail_status
+        if any(c is transfer for c in self.cancelled):
+            self.cancelled = [c for c in self.cancelled if c is not transfer]
+            t.status = 3  # LIBUSB_TRANSFER_CANCELLED
+        t.actual_length = 0 if self.fail_status else t.length
+        t.callback(transfer)
+        return 0
+
+
+class TestBulkDeviceAsync(unittest.TestCase):
+    """Double-buffered frame send through libusb's async API."""
+
+    def _setup_device(self, lib):
+        bd = BulkDevice(0x87AD, 0x70DB)
+        bd._dev = MagicMock()
+        bd._ep_out = MagicMock(bEndpointAddress=0x01)
+        bd.width = bd.height = 480
+        bd._sender = _AsyncFrameSender(LibusbTransfers(lib, None, None), 0x01, bd.stats)
+        return bd
+
+    def test_frame_layout(self):
+        """Header, 16 KiB chunks, then a ZLP — same as the blocking path."""
+        lib = FakeLibusb()
+        bd = self._setup_device(lib)
+        data = bytes(range(256)) * 70  # 17920 bytes
+        self.assertTrue(bd.send_frame(data))
+        self.assertEqual([len(p) for p in lib.submitted],
+                         [64, _WRITE_CHUNK_SIZE, len(data) - _WRITE_CHUNK_SIZE, 0])
+        self.assertEqual(struct.unpack_from("<I", lib.submitted[0], 60)[0], len(data))
+        self.assertEqual(b''.join(lib.submitted[1:]), data)
+        bd._ep_out.write.assert_not_called()
+
+    def test_double_buffered(self):
+        """Frame N+1 is queued while N is in flight; N+2 waits for N."""
+        lib = FakeLibusb()
+        bd = self._setup_device(lib)
+        bd.send_frame(b'\x01' * 100)
+        bd.send_frame(b'\x02' * 100)
+        self.assertEqual(len(lib.queue), 6)  # Both frames pending
+        self.assertEqual(bd.stats.frames, 0)
+        bd.send_frame(b'\x03' * 100)
+        self.assertEqual(bd.stats.frames, 1)
+        self.assertEqual(lib.submitted[-2], b'\x03' * 100)
+
+    def test_stats_after_flush(self):
+        lib = FakeLibusb()
+        bd = self._setup_device(lib)
+        for _ in range(3):
+            bd.send_frame(b'\x00' * 1000)
+        self.assertTrue(bd._sender.flush())
+        self.assertEqual(bd.stats.frames, 3)
+        self.assertEqual(bd.stats.bytes, 3 * 1064)
+        self.assertEqual(bd.stats.failed, 0)
+        self.assertGreater(bd.stats.throughput_mb_s, 0)
+
+    def test_failure_reported_on_buffer_reuse(self):
+        lib = FakeLibusb(fail_status=1)
+        bd = self._setup_device(lib)
+        self.assertTrue(bd.send_frame(b'\x00' * 100))
+        self.assertTrue(bd.send_frame(b'\x00' * 100))
+        self.assertFalse(bd.send_frame(b'\x00' * 100))  # First frame failed
+        self.assertEqual(bd.stats.failed, 1)
+
+    def test_submit_failure_finishes_frame_synchronously(self):
+        """The device still gets the whole frame and its ZLP, in order."""
+        lib = FakeLibusb(submit_fail_at=2)
+        bd = self._setup_device(lib)
+        data = bytes(range(256)) * 200  # 51200 bytes: header, 4 chunks, ZLP
+        self.assertTrue(bd.send_frame(data))
+        self.assertEqual(len(lib.submitted), 2)
+        self.assertEqual([len(w) for w in lib.written],
+                         [_WRITE_CHUNK_SIZE, _WRITE_CHUNK_SIZE, len(data) - 3 * _WRITE_CHUNK_SIZE, 0])
+        self.assertEqual(b''.join(lib.submitted[1:] + lib.written), data)
+
+    def test_event_errors_cancel_frame(self):
+        lib = FakeLibusb(event_errors=LibusbTransfers.MAX_EVENT_ERRORS)
+        bd = self._setup_device(lib)
+        bd.send_frame(b'\x01' * 100)
+        bd.send_frame(b'\x02' * 100)
+        self.assertFalse(bd.send_frame(b'\x03' * 100))  # First frame cancelled
+        self.assertTrue(bd._sender.flush())
+        self.assertEqual(lib.queue, [])
+
+    def test_gives_up_when_events_keep_failing(self):
+        lib = FakeLibusb(event_errors=1000)
+        bd = self._setup_device(lib)
+        sender = bd._sender
+        bd.send_frame(b'\x01' * 100)
+        bd.send_frame(b'\x02' * 100)
+        self.assertFalse(bd.send_frame(b'\x03' * 100))
+        self.assertEqual(lib.event_errors, 1000 - 2 * LibusbTransfers.MAX_EVENT_ERRORS)
+        self.assertFalse(bd.send_frame(b'\x04' * 100))
+        self.assertEqual(len(lib.submitted), 6)  # Nothing queued on stranded buffers
+        with patch('usb.util.dispose_resources'), patch('usb.util.release_interface'):
+            bd.close()
+        self.assertEqual(lib.freed, 0)
+        self.assertIn(sender, LibusbTransfers._abandoned)
+        LibusbTransfers._abandoned.remove(sender)
+
+    def test_close_drains_and_frees(self):
+        lib = FakeLibusb()
+        bd = self._setup_device(lib)
+        bd.send_frame(b'\x00' * 100)
+        with patch('usb.util.dispose_resources'), patch('usb.util.release_interface'):
+            bd.close()
+        self.assertEqual(lib.queue, [])
+        self.assertEqual(lib.freed, 3)
+        self.assertEqual(bd.stats.frames, 1)
+
+    def test_falls_back_without_libusb1_backend(self):
+        """A non-libusb1 pyusb device uses the blocking path."""
+        bd = BulkDevice(0x87AD, 0x70DB)
+        bd._dev = MagicMock()
+        bd._ep_out = MagicMock()
+        self.assertTrue(bd.send_frame(b'\x00' * 100))
+        self.assertTrue(bd._async_failed)
+        self.assertEqual(bd._ep_out.write.call_count, 3)
+        self.assertEqual(bd.stats.frames, 1)
+
+    def test_disabled(self):
+        bd = BulkDevice(0x87AD, 0x70DB, async_transfers=False)
+        bd._dev = MagicMock()
+        bd._ep_out = MagicMock()
+        with patch.object(_AsyncFrameSender, 'for_device') as for_device:
+            bd.send_frame(b'\x00' * 100)
+        for_device.assert_not_called()
+
+    def test_stats_properties(self):
+        stats = BulkStats()
+        self.assertEqual((stats.avg_latency_ms, stats.throughput_mb_s), (0.0, 0.0))
+        stats.record(2_000_000, 0.5, 1.0)
+        stats.record(0, 0.1, 0.0, ok=False)
+        self.assertAlmostEqual(stats.avg_latency_ms, 300.0)
+        self.assertAlmostEqual(stats.throughput_mb_s, 2.0)
+        self.assertEqual(stats.failed, 1)
+
+
 class TestBulkDeviceClose(unittest.TestCase):
     """Test close/cleanup."""
 
@@ -513,6 +702,18 @@ class TestBulkProtocol(unittest.TestCase):
         self.assertEqual(proto.protocol_name, "bulk")
         proto.close()
 
+    @patch('trcc.conf.Settings.get_bulk_async_transfers', return_value=False)
+    def test_async_transfers_from_config(self, _):
+        from trcc.device_factory import DeviceProtocolFactory
+
+        device_info = MagicMock(protocol='bulk', vid=0x87AD, pid=0x70DB,
+                                path='bulk:87ad:70db', implementation='bulk_usblcdnew')
+        proto = DeviceProtocolFactory.create_protocol(device_info)
+        with patch('trcc.device_bulk.BulkDevice') as MockBulk:
+            MockBulk.return_value.handshake.return_value = HandshakeResult()
+            proto._ensure_device()
+        MockBulk.assert_called_once_with(0x87AD, 0x70DB, async_transfers=False)
+
     def test_protocol_info(self):
         from trcc.device_factory import BulkProtocol
 
@@ -6,6 +6,7 @@ Tests cover:
 - KNOWN_DEVICES mapping
 - run_command() subprocess wrapper
 - find_usb_devices() via lsusb
+- find_usb_devices_sysfs() via /sys/bus/usb/devices
 - find_scsi_device_by_usb_path() via sysfs/lsscsi
 - find_scsi_usblcd_devices() via sysfs
 - detect_devices() integration
@@ -15,6 +16,7 @@ Tests cover:
 
 import os
 import sys
+import tempfile
 import unittest
 from dataclasses import fields
 from unittest.mock import MagicMock, mock_open, patch
@@ -165,7 +167,12 @@ _CLS = 'trcc.device_detector.DeviceDetector'
 
 
 class TestFindUsbDevices(unittest.TestCase):
-    """Test find_usb_devices function."""
+    """Test find_usb_devices function (lsusb fallback, no sysfs)."""
+
+    def setUp(self):
+        patcher = patch.object(DeviceDetector, 'SYSFS_USB_DIR', '/nonexistent/usb')
+        patcher.start()
+        self.addCleanup(patcher.stop)
 
     @patch(f'{_CLS}.run_command')
     def test_no_devices_found(self, mock_run):
@@ -317,6 +324,52 @@ class TestFindScsiUsblcdDevices(unittest.TestCase):
         self.assertEqual(devices[0].vendor_name, "Thermalright")
 
 
+class TestFindUsbDevicesSysfs(unittest.TestCase):
+    """Test sysfs USB enumeration."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = tmp.name
+        patcher = patch.object(DeviceDetector, 'SYSFS_USB_DIR', self.root)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _add(self, name, vid=None, pid=None):
+        path = os.path.join(self.root, name)
+        os.makedirs(path)
+        if vid is not None:
+            with open(os.path.join(path, 'idVendor'), 'w') as f:
+                f.write(f'{vid}\n')
+            with open(os.path.join(path, 'idProduct'), 'w') as f:
+                f.write(f'{pid}\n')
+
+    def test_known_devices_found(self):
+        self._add('usb1', '1d6b', '0002')       # Root hub
+        self._add('1-3', '87cd', '70db')        # SCSI LCD
+        self._add('1-3:1.0')                    # Its interface
+        self._add('2-1.4', '0416', '5302')      # HID Type 2
+        devices = DeviceDetector.find_usb_devices_sysfs()
+        self.assertEqual([(d.usb_path, d.protocol) for d in devices],
+                         [('1-3', 'scsi'), ('2-1.4', 'hid')])
+        self.assertEqual(devices[1].device_type, 2)
+
+    @patch(f'{_CLS}.run_command')
+    def test_find_usb_devices_prefers_sysfs(self, mock_run):
+        self._add('1-3', '87cd', '70db')
+        devices = find_usb_devices()
+        self.assertEqual(len(devices), 1)
+        mock_run.assert_not_called()
+
+    def test_unreadable_ids_skipped(self):
+        self._add('1-3', '87cd', 'zzzz')
+        self.assertEqual(DeviceDetector.find_usb_devices_sysfs(), [])
+
+    def test_no_sysfs_returns_none(self):
+        with patch.object(DeviceDetector, 'SYSFS_USB_DIR', '/nonexistent/usb'):
+            self.assertIsNone(DeviceDetector.find_usb_devices_sysfs())
+
+
 class TestDetectDevices(unittest.TestCase):
     """Test detect_devices integration function."""
 
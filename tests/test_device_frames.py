@@ -0,0 +1,184 @@
+"""Tests for device_frames — pre-encoded, memory-mapped device payloads."""
+
+import os
+import struct
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from PIL import Image
+
+from trcc.device_frames import (
+    SUFFIX,
+    DeviceFrames,
+    FrameFormat,
+    cache_entries,
+    cache_path,
+    context_digest,
+    prune_cache,
+    sibling_path,
+    write_device_frames,
+)
+from trcc.services.image import ImageService
+
+
+class TestFrameFormat(unittest.TestCase):
+
+    def test_for_device(self):
+        fmt = FrameFormat.for_device('scsi', (320, 240), '<', rotation=90)
+        self.assertEqual((fmt.encoding, fmt.frame_bytes), ('rgb565-le', 320 * 240 * 2))
+        bulk = FrameFormat.for_device('bulk', (480, 480))
+        self.assertEqual(bulk.encoding, 'jpeg')
+        self.assertIsNone(bulk.frame_bytes)
+
+    def test_unknown_encoding(self):
+        with self.assertRaises(ValueError):
+            FrameFormat(8, 8, 'bmp')
+
+
+class TestDeviceFrames(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = Path(tmp.name)
+        self.source = self.tmp / 'Theme.zt'
+        self.source.write_bytes(b'source animation')
+        self.fmt = FrameFormat(4, 2)
+        self.colors = [(255, 0, 0), (0, 255, 0), (0, 0, 255)]
+        self.payloads = [
+            ImageService.to_rgb565(Image.new('RGB', (4, 2), c), '>')
+            for c in self.colors]
+
+    def write(self, path=None, **kwargs):
+        path = path or sibling_path(self.source)
+        kwargs.setdefault('source', self.source)
+        write_device_frames(path, self.fmt, self.payloads, [42, 42, 84], **kwargs)
+        return path
+
+    def open(self, path):
+        frames = DeviceFrames(path)
+        self.addCleanup(frames.close)
+        return frames
+
+    def test_round_trip(self):
+        frames = self.open(self.write())
+        self.assertEqual(frames.format, self.fmt)
+        self.assertEqual(frames.frame_count, 3)
+        self.assertEqual(frames.delays, [42, 42, 84])
+        self.assertAlmostEqual(frames.fps, 3000 / 168)
+        for i, payload in enumerate(self.payloads):
+            view = frames.frame(i)
+            self.assertIsInstance(view, memoryview)
+            self.assertEqual(bytes(view), payload)
+
+    def test_previews_decode_rgb565(self):
+        frames = self.open(self.write())
+        self.assertEqual(len(frames.frames), 3)
+        self.assertEqual(frames.frames[1].getpixel((0, 0)), (0, 252, 0))
+        self.assertEqual(frames.frames[2].size, (4, 2))
+
+    def test_jpeg_previews(self):
+        fmt = FrameFormat(8, 8, 'jpeg', 'bulk')
+        jpeg = ImageService.to_jpeg(Image.new('RGB', (8, 8), (0, 0, 250)))
+        path = self.tmp / 'bulk.tdf'
+        write_device_frames(path, fmt, [jpeg], [100])
+        frames = self.open(path)
+        self.assertEqual(bytes(frames.frame(0)), jpeg)
+        self.assertGreater(frames.preview(0).getpixel((4, 4))[2], 200)
+
+    def test_find_sibling_then_cache(self):
+        with patch('trcc.device_frames.CACHE_DIR', str(self.tmp / 'cache')):
+            self.assertIsNone(DeviceFrames.find(self.source, self.fmt))
+            cached = cache_path(self.source, self.fmt)
+            self.write(cached)
+            found = DeviceFrames.find(self.source, self.fmt)
+            self.addCleanup(found.close)
+            self.assertEqual(found.path, cached)
+            self.write()
+            found = DeviceFrames.find(self.source, self.fmt)
+            self.addCleanup(found.close)
+            self.assertEqual(found.path, sibling_path(self.source))
+
+    def test_cache_hit_bumps_lru(self):
+        with patch('trcc.device_frames.CACHE_DIR', str(self.tmp / 'cache')):
+            cached = self.write(cache_path(self.source, self.fmt))
+            os.utime(cached, (1, 1))
+            found = DeviceFrames.find(self.source, self.fmt)
+            self.addCleanup(found.close)
+            self.assertGreater(os.stat(cached).st_mtime, 1)
+
+    def test_prune_evicts_least_recently_used(self):
+        cache = self.tmp / 'cache'
+        cache.mkdir()
+        paths = []
+        for i, name in enumerate(('a', 'b', 'c')):
+            path = cache / f'{name}{SUFFIX}'
+            path.write_bytes(b'\0' * 1000)
+            os.utime(path, (i + 1, i + 1))
+            paths.append(str(path))
+        (cache / 'notes.txt').write_bytes(b'\0' * 5000)  # Not an entry
+        self.assertEqual(prune_cache(1500, keep=paths[0], cache_dir=str(cache)), (2, 2000))
+        self.assertEqual([p for p, _, _ in cache_entries(str(cache))], [paths[0]])
+
+    def test_cache_shared_by_copies(self):
+        copy = self.tmp / 'work' / 'Theme.zt'
+        copy.parent.mkdir()
+        copy.write_bytes(self.source.read_bytes())
+        st = self.source.stat()
+        os.utime(copy, ns=(st.st_atime_ns, st.st_mtime_ns))
+        self.assertEqual(cache_path(copy, self.fmt), cache_path(self.source, self.fmt))
+
+    def test_stale_when_source_format_or_context_change(self):
+        digest = context_digest('mask', (0, 0))
+        frames = self.open(self.write(context=digest))
+        st = self.source.stat()
+        self.assertTrue(frames.is_current(st, self.fmt, digest))
+        self.assertFalse(frames.is_current(st, self.fmt))
+        self.assertFalse(frames.is_current(st, FrameFormat(4, 2, 'rgb565-le'), digest))
+        os.utime(self.source, ns=(1, 1))
+        self.assertFalse(frames.is_current(self.source.stat(), self.fmt, digest))
+        self.assertIsNone(DeviceFrames.find(self.source, self.fmt, digest))
+
+    def test_wrong_frame_size_rejected(self):
+        self.payloads[1] = b'\0' * 10
+        with self.assertRaises(ValueError):
+            self.write()
+        self.assertEqual(os.listdir(self.tmp), ['Theme.zt'])  # No temp file left
+
+    def test_frame_count_must_match_delays(self):
+        with self.assertRaises(ValueError):
+            write_device_frames(self.tmp / 'a.tdf', self.fmt, self.payloads, [42, 42])
+
+    def test_invalid_files_rejected(self):
+        bad = self.tmp / 'bad.tdf'
+        bad.write_bytes(b'TRDF')
+        with self.assertRaises(ValueError):
+            DeviceFrames(bad)
+        path = self.write()
+        data = Path(path).read_bytes()
+        Path(path).write_bytes(data[:-20])  # Last frame cut short
+        with self.assertRaises(ValueError):
+            DeviceFrames(path)
+        Path(path).write_bytes(b'XXXX' + data[4:])
+        with self.assertRaises(ValueError):
+            DeviceFrames(path)
+        self.assertIsNone(DeviceFrames.find(self.source, self.fmt))
+
+    def test_close_with_live_view(self):
+        frames = DeviceFrames(self.write())
+        view = frames.frame(0)
+        frames.close()
+        self.assertEqual(bytes(view), self.payloads[0])
+        with self.assertRaises(ValueError):
+            frames.frame(0)
+
+    def test_header_layout(self):
+        with open(self.write(), 'rb') as f:
+            magic, version, width, height = struct.unpack('<4sHHH', f.read(10))
+        self.assertEqual((magic, version, width, height), (b'TRDF', 1, 4, 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
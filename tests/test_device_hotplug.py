@@ -0,0 +1,186 @@
+"""Tests for device_hotplug — uevent parsing and the hotplug monitor."""
+
+import socket
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+from trcc.device_hotplug import (
+    HotplugEvent,
+    HotplugMonitor,
+    event_from_properties,
+    parse_uevent,
+)
+from trcc.services.device import DeviceService
+
+
+def _uevent(action, subsystem, devpath, **props):
+    fields = [f'{action}@{devpath}', f'ACTION={action}', f'DEVPATH={devpath}',
+              f'SUBSYSTEM={subsystem}'] + [f'{k}={v}' for k, v in props.items()]
+    return '\0'.join(fields).encode() + b'\0'
+
+
+LCD_ADD = _uevent('add', 'usb', '/devices/pci0000:00/usb1/1-3',
+                  DEVTYPE='usb_device', PRODUCT='87cd/70db/100')
+
+
+class TestParseUevent(unittest.TestCase):
+
+    def test_properties(self):
+        props = parse_uevent(LCD_ADD)
+        self.assertEqual(props['ACTION'], 'add')
+        self.assertEqual(props['PRODUCT'], '87cd/70db/100')
+        self.assertNotIn('add@/devices/pci0000:00/usb1/1-3', props)
+
+    def test_known_usb_device(self):
+        event = event_from_properties(parse_uevent(LCD_ADD))
+        self.assertEqual(event, HotplugEvent('add', 'usb', 0x87CD, 0x70DB, '1-3'))
+
+    def test_unpadded_product_ids(self):
+        props = parse_uevent(_uevent('remove', 'usb', '/devices/usb2/2-1',
+                                     DEVTYPE='usb_device', PRODUCT='416/5302/200'))
+        event = event_from_properties(props)
+        self.assertEqual((event.action, event.vid, event.pid), ('remove', 0x0416, 0x5302))
+
+    def test_irrelevant_events_ignored(self):
+        cases = [
+            _uevent('add', 'usb', '/devices/usb1/1-4', DEVTYPE='usb_device',
+                    PRODUCT='46d/c52b/1211'),                       # Unknown device
+            _uevent('add', 'usb', '/devices/usb1/1-3/1-3:1.0',
+                    DEVTYPE='usb_interface', PRODUCT='87cd/70db/100'),  # Interface
+            _uevent('bind', 'usb', '/devices/usb1/1-3', DEVTYPE='usb_device',
+                    PRODUCT='87cd/70db/100'),                       # Not add/remove
+            _uevent('add', 'block', '/devices/virtual/block/loop0'),
+        ]
+        for message in cases:
+            self.assertIsNone(event_from_properties(parse_uevent(message)))
+
+    def test_scsi_generic(self):
+        props = parse_uevent(_uevent('add', 'scsi_generic',
+                                     '/devices/usb1/1-3/host6/scsi_generic/sg1'))
+        self.assertEqual(event_from_properties(props),
+                         HotplugEvent('add', 'scsi_generic', name='sg1'))
+
+
+class TestHotplugMonitor(unittest.TestCase):
+    """Monitor thread over a socketpair standing in for the netlink socket."""
+
+    def setUp(self):
+        self.events = []
+        self.received = threading.Event()
+        self.kernel, source = socket.socketpair(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self.addCleanup(self.kernel.close)
+        self.monitor = HotplugMonitor(self._callback, backend='netlink')
+        self.addCleanup(self.monitor.stop)
+        patcher = patch.object(HotplugMonitor, '_open', return_value=(source, 'netlink'))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _callback(self, event):
+        self.events.append(event)
+        self.received.set()
+
+    def test_delivers_relevant_events(self):
+        self.assertTrue(self.monitor.start())
+        self.assertTrue(self.monitor.is_running)
+        self.kernel.send(_uevent('add', 'usb', '/devices/usb1/1-4',
+                                 DEVTYPE='usb_device', PRODUCT='46d/c52b/1211'))
+        self.kernel.send(LCD_ADD)
+        self.assertTrue(self.received.wait(5))
+        self.assertEqual([(e.vid, e.pid) for e in self.events], [(0x87CD, 0x70DB)])
+
+    def test_stop_joins_thread(self):
+        self.monitor.start()
+        self.monitor.stop()
+        self.assertFalse(self.monitor.is_running)
+
+    def test_unavailable_backend(self):
+        with patch.object(HotplugMonitor, '_open', side_effect=OSError('EPERM')):
+            monitor = HotplugMonitor(self._callback)
+            self.assertFalse(monitor.start())
+
+    def test_unknown_backend_rejected(self):
+        with self.assertRaises(ValueError):
+            HotplugMonitor(self._callback, backend='inotify')
+
+
+class TestDeviceServiceHotplug(unittest.TestCase):
+
+    def _device(self, path):
+        from trcc.core.models import DeviceInfo
+        return DeviceInfo(name=path, path=path, vid=0x87CD, pid=0x70DB)
+
+    def test_event_rescans_and_drops_removed_selection(self):
+        svc = DeviceService()
+        a, b = self._device('/dev/sg0'), self._device('/dev/sg1')
+        svc._devices = [a, b]
+        svc.select(a)
+        seen = []
+        svc._on_hotplug = seen.append
+
+        def detect():
+            svc._devices = [b]
+            return svc._devices
+
+        event = HotplugEvent('remove', 'usb', 0x87CD, 0x70DB, '1-3')
+        with patch.object(svc, 'detect', side_effect=detect):
+            svc._handle_hotplug(event)
+        self.assertIs(svc.selected, b)
+        self.assertEqual(seen, [event])
+
+    def test_wait_for_devices_wakes_on_event(self):
+        svc = DeviceService()
+        found = [self._device('/dev/sg0')]
+        monitor = MagicMock()
+
+        def start():
+            # Device arrives right after the monitor starts
+            threading.Timer(0.05, svc._handle_hotplug,
+                            [HotplugEvent('add', 'usb', 0x87CD, 0x70DB, '1-3')]).start()
+            return True
+        monitor.start.side_effect = start
+        scans = iter([[], [], found])
+
+        def detect():
+            svc._devices = next(scans)
+            return svc._devices
+
+        with patch('trcc.device_hotplug.HotplugMonitor', return_value=monitor), \
+             patch.object(svc, 'detect', side_effect=detect):
+            self.assertEqual(svc.wait_for_devices(timeout=5), found)
+        monitor.stop.assert_called_once()
+
+    def test_wait_for_devices_rescans_after_monitor_starts(self):
+        """A device plugged in before the monitor was listening isn't missed."""
+        svc = DeviceService()
+        found = [self._device('/dev/sg0')]
+        monitor = MagicMock()
+        monitor.start.return_value = True
+        scans = iter([[], found])
+        waiting = []
+
+        def detect():
+            svc._devices = next(scans)
+            return svc._devices
+
+        with patch('trcc.device_hotplug.HotplugMonitor', return_value=monitor), \
+             patch.object(svc, 'detect', side_effect=detect):
+            self.assertEqual(svc.wait_for_devices(timeout=5, on_wait=lambda: waiting.append(1)),
+                             found)
+        self.assertEqual(waiting, [1])
+
+    def test_wait_for_devices_polls_without_monitor(self):
+        svc = DeviceService()
+        monitor = MagicMock()
+        monitor.start.return_value = False
+        with patch('trcc.device_hotplug.HotplugMonitor', return_value=monitor), \
+             patch.object(svc, 'detect', return_value=[]) as detect, \
+             patch('trcc.services.device.time.sleep') as sleep, \
+             patch('trcc.services.device.time.monotonic', side_effect=[0.0, 0.0, 2.0, 4.0]):
+            self.assertEqual(svc.wait_for_devices(timeout=4), [])
+        self.assertEqual(detect.call_count, 3)
+        self.assertEqual(sleep.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,7 @@
 """Tests for scsi_device – SCSI frame chunking, header building, CRC."""
 
 import binascii
+import ctypes
 import struct
 import unittest
 from unittest.mock import MagicMock, patch
@@ -12,12 +13,46 @@ from trcc.device_scsi import (
     _CHUNK_SIZE,
     _FRAME_CMD_BASE,
     _POST_INIT_DELAY,
+    _SG_DXFER_FROM_DEV,
+    _SG_DXFER_TO_DEV,
+    _SG_IO,
     ScsiDevice,
+    ScsiTransport,
+    SgIoTransport,
+    _SgIoHdr,
     find_lcd_devices,
     send_image_to_device,
 )
 
 
+class FakeScsiTransport(ScsiTransport):
+    """In-memory SCSI device: records every CDB and payload it receives."""
+
+    def __init__(self, poll_response: bytes = b'\x64' + b'\x00' * 15):
+        self.poll_response = poll_response
+        self.reads: list = []   # (cdb, length)
+        self.writes: list = []  # (cdb, payload bytes)
+        self._open = False
+
+    def open(self) -> None:
+        self._open = True
+
+    def close(self) -> None:
+        self._open = False
+
+    def read(self, cdb: bytes, length: int) -> bytes:
+        self.reads.append((bytes(cdb), length))
+        return self.poll_response
+
+    def write(self, cdb: bytes, data) -> bool:
+        self.writes.append((bytes(cdb), bytes(data)))
+        return True
+
+    @property
+    def is_open(self) -> bool:
+        return self._open
+
+
 class TestBootConstants(unittest.TestCase):
     """Verify boot state constants match USBLCD.exe protocol."""
 
@@ -317,6 +352,216 @@ class TestSendFrame(unittest.TestCase):
         self.assertEqual(mock_write.call_count, 8)  # 480x480 = 8 chunks
 
 
+class TestPartialUpdate(unittest.TestCase):
+    """Chunk-level diffing against the last frame written."""
+
+    SIZE = 480 * 480 * 2
+
+    def setUp(self):
+        ScsiDevice._initialized_devices.clear()
+        ScsiDevice._last_frames.clear()
+        self.fake = FakeScsiTransport()
+        ScsiDevice.register_transport('/dev/sg0', self.fake)
+        self.addCleanup(ScsiDevice.unregister_transport, '/dev/sg0')
+        self.addCleanup(ScsiDevice._last_frames.clear)
+
+    def send(self, data, **kwargs):
+        self.fake.writes.clear()
+        ScsiDevice._send_frame('/dev/sg0', data, 480, 480, partial=True, **kwargs)
+        return [struct.unpack_from('<I', cdb)[0] >> 24 for cdb, _ in self.fake.writes]
+
+    def test_first_frame_is_full(self):
+        self.assertEqual(self.send(bytes(self.SIZE)), list(range(8)))
+
+    def test_only_changed_chunks_sent(self):
+        frame = bytearray(self.SIZE)
+        self.send(bytes(frame))
+        frame[5 * _CHUNK_SIZE + 10] = 0xFF
+        frame[7 * _CHUNK_SIZE] = 0xFF
+        self.assertEqual(self.send(bytes(frame)), [5, 7])
+        self.assertEqual(self.fake.writes[0][1], bytes(frame[5 * _CHUNK_SIZE:6 * _CHUNK_SIZE]))
+        self.assertEqual(self.send(bytes(frame)), [])
+
+    def test_caller_buffer_reuse(self):
+        """The frame is snapshotted, so a reused buffer still diffs correctly."""
+        frame = bytearray(self.SIZE)
+        self.send(frame)
+        frame[0] = 1
+        self.assertEqual(self.send(frame), [0])
+
+    def test_full_refresh_cadence(self):
+        with patch('trcc.device_scsi.time.monotonic', side_effect=[100.0, 105.0, 111.0]):
+            self.send(bytes(self.SIZE), full_refresh_s=10.0)
+            self.assertEqual(self.send(bytes(self.SIZE), full_refresh_s=10.0), [])
+            self.assertEqual(len(self.send(bytes(self.SIZE), full_refresh_s=10.0)), 8)
+
+    def test_failed_write_forces_full_frame(self):
+        self.send(bytes(self.SIZE))
+        self.fake.write = MagicMock(return_value=False)
+        with self.assertRaises(OSError):
+            ScsiDevice._send_frame('/dev/sg0', b'\x01' * self.SIZE, 480, 480, partial=True)
+        self.assertNotIn('/dev/sg0', ScsiDevice._last_frames)
+
+    @patch('trcc.device_scsi.time.sleep')
+    def test_failed_write_reported(self, _):
+        """A frame that didn't reach the screen isn't reported as sent."""
+        self.assertTrue(send_image_to_device('/dev/sg0', bytes(self.SIZE), 480, 480))
+        self.fake.write = MagicMock(return_value=False)
+        self.assertFalse(send_image_to_device('/dev/sg0', bytes(self.SIZE), 480, 480))
+        dev = ScsiDevice('/dev/sg0')
+        dev._initialized, dev.width, dev.height = True, 480, 480
+        self.assertFalse(dev.send_frame(bytes(self.SIZE)))
+
+    def test_off_by_default(self):
+        ScsiDevice._send_frame('/dev/sg0', bytes(self.SIZE), 480, 480)
+        self.fake.writes.clear()
+        ScsiDevice._send_frame('/dev/sg0', bytes(self.SIZE), 480, 480)
+        self.assertEqual(len(self.fake.writes), 8)
+
+    @patch('trcc.device_scsi.time.sleep')
+    def test_full_frame_after_init(self, _):
+        send_image_to_device('/dev/sg0', bytes(self.SIZE), 480, 480, partial=True)
+        send_image_to_device('/dev/sg0', bytes(self.SIZE), 480, 480, partial=True)
+        self.fake.writes.clear()
+        ScsiDevice._initialized_devices.clear()  # e.g. after a send error
+        send_image_to_device('/dev/sg0', bytes(self.SIZE), 480, 480, partial=True)
+        frame_writes = [w for w in self.fake.writes
+                        if struct.unpack_from('<I', w[0])[0] & 0xFFFFFF == _FRAME_CMD_BASE]
+        self.assertEqual(len(frame_writes), 8)
+
+
+# -- Persistent transport --
+
+class TestScsiTransportRouting(unittest.TestCase):
+    """CDBs route through a registered transport instead of sg_raw."""
+
+    def setUp(self):
+        ScsiDevice._initialized_devices.clear()
+        self.fake = FakeScsiTransport()
+        ScsiDevice.register_transport('/dev/sg0', self.fake)
+
+    def tearDown(self):
+        ScsiDevice.unregister_transport('/dev/sg0')
+        ScsiDevice._initialized_devices.clear()
+
+    @patch('trcc.device_scsi.subprocess.run')
+    def test_read_uses_transport(self, mock_run):
+        result = ScsiDevice._scsi_read('/dev/sg0', b'\x01\x02', 64)
+        self.assertEqual(result, self.fake.poll_response)
+        self.assertEqual(self.fake.reads, [(b'\x01\x02', 64)])
+        mock_run.assert_not_called()
+
+    @patch('trcc.device_scsi.subprocess.run')
+    def test_write_passes_16_byte_cdb(self, mock_run):
+        header = ScsiDevice._build_header(0x101F5, 10)
+        self.assertTrue(ScsiDevice._scsi_write('/dev/sg0', header, b'\xAB' * 10))
+        self.assertEqual(self.fake.writes, [(header[:16], b'\xAB' * 10)])
+        mock_run.assert_not_called()
+
+    @patch('trcc.device_scsi.time.sleep')
+    def test_full_send_framing(self, _):
+        """Poll, init, then one header-tagged write per 64 KiB chunk."""
+        frame = bytes(range(256)) * (480 * 480 * 2 // 256)
+        self.assertTrue(send_image_to_device('/dev/sg0', frame, 480, 480))
+
+        self.assertEqual(self.fake.reads,
+                         [(ScsiDevice._build_header(0xF5, 0xE100)[:16], 0xE100)])
+        init_cdb, init_data = self.fake.writes[0]
+        self.assertEqual(init_cdb, ScsiDevice._build_header(0x1F5, 0xE100)[:16])
+        self.assertEqual(init_data, b'\x00' * 0xE100)
+
+        frame_writes = self.fake.writes[1:]
+        chunks = ScsiDevice._get_frame_chunks(480, 480)
+        self.assertEqual(len(frame_writes), len(chunks))
+        for (cdb, _), (cmd, size) in zip(frame_writes, chunks):
+            self.assertEqual(cdb, ScsiDevice._build_header(cmd, size)[:16])
+        self.assertEqual(b''.join(d for _, d in frame_writes), frame)
+
+    def test_send_accepts_memoryview(self):
+        ScsiDevice._send_frame('/dev/sg0', memoryview(b'\x11' * 100))
+        self.assertEqual(sum(len(d) for _, d in self.fake.writes), 320 * 320 * 2)
+
+    def test_unregister_closes_transport(self):
+        self.fake.open()
+        ScsiDevice.unregister_transport('/dev/sg0')
+        self.assertFalse(self.fake.is_open)
+        self.assertNotIn('/dev/sg0', ScsiDevice._transports)
+
+    def test_register_replaces_and_closes_old(self):
+        self.fake.open()
+        other = FakeScsiTransport()
+        ScsiDevice.register_transport('/dev/sg0', other)
+        self.assertFalse(self.fake.is_open)
+        self.assertIs(ScsiDevice._transports['/dev/sg0'], other)
+
+
+class TestSgIoTransport(unittest.TestCase):
+    """SG_IO ioctl header construction (ioctl mocked — no hardware)."""
+
+    def _run(self, fn, info=0, fill=b''):
+        calls = []
+
+        def fake_ioctl(fd, req, hdr):
+            calls.append((fd, req, hdr.interface_id, hdr.dxfer_direction,
+                          hdr.cmd_len, hdr.dxfer_len, hdr.timeout))
+            if fill:
+                ctypes.memmove(hdr.dxferp, fill, len(fill))
+            hdr.info = info
+            return 0
+
+        with patch('trcc.device_scsi.os.open', return_value=42), \
+             patch('trcc.device_scsi.os.close'), \
+             patch('trcc.device_scsi.fcntl.ioctl', side_effect=fake_ioctl):
+            t = SgIoTransport('/dev/sg0')
+            result = fn(t)
+        return result, calls, t
+
+    def test_write_header_fields(self):
+        header = ScsiDevice._build_header(0x101F5, 0x10000)
+        ok, calls, _ = self._run(lambda t: t.write(header[:16], b'\x00' * 0x10000))
+        self.assertTrue(ok)
+        fd, req, iface, direction, cmd_len, length, timeout = calls[0]
+        self.assertEqual((fd, req), (42, _SG_IO))
+        self.assertEqual(iface, ord('S'))
+        self.assertEqual(direction, _SG_DXFER_TO_DEV)
+        self.assertEqual(cmd_len, 16)
+        self.assertEqual(length, 0x10000)
+        self.assertGreater(timeout, 0)
+
+    def test_read_returns_device_data(self):
+        data, calls, _ = self._run(lambda t: t.read(b'\xF5' + b'\x00' * 15, 8),
+                                   fill=b'\x64ABCDEFG')
+        self.assertEqual(data, b'\x64ABCDEFG')
+        self.assertEqual(calls[0][3], _SG_DXFER_FROM_DEV)
+
+    def test_failed_status_returns_empty(self):
+        data, _, _ = self._run(lambda t: t.read(b'\xF5' * 16, 8), info=1)
+        self.assertEqual(data, b'')
+
+    def test_fd_reused_across_calls(self):
+        with patch('trcc.device_scsi.os.open', return_value=7) as mock_open, \
+             patch('trcc.device_scsi.fcntl.ioctl', return_value=0):
+            t = SgIoTransport('/dev/sg0')
+            t.write(b'\x00' * 16, b'a')
+            t.write(b'\x00' * 16, b'b')
+            mock_open.assert_called_once()
+            self.assertTrue(t.is_open)
+
+    def test_ioctl_error_closes_handle(self):
+        with patch('trcc.device_scsi.os.open', return_value=7), \
+             patch('trcc.device_scsi.os.close'), \
+             patch('trcc.device_scsi.fcntl.ioctl', side_effect=OSError(19, 'ENODEV')):
+            t = SgIoTransport('/dev/sg0')
+            with self.assertRaises(OSError):
+                t.write(b'\x00' * 16, b'x')
+            self.assertFalse(t.is_open)
+
+    def test_header_struct_size(self):
+        """sg_io_hdr is 88 bytes on 64-bit Linux."""
+        if ctypes.sizeof(ctypes.c_void_p) == 8:
+            self.assertEqual(ctypes.sizeof(_SgIoHdr), 88)
+
+
 # -- find_lcd_devices --
 
 class TestFindLCDDevices(unittest.TestCase):
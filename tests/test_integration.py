@@ -5,6 +5,7 @@ the hardware boundary (SCSI sg_raw, USB, filesystem device nodes) and letting
 all layers above run for real.
 """
 
+import itertools
 import os
 import struct
 import tempfile
@@ -197,7 +198,10 @@ class TestCLIResumePipeline(unittest.TestCase):
         """resume() with no devices returns 1."""
         from trcc.cli import resume
         mock_detect.return_value = []
-        result = resume()
+        with patch("trcc.device_hotplug.HotplugMonitor.start", return_value=False), \
+             patch("trcc.services.device.time.monotonic",
+                   side_effect=itertools.count(0.0, 30.0)):  # Wait times out at once
+            result = resume()
         self.assertEqual(result, 1)
 
     @patch("trcc.device_detector.DeviceDetector.detect")
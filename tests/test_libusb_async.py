@@ -0,0 +1,98 @@
+"""Tests for libusb_async — transfer setup, reaping and the event-error ladder."""
+
+import ctypes
+import unittest
+from unittest.mock import MagicMock
+
+from trcc.libusb_async import LibusbTransfers
+
+
+class FakeLibusb:
+    """libusb async API double: handle_events() completes everything queued."""
+
+    def __init__(self, event_errors=0):
+        from usb.backend import libusb1
+        self._struct = libusb1._libusb_transfer
+        self.event_errors = event_errors  # handle_events() calls that fail first
+        self.queue = []
+        self.cancelled = []
+        self.freed = 0
+
+    def libusb_alloc_transfer(self, iso_packets):
+        return ctypes.pointer(self._struct())
+
+    def libusb_free_transfer(self, transfer):
+        self.freed += 1
+
+    def libusb_submit_transfer(self, transfer):
+        self.queue.append(transfer)
+        return 0
+
+    def libusb_cancel_transfer(self, transfer):
+        self.cancelled.append(transfer)
+        return 0
+
+    def libusb_handle_events(self, ctx):
+        if self.event_errors:
+            self.event_errors -= 1
+            return -1  # LIBUSB_ERROR_IO
+        for transfer in self.queue:
+            t = transfer.contents
+            t.status = 0
+            t.actual_length = t.length
+            t.callback(transfer)
+        self.queue = []
+        return 0
+
+
+class TestLibusbTransfers(unittest.TestCase):
+
+    def test_submit_and_reap(self):
+        lib = FakeLibusb()
+        usb = LibusbTransfers(lib, None, None)
+        buf = ctypes.create_string_buffer(b'frame', 5)
+        transfer = usb.alloc()
+        self.assertEqual(usb.submit(transfer, 0x02, ctypes.addressof(buf), 5, 100), 0)
+        t = transfer.contents
+        self.assertEqual((t.endpoint, t.type, t.length), (0x02, LibusbTransfers.TYPE_BULK, 5))
+        completed, error = usb.handle_events([transfer])
+        self.assertEqual(completed, [transfer])
+        self.assertIsNone(error)
+        usb.close()
+        self.assertEqual(lib.freed, 1)
+
+    def test_event_errors_cancel_then_strand(self):
+        lib = FakeLibusb(event_errors=1000)
+        usb = LibusbTransfers(lib, None, None)
+        transfer = usb.alloc()
+        usb.submit(transfer, 0x02, 0, 0, 100)
+        errors = [usb.handle_events([transfer])[1]
+                  for _ in range(2 * LibusbTransfers.MAX_EVENT_ERRORS)]
+        self.assertIn('handle_events failed', errors[LibusbTransfers.MAX_EVENT_ERRORS - 1])
+        self.assertEqual(lib.cancelled, [transfer])
+        self.assertIn('never completed', errors[-1])
+        self.assertTrue(usb.stranded)
+
+        owner = MagicMock()
+        usb.close(owner=owner)
+        self.assertEqual(lib.freed, 0)
+        self.assertIn(owner, LibusbTransfers._abandoned)
+        LibusbTransfers._abandoned.remove(owner)
+
+    def test_success_resets_error_count(self):
+        lib = FakeLibusb(event_errors=LibusbTransfers.MAX_EVENT_ERRORS - 1)
+        usb = LibusbTransfers(lib, None, None)
+        for _ in range(LibusbTransfers.MAX_EVENT_ERRORS):
+            usb.handle_events([])
+        lib.event_errors = LibusbTransfers.MAX_EVENT_ERRORS - 1
+        for _ in range(LibusbTransfers.MAX_EVENT_ERRORS - 1):
+            self.assertIsNone(usb.handle_events([])[1])
+        self.assertEqual(lib.cancelled, [])
+
+    def test_needs_libusb1_backend(self):
+        with self.assertRaises(RuntimeError):
+            LibusbTransfers.for_device(MagicMock())
+
+
+if __name__ == '__main__':
+    unittest.main()
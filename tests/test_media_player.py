@@ -10,8 +10,10 @@ from unittest.mock import MagicMock, patch
 from PIL import Image
 
 from trcc.media_player import (
+    FramePool,
     ThemeZtDecoder,
     VideoDecoder,
+    VideoStream,
     _check_ffmpeg,
 )
 
@@ -169,6 +171,149 @@ class TestVideoDecoderDecode(unittest.TestCase):
         decoder.close()
 
 
+# -- VideoStream -------------------------------------------------------------
+
+def _fake_ffmpeg(frame_count, size=(4, 4)):
+    """Popen side_effect: each launch streams frames starting at its -ss offset.
+
+    Frame i is a solid (i, 0, 0) image so tests can check which frame came out.
+    """
+    w, h = size
+    launches = []
+
+    def popen(cmd, **kwargs):
+        start = 0
+        if '-ss' in cmd:
+            start = round(float(cmd[cmd.index('-ss') + 1]) * 16)
+        launches.append(cmd)
+        raw = b''.join(bytes([i, 0, 0]) * (w * h) for i in range(start, frame_count))
+        proc = MagicMock()
+        proc.stdout = io.BytesIO(raw)
+        proc.wait.return_value = 0
+        return proc
+
+    return popen, launches
+
+
+class TestVideoStream(unittest.TestCase):
+    """VideoStream with a fake FFmpeg process."""
+
+    def _open(self, frame_count=5, buffer_frames=2, duration=b'0.3125\n'):
+        popen, launches = _fake_ffmpeg(frame_count)
+        patches = [
+            patch('trcc.media_player.FFMPEG_AVAILABLE', True),
+            patch('subprocess.run', return_value=MagicMock(stdout=duration)),
+            patch('subprocess.Popen', side_effect=popen),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+        stream = VideoStream('/fake/v.mp4', target_size=(4, 4),
+                             buffer_frames=buffer_frames)
+        self.addCleanup(stream.close)
+        return stream, launches
+
+    def test_frame_count_from_probe(self):
+        stream, _ = self._open()
+        self.assertEqual(stream.frame_count, 5)  # 0.3125s * 16fps
+
+    def test_reads_frames_in_order_then_eof(self):
+        stream, _ = self._open(frame_count=5)
+        reds = [stream.read().getpixel((0, 0))[0] for _ in range(5)]
+        self.assertEqual(reds, [0, 1, 2, 3, 4])
+        self.assertIsNone(stream.read())
+        self.assertTrue(stream.at_end)
+
+    def test_buffer_is_bounded(self):
+        stream, _ = self._open(frame_count=50, buffer_frames=3)
+        import time
+        time.sleep(0.05)  # Let the reader fill the buffer
+        self.assertLessEqual(stream._queue.qsize(), 3)
+        self.assertEqual(stream._queue.maxsize, 3)
+
+    def test_peek_does_not_consume(self):
+        stream, _ = self._open()
+        first = stream.peek()
+        self.assertEqual(stream.position, 0)
+        self.assertIs(stream.read(), first)
+        self.assertEqual(stream.position, 1)
+
+    def test_seek_restarts_pipe_at_offset(self):
+        stream, launches = self._open(frame_count=10)
+        stream.seek(6)
+        self.assertEqual(len(launches), 2)
+        self.assertIn('-ss', launches[1])
+        self.assertEqual(stream.position, 6)
+        self.assertEqual(stream.read().getpixel((0, 0))[0], 6)
+
+    def test_restart_reopens_from_start(self):
+        stream, launches = self._open(frame_count=2)
+        stream.read()
+        stream.read()
+        stream.restart()
+        self.assertNotIn('-ss', launches[-1])
+        self.assertEqual(stream.read().getpixel((0, 0))[0], 0)
+
+    def test_unknown_duration_gives_zero_count(self):
+        stream, _ = self._open(duration=b'N/A')
+        self.assertEqual(stream.frame_count, 0)
+
+    @patch('trcc.media_player.FFMPEG_AVAILABLE', False)
+    def test_raises_without_ffmpeg(self):
+        with self.assertRaises(RuntimeError):
+            VideoStream('/fake/v.mp4')
+
+
+class TestMediaServiceStreaming(unittest.TestCase):
+    """MediaService consuming a VideoStream."""
+
+    def setUp(self):
+        from pathlib import Path
+
+        from trcc.services.media import MediaService
+        popen, self.launches = _fake_ffmpeg(3)
+        for p in (patch('trcc.media_player.FFMPEG_AVAILABLE', True),
+                  patch('subprocess.run', return_value=MagicMock(stdout=b'0.1875')),
+                  patch('subprocess.Popen', side_effect=popen)):
+            p.start()
+            self.addCleanup(p.stop)
+        self.svc = MediaService()
+        self.svc.set_target_size(4, 4)
+        self.assertTrue(self.svc.load(Path('/fake/v.mp4')))
+        self.addCleanup(self.svc.close)
+
+    def _red(self, frame):
+        return frame.getpixel((0, 0))[0]
+
+    def test_streams_without_frame_list(self):
+        self.assertTrue(self.svc.is_streaming)
+        self.assertTrue(self.svc.has_frames)
+        self.assertEqual(self.svc._frames, [])
+        self.assertEqual(self.svc.state.total_frames, 3)
+
+    def test_first_frame_available_before_play(self):
+        self.assertEqual(self._red(self.svc.get_frame(0)), 0)
+
+    def test_tick_loops_by_reopening_pipe(self):
+        self.svc.play()
+        reds = [self._red(self.svc.tick()[0]) for _ in range(5)]
+        self.assertEqual(reds, [0, 1, 2, 0, 1])
+        self.assertEqual(len(self.launches), 2)
+
+    def test_no_loop_stops_at_end(self):
+        self.svc.state.loop = False
+        self.svc.play()
+        for _ in range(3):
+            self.assertIsNotNone(self.svc.tick()[0])
+        self.assertIsNone(self.svc.tick()[0])
+        self.assertFalse(self.svc.is_playing)
+
+    def test_seek_restarts_at_offset(self):
+        self.svc.seek(70)  # frame 2 of 3
+        self.svc.play()
+        self.assertEqual(self._red(self.svc.tick()[0]), 2)
+
+
 # -- VideoDecoder.extract_frames --------------------------------------------
 
 class TestExtractFrames(unittest.TestCase):
@@ -343,6 +488,157 @@ class TestThemeZtDecoderEdge(unittest.TestCase):
         finally:
             os.unlink(path)
 
+    def test_truncated_file_keeps_complete_frames(self):
+        path = _make_theme_zt(frames=3)
+        try:
+            with open(path, 'r+b') as f:
+                f.truncate(os.path.getsize(path) - 10)
+            decoder = ThemeZtDecoder(path)
+            self.assertEqual(decoder.frame_count, 2)
+            self.assertEqual(len(decoder.timestamps), 2)
+            decoder.close()
+        finally:
+            os.unlink(path)
+
+
+# -- Lazy Theme.zt frames ------------------------------------------------------
+
+class TestZtFrames(unittest.TestCase):
+    """ThemeZtDecoder.frames decodes on demand through an LRU."""
+
+    def setUp(self):
+        self.path = _make_theme_zt(frames=20, size=(8, 8))
+        self.addCleanup(os.unlink, self.path)
+        self.decoder = ThemeZtDecoder(self.path)
+        self.addCleanup(self.decoder.close)
+        self.frames = self.decoder.frames
+
+    def _green(self, frame):
+        return frame.getpixel((4, 4))[1]
+
+    def test_open_decodes_nothing(self):
+        self.assertEqual(self.decoder.frame_count, 20)
+        self.assertEqual(self.frames.decodes, 0)
+
+    def test_random_access(self):
+        self.assertAlmostEqual(self._green(self.frames[3]), 180, delta=8)
+        self.assertAlmostEqual(self._green(self.frames[-20]), 0, delta=8)
+        with self.assertRaises(IndexError):
+            self.frames[20]
+
+    def test_repeated_access_cached(self):
+        frame = self.frames[3]
+        self.assertIs(self.frames[3], frame)
+
+    def test_read_ahead_decodes_next_frames(self):
+        self.frames[18]
+        self.frames.wait()
+        self.assertIn(19, self.frames._cache)
+        self.assertIn(0, self.frames._cache)  # Wraps for looped playback
+
+    def test_cache_bounded(self):
+        for i in range(20):
+            self.frames[i]
+        self.frames.wait()
+        self.assertLessEqual(len(self.frames._cache), self.frames.cache_frames)
+
+    def test_decode_all_in_order(self):
+        frames = self.frames.decode_all()
+        self.assertEqual(len(frames), 20)
+        self.assertAlmostEqual(self._green(frames[3]), 180, delta=8)
+        self.assertEqual(frames[0].mode, 'RGB')
+
+    def test_closed_reader_raises(self):
+        self.decoder.close()
+        self.assertEqual(len(self.frames), 0)
+        with self.assertRaises(IndexError):
+            self.frames[0]
+
+
+class TestFramePool(unittest.TestCase):
+    """Ordered parallel frame preparation."""
+
+    def setUp(self):
+        self.pool = FramePool(workers=4)
+        self.addCleanup(self.pool.close)
+
+    def test_map_keeps_order(self):
+        import time
+        def slow_for_small(i):
+            time.sleep(0.002 * (10 - i))
+            return i * i
+        self.assertEqual(list(self.pool.map(slow_for_small, range(10))),
+                         [i * i for i in range(10)])
+
+    def test_map_bounds_in_flight(self):
+        import threading
+        submitted = []
+        lock = threading.Lock()
+
+        def record(i):
+            with lock:
+                submitted.append(i)
+            return i
+
+        results = self.pool.map(record, range(100), window=3)
+        next(results)
+        with lock:
+            self.assertLessEqual(len(submitted), 3)
+        results.close()
+
+    def test_errors_propagate(self):
+        def boom(i):
+            if i == 2:
+                raise ValueError("bad frame")
+            return i
+        with self.assertRaises(ValueError):
+            list(self.pool.map(boom, range(5)))
+
+    def test_single_worker_runs_inline(self):
+        import threading
+        pool = FramePool(workers=1)
+        threads = list(pool.map(lambda _: threading.current_thread(), range(3)))
+        self.assertEqual(set(threads), {threading.current_thread()})
+        self.assertIsNone(pool._executor)
+
+
+class TestMediaServiceZt(unittest.TestCase):
+    """MediaService playing a lazily decoded Theme.zt."""
+
+    def setUp(self):
+        from pathlib import Path
+
+        from trcc.services.media import MediaService
+        self.path = _make_theme_zt(frames=30, size=(8, 8))
+        self.addCleanup(os.unlink, self.path)
+        self.svc = MediaService()
+        self.svc.set_target_size(8, 8)
+        self.assertTrue(self.svc.load(Path(self.path)))
+        self.addCleanup(self.svc.close)
+
+    def test_seek_decodes_only_target(self):
+        self.assertEqual(self.svc.state.total_frames, 30)
+        self.svc.seek(50)
+        frame = self.svc.get_frame()
+        self.assertEqual(self.svc.state.current_frame, 15)
+        self.assertIs(frame, self.svc._frames[15])
+        self.assertLessEqual(self.svc._frames.decodes, 1 + self.svc._decoder.READ_AHEAD)
+
+    def test_paced_drops_skip_decoding(self):
+        from trcc.services.media import FramePacer
+        clock = MagicMock(return_value=100.0)
+        self.svc.paced = True
+        self.svc._pacer = FramePacer(clock)
+        self.svc.play()
+        self.svc.tick()
+        clock.return_value = 100.25  # Frames 1-4 missed
+        self.svc.tick()
+        self.assertGreater(self.svc.pacing.dropped, 0)
+        self.assertEqual(self.svc.frame_index, self.svc.pacing.dropped + 1)
+        self.svc._frames.wait()
+        self.assertNotIn(3, self.svc._frames._cache)  # Not read ahead, not decoded
+        self.assertNotIn(4, self.svc._frames._cache)
+
 
 if __name__ == '__main__':
     unittest.main()
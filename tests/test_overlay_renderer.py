@@ -9,17 +9,21 @@ Tests cover:
 - Text rendering with metrics
 - Config application
 - Dynamic scaling
+- Graph elements (sparkline / bar / area)
 """
 
 import os
 import sys
 import unittest
+from unittest.mock import patch
 
 # Add parent directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
 
 from PIL import Image
 
+from trcc.services.history import MetricHistory
+from trcc.services.overlay import MetricGraph
 from trcc.services.overlay import OverlayService as OverlayRenderer
 
 
@@ -700,6 +704,18 @@ class TestRenderMaskScaling(unittest.TestCase):
         img = renderer.render()
         self.assertEqual(img.size, (480, 480))
 
+    def test_mask_copy_renders_identically(self):
+        renderer = OverlayRenderer(width=480, height=480)
+        renderer.enabled = True
+        renderer.set_config_resolution(320, 320)
+        renderer.set_theme_mask(Image.new('RGBA', (320, 100), (255, 0, 0, 128)),
+                                position=(0, 220))
+        copy = renderer.mask_copy()
+        self.assertTrue(copy.enabled)
+        self.assertIsNot(copy._mask_prep, renderer._mask_prep)
+        bg = Image.new('RGB', (480, 480), 'blue')
+        self.assertEqual(copy.render(bg).tobytes(), renderer.render(bg).tobytes())
+
 
 # ── render with flash_skip_index ─────────────────────────────────────────────
 
@@ -796,5 +812,281 @@ class TestFallbackFormatMetric(unittest.TestCase):
         self.assertEqual(fallback_format('cpu_percent', 42), '42')
 
 
+# ── incremental compositor ──────────────────────────────────────────────────
+
+def _reference_render(renderer, metrics):
+    """Full redraw with draw.text — the pre-compositor rendering path."""
+    from PIL import ImageDraw
+
+    from trcc.services.system import SystemService
+
+    img = renderer.background.copy().convert('RGBA')
+    if renderer.theme_mask is not None:
+        img.paste(renderer.theme_mask, renderer.theme_mask_position, renderer.theme_mask)
+    img = img.convert('RGB')
+    draw = ImageDraw.Draw(img)
+    for cfg in renderer.config.values():
+        if 'text' in cfg:
+            text = cfg['text']
+        else:
+            text = SystemService.format_metric(
+                cfg['metric'], metrics[cfg['metric']], 0, 0, renderer.temp_unit)
+        font = renderer.get_font(cfg['font']['size'])
+        draw.text((cfg['x'], cfg['y']), text, fill=cfg['color'], font=font, anchor='mm')
+    return img
+
+
+class TestIncrementalCompositor(unittest.TestCase):
+
+    def setUp(self):
+        self.renderer = OverlayRenderer()
+        self.renderer.set_background(Image.effect_noise((320, 320), 40).convert('RGB'))
+        self.renderer.set_theme_mask(Image.new('RGBA', (320, 60), (0, 0, 80, 160)))
+        self.renderer.set_config({
+            'cpu_temp': {'x': 80, 'y': 60, 'metric': 'cpu_temp',
+                         'color': '#FF8000', 'font': {'size': 28}},
+            'gpu_temp': {'x': 100, 'y': 70, 'metric': 'gpu_temp',  # overlaps cpu_temp
+                         'color': '#00FF80', 'font': {'size': 28}},
+            'cpu_percent': {'x': 240, 'y': 60, 'metric': 'cpu_percent',
+                            'color': '#FFFFFF', 'font': {'size': 20}},
+            'label': {'x': 160, 'y': 290, 'text': 'CPU',
+                      'color': '#FFFFFF', 'font': {'size': 16}},
+        })
+        self.metrics = {'cpu_temp': 45, 'gpu_temp': 60, 'cpu_percent': 12}
+
+    def test_incremental_matches_full_redraw(self):
+        """Re-blitting changed elements is pixel-identical to a full redraw."""
+        for cpu_temp, gpu_temp in [(45, 60), (45, 60), (46, 60), (46, 71), (99, 8)]:
+            self.metrics.update(cpu_temp=cpu_temp, gpu_temp=gpu_temp)
+            img = self.renderer.render(metrics=self.metrics)
+            self.assertEqual(
+                img.tobytes(),
+                _reference_render(self.renderer, self.metrics).tobytes())
+
+    def test_unchanged_values_report_no_dirty_rects(self):
+        self.renderer.render(metrics=self.metrics)
+        self.assertEqual(self.renderer.dirty_rects, [(0, 0, 320, 320)])
+        self.renderer.render(metrics=dict(self.metrics))
+        self.assertEqual(self.renderer.dirty_rects, [])
+
+    def test_changed_value_dirties_only_its_box(self):
+        self.renderer.render(metrics=self.metrics)
+        self.renderer.render(metrics={**self.metrics, 'cpu_percent': 13})
+        self.assertEqual(len(self.renderer.dirty_rects), 2)  # old + new box
+        for left, top, right, bottom in self.renderer.dirty_rects:
+            self.assertLess(right - left, 100)
+            self.assertLess(bottom - top, 60)
+
+    def test_glyphs_cached_per_text_and_font(self):
+        self.renderer.render(metrics=self.metrics)
+        glyphs = len(self.renderer._glyphs)
+        self.renderer.set_config({
+            k: {**v, 'color': '#123456'} for k, v in self.renderer.config.items()})
+        self.renderer.render(metrics=self.metrics)
+        self.assertEqual(len(self.renderer._glyphs), glyphs)  # color-independent
+
+    def test_new_background_rebuilds_base(self):
+        self.renderer.render(metrics=self.metrics)
+        self.renderer.set_background(Image.new('RGB', (320, 320), 'red'))
+        img = self.renderer.render(metrics=self.metrics)
+        self.assertEqual(self.renderer.dirty_rects, [(0, 0, 320, 320)])
+        self.assertEqual(img.tobytes(),
+                         _reference_render(self.renderer, self.metrics).tobytes())
+
+    def test_returned_image_not_mutated_by_later_render(self):
+        first = self.renderer.render(metrics=self.metrics)
+        snapshot = first.tobytes()
+        self.renderer.render(metrics={**self.metrics, 'cpu_temp': 80})
+        self.assertEqual(first.tobytes(), snapshot)
+
+
+# ── cached scaled / premultiplied mask ───────────────────────────────────────
+
+def _legacy_mask_base(background, mask, position, scale):
+    """Per-frame LANCZOS resize + RGBA paste — the pre-cache mask path."""
+    img = background.copy().convert('RGBA')
+    if abs(scale - 1.0) > 0.01:
+        scaled = mask.resize((int(mask.width * scale), int(mask.height * scale)),
+                             Image.Resampling.LANCZOS)
+        img.paste(scaled, (int(position[0] * scale), int(position[1] * scale)), scaled)
+    else:
+        img.paste(mask, position, mask)
+    return img.convert('RGB')
+
+
+class TestCachedMask(unittest.TestCase):
+
+    def _mask(self, size):
+        rgb = Image.effect_noise(size, 80).convert('RGB')
+        alpha = Image.linear_gradient('L').resize(size)
+        mask = rgb.copy()
+        mask.putalpha(alpha)
+        return mask
+
+    def test_pixel_identical_to_legacy_paste(self):
+        cases = [
+            ((320, 320), (320, 320), (0, 220)),    # unscaled
+            ((480, 480), (320, 320), (0, 220)),    # upscaled
+            ((240, 240), (320, 320), (10, 200)),   # downscaled
+            ((320, 320), (320, 320), (-40, 290)),  # hangs off two edges
+        ]
+        for size, config_res, position in cases:
+            with self.subTest(size=size, position=position):
+                renderer = OverlayRenderer(*size)
+                renderer.set_config_resolution(*config_res)
+                background = Image.effect_noise(size, 50).convert('RGB')
+                mask = self._mask((320, 100))
+                renderer.set_background(background)
+                renderer.set_theme_mask(mask, position=position)
+                expected = _legacy_mask_base(
+                    background, renderer.theme_mask, position,
+                    renderer._get_scale_factor())
+                self.assertEqual(renderer.render().tobytes(), expected.tobytes())
+
+    def test_non_rgb_background_matches(self):
+        renderer = OverlayRenderer()
+        background = Image.effect_noise((320, 320), 50)  # mode L
+        renderer.set_background(background)
+        renderer.set_theme_mask(self._mask((320, 80)))
+        expected = _legacy_mask_base(background, renderer.theme_mask,
+                                     renderer.theme_mask_position, 1.0)
+        self.assertEqual(renderer.render().tobytes(), expected.tobytes())
+
+    def test_mask_resized_once_across_frames(self):
+        renderer = OverlayRenderer(480, 480)
+        renderer.set_config_resolution(320, 320)
+        mask = self._mask((320, 100))
+        with patch.object(mask, 'resize', wraps=mask.resize) as resize:
+            renderer.set_theme_mask(mask, position=(0, 220))
+            for color in ('red', 'green', 'blue'):
+                renderer.render(Image.new('RGB', (480, 480), color))
+        self.assertEqual(resize.call_count, 1)
+
+    def test_scale_change_rebuilds_mask(self):
+        renderer = OverlayRenderer(480, 480)
+        renderer.set_theme_mask(self._mask((320, 100)), position=(0, 220))
+        renderer.set_background(Image.new('RGB', (480, 480), 'blue'))
+        renderer.render()
+        renderer.set_config_resolution(320, 320)
+        background = Image.new('RGB', (480, 480), 'navy')
+        img = renderer.render(background)
+        expected = _legacy_mask_base(background, renderer.theme_mask, (0, 220), 1.5)
+        self.assertEqual(img.tobytes(), expected.tobytes())
+
+
+
+# ── graph elements ───────────────────────────────────────────────────────────
+
+class TestMetricGraph(unittest.TestCase):
+
+    def _history(self, values, start=1000):
+        history = MetricHistory(tiers=((1.0, 120),))
+        for i, v in enumerate(values):
+            history.record({'cpu_temp': v}, now=float(start + i))
+        return history
+
+    def test_incremental_matches_full_redraw(self):
+        """Shifting + drawing new columns equals drawing the window from scratch."""
+        for style in MetricGraph.STYLES:
+            history = MetricHistory(tiers=((1.0, 120),))
+            graph = MetricGraph('cpu_temp', style, 40, 20, lo=0, hi=100)
+            for i in range(60):
+                history.record({'cpu_temp': (i * 37) % 100}, now=1000.0 + i)
+                if i % 3 == 0:
+                    history.record({'cpu_temp': 50}, now=1000.5 + i)  # in-place average
+                graph.update(history)
+                fresh = MetricGraph('cpu_temp', style, 40, 20, lo=0, hi=100)
+                fresh.update(history)
+                self.assertTrue((graph.mask == fresh.mask).all(), (style, i))
+            self.assertEqual(graph.full_redraws, 1)
+
+    def test_batched_points_shift_once(self):
+        graph = MetricGraph('cpu_temp', 'sparkline', 30, 10, lo=0, hi=100)
+        history = self._history([10, 20])
+        graph.update(history)
+        for t in range(1002, 1007):
+            history.record({'cpu_temp': t - 950}, now=float(t))
+        graph.update(history)
+        fresh = MetricGraph('cpu_temp', 'sparkline', 30, 10, lo=0, hi=100)
+        fresh.update(history)
+        self.assertTrue((graph.mask == fresh.mask).all())
+        self.assertEqual(graph.full_redraws, 1)
+
+    def test_no_new_points_is_noop(self):
+        history = self._history([10, 20])
+        graph = MetricGraph('cpu_temp', 'bar', 30, 10)
+        self.assertTrue(graph.update(history))
+        version = graph.version
+        self.assertFalse(graph.update(history))
+        self.assertEqual(graph.version, version)
+
+    def test_auto_scale_redraws_on_new_peak(self):
+        history = self._history([10, 20])
+        graph = MetricGraph('cpu_temp', 'area', 30, 10)
+        graph.update(history)
+        self.assertEqual(graph._range, (0.0, 20.0))
+        history.record({'cpu_temp': 70}, now=1010.0)
+        graph.update(history)
+        self.assertEqual(graph._range, (0.0, 100.0))
+        self.assertEqual(graph.full_redraws, 2)
+
+    def test_styles(self):
+        history = self._history([100, 100])
+        bar = MetricGraph('cpu_temp', 'bar', 6, 4, lo=0, hi=100)
+        bar.update(history)
+        self.assertEqual(bar.mask[:, 3:].tolist(), [[255, 255, 0]] * 4)  # 1 px gap
+        area = MetricGraph('cpu_temp', 'area', 2, 4, lo=0, hi=200)
+        area.update(history)
+        self.assertEqual(area.mask[:, 1].tolist(), [0, 0, 255, MetricGraph.AREA_FILL])
+        with self.assertRaises(ValueError):
+            MetricGraph('cpu_temp', 'pie', 10, 10)
+
+
+class TestGraphElements(unittest.TestCase):
+
+    def setUp(self):
+        self.renderer = OverlayRenderer()
+        self.renderer.set_background(Image.new('RGB', (320, 320), 'black'))
+        self.renderer.set_config({
+            'cpu_graph': {'graph': 'sparkline', 'metric': 'cpu_temp', 'x': 10, 'y': 200,
+                          'width': 100, 'height': 40, 'min': 0, 'max': 100,
+                          'color': '#00FF00'},
+            'label': {'x': 160, 'y': 40, 'text': 'CPU',
+                      'color': '#FFFFFF', 'font': {'size': 16}},
+        })
+        self.history = MetricHistory(tiers=((1.0, 300),))
+        self.renderer.history = self.history
+
+    def test_graph_drawn_in_its_box(self):
+        self.history.record({'cpu_temp': 50}, now=1000.0)
+        img = self.renderer.render()
+        pixels = [img.getpixel((109, y)) for y in range(200, 240)]
+        self.assertIn((0, 255, 0), pixels)
+        self.assertEqual(img.getpixel((5, 220)), (0, 0, 0))
+
+    def test_new_point_dirties_only_graph(self):
+        self.history.record({'cpu_temp': 50}, now=1000.0)
+        self.renderer.render()
+        self.renderer.render()
+        self.assertEqual(self.renderer.dirty_rects, [])
+        self.history.record({'cpu_temp': 60}, now=1001.0)
+        self.renderer.render()
+        self.assertEqual(self.renderer.dirty_rects, [(10, 200, 110, 240)] * 2)
+
+    def test_hidden_until_history_has_points(self):
+        self.renderer.render()
+        self.assertIsNone(self.renderer._drawn[0])
+
+    def test_private_history_without_shared_one(self):
+        self.renderer.history = None
+        self.renderer.update_metrics({'cpu_temp': 42, 'gpu_temp': 50})
+        self.assertEqual(self.renderer._graph_history().keys(), ['cpu_temp'])
+        self.renderer.render()
+        self.assertIsNotNone(self.renderer._drawn[0])
+
+    def test_required_metrics_include_graphs(self):
+        self.assertEqual(self.renderer.required_metrics(), {'cpu_temp'})
+
+
 if __name__ == '__main__':
     unittest.main()
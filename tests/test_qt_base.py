@@ -16,6 +16,7 @@ Tests cover:
 
 import os
 import sys
+import tempfile
 import unittest
 
 # Must set before ANY Qt import
@@ -29,7 +30,7 @@ _app = QApplication.instance() or QApplication(sys.argv)
 from PIL import Image  # noqa: E402
 from PySide6.QtGui import QPixmap  # noqa: E402
 
-from trcc.core.models import ThemeItem  # noqa: E402
+from trcc.core.models import LocalThemeItem, ThemeItem  # noqa: E402
 from trcc.qt_components.base import (  # noqa: E402
     BasePanel,
     BaseThumbnail,
@@ -230,6 +231,31 @@ class TestBaseThumbnail(unittest.TestCase):
         self.assertEqual(len(received), 1)
         self.assertEqual(received[0].name, 'Clicked')
 
+    def _themed_thumb(self, tmp):
+        path = os.path.join(tmp, 'Theme.png')
+        Image.new('RGB', (320, 320), (0, 0, 255)).save(path)
+        return BaseThumbnail(LocalThemeItem(name='T', thumbnail=path))
+
+    def test_thumbnail_loads_on_first_paint(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            thumb = self._themed_thumb(tmp)
+            self.assertTrue(thumb.thumb_label.pixmap().isNull())  # Not painted yet
+            thumb.grab()
+            pix = thumb.thumb_label.pixmap()
+            self.assertEqual(pix.width(), Sizes.THUMB_IMAGE)
+            self.assertEqual(pix.toImage().pixelColor(60, 60).blue(), 255)
+
+    def test_thumbnail_from_atlas(self):
+        from trcc.thumbnail_cache import ThumbnailAtlas
+        with tempfile.TemporaryDirectory() as tmp:
+            thumb = self._themed_thumb(tmp)
+            thumb.atlas = ThumbnailAtlas('test', cache_dir=os.path.join(tmp, 'cache'))
+            thumb.atlas.load(thumb.item_info.thumbnail)
+            thumb.grab()
+            self.assertEqual(thumb.atlas.hits, 1)
+            self.assertEqual(thumb.thumb_label.pixmap().toImage().pixelColor(60, 60).blue(), 255)
+            thumb.atlas.close()
+
 
 class TestCreateImageButton(unittest.TestCase):
     """Test create_image_button factory."""
@@ -3,14 +3,17 @@ from __future__ import annotations
 
 import unittest
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from PIL import Image
 
 from trcc.services.device import DeviceService
-from trcc.services.image import ImageService
-from trcc.services.media import MediaService
+from trcc.services.display import DisplayService, FrameCache
+from trcc.services.history import MetricHistory, RingBuffer
+from trcc.services.image import ImageService, JpegEncoder, Rgb565Encoder
+from trcc.services.media import FramePacer, MediaService
 from trcc.services.overlay import OverlayService
+from trcc.services.pipeline import FramePipeline, Mailbox, PipelineFrame
 from trcc.services.theme import ThemeData, ThemeService
 
 # =============================================================================
@@ -78,6 +81,68 @@ class TestImageServiceRgb565(unittest.TestCase):
         self.assertEqual(len(data), 2 * 2 * 2)
 
 
+class TestRgb565Encoder(unittest.TestCase):
+    """Test the reusable-buffer RGB565 encoder."""
+
+    @staticmethod
+    def _reference(img, byte_order):
+        import numpy as np
+        arr = np.array(img, dtype=np.uint16)
+        r = (arr[:, :, 0] >> 3) & 0x1F
+        g = (arr[:, :, 1] >> 2) & 0x3F
+        b = (arr[:, :, 2] >> 3) & 0x1F
+        return ((r << 11) | (g << 5) | b).astype(f'{byte_order}u2').tobytes()
+
+    def _noise(self, w, h):
+        import numpy as np
+        rng = np.random.default_rng(565)
+        return Image.fromarray(rng.integers(0, 256, (h, w, 3), dtype=np.uint8))
+
+    def test_matches_reference_both_orders(self):
+        img = self._noise(37, 21)
+        for order in ('>', '<'):
+            enc = Rgb565Encoder(37, 21, order)
+            self.assertEqual(bytes(enc.encode(img)), self._reference(img, order))
+
+    def test_returns_view_over_reused_buffer(self):
+        enc = Rgb565Encoder(4, 4)
+        first = enc.encode(Image.new('RGB', (4, 4), (255, 0, 0)))
+        second = enc.encode(Image.new('RGB', (4, 4), (0, 0, 255)))
+        self.assertIsInstance(first, memoryview)
+        self.assertEqual(len(second), enc.nbytes)
+        # Same underlying buffer: the first view now shows the second frame
+        self.assertEqual(bytes(first), bytes(second))
+
+    def test_size_mismatch_raises(self):
+        enc = Rgb565Encoder(4, 4)
+        with self.assertRaises(ValueError):
+            enc.encode(Image.new('RGB', (5, 4)))
+
+    def test_bad_byte_order_raises(self):
+        with self.assertRaises(ValueError):
+            Rgb565Encoder(4, 4, '=')
+
+    def test_service_caches_encoder_per_key(self):
+        a = ImageService.rgb565_encoder(8, 8, '>')
+        self.assertIs(ImageService.rgb565_encoder(8, 8, '>'), a)
+        self.assertIsNot(ImageService.rgb565_encoder(8, 8, '<'), a)
+
+    def test_encoder_cache_is_per_thread(self):
+        import threading
+        main = ImageService.rgb565_encoder(8, 8, '>')
+        other = []
+        t = threading.Thread(
+            target=lambda: other.append(ImageService.rgb565_encoder(8, 8, '>')))
+        t.start()
+        t.join()
+        self.assertIsNot(other[0], main)
+
+    def test_to_rgb565_returns_independent_bytes(self):
+        red = ImageService.to_rgb565(Image.new('RGB', (2, 2), (255, 0, 0)))
+        ImageService.to_rgb565(Image.new('RGB', (2, 2), (0, 0, 255)))
+        self.assertEqual(red, b'\xf8\x00' * 4)
+
+
 class TestImageServiceRotation(unittest.TestCase):
     """Test image rotation."""
 
@@ -185,6 +250,74 @@ class TestImageServiceToJpeg(unittest.TestCase):
         self.assertLess(len(jpeg), len(rgb565))
 
 
+def _noisy(seed: int, size=(96, 96)) -> Image.Image:
+    import numpy as np
+    rng = np.random.default_rng(seed)
+    return Image.fromarray(rng.integers(0, 256, (size[1], size[0], 3), dtype=np.uint8))
+
+
+def _legacy_quality(img, max_size):
+    """Quality the C# CompressionImage() loop settles on."""
+    import io
+    for q in range(95, 4, -5):
+        buf = io.BytesIO()
+        img.save(buf, format='JPEG', quality=q)
+        if buf.tell() < max_size:
+            return q
+    return 5
+
+
+class TestJpegEncoder(unittest.TestCase):
+    """Rate-controlled quality selection."""
+
+    def setUp(self):
+        self.enc = JpegEncoder(use_simplejpeg=False)
+
+    def test_first_frame_matches_legacy_quality(self):
+        img = _noisy(0)
+        for cap in (30_000, 8_000, 5_000):
+            enc = JpegEncoder(use_simplejpeg=False)
+            data = enc.encode(img, max_size=cap)
+            self.assertLess(len(data), cap)
+            self.assertEqual(enc.quality, _legacy_quality(img, cap))
+            self.assertLessEqual(enc.encodes, 6)  # Binary search, not 19 steps
+
+    def test_similar_frames_encode_once(self):
+        self.enc.encode(_noisy(0), max_size=6_000)
+        before = self.enc.encodes
+        for seed in range(1, 6):
+            self.enc.encode(_noisy(seed), max_size=6_000)
+        self.assertEqual(self.enc.encodes - before, 5)
+
+    def test_probes_up_after_simpler_frame(self):
+        self.enc.encode(_noisy(0), max_size=6_000)
+        low = self.enc.quality
+        flat = Image.new('RGB', (96, 96), (40, 80, 120))
+        self.enc.encode(flat, max_size=6_000)  # Fits easily at the same quality
+        self.assertEqual(self.enc.quality, low)
+        self.enc.encode(flat, max_size=6_000)
+        self.assertEqual(self.enc.quality, low + 5)
+
+    def test_nothing_fits_falls_back_to_min_quality(self):
+        data = self.enc.encode(_noisy(0), max_size=1)
+        self.assertEqual(self.enc.quality, 5)
+        self.assertEqual(data[:2], b'\xff\xd8')
+
+    def test_simplejpeg_backend(self):
+        from unittest.mock import MagicMock
+        fake = MagicMock()
+        fake.encode_jpeg.return_value = b'\xff\xd8jpeg'
+        with patch('trcc.services.image.SIMPLEJPEG_AVAILABLE', True), \
+             patch('trcc.services.image.simplejpeg', fake):
+            data = JpegEncoder(use_simplejpeg=True).encode(Image.new('RGB', (8, 8)))
+        self.assertEqual(data, b'\xff\xd8jpeg')
+        self.assertEqual(fake.encode_jpeg.call_args.kwargs['quality'], 95)
+
+    def test_to_jpeg_reuses_thread_encoder(self):
+        self.assertIs(ImageService.jpeg_encoder(64, 48),
+                      ImageService.jpeg_encoder(64, 48))
+
+
 class TestDeviceServiceSendPilBulk(unittest.TestCase):
     """Test that send_pil routes bulk devices through JPEG encoding."""
 
@@ -253,6 +386,231 @@ class TestDeviceService(unittest.TestCase):
         svc = DeviceService()
         self.assertFalse(svc.is_busy)
 
+    def test_send_seconds_averages_successful_sends(self):
+        from trcc.core.models import DeviceInfo
+        svc = DeviceService()
+        svc.select(DeviceInfo(name='test', path='/dev/sg0'))
+        protocol = type('P', (), {'send_image': lambda *a: True})()
+        times = iter([0.0, 0.10, 1.0, 1.05])
+        with patch('trcc.device_factory.DeviceProtocolFactory.get_protocol',
+                   return_value=protocol), \
+             patch('trcc.services.device.time.perf_counter',
+                   side_effect=lambda: next(times)):
+            self.assertEqual(svc.send_seconds, 0.0)
+            svc.send_rgb565(b'x', 1, 1)
+            self.assertAlmostEqual(svc.send_seconds, 0.10)
+            svc.send_rgb565(b'y', 1, 1)
+        self.assertAlmostEqual(svc.send_seconds, 0.09)
+
+    def _counting_protocol(self, result=True):
+        sent = []
+        protocol = type('P', (), {
+            'send_image': lambda _self, data, w, h: sent.append(bytes(data)) or result})()
+        patcher = patch('trcc.device_factory.DeviceProtocolFactory.get_protocol',
+                        return_value=protocol)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return sent
+
+    def test_unchanged_frame_suppressed(self):
+        from trcc.core.models import DeviceInfo
+        svc = DeviceService()
+        svc.select(DeviceInfo(name='test', path='/dev/sg0'))
+        sent = self._counting_protocol()
+        self.assertTrue(svc.send_rgb565(b'frame', 1, 1))
+        self.assertTrue(svc.send_rgb565(bytearray(b'frame'), 1, 1))
+        self.assertTrue(svc.send_rgb565(b'other', 1, 1))
+        self.assertEqual(sent, [b'frame', b'other'])
+        self.assertEqual((svc.dedup.sent, svc.dedup.suppressed), (2, 1))
+
+    def test_unchanged_frame_resent_after_keepalive(self):
+        from trcc.core.models import DeviceInfo
+        svc = DeviceService()
+        svc.select(DeviceInfo(name='test', path='/dev/sg0'))
+        sent = self._counting_protocol()
+        with patch('trcc.services.device.time.monotonic', side_effect=[100.0, 102.0, 106.0]):
+            for _ in range(3):
+                svc.send_rgb565(b'frame', 1, 1)
+        self.assertEqual(len(sent), 2)  # 0 s sent, 2 s suppressed, 6 s keepalive
+
+    def test_failed_send_not_remembered(self):
+        from trcc.core.models import DeviceInfo
+        svc = DeviceService()
+        svc.select(DeviceInfo(name='test', path='/dev/sg0'))
+        sent = self._counting_protocol(result=False)
+        svc.send_rgb565(b'frame', 1, 1)
+        svc.send_rgb565(b'frame', 1, 1)
+        self.assertEqual(len(sent), 2)
+        self.assertEqual(svc.dedup.suppressed, 0)
+
+    def test_dedup_per_device_and_reset_on_select(self):
+        from trcc.core.models import DeviceInfo
+        svc = DeviceService()
+        a = DeviceInfo(name='a', path='/dev/sg0')
+        b = DeviceInfo(name='b', path='/dev/sg1')
+        sent = self._counting_protocol()
+        svc.select(a)
+        svc.send_rgb565(b'frame', 1, 1)
+        svc._selected = b
+        svc.send_rgb565(b'frame', 1, 1)   # Other device: sent
+        svc.select(a)
+        svc.send_rgb565(b'frame', 1, 1)   # Reselected: sent again
+        self.assertEqual(len(sent), 3)
+
+    def test_dedup_disabled_by_zero_keepalive(self):
+        from trcc.core.models import DeviceInfo
+        with patch('trcc.conf.Settings.get_frame_keepalive', return_value=0.0):
+            svc = DeviceService()
+        svc.select(DeviceInfo(name='test', path='/dev/sg0'))
+        sent = self._counting_protocol()
+        svc.send_rgb565(b'frame', 1, 1)
+        svc.send_rgb565(b'frame', 1, 1)
+        self.assertEqual(len(sent), 2)
+
+
+# =============================================================================
+# FramePipeline
+# =============================================================================
+
+
+class TestMailbox(unittest.TestCase):
+
+    def test_latest_wins(self):
+        box = Mailbox()
+        self.assertFalse(box.put(1))
+        self.assertTrue(box.put(2))   # 1 coalesced
+        self.assertEqual(box.get(), 2)
+
+    def test_close_wakes_consumer(self):
+        import threading
+        box = Mailbox()
+        got = []
+        t = threading.Thread(target=lambda: got.append(box.get()))
+        t.start()
+        self.assertFalse(box.close())
+        t.join(1)
+        self.assertFalse(t.is_alive())
+        self.assertFalse(box.put(3))  # Discarded after close
+
+
+class TestFramePipeline(unittest.TestCase):
+
+    def setUp(self):
+        import threading
+        self.sent: list[bytes] = []
+        self.gate = threading.Event()
+        self.gate.set()
+        self.in_transmit = threading.Event()
+        self.ok = True
+
+        def transmit(data, w, h):
+            self.in_transmit.set()
+            self.gate.wait(2)
+            self.sent.append(data)
+            return self.ok
+
+        self.pipeline = FramePipeline(transmit, name='test-pipeline')
+
+    def tearDown(self):
+        self.gate.set()
+        self.pipeline.stop()
+
+    def test_encoded_frame_sent(self):
+        self.pipeline.submit_encoded(b'abc', 1, 1)
+        self.assertTrue(self.pipeline.wait_idle(2))
+        self.assertEqual(self.sent, [b'abc'])
+        self.assertEqual(self.pipeline.stats.sent, 1)
+
+    def test_render_encode_send(self):
+        self.pipeline.submit_render(
+            lambda: PipelineFrame(1, 1, encode=lambda: b'encoded'))
+        self.assertTrue(self.pipeline.wait_idle(2))
+        self.assertEqual(self.sent, [b'encoded'])
+
+    def test_render_returning_none_sends_nothing(self):
+        self.pipeline.submit_render(lambda: None)
+        self.assertTrue(self.pipeline.wait_idle(2))
+        self.assertEqual(self.sent, [])
+        self.assertEqual(self.pipeline.stats.dropped, 0)
+
+    def test_slow_transmit_coalesces_to_latest(self):
+        self.gate.clear()
+        self.pipeline.submit_encoded(b'0', 1, 1)
+        # Wait until frame 0 is inside transmit, then pile up newer frames
+        self.assertTrue(self.in_transmit.wait(2))
+        for i in range(1, 5):
+            self.pipeline.submit_encoded(str(i).encode(), 1, 1)
+        self.gate.set()
+        self.assertTrue(self.pipeline.wait_idle(2))
+        self.assertEqual(self.sent, [b'0', b'4'])
+        stats = self.pipeline.stats
+        self.assertEqual((stats.submitted, stats.sent, stats.coalesced), (5, 2, 3))
+
+    def test_encode_overlaps_transmit(self):
+        import threading
+        self.gate.clear()
+        encoded = threading.Event()
+        self.pipeline.submit_encoded(b'0', 1, 1)
+        self.assertTrue(self.in_transmit.wait(2))
+
+        def encode():
+            encoded.set()
+            return b'1'
+
+        self.pipeline.submit_frame(PipelineFrame(1, 1, encode=encode))
+        # Frame 1 encodes while frame 0 is still blocked in transmit
+        self.assertTrue(encoded.wait(2))
+        self.gate.set()
+        self.assertTrue(self.pipeline.wait_idle(2))
+        self.assertEqual(self.sent, [b'0', b'1'])
+
+    def test_failures_counted_as_dropped(self):
+        self.ok = False
+        self.pipeline.submit_encoded(b'x', 1, 1)
+
+        def boom():
+            raise RuntimeError("render failed")
+
+        self.pipeline.submit_render(boom)
+        self.assertTrue(self.pipeline.wait_idle(2))
+        self.assertEqual(self.pipeline.stats.dropped, 2)
+        self.assertEqual(self.pipeline.stats.sent, 0)
+
+    def test_stop_joins_threads(self):
+        self.pipeline.submit_encoded(b'x', 1, 1)
+        self.pipeline.wait_idle(2)
+        threads = list(self.pipeline._threads)
+        self.pipeline.stop()
+        self.assertFalse(self.pipeline.running)
+        self.assertFalse(any(t.is_alive() for t in threads))
+
+
+class TestDeviceServiceAsync(unittest.TestCase):
+    """send_*_async go through one long-lived pipeline, not a thread per frame."""
+
+    def test_async_sends_reuse_pipeline(self):
+        svc = DeviceService()
+        with patch.object(svc, 'send_rgb565', return_value=True) as mock_send:
+            svc.send_rgb565_async(b'a', 1, 1)
+            svc.pipeline.wait_idle(2)
+            threads = list(svc.pipeline._threads)
+            svc.send_rgb565_async(b'b', 1, 1)
+            svc.pipeline.wait_idle(2)
+        self.assertEqual(svc.pipeline._threads, threads)
+        self.assertEqual([c.args[0] for c in mock_send.call_args_list], [b'a', b'b'])
+        svc.close()
+
+    def test_send_pil_async_encodes_off_thread(self):
+        from trcc.core.models import DeviceInfo
+        svc = DeviceService()
+        svc.select(DeviceInfo(name='scsi', path='/dev/sg0', protocol='scsi',
+                              resolution=(320, 320)))
+        with patch.object(svc, 'send_rgb565', return_value=True) as mock_send:
+            svc.send_pil_async(Image.new('RGB', (320, 320), 'red'), 320, 320)
+            svc.pipeline.wait_idle(2)
+        self.assertEqual(len(mock_send.call_args[0][0]), 320 * 320 * 2)
+        svc.close()
+
 
 # =============================================================================
 # MediaService
@@ -293,6 +651,358 @@ class TestMediaService(unittest.TestCase):
         self.assertFalse(should_send)
         self.assertIsNone(progress)
 
+    def test_load_closes_previous_decoder(self):
+        first, second = MagicMock(frame_count=2, fps=16), MagicMock(frame_count=2, fps=16)
+        svc = MediaService()
+        with patch('trcc.media_player.VideoDecoder', side_effect=[first, second]):
+            self.assertTrue(svc.load(Path('/tmp/a.mp4'), stream=False))
+            self.assertTrue(svc.load(Path('/tmp/b.mp4'), stream=False))
+        first.close.assert_called_once()
+        second.close.assert_not_called()
+
+
+class _Clock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestFramePacer(unittest.TestCase):
+    """Absolute deadlines, drop/hold decisions and stats."""
+
+    def setUp(self):
+        self.clock = _Clock()
+        self.pacer = FramePacer(self.clock)
+        self.pacer.reset()
+
+    def test_deadlines_do_not_drift(self):
+        for _ in range(10):
+            self.clock.now += 0.013  # Late tick: next deadline is unaffected
+            self.pacer.present(self.clock.now, 0.1)
+            self.clock.now = self.pacer.next_deadline - 0.013
+        self.assertAlmostEqual(self.pacer.next_deadline, 101.0)
+
+    def test_due_allows_small_early_tick(self):
+        self.assertTrue(self.pacer.due(100.0, 0.1))
+        self.pacer.present(100.0, 0.1)
+        self.assertTrue(self.pacer.due(100.08, 0.1))
+        self.assertFalse(self.pacer.due(100.05, 0.1))
+
+    def test_behind_when_next_frame_also_due(self):
+        self.assertFalse(self.pacer.behind(100.05, 0.1))
+        self.assertTrue(self.pacer.behind(100.1, 0.1))
+
+    def test_stats(self):
+        for i in range(5):
+            self.pacer.present(100.0 + i * 0.1 + 0.002, 0.1)
+        stats = self.pacer.stats
+        self.assertEqual(stats.presented, 5)
+        self.assertAlmostEqual(stats.fps, 10.0)
+        self.assertAlmostEqual(stats.jitter_ms, 2.0)
+        self.assertIn('10.0 fps', str(stats))
+
+
+class TestMediaServicePaced(unittest.TestCase):
+    """tick() follows the clock when paced."""
+
+    def setUp(self):
+        self.clock = _Clock()
+        self.svc = MediaService()
+        self.svc.paced = True
+        self.svc._pacer = FramePacer(self.clock)
+        self.svc._frames = [Image.new('RGB', (1, 1), (i, 0, 0)) for i in range(10)]
+        self.svc._state.total_frames = 10
+        self.svc._state.fps = 10
+        self.svc.play()
+
+    def _tick(self, at: float):
+        self.clock.now = at
+        frame, send, _ = self.svc.tick()
+        return (None if frame is None else frame.getpixel((0, 0))[0]), send
+
+    def test_on_time_ticks_show_every_frame(self):
+        shown = [self._tick(100.0 + i * 0.1)[0] for i in range(5)]
+        self.assertEqual(shown, [0, 1, 2, 3, 4])
+
+    def test_early_tick_holds_frame(self):
+        self._tick(100.0)
+        self.assertEqual(self._tick(100.03), (None, False))
+        self.assertEqual(self._tick(100.1)[0], 1)
+        self.assertEqual(self.svc.pacing.duplicated, 1)
+
+    def test_late_tick_drops_missed_frames(self):
+        self._tick(100.0)
+        self.assertEqual(self._tick(100.35)[0], 3)
+        self.assertEqual(self.svc.pacing.dropped, 2)
+        self.assertEqual(self._tick(100.4)[0], 4)  # Back on the timeline
+
+    def test_long_stall_resyncs(self):
+        self._tick(100.0)
+        self.assertEqual(self._tick(105.0)[0], 1)
+        self.assertEqual(self.svc.pacing.dropped, 0)
+
+    def test_zt_delays_set_deadlines(self):
+        self.svc._delays = [100, 300, 100] + [100] * 7
+        self.svc.play()
+        self._tick(100.0)
+        self._tick(100.1)
+        self.assertEqual(self._tick(100.2), (None, False))
+        self.assertEqual(self._tick(100.4)[0], 2)
+        self.assertEqual(self.svc.tick_interval_ms, 100)
+
+    def test_slow_transport_skips_sends(self):
+        self.svc.send_cost_s = 0.25
+        sends = [self._tick(100.0 + i * 0.1)[1] for i in range(6)]
+        self.assertEqual(sends, [True, False, False, True, False, False])
+
+    def test_unpaced_tick_ignores_clock(self):
+        self.svc.paced = False
+        shown = [self._tick(100.0)[0] for _ in range(3)]
+        self.assertEqual(shown, [0, 1, 2])
+
+
+# =============================================================================
+# DisplayService frame cache
+# =============================================================================
+
+
+class TestFrameCache(unittest.TestCase):
+    """Byte-budgeted LRU of device-ready frames."""
+
+    def test_get_put_and_counters(self):
+        cache = FrameCache(1024)
+        self.assertIsNone(cache.get(0))
+        cache.put(0, None, b'\x01' * 10)
+        self.assertEqual(cache.get(0), (None, b'\x01' * 10))
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual(cache.nbytes, 10)
+
+    def test_lru_eviction_under_budget(self):
+        cache = FrameCache(30)
+        for i in range(3):
+            cache.put(i, None, bytes(10))
+        cache.get(0)                  # 1 is now least recently used
+        cache.put(3, None, bytes(10))
+        self.assertIsNone(cache.get(1))
+        self.assertIsNotNone(cache.get(0))
+        self.assertEqual(cache.nbytes, 30)
+
+    def test_preview_counts_toward_budget(self):
+        cache = FrameCache(10 * 10 * 3 + 4)
+        cache.put(0, Image.new('RGB', (10, 10)), bytes(4))
+        self.assertEqual(len(cache), 1)
+        cache.put(1, Image.new('RGB', (10, 10)), bytes(4))
+        self.assertEqual(len(cache), 1)
+        self.assertIsNone(cache.get(0))
+
+    def test_oversized_entry_skipped(self):
+        cache = FrameCache(8)
+        cache.put(0, None, bytes(9))
+        self.assertEqual(len(cache), 0)
+
+    def test_bind_new_context_invalidates(self):
+        cache = FrameCache(1024)
+        cache.bind(('a', 0))
+        cache.put(0, None, b'x')
+        cache.bind(('a', 0))
+        self.assertEqual(len(cache), 1)
+        cache.bind(('a', 90))
+        self.assertEqual(len(cache), 0)
+
+
+class TestDisplayServiceFrameCache(unittest.TestCase):
+    """video_tick serves looping frames from the frame cache."""
+
+    def setUp(self):
+        self.media = MediaService()
+        self.display = DisplayService(DeviceService(), OverlayService(), self.media)
+        self.display.frame_cache = FrameCache(16 * 1024 * 1024)
+        self.display.brightness = 100
+        colors = [(255, 0, 0), (0, 255, 0), (0, 0, 255)]
+        self.media._frames = [Image.new('RGB', (320, 320), c) for c in colors]
+        self.media._state.total_frames = len(colors)
+        self.media._source_path = Path('/tmp/clip.zt')
+        self.media.play()
+
+    def tearDown(self):
+        self.display.cleanup()
+
+    def _loop(self):
+        return [self.display.video_tick() for _ in range(3)]
+
+    def test_second_loop_skips_render_and_encode(self):
+        first = self._loop()
+        with patch.object(self.display, '_encode_for_device') as enc, \
+             patch.object(self.display, '_apply_adjustments') as adj:
+            second = self._loop()
+        enc.assert_not_called()
+        adj.assert_not_called()
+        self.assertEqual([r['rgb565'] for r in first],
+                         [r['rgb565'] for r in second])
+        self.assertEqual(self.display.frame_cache.hits, 3)
+
+    def test_cached_bytes_match_fresh_encode(self):
+        self.display.rotation = 90
+        self.display.brightness = 50
+        self._loop()
+        cached = self._loop()
+        for frame, result in zip(self.media._frames, cached):
+            expected = self.display._encode_for_device(
+                self.display._apply_adjustments(frame))
+            self.assertEqual(result['rgb565'], expected)
+            self.assertEqual(result['preview'].tobytes(),
+                             self.display._apply_adjustments(frame).tobytes())
+
+    def test_adjustment_change_invalidates(self):
+        self._loop()
+        self.display.brightness = 25
+        with patch.object(self.display, '_encode_for_device',
+                          return_value=b'new') as enc:
+            result = self.display.video_tick()
+        enc.assert_called_once()
+        self.assertEqual(result['rgb565'], b'new')
+
+    def test_text_overlay_not_cached(self):
+        self.display.overlay.enabled = True
+        self.display.overlay.config = {'cpu': {'metric': 'cpu_temp', 'x': 10, 'y': 10}}
+        self._loop()
+        self._loop()
+        self.assertEqual(len(self.display.frame_cache), 0)
+
+    def test_mask_overlay_cached_until_mask_changes(self):
+        self.display.overlay.enabled = True
+        self.display.overlay.set_mask(Image.new('RGBA', (320, 40), (9, 9, 9, 255)))
+        self._loop()
+        self.assertEqual(len(self.display.frame_cache), 3)
+        self.display.overlay.set_mask(Image.new('RGBA', (320, 40), (200, 9, 9, 255)))
+        self.display.video_tick()
+        self.assertEqual(len(self.display.frame_cache), 1)
+
+    def test_auto_send_off_does_not_encode(self):
+        self.display.auto_send = False
+        with patch.object(self.display, '_encode_for_device') as enc:
+            results = self._loop()
+        enc.assert_not_called()
+        self.assertTrue(all(r['rgb565'] is None for r in results))
+
+
+class TestDisplayServiceDeviceFrames(unittest.TestCase):
+    """video_tick sends pre-encoded .tdf frames without encoding."""
+
+    def setUp(self):
+        import io
+        import struct
+        import tempfile
+
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = Path(tmp.name)
+        patcher = patch('trcc.device_frames.CACHE_DIR', str(self.tmp / 'cache'))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.source = self.tmp / 'Theme.zt'
+        colors = [(200, 0, 0), (0, 200, 0), (0, 0, 200)]
+        with open(self.source, 'wb') as f:
+            f.write(struct.pack('<Bi', 0xDC, len(colors)))
+            f.write(struct.pack('<3i', 0, 50, 100))
+            for color in colors:
+                buf = io.BytesIO()
+                Image.new('RGB', (320, 320), color).save(buf, format='JPEG')
+                f.write(struct.pack('<i', buf.tell()) + buf.getvalue())
+
+        self.media = MediaService()
+        self.display = DisplayService(DeviceService(), OverlayService(), self.media)
+        self.display.frame_cache = FrameCache(0)
+        self.display.brightness = 50
+        self.display.rotation = 90
+        self.assertTrue(self.media.load(self.source))
+        self.media.play()
+
+    def tearDown(self):
+        self.display.cleanup()
+        self.media.close()
+
+    def _loop(self):
+        return [self.display.video_tick() for _ in range(3)]
+
+    def test_exported_frames_sent_as_views(self):
+        expected = [r['rgb565'] for r in self._loop()]
+        ok, msg = self.display.export_device_frames()
+        self.assertTrue(ok, msg)
+        with patch.object(self.display, '_encode_for_device') as enc:
+            results = self._loop()
+        enc.assert_not_called()
+        for result, data in zip(results, expected):
+            self.assertIsInstance(result['rgb565'], memoryview)
+            self.assertEqual(bytes(result['rgb565']), data)
+        self.assertIsNotNone(results[0]['preview'])
+
+    def test_adjustment_change_falls_back_to_encoding(self):
+        self.display.export_device_frames()
+        self.display.brightness = 100
+        result = self.display.video_tick()
+        self.assertIsInstance(result['rgb565'], bytes)
+
+    def test_export_prunes_cache_to_quota(self):
+        old = self.tmp / 'cache' / 'old.tdf'
+        old.parent.mkdir()
+        old.write_bytes(b'\0' * 4096)
+        with patch('trcc.conf.Settings.get_device_frames_cache_quota', return_value=0):
+            ok, msg = self.display.export_device_frames()
+        self.assertTrue(ok, msg)
+        self.assertFalse(old.exists())
+        self.assertEqual(len(list((self.tmp / 'cache').iterdir())), 1)  # The new export
+
+    def test_first_loop_fills_cache(self):
+        with patch('trcc.conf.Settings.get_device_frames_cache_quota',
+                   return_value=1 << 30):
+            expected = [r['rgb565'] for r in self._loop()]
+            self.assertIsInstance(self.display.video_tick()['rgb565'], bytes)  # Wraps
+            self.display._fill_thread.join(5)
+            results = self._loop()
+        self.assertEqual(len(list((self.tmp / 'cache').iterdir())), 1)
+        for result, data in zip(results, expected[1:] + expected[:1]):
+            self.assertIsInstance(result['rgb565'], memoryview)
+            self.assertEqual(bytes(result['rgb565']), data)
+
+    def test_cache_fill_disabled_by_zero_quota(self):
+        with patch('trcc.conf.Settings.get_device_frames_cache_quota', return_value=0):
+            self._loop()
+            self.display.video_tick()
+        self.assertIsNone(self.display._fill_thread)
+
+    def test_text_overlay_not_exported(self):
+        self.display.overlay.enabled = True
+        self.display.overlay.config = {'cpu': {'metric': 'cpu_temp', 'x': 10, 'y': 10}}
+        ok, _ = self.display.export_device_frames()
+        self.assertFalse(ok)
+
+    def test_export_config_tdf_uses_device_format(self):
+        self.display.current_theme_path = self.tmp
+        path = self.tmp / 'Theme.tdf'
+        ok, msg = self.display.export_config(path)
+        self.assertTrue(ok, msg)
+        self.assertTrue(self.media.load(path))
+        self.assertEqual(self.media._decoder.format.rotation, 90)
+
+    def test_play_tdf_file_directly(self):
+        path = self.tmp / 'Theme.tdf'
+        ok, msg = self.display.export_device_frames(path)
+        self.assertTrue(ok, msg)
+        self.assertTrue(self.media.load(path))
+        self.media.play()
+        self.assertTrue(self.media.is_device_native)
+        with patch.object(self.display, '_apply_adjustments') as adj:
+            result = self.display.video_tick()
+        adj.assert_not_called()
+        self.assertIsInstance(result['rgb565'], memoryview)
+        self.assertEqual(result['preview'].size, (320, 320))
+
 
 # =============================================================================
 # OverlayService
@@ -335,6 +1045,18 @@ class TestOverlayService(unittest.TestCase):
         result = svc.render()
         self.assertIs(result, img)
 
+    def test_required_metrics(self):
+        svc = OverlayService()
+        svc.set_config({
+            'cpu': {'metric': 'cpu_temp', 'x': 0, 'y': 0},
+            'gpu': {'metric': 'gpu_usage', 'enabled': False},
+            'label': {'text': 'CPU', 'metric': 'cpu_freq'},
+            'clock': {'metric': 'time'},
+        })
+        self.assertEqual(svc.required_metrics(), {'cpu_temp', 'time'})
+        svc.clear()
+        self.assertEqual(svc.required_metrics(), set())
+
     def test_dc_data_round_trip(self):
         svc = OverlayService()
         data = {'display_options': {'ui_mode': 1}}
@@ -344,6 +1066,96 @@ class TestOverlayService(unittest.TestCase):
         self.assertIsNone(svc.get_dc_data())
 
 
+# =============================================================================
+# MetricHistory
+# =============================================================================
+
+
+class TestRingBuffer(unittest.TestCase):
+
+    def test_wraps_and_keeps_order(self):
+        buf = RingBuffer(3)
+        for t in range(5):
+            buf.append(float(t), t * 10)
+        times, values = buf.arrays()
+        self.assertEqual(times.tolist(), [2.0, 3.0, 4.0])
+        self.assertEqual(values.tolist(), [20, 30, 40])
+        self.assertEqual(len(buf), 3)
+        self.assertEqual(buf.appended, 5)
+
+    def test_since_and_tail(self):
+        buf = RingBuffer(4)
+        for t in range(6):
+            buf.append(float(t), t)
+        self.assertEqual(buf.arrays(since=3.0)[0].tolist(), [4.0, 5.0])
+        self.assertEqual(buf.tail(2).tolist(), [4, 5])
+        self.assertEqual(buf.tail(10).tolist(), [2, 3, 4, 5])
+        self.assertEqual(RingBuffer(2).tail(1).tolist(), [])
+
+    def test_replace_last(self):
+        buf = RingBuffer(2)
+        buf.replace_last(1.0, 5)  # empty: appends
+        buf.replace_last(1.0, 7)
+        self.assertEqual(buf.last(), (1.0, 7.0))
+        self.assertEqual(buf.appended, 1)
+
+    def test_capacity_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            RingBuffer(0)
+
+
+class TestMetricHistory(unittest.TestCase):
+
+    def setUp(self):
+        self.history = MetricHistory(tiers=((1.0, 10), (10.0, 5)))
+
+    def test_samples_in_one_bucket_are_averaged(self):
+        self.history.record({'cpu_temp': 40}, now=100.2)
+        self.history.record({'cpu_temp': 50}, now=100.7)
+        times, values = self.history.series('cpu_temp')
+        self.assertEqual(times.tolist(), [100.0])
+        self.assertEqual(values.tolist(), [45.0])
+
+    def test_coarse_tier_downsamples(self):
+        for t in range(100, 125):
+            self.history.record({'cpu_temp': t}, now=float(t))
+        times, values = self.history.series('cpu_temp')
+        self.assertEqual(len(times), 10)                  # finest tier is full
+        times, values = self.history.series('cpu_temp', resolution=5)
+        self.assertEqual(times.tolist(), [100.0, 110.0, 120.0])
+        self.assertEqual(values.tolist(), [104.5, 114.5, 122.0])
+
+    def test_since(self):
+        for t in range(100, 105):
+            self.history.record({'cpu_temp': t}, now=float(t))
+        times, _ = self.history.series('cpu_temp', since=102.0)
+        self.assertEqual(times.tolist(), [103.0, 104.0])
+
+    def test_skips_non_numeric_and_unknown(self):
+        self.history.record({'cpu_temp': None, 'gpu_temp': float('nan'), 'x': 1},
+                            now=1.0)
+        self.assertEqual(self.history.keys(), ['x'])
+        self.assertEqual(len(self.history.series('missing')[0]), 0)
+
+    def test_tier_for(self):
+        self.assertEqual(self.history.tier_for(None), 0)
+        self.assertEqual(self.history.tier_for(0.5), 0)
+        self.assertEqual(self.history.tier_for(2), 1)
+        self.assertEqual(self.history.tier_for(3600), 1)
+
+    def test_position_tracks_appends_and_updates(self):
+        self.assertEqual(self.history.position('cpu_temp'), (0, 0))
+        self.history.record({'cpu_temp': 1}, now=1.0)
+        self.history.record({'cpu_temp': 2}, now=1.5)
+        self.assertEqual(self.history.position('cpu_temp'), (1, 2))
+        self.history.record({'cpu_temp': 3}, now=2.0)
+        self.assertEqual(self.history.position('cpu_temp'), (2, 3))
+
+    def test_invalid_tiers(self):
+        with self.assertRaises(ValueError):
+            MetricHistory(tiers=((0, 10),))
+
+
 # =============================================================================
 # ThemeService
 # =============================================================================
@@ -407,6 +1219,7 @@ class TestServicesInit(unittest.TestCase):
         self.assertTrue(hasattr(services, 'DeviceService'))
         self.assertTrue(hasattr(services, 'DisplayService'))
         self.assertTrue(hasattr(services, 'MediaService'))
+        self.assertTrue(hasattr(services, 'MetricHistory'))
         self.assertTrue(hasattr(services, 'OverlayService'))
         self.assertTrue(hasattr(services, 'ThemeService'))
 
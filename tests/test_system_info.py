@@ -1196,5 +1196,141 @@ class TestAllMetricsFallbacks(unittest.TestCase):
             self.assertAlmostEqual(m['cpu_temp'], 55.0)
 
 
+class TestBackgroundSampling(unittest.TestCase):
+
+    def _sampling_si(self):
+        si = _make_si(defaults={'cpu_temp': 'hwmon:coretemp:temp1',
+                                'gpu_temp': 'nvidia:0:temp'})
+        si._enumerator.SOURCE_INTERVALS = {'hwmon': 1.0, 'nvidia': 1.0}
+        si._enumerator.read_source.side_effect = lambda source, r: r.update(
+            {'hwmon': {'hwmon:coretemp:temp1': 55.0}}.get(source, {}))
+        si._discovered = True
+        with patch('trcc.system_sensors.SensorSampler.start'):
+            si.start_sampling()
+        self.addCleanup(si.stop_sampling)
+        return si
+
+    def test_all_metrics_reads_snapshot(self):
+        si = self._sampling_si()
+        with patch.object(si, '_fallback_cpu_usage', return_value=12.0), \
+             patch.object(si, '_fallback_cpu_freq', return_value=None), \
+             patch.object(si, '_fallback_mem_temp', return_value=None), \
+             patch.object(si, '_fallback_mem_clock', return_value=None), \
+             patch.object(si, '_fallback_disk_temp', return_value=None), \
+             patch.object(si, '_fallback_cpu_temp') as cpu_temp_fb:
+            si._sampler.sample(now=0.0)
+            cpu_temp_fb.assert_not_called()  # Enumerator provided cpu_temp
+            si._enumerator.read_source.reset_mock()
+            m = si.all_metrics
+            m2 = si.all_metrics
+        si._enumerator.read_all.assert_not_called()
+        si._enumerator.read_source.assert_not_called()
+        self.assertAlmostEqual(m['cpu_temp'], 55.0)
+        self.assertAlmostEqual(m['cpu_percent'], 12.0)
+        self.assertNotIn('gpu_temp', m)
+        self.assertEqual(m['cpu_temp'], m2['cpu_temp'])
+
+    def test_read_one_uses_snapshot(self):
+        si = self._sampling_si()
+        with patch.object(si, '_sample_fallbacks'):
+            si._sampler.sample(now=0.0)
+        self.assertAlmostEqual(si.read_one('hwmon:coretemp:temp1'), 55.0)
+        si._enumerator.read_one.assert_not_called()
+
+    def test_stop_sampling_reads_hardware_again(self):
+        si = self._sampling_si()
+        si.stop_sampling()
+        self.assertIsNone(si.snapshot)
+        si.read_all()
+        si._enumerator.read_all.assert_called_once()
+
+
+class TestSubscriptions(unittest.TestCase):
+
+    def _si(self):
+        si = _make_si(defaults={'cpu_temp': 'hwmon:coretemp:temp1',
+                                'cpu_percent': 'psutil:cpu_percent',
+                                'gpu_temp': 'nvidia:0:temp'})
+        si._discovered = True
+        return si
+
+    def test_plan_is_union_of_subscribed_sensors(self):
+        si = self._si()
+        si.subscribe('overlay', ['cpu_temp', 'time'])
+        si.subscribe('led', ['gpu_temp'])
+        self.assertEqual(si.wanted_metrics,
+                         frozenset({'cpu_temp', 'time', 'gpu_temp'}))
+        plan = si._enumerator.set_read_plan.call_args.args[0]
+        self.assertEqual(set(plan), {'hwmon:coretemp:temp1', 'nvidia:0:temp'})
+
+    def test_unchanged_subscription_is_noop(self):
+        si = self._si()
+        si.subscribe('overlay', ['cpu_temp'])
+        si.subscribe('overlay', {'cpu_temp'})
+        si._enumerator.set_read_plan.assert_called_once()
+
+    def test_last_unsubscribe_reads_everything(self):
+        si = self._si()
+        si.subscribe('overlay', ['cpu_temp'])
+        si.unsubscribe('overlay')
+        si.unsubscribe('overlay')
+        self.assertIsNone(si.wanted_metrics)
+        si._enumerator.set_read_plan.assert_called_with(None)
+        self.assertEqual(si._enumerator.set_read_plan.call_count, 2)
+
+    def test_fallbacks_limited_to_subscribed_keys(self):
+        si = self._si()
+        si.subscribe('overlay', ['cpu_percent'])
+        with patch.object(si, '_fallback_cpu_usage', return_value=12.0), \
+             patch.object(si, '_fallback_cpu_temp') as cpu_temp_fb, \
+             patch.object(si, '_fallback_mem_clock') as mem_clock_fb, \
+             patch.object(si, '_fallback_disk_temp') as disk_temp_fb:
+            m = si.all_metrics
+        self.assertEqual(m['cpu_percent'], 12.0)
+        cpu_temp_fb.assert_not_called()
+        mem_clock_fb.assert_not_called()
+        disk_temp_fb.assert_not_called()
+
+    def test_rediscover_reapplies_plan(self):
+        si = self._si()
+        si.subscribe('overlay', ['cpu_temp'])
+        si._enumerator.set_read_plan.reset_mock()
+        si.discover()
+        si._enumerator.set_read_plan.assert_called_once()
+
+
+class TestMetricHistoryRecording(unittest.TestCase):
+
+    def _si(self):
+        si = _make_si(defaults={'cpu_temp': 'hwmon:coretemp:temp1'},
+                      readings={'hwmon:coretemp:temp1': 55.0})
+        si._discovered = True
+        return si
+
+    def test_all_metrics_records_sensor_keys(self):
+        si = self._si()
+        with patch.object(si, '_fallbacks', return_value=[]):
+            si.all_metrics
+        self.assertEqual(si.history.keys(), ['cpu_temp'])  # no date/time keys
+        self.assertEqual(si.history.series('cpu_temp')[1].tolist(), [55.0])
+
+    def test_sampling_records_each_snapshot(self):
+        from trcc.system_sensors import SensorSnapshot
+        si = self._si()
+        si._record_snapshot(SensorSnapshot(
+            {'hwmon:coretemp:temp1': 60.0, 'fallback:disk_temp': 35.0}))
+        self.assertEqual(si.history.keys(), ['cpu_temp', 'disk_temp'])
+
+    def test_snapshot_reads_do_not_record(self):
+        from trcc.system_sensors import SensorSnapshot
+        si = self._si()
+        si._sampler = MagicMock(snapshot=SensorSnapshot({'hwmon:coretemp:temp1': 60.0}))
+        self.assertEqual(si.all_metrics['cpu_temp'], 60.0)
+        self.assertEqual(si.history.keys(), [])
+
+    def test_configurable_tiers(self):
+        self.assertEqual(SystemInfo(history_tiers=[(5, 12)]).history.tiers, ((5.0, 12),))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -3,12 +3,15 @@
 import unittest
 from unittest.mock import MagicMock, patch
 
+import numpy as np
+
 from trcc.data_repository import SysUtils
 from trcc.system_sensors import (
     _HWMON_DIVISORS,
     _HWMON_TYPES,
     SensorEnumerator,
     SensorInfo,
+    SensorSampler,
 )
 
 # ── read_sysfs ──────────────────────────────────────────────────────────────
@@ -130,7 +133,7 @@ class TestSensorEnumeratorGetters(unittest.TestCase):
 
 class TestSensorEnumeratorReadHwmon(unittest.TestCase):
 
-    @patch('trcc.data_repository.SysUtils.read_sysfs')
+    @patch('trcc.data_repository.SysfsReader.read')
     def test_read_all_hwmon(self, mock_read):
         mock_read.return_value = '65000'
 
@@ -143,7 +146,7 @@ class TestSensorEnumeratorReadHwmon(unittest.TestCase):
         readings = enum.read_all()
         self.assertAlmostEqual(readings['hwmon:coretemp:temp1'], 65.0)
 
-    @patch('trcc.data_repository.SysUtils.read_sysfs', return_value='1500')
+    @patch('trcc.data_repository.SysfsReader.read', return_value='1500')
     def test_read_all_fan(self, _):
         enum = SensorEnumerator()
         enum._hwmon_paths = {'hwmon:it8688:fan1': '/sys/class/hwmon/hwmon3/fan1_input'}
@@ -154,7 +157,7 @@ class TestSensorEnumeratorReadHwmon(unittest.TestCase):
         readings = enum.read_all()
         self.assertAlmostEqual(readings['hwmon:it8688:fan1'], 1500.0)
 
-    @patch('trcc.data_repository.SysUtils.read_sysfs', return_value=None)
+    @patch('trcc.data_repository.SysfsReader.read', return_value=None)
     def test_read_all_missing_value(self, _):
         enum = SensorEnumerator()
         enum._hwmon_paths = {'hwmon:x:temp1': '/fake'}
@@ -164,7 +167,7 @@ class TestSensorEnumeratorReadHwmon(unittest.TestCase):
 
 class TestSensorEnumeratorReadOne(unittest.TestCase):
 
-    @patch('trcc.data_repository.SysUtils.read_sysfs', return_value='72500')
+    @patch('trcc.data_repository.SysfsReader.read', return_value='72500')
     def test_read_one_hwmon(self, _):
         enum = SensorEnumerator()
         enum._hwmon_paths = {'hwmon:k10temp:temp1': '/fake'}
@@ -172,7 +175,7 @@ class TestSensorEnumeratorReadOne(unittest.TestCase):
         assert val is not None
         self.assertAlmostEqual(val, 72.5)
 
-    @patch('trcc.data_repository.SysUtils.read_sysfs', return_value=None)
+    @patch('trcc.data_repository.SysfsReader.read', return_value=None)
     def test_read_one_missing(self, _):
         enum = SensorEnumerator()
         enum._hwmon_paths = {'hwmon:k10temp:temp1': '/fake'}
@@ -183,7 +186,7 @@ class TestSensorEnumeratorReadOne(unittest.TestCase):
 
 class TestSensorEnumeratorReadRapl(unittest.TestCase):
 
-    @patch('trcc.data_repository.SysUtils.read_sysfs')
+    @patch('trcc.data_repository.SysfsReader.read')
     @patch('trcc.system_sensors.time')
     def test_rapl_power_calculation(self, mock_time, mock_read):
         enum = SensorEnumerator()
@@ -390,7 +393,7 @@ class TestReadAllEdgeCases(unittest.TestCase):
     def test_unknown_prefix_returns_raw(self):
         enum = SensorEnumerator()
         enum._hwmon_paths = {'hwmon:test:custom1': '/fake/custom1_input'}
-        with patch('trcc.data_repository.SysUtils.read_sysfs', return_value='123'):
+        with patch('trcc.data_repository.SysfsReader.read', return_value='123'):
             readings = enum.read_all()
         # 'custom1' doesn't start with temp/fan/in/power/freq → raw value
         self.assertEqual(readings['hwmon:test:custom1'], 123.0)
@@ -398,7 +401,7 @@ class TestReadAllEdgeCases(unittest.TestCase):
     def test_hwmon_value_error(self):
         enum = SensorEnumerator()
         enum._hwmon_paths = {'hwmon:test:temp1': '/fake/temp1_input'}
-        with patch('trcc.data_repository.SysUtils.read_sysfs', return_value='not-a-number'):
+        with patch('trcc.data_repository.SysfsReader.read', return_value='not-a-number'):
             readings = enum.read_all()
         self.assertNotIn('hwmon:test:temp1', readings)
 
@@ -407,17 +410,20 @@ class TestReadAllEdgeCases(unittest.TestCase):
 
 class TestReadOneEdgeCases(unittest.TestCase):
 
-    def test_falls_through_to_read_all(self):
+    @patch('trcc.system_sensors.psutil')
+    def test_falls_through_to_single_sensor_read(self, mock_psutil):
         enum = SensorEnumerator()
-        # Sensor not in _hwmon_paths → falls through to read_all
-        with patch.object(enum, 'read_all', return_value={'psutil:cpu_percent': 42.0}):
-            result = enum.read_one('psutil:cpu_percent')
+        mock_psutil.cpu_percent.return_value = 42.0
+        # Sensor not in _hwmon_paths → reads only the call behind it
+        result = enum.read_one('psutil:cpu_percent')
         self.assertEqual(result, 42.0)
+        mock_psutil.virtual_memory.assert_not_called()
+        mock_psutil.net_io_counters.assert_not_called()
 
     def test_hwmon_value_error_returns_none(self):
         enum = SensorEnumerator()
         enum._hwmon_paths = {'hwmon:test:temp1': '/fake/path'}
-        with patch('trcc.data_repository.SysUtils.read_sysfs', return_value='bad'):
+        with patch('trcc.data_repository.SysfsReader.read', return_value='bad'):
             result = enum.read_one('hwmon:test:temp1')
         self.assertIsNone(result)
 
@@ -641,7 +647,7 @@ class TestReadNvidia(unittest.TestCase):
 
 class TestReadRaplEdge(unittest.TestCase):
 
-    @patch('trcc.data_repository.SysUtils.read_sysfs', return_value=None)
+    @patch('trcc.data_repository.SysfsReader.read', return_value=None)
     @patch('trcc.system_sensors.time')
     def test_none_value_skipped(self, mock_time, _):
         mock_time.monotonic.return_value = 100.0
@@ -651,7 +657,7 @@ class TestReadRaplEdge(unittest.TestCase):
         enum._read_rapl(readings)
         self.assertEqual(readings, {})
 
-    @patch('trcc.data_repository.SysUtils.read_sysfs', return_value='not-a-number')
+    @patch('trcc.data_repository.SysfsReader.read', return_value='not-a-number')
     @patch('trcc.system_sensors.time')
     def test_value_error_skipped(self, mock_time, _):
         mock_time.monotonic.return_value = 100.0
@@ -661,7 +667,7 @@ class TestReadRaplEdge(unittest.TestCase):
         enum._read_rapl(readings)
         self.assertEqual(readings, {})
 
-    @patch('trcc.data_repository.SysUtils.read_sysfs', return_value='20000000')
+    @patch('trcc.data_repository.SysfsReader.read', return_value='20000000')
     @patch('trcc.system_sensors.time')
     def test_negative_power_ignored(self, mock_time, _):
         """Counter wrap produces negative delta — should be ignored."""
@@ -1019,7 +1025,7 @@ class TestNvmlImport(unittest.TestCase):
 
 class TestReadOneDivisor(unittest.TestCase):
 
-    @patch('trcc.data_repository.SysUtils.read_sysfs', return_value='12500')
+    @patch('trcc.data_repository.SysfsReader.read', return_value='12500')
     def test_in_prefix(self, _):
         """'in' prefix divides by 1000 (millivolts → volts)."""
         enum = SensorEnumerator()
@@ -1027,14 +1033,14 @@ class TestReadOneDivisor(unittest.TestCase):
         val = enum.read_one('hwmon:nct:in0')
         self.assertAlmostEqual(val, 12.5)
 
-    @patch('trcc.data_repository.SysUtils.read_sysfs', return_value='250000')
+    @patch('trcc.data_repository.SysfsReader.read', return_value='250000')
     def test_power_prefix(self, _):
         enum = SensorEnumerator()
         enum._hwmon_paths = {'hwmon:test:power1': '/fake/power1_input'}
         val = enum.read_one('hwmon:test:power1')
         self.assertAlmostEqual(val, 0.25)  # µW → W
 
-    @patch('trcc.data_repository.SysUtils.read_sysfs', return_value='3600000000')
+    @patch('trcc.data_repository.SysfsReader.read', return_value='3600000000')
     def test_freq_prefix(self, _):
         enum = SensorEnumerator()
         enum._hwmon_paths = {'hwmon:test:freq1': '/fake/freq1_input'}
@@ -1042,5 +1048,262 @@ class TestReadOneDivisor(unittest.TestCase):
         self.assertAlmostEqual(val, 3600.0)  # Hz → MHz
 
 
+# ── Per-source reads ─────────────────────────────────────────────────────────
+
+class TestReadSource(unittest.TestCase):
+
+    @patch('trcc.data_repository.SysfsReader.read', return_value='40000')
+    def test_slow_hwmon_split(self, _):
+        enum = SensorEnumerator()
+        enum._hwmon_paths = {'hwmon:coretemp:temp1': '/fake/a',
+                             'hwmon:nvme:temp1': '/fake/b'}
+        enum._hwmon_slow = {'hwmon:nvme:temp1'}
+        fast: dict[str, float] = {}
+        slow: dict[str, float] = {}
+        enum.read_source('hwmon', fast)
+        enum.read_source('hwmon_slow', slow)
+        self.assertEqual(list(fast), ['hwmon:coretemp:temp1'])
+        self.assertEqual(list(slow), ['hwmon:nvme:temp1'])
+
+    def test_unknown_source(self):
+        with self.assertRaises(ValueError):
+            SensorEnumerator().read_source('bogus', {})
+
+    def test_read_all_covers_every_source(self):
+        enum = SensorEnumerator()
+        with patch.object(enum, 'read_source') as read:
+            enum.read_all()
+        self.assertEqual([c.args[0] for c in read.call_args_list],
+                         list(SensorEnumerator.SOURCE_INTERVALS))
+
+
+# ── Read plan ────────────────────────────────────────────────────────────────
+
+class TestReadPlan(unittest.TestCase):
+
+    def _enum(self):
+        enum = SensorEnumerator()
+        enum._hwmon_paths = {'hwmon:coretemp:temp1': '/fake/a',
+                             'hwmon:nct:fan1': '/fake/b'}
+        enum._drm_paths = {'drm:card0:gpu_busy': '/fake/c'}
+        enum._rapl_paths = {'rapl:package-0': '/fake/d'}
+        return enum
+
+    def test_compiles_subset(self):
+        enum = self._enum()
+        enum.set_read_plan(['hwmon:coretemp:temp1', 'nvidia:0:temp',
+                            'psutil:cpu_percent', 'computed:net_up', 'bogus'])
+        plan = enum.read_plan
+        self.assertEqual(plan.hwmon.ids, ('hwmon:coretemp:temp1',))
+        self.assertEqual(plan.hwmon.paths, ('/fake/a',))
+        self.assertEqual(plan.drm.ids, ())
+        self.assertEqual(dict(plan.rapl), {})
+        self.assertEqual(dict(plan.nvidia), {0: frozenset({'temp'})})
+        self.assertEqual(plan.psutil, frozenset({'cpu_percent'}))
+        self.assertEqual(plan.computed, frozenset({'net_up'}))
+        self.assertEqual(plan.sources, ('hwmon', 'nvidia', 'psutil', 'computed'))
+
+    @patch('trcc.data_repository.SysfsReader.read', return_value='40000')
+    def test_read_all_skips_unplanned_files(self, read):
+        enum = self._enum()
+        enum.set_read_plan(['hwmon:coretemp:temp1'])
+        with patch('trcc.system_sensors.psutil') as mock_psutil:
+            readings = enum.read_all()
+        self.assertEqual(readings, {'hwmon:coretemp:temp1': 40.0})
+        read.assert_called_once_with('/fake/a')
+        mock_psutil.cpu_percent.assert_not_called()
+        mock_psutil.virtual_memory.assert_not_called()
+        mock_psutil.disk_io_counters.assert_not_called()
+        mock_psutil.net_io_counters.assert_not_called()
+
+    @patch('trcc.system_sensors.NVML_AVAILABLE', True)
+    @patch('trcc.system_sensors.pynvml')
+    def test_nvml_calls_follow_plan(self, mock_nvml):
+        mock_nvml.nvmlDeviceGetTemperature.return_value = 65
+        enum = SensorEnumerator()
+        enum._nvidia_handles = {0: MagicMock(), 1: MagicMock()}
+        enum.set_read_plan(['nvidia:0:temp'])
+        readings: dict[str, float] = {}
+        enum.read_source('nvidia', readings)
+        enum.read_source('nvidia_mem', readings)
+        self.assertEqual(readings, {'nvidia:0:temp': 65.0})
+        mock_nvml.nvmlDeviceGetTemperature.assert_called_once()
+        mock_nvml.nvmlDeviceGetUtilizationRates.assert_not_called()
+        mock_nvml.nvmlDeviceGetPowerUsage.assert_not_called()
+        mock_nvml.nvmlDeviceGetMemoryInfo.assert_not_called()
+
+    @patch('trcc.system_sensors.psutil')
+    def test_none_reads_everything_again(self, mock_psutil):
+        enum = SensorEnumerator()
+        enum.set_read_plan([])
+        enum.read_source('psutil', {})
+        mock_psutil.cpu_percent.assert_not_called()
+        enum.set_read_plan(None)
+        self.assertIsNone(enum.read_plan)
+        enum.read_source('psutil', {})
+        mock_psutil.cpu_percent.assert_called_once()
+        mock_psutil.virtual_memory.assert_called_once()
+
+    @patch('trcc.system_sensors.psutil')
+    def test_read_one_outside_plan(self, mock_psutil):
+        mock_psutil.cpu_freq.return_value = MagicMock(current=3600.0)
+        enum = SensorEnumerator()
+        enum.set_read_plan(['psutil:cpu_percent'])
+        self.assertEqual(enum.read_one('psutil:cpu_freq'), 3600.0)
+        mock_psutil.cpu_percent.assert_not_called()
+
+    @patch('trcc.system_sensors.SensorEnumerator._discover_computed')
+    @patch('trcc.system_sensors.SensorEnumerator._discover_rapl')
+    @patch('trcc.system_sensors.SensorEnumerator._discover_psutil')
+    @patch('trcc.system_sensors.SensorEnumerator._discover_drm')
+    @patch('trcc.system_sensors.SensorEnumerator._discover_nvidia')
+    @patch('trcc.system_sensors.SensorEnumerator._discover_hwmon')
+    def test_discover_recompiles(self, discover_hwmon, *_):
+        enum = SensorEnumerator()
+        enum.set_read_plan(['hwmon:coretemp:temp1'])
+        self.assertEqual(enum.read_plan.hwmon.ids, ())
+
+        def found():
+            enum._hwmon_paths['hwmon:coretemp:temp1'] = '/fake/a'
+        discover_hwmon.side_effect = found
+        enum.discover()
+        self.assertEqual(enum.read_plan.hwmon.paths, ('/fake/a',))
+
+
+# ── Compiled index ───────────────────────────────────────────────────────────
+
+class TestCompiledIndex(unittest.TestCase):
+
+    def _enum(self):
+        enum = SensorEnumerator()
+        enum._hwmon_paths = {'hwmon:coretemp:temp1': '/fake/a',
+                             'hwmon:nct:fan1': '/fake/b',
+                             'hwmon:nct:in0': '/fake/c'}
+        return enum
+
+    def test_batch_arrays(self):
+        plan = self._enum()._current_plan()
+        self.assertEqual(plan.hwmon.paths, ('/fake/a', '/fake/b', '/fake/c'))
+        self.assertEqual(plan.hwmon.divisors.tolist(), [1000.0, 1.0, 1000.0])
+        self.assertEqual(plan.hwmon.slots.tolist(), [0, 1, 2])
+
+    def test_read_fills_values_vector(self):
+        enum = self._enum()
+        files = {'/fake/a': '45000', '/fake/b': '1200', '/fake/c': 'bad'}
+        with patch('trcc.data_repository.SysfsReader.read',
+                   side_effect=files.get):
+            readings: dict[str, float] = {}
+            enum.read_source('hwmon', readings)
+        self.assertEqual(readings, {'hwmon:coretemp:temp1': 45.0,
+                                    'hwmon:nct:fan1': 1200.0})
+        values = enum.values
+        self.assertEqual(values[enum.slot('hwmon:coretemp:temp1')], 45.0)
+        self.assertTrue(np.isnan(values[enum.slot('hwmon:nct:in0')]))
+        self.assertFalse(values.flags.writeable)
+        self.assertEqual(enum.latest('hwmon:nct:fan1'), 1200.0)
+        self.assertIsNone(enum.latest('hwmon:nct:in0'))
+        self.assertIsNone(enum.latest('unknown'))
+
+    @patch('trcc.system_sensors.psutil')
+    def test_other_sources_stored_by_slot(self, mock_psutil):
+        mock_psutil.cpu_percent.return_value = 33.0
+        enum = SensorEnumerator()
+        enum._sensors = [SensorInfo('psutil:cpu_percent', 'CPU Usage',
+                                    'usage', '%', 'psutil')]
+        enum.read_source('psutil', {})
+        self.assertEqual(enum.latest('psutil:cpu_percent'), 33.0)
+
+    @patch('trcc.data_repository.SysfsReader.read', return_value='51000')
+    def test_read_one_never_sweeps(self, read):
+        enum = self._enum()
+        with patch.object(enum, 'read_all') as read_all, \
+             patch.object(enum, '_read_psutil') as read_psutil:
+            self.assertEqual(enum.read_one('hwmon:coretemp:temp1'), 51.0)
+            enum.read_one('psutil:cpu_percent')
+        read.assert_called_once_with('/fake/a')
+        read_all.assert_not_called()
+        read_psutil.assert_called_once()
+
+    def test_single_sensor_plan_cached(self):
+        enum = SensorEnumerator()
+        with patch('trcc.system_sensors.psutil'):
+            enum.read_one('psutil:cpu_percent')
+            plan = enum._single_plans['psutil:cpu_percent']
+            enum.read_one('psutil:cpu_percent')
+        self.assertIs(enum._single_plans['psutil:cpu_percent'], plan)
+        self.assertEqual(plan.sources, ('psutil',))
+
+
+# ── SensorSampler ────────────────────────────────────────────────────────────
+
+class TestSensorSampler(unittest.TestCase):
+
+    def setUp(self):
+        self.calls: list[str] = []
+        self.fast_value = 1.0
+
+        def fast(readings):
+            self.calls.append('fast')
+            readings['fast'] = self.fast_value
+
+        def slow(readings):
+            self.calls.append('slow')
+            readings['slow'] = 2.0
+
+        self.sampler = SensorSampler({'fast': (1.0, fast), 'slow': (10.0, slow)})
+
+    def test_sources_follow_their_intervals(self):
+        for t in (0.0, 1.0, 2.0, 10.0):
+            self.sampler.sample(now=t)
+        self.assertEqual(self.calls, ['fast', 'slow', 'fast', 'fast', 'fast', 'slow'])
+
+    def test_snapshot_is_immutable_and_replaced(self):
+        first = self.sampler.sample(now=0.0)
+        self.fast_value = 5.0
+        second = self.sampler.sample(now=1.0)
+        self.assertEqual(dict(first.readings), {'fast': 1.0, 'slow': 2.0})
+        self.assertEqual(dict(second.readings), {'fast': 5.0, 'slow': 2.0})
+        self.assertEqual(second.sampled_at, {'fast': 1.0, 'slow': 0.0})
+        with self.assertRaises(TypeError):
+            second.readings['fast'] = 0.0  # type: ignore[index]
+        self.assertIs(self.sampler.snapshot, second)
+
+    def test_failing_source_keeps_others(self):
+        sampler = SensorSampler({'bad': (1.0, MagicMock(side_effect=OSError)),
+                                 'ok': (1.0, lambda r: r.update(ok=1.0))})
+        self.assertEqual(dict(sampler.sample(now=0.0).readings), {'ok': 1.0})
+
+    def test_vanished_sensor_dropped(self):
+        values = [{'a': 1.0, 'b': 2.0}, {'a': 3.0}]
+        sampler = SensorSampler({'src': (1.0, lambda r: r.update(values.pop(0)))})
+        sampler.sample(now=0.0)
+        self.assertEqual(dict(sampler.sample(now=1.0).readings), {'a': 3.0})
+
+    def test_thread_publishes(self):
+        import threading
+        ready = threading.Event()
+        sampler = SensorSampler({'src': (0.05, lambda r: (r.update(x=1.0), ready.set()))})
+        sampler.start()
+        try:
+            self.assertTrue(ready.wait(2))
+            self.assertTrue(sampler.running)
+        finally:
+            sampler.stop()
+        self.assertFalse(sampler.running)
+        self.assertEqual(sampler.snapshot.readings.get('x'), 1.0)
+
+    def test_on_sample_gets_each_snapshot(self):
+        seen = []
+        sampler = SensorSampler({'src': (1.0, lambda r: r.update(x=1.0))},
+                                on_sample=seen.append)
+        snapshot = sampler.sample(now=0.0)
+        self.assertEqual(seen, [snapshot])
+
+    def test_failing_on_sample_still_publishes(self):
+        sampler = SensorSampler({'src': (1.0, lambda r: r.update(x=1.0))},
+                                on_sample=MagicMock(side_effect=RuntimeError))
+        self.assertEqual(sampler.sample(now=0.0).readings.get('x'), 1.0)
+
+
 if __name__ == '__main__':
     unittest.main()
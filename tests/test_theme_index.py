@@ -0,0 +1,176 @@
+"""Tests for theme_index — persistent, mtime-keyed theme directory index."""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from trcc.services.theme import ThemeService
+from trcc.theme_index import INOTIFY_AVAILABLE, DirWatcher, ThemeIndex
+
+_OLD = 1_600_000_000  # An mtime well outside ThemeIndex.RACY_SECONDS
+
+
+def _age(*paths):
+    for path in paths:
+        os.utime(path, (_OLD, _OLD))
+
+
+class _IndexTestCase(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = Path(tmp.name)
+        self.root = self.tmp / 'theme320320'
+        self.cache = str(self.tmp / 'cache')
+        for name, files in (('Theme1', ('00.png', 'Theme.png', 'config1.dc')),
+                            ('Theme2', ('01.png', 'config1.dc')),
+                            ('Notes', ('readme.txt',))):
+            self.make(name, *files)
+        self.settle()
+
+    def make(self, name, *files):
+        d = self.root / name
+        d.mkdir(parents=True, exist_ok=True)
+        for f in files:
+            (d / f).touch()
+        return d
+
+    def settle(self):
+        """Backdate every mtime so the index trusts them."""
+        _age(self.root, *(p for p in self.root.iterdir() if p.is_dir()))
+
+    def index(self):
+        return ThemeIndex(self.root, index_dir=self.cache)
+
+
+class TestThemeIndex(_IndexTestCase):
+
+    def test_lists_theme_dirs(self):
+        listing = self.index().theme_dirs()
+        self.assertEqual(set(listing), {'Theme1', 'Theme2'})
+        self.assertEqual(listing['Theme2'], {'01.png', 'config1.dc'})
+
+    def test_unchanged_tree_lists_nothing(self):
+        index = self.index()
+        index.refresh()
+        rescans = index.rescans
+        self.assertFalse(index.refresh())
+        self.assertEqual(index.rescans, rescans)
+
+    def test_only_changed_dir_rescanned(self):
+        index = self.index()
+        index.refresh()
+        rescans = index.rescans
+        (self.root / 'Theme2' / '00.png').touch()
+        _age(self.root / 'Theme2')
+        os.utime(self.root / 'Theme2', (_OLD + 10, _OLD + 10))
+        self.assertTrue(index.refresh())
+        self.assertEqual(index.rescans, rescans + 1)
+        self.assertIn('00.png', index.dirs()['Theme2'])
+
+    def test_new_and_removed_dirs(self):
+        index = self.index()
+        index.refresh()
+        self.make('Custom_1', '00.png')
+        (self.root / 'Notes' / 'readme.txt').unlink()
+        (self.root / 'Notes').rmdir()
+        self.assertEqual(set(index.dirs()), {'Theme1', 'Theme2', 'Custom_1'})
+
+    def test_racy_mtime_rechecked(self):
+        index = self.index()
+        index.refresh()
+        (self.root / 'Theme1' / 'Theme.zt').touch()  # Dir mtime is "now"
+        self.assertIn('Theme.zt', index.dirs()['Theme1'])
+        rescans = index.rescans
+        index.refresh()
+        self.assertEqual(index.rescans, rescans + 1)  # Not trusted yet
+
+    def test_persisted_between_instances(self):
+        self.index().refresh()
+        self.assertTrue(os.path.exists(self.index().index_path))
+        fresh = self.index()
+        self.assertEqual(set(fresh.dirs()), {'Theme1', 'Theme2', 'Notes'})
+        self.assertEqual(fresh.rescans, 0)
+
+    def test_corrupt_index_ignored(self):
+        index = self.index()
+        os.makedirs(self.cache)
+        with open(index.index_path, 'w') as f:
+            f.write('{not json')
+        self.assertEqual(set(index.theme_dirs()), {'Theme1', 'Theme2'})
+
+    def test_missing_root(self):
+        index = ThemeIndex(self.tmp / 'nope', index_dir=self.cache)
+        self.assertEqual(index.dirs(), {})
+        self.assertEqual(index.files(), frozenset())
+
+
+@unittest.skipUnless(INOTIFY_AVAILABLE, "inotify not available")
+class TestThemeIndexWatch(_IndexTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.watched = self.index()
+        self.assertTrue(self.watched.watch())
+        self.addCleanup(self.watched.unwatch)
+        self.watched.refresh()
+
+    def test_quiet_tree_needs_no_stats(self):
+        rescans = self.watched.rescans
+        self.assertFalse(self.watched.refresh())
+        self.assertEqual(self.watched.rescans, rescans)
+
+    def test_events_rescan_only_changed_dir(self):
+        rescans = self.watched.rescans
+        (self.root / 'Theme2' / '00.png').touch()
+        _age(self.root / 'Theme2')  # Same mtime as before: only inotify knows
+        self.assertIn('00.png', self.watched.dirs()['Theme2'])
+        self.assertEqual(self.watched.rescans, rescans + 1)
+
+    def test_new_dir_gets_watched(self):
+        self.make('Custom_1', '00.png')
+        self.assertIn('Custom_1', self.watched.theme_dirs())
+        self.assertTrue(self.watched.watching)
+
+    def test_dir_watcher_poll(self):
+        watcher = DirWatcher()
+        self.addCleanup(watcher.close)
+        self.assertTrue(watcher.add(str(self.root)))
+        self.assertEqual(watcher.poll(), set())
+        (self.root / 'new.png').touch()
+        self.assertEqual(watcher.poll(), {str(self.root)})
+        self.assertFalse(watcher.add(str(self.tmp / 'missing')))
+
+
+class TestThemeServiceIndexed(_IndexTestCase):
+
+    def setUp(self):
+        super().setUp()
+        ThemeIndex._instances.pop(str(self.root), None)
+        self.addCleanup(ThemeIndex._instances.pop, str(self.root), None)
+        ThemeIndex._instances[str(self.root)] = self.index()
+
+    def test_discover_local_matches_from_directory(self):
+        from trcc.core.models import ThemeInfo
+        themes = ThemeService.discover_local(self.root, (320, 320))
+        self.assertEqual([t.name for t in themes], ['Theme1', 'Theme2'])
+        for theme in themes:
+            self.assertEqual(theme, ThemeInfo.from_directory(theme.path, (320, 320)))
+
+    def test_discover_cloud(self):
+        web = self.tmp / 'web'
+        web.mkdir()
+        for name in ('a001.mp4', 'a001.png', 'b002.mp4', 'c003.png'):
+            (web / name).touch()
+        ThemeIndex._instances[str(web)] = ThemeIndex(web, index_dir=self.cache)
+        self.addCleanup(ThemeIndex._instances.pop, str(web), None)
+        themes = ThemeService.discover_cloud(web)
+        self.assertEqual([t.name for t in themes], ['a001', 'b002'])
+        self.assertEqual(themes[0].thumbnail_path, web / 'a001.png')
+        self.assertIsNone(themes[1].thumbnail_path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,145 @@
+"""Tests for thumbnail_cache — packed, mtime-keyed thumbnail atlas."""
+
+import os
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+from PIL import Image
+
+from trcc.thumbnail_cache import ThumbnailAtlas, render_thumbnail
+
+
+class TestRenderThumbnail(unittest.TestCase):
+
+    def test_letterboxed_on_black(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'wide.png')
+            Image.new('RGB', (480, 240), (255, 0, 0)).save(path)
+            img = Image.frombytes('RGB', (120, 120), render_thumbnail(path))
+        self.assertEqual(img.getpixel((60, 60)), (255, 0, 0))
+        self.assertEqual(img.getpixel((60, 5)), (0, 0, 0))
+
+
+class TestThumbnailAtlas(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = Path(tmp.name)
+        self.cache = str(self.tmp / 'cache')
+
+    def image(self, name, color):
+        path = self.tmp / name
+        Image.new('RGB', (320, 320), color).save(path)
+        return str(path)
+
+    def atlas(self):
+        atlas = ThumbnailAtlas('local-theme320320', cache_dir=self.cache)
+        self.addCleanup(atlas.close)
+        return atlas
+
+    def test_miss_then_hit(self):
+        path = self.image('a.png', (0, 0, 255))
+        atlas = self.atlas()
+        self.assertIsNone(atlas.get(path))
+        data = atlas.load(path)
+        self.assertEqual(len(data), 120 * 120 * 3)
+        self.assertEqual(atlas.get(path), data)
+        self.assertEqual((atlas.builds, atlas.hits), (1, 1))
+
+    def test_slots_packed_in_one_file(self):
+        atlas = self.atlas()
+        for i in range(3):
+            atlas.load(self.image(f'{i}.png', (i * 50, 0, 0)))
+        self.assertEqual(os.path.getsize(atlas.data_path), 3 * atlas.slot_bytes)
+        self.assertEqual(len(atlas), 3)
+
+    def test_persisted_between_instances(self):
+        path = self.image('a.png', (0, 255, 0))
+        data = self.atlas().load(path)
+        fresh = self.atlas()
+        self.assertEqual(fresh.get(path), data)
+        self.assertEqual(fresh.builds, 0)
+
+    def test_changed_source_rebuilt_in_place(self):
+        path = self.image('a.png', (0, 255, 0))
+        atlas = self.atlas()
+        atlas.load(path)
+        Image.new('RGB', (320, 320), (255, 255, 0)).save(path)
+        os.utime(path, ns=(1, 1))
+        self.assertIsNone(atlas.get(path))
+        data = atlas.load(path)
+        self.assertEqual(data[:3], b'\xff\xff\x00')
+        self.assertEqual(os.path.getsize(atlas.data_path), atlas.slot_bytes)
+
+    def test_deleted_source_frees_slot(self):
+        atlas = self.atlas()
+        gone = self.image('gone.png', (1, 2, 3))
+        atlas.load(gone)
+        os.unlink(gone)
+        self.assertIsNone(atlas.get(gone))
+        atlas.load(self.image('new.png', (4, 5, 6)))
+        self.assertEqual(os.path.getsize(atlas.data_path), atlas.slot_bytes)
+
+    def test_truncated_data_file_drops_slots(self):
+        path = self.image('a.png', (9, 9, 9))
+        atlas = self.atlas()
+        atlas.load(path)
+        atlas.close()
+        os.truncate(atlas.data_path, 100)
+        self.assertIsNone(self.atlas().get(path))
+
+    def test_corrupt_index_ignored(self):
+        path = self.image('a.png', (9, 9, 9))
+        atlas = self.atlas()
+        os.makedirs(self.cache)
+        with open(atlas.index_path, 'w') as f:
+            f.write('{not json')
+        self.assertIsNone(atlas.get(path))
+        self.assertEqual(len(atlas.load(path)), atlas.slot_bytes)
+
+    def test_request_builds_in_background(self):
+        paths = [self.image(f'{i}.png', (i, i, i)) for i in range(4)]
+        atlas = self.atlas()
+        results = {}
+        done = threading.Event()
+
+        def callback(path):
+            def on_built(data):
+                results[path] = data
+                if len(results) == len(paths):
+                    done.set()
+            return on_built
+
+        for path in paths:
+            self.assertIsNone(atlas.request(path, callback(path)))
+        self.assertTrue(done.wait(10))
+        for path in paths:
+            self.assertEqual(atlas.request(path, callback(path)), results[path])
+        self.assertTrue(os.path.exists(atlas.index_path))
+
+    def test_request_undecodable_reports_none(self):
+        path = self.tmp / 'broken.png'
+        path.write_bytes(b'not a png')
+        results = []
+        done = threading.Event()
+        atlas = self.atlas()
+        atlas.request(str(path), lambda data: (results.append(data), done.set()))
+        self.assertTrue(done.wait(10))
+        self.assertEqual(results, [None])
+        self.assertEqual(len(atlas), 0)
+
+    def test_for_dir_shared_per_category(self):
+        local = ThumbnailAtlas.for_dir('local', self.tmp / 'theme320320')
+        self.addCleanup(ThumbnailAtlas._instances.pop, local.name, None)
+        self.assertIs(local, ThumbnailAtlas.for_dir('local', self.tmp / 'theme320320'))
+        mask = ThumbnailAtlas.for_dir('mask', self.tmp / 'theme320320')
+        self.addCleanup(ThumbnailAtlas._instances.pop, mask.name, None)
+        self.assertIsNot(local, mask)
+        self.assertTrue(local.name.startswith('local-theme320320-'))
+
+
+if __name__ == '__main__':
+    unittest.main()
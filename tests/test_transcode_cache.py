@@ -0,0 +1,201 @@
+"""Tests for transcode_cache — content-addressed cache of transcoded videos."""
+
+import io
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from trcc.media_player import ThemeZtDecoder
+from trcc.transcode_cache import TranscodeCache
+
+
+def _fake_ffmpeg(frame_count, size=(4, 4), rc=0):
+    """Popen side_effect streaming solid (i*20, 0, 0) frames."""
+    w, h = size
+    launches = []
+
+    def popen(cmd, **kwargs):
+        launches.append(cmd)
+        raw = b''.join(bytes([i * 20, 0, 0]) * (w * h) for i in range(frame_count))
+        proc = MagicMock()
+        proc.stdout = io.BytesIO(raw)
+        proc.wait.return_value = rc
+        proc.poll.return_value = rc
+        return proc
+
+    return popen, launches
+
+
+class TestTranscodeCache(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = Path(tmp.name)
+        self.video = self.tmp / 'a001.mp4'
+        self.video.write_bytes(b'fake mp4 contents')
+        self.cache = TranscodeCache(str(self.tmp / 'cache'))
+        self.addCleanup(self.cache.close)
+        patcher = patch('trcc.media_player.FFMPEG_AVAILABLE', True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def ffmpeg(self, frame_count=3, rc=0):
+        popen, launches = _fake_ffmpeg(frame_count, rc=rc)
+        patcher = patch('subprocess.Popen', side_effect=popen)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return launches
+
+    def test_content_addressed(self):
+        copy = self.tmp / 'renamed.mp4'
+        copy.write_bytes(self.video.read_bytes())
+        self.assertEqual(self.cache.entry_path(copy, (4, 4)),
+                         self.cache.entry_path(self.video, (4, 4)))
+        self.assertNotEqual(self.cache.entry_path(self.video, (8, 8)),
+                            self.cache.entry_path(self.video, (4, 4)))
+        self.assertNotEqual(self.cache.entry_path(self.video, (4, 4), 24),
+                            self.cache.entry_path(self.video, (4, 4)))
+
+    def test_transcode_then_hit(self):
+        launches = self.ffmpeg(3)
+        self.assertIsNone(self.cache.lookup(self.video, (4, 4)))
+        path = self.cache.transcode(self.video, (4, 4))
+        self.assertIn('scale=4:4', launches[0])
+        self.assertEqual(self.cache.lookup(self.video, (4, 4)), path)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+        decoder = ThemeZtDecoder(path)
+        self.addCleanup(decoder.close)
+        self.assertEqual(decoder.frame_count, 3)
+        self.assertEqual(decoder.delays[0], 62)  # 16 fps
+        self.assertAlmostEqual(decoder.frames[2].getpixel((1, 1))[0], 40, delta=4)
+
+    def test_ffmpeg_failure_leaves_no_entry(self):
+        self.ffmpeg(2, rc=1)
+        with self.assertRaises(RuntimeError):
+            self.cache.transcode(self.video, (4, 4))
+        self.assertEqual(self.cache.entries(), [])
+
+    def test_request_runs_in_background_once(self):
+        launches = self.ffmpeg(2)
+        self.assertTrue(self.cache.request(self.video, (4, 4)))
+        self.cache.close()  # Wait for the worker
+        self.assertFalse(self.cache.request(self.video, (4, 4)))
+        self.assertEqual(len(launches), 1)
+        self.assertIsNotNone(self.cache.lookup(self.video, (4, 4)))
+
+    def test_copy_hashed_on_worker_not_lookup(self):
+        launches = self.ffmpeg(2)
+        self.cache.transcode(self.video, (4, 4))
+        copy = self.tmp / 'renamed.mp4'
+        copy.write_bytes(self.video.read_bytes())
+        with patch.object(self.cache, 'source_digest') as digest:
+            self.assertIsNone(self.cache.lookup(copy, (4, 4)))  # Not indexed yet
+        digest.assert_not_called()
+        self.assertTrue(self.cache.request(copy, (4, 4)))
+        self.cache.close()
+        self.assertEqual(len(launches), 1)  # Same contents: no second transcode
+        self.assertIsNotNone(self.cache.lookup(copy, (4, 4)))
+
+    def test_index_persists(self):
+        self.ffmpeg(2)
+        path = self.cache.transcode(self.video, (4, 4))
+        reopened = TranscodeCache(self.cache.cache_dir)
+        self.assertEqual(reopened.lookup(self.video, (4, 4)), path)
+        os.utime(self.video, ns=(1, 1))  # Changed video: hash again
+        self.assertIsNone(reopened.lookup(self.video, (4, 4)))
+
+    def test_request_missing_source(self):
+        self.assertFalse(self.cache.request(self.tmp / 'gone.mp4', (4, 4)))
+
+    def test_prune_evicts_least_recently_used(self):
+        self.ffmpeg(2)
+        paths = []
+        for i in range(3):
+            video = self.tmp / f'{i}.mp4'
+            video.write_bytes(bytes([i]) * 10)
+            paths.append(self.cache.transcode(video, (4, 4)))
+            os.utime(paths[-1], (1000 + i, 1000 + i))
+        self.cache.lookup(self.tmp / '0.mp4', (4, 4))  # 0 becomes most recent
+        size = os.path.getsize(paths[0])
+        removed, freed = self.cache.prune(2 * size)
+        self.assertEqual((removed, freed), (1, size))
+        self.assertFalse(os.path.exists(paths[1]))
+        self.assertTrue(os.path.exists(paths[0]))
+
+    def test_new_entry_survives_small_quota(self):
+        self.ffmpeg(2)
+        self.cache.quota_bytes = 1
+        path = self.cache.transcode(self.video, (4, 4))
+        self.assertTrue(os.path.exists(path))
+
+
+class TestMediaServiceTranscode(unittest.TestCase):
+    """MediaService plays videos from the transcode cache."""
+
+    def setUp(self):
+        from trcc.services.media import MediaService
+
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = Path(tmp.name)
+        self.video = self.tmp / 'a001.mp4'
+        self.video.write_bytes(b'fake mp4 contents')
+        self.cache = TranscodeCache(str(self.tmp / 'cache'))
+        self.addCleanup(self.cache.close)
+        popen, self.launches = _fake_ffmpeg(3)
+        for p in (patch('trcc.media_player.FFMPEG_AVAILABLE', True),
+                  patch('subprocess.run', return_value=MagicMock(stdout=b'0.1875')),
+                  patch('subprocess.Popen', side_effect=popen),
+                  patch.object(TranscodeCache, '_shared', self.cache),
+                  patch('trcc.conf.Settings.get_transcode_cache_quota',
+                        return_value=1024 * 1024)):
+            p.start()
+            self.addCleanup(p.stop)
+        self.svc = MediaService()
+        self.svc.set_target_size(4, 4)
+        self.addCleanup(self.svc.close)
+
+    def test_first_play_streams_and_fills_cache(self):
+        self.assertTrue(self.svc.load(self.video))
+        self.assertTrue(self.svc.is_streaming)
+        self.cache.close()
+        self.assertIsNotNone(self.cache.lookup(self.video, (4, 4)))
+
+    def test_video_hashed_off_the_calling_thread(self):
+        import threading
+
+        threads = []
+        source_digest = self.cache.source_digest
+
+        def digest(source):
+            threads.append(threading.current_thread().name)
+            return source_digest(source)
+
+        with patch.object(self.cache, 'source_digest', side_effect=digest):
+            self.assertTrue(self.svc.load(self.video))
+            self.cache.close()
+        self.assertTrue(threads)
+        self.assertTrue(all(t.startswith('trcc-transcode') for t in threads))
+
+    def test_second_play_loads_from_cache(self):
+        self.cache.transcode(self.video, (4, 4))
+        launched = len(self.launches)
+        self.assertTrue(self.svc.load(self.video))
+        self.assertFalse(self.svc.is_streaming)
+        self.assertEqual(len(self.launches), launched)  # No FFmpeg
+        self.assertEqual(self.svc.state.total_frames, 3)
+        self.assertEqual(self.svc.get_frame(0).size, (4, 4))
+
+    def test_disabled_by_zero_quota(self):
+        with patch('trcc.conf.Settings.get_transcode_cache_quota', return_value=0):
+            self.svc.load(self.video)
+        self.cache.close()
+        self.assertEqual(self.cache.entries(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
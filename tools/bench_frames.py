@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Benchmark: Theme.zt frame preparation on 1, 2, 4 and N FramePool workers.
+
+Writes a synthetic Theme.zt (noisy gradients, so JPEG decode does real
+work) and times two per-frame stages at each worker count:
+
+- load:   decode + LANCZOS resize + RGB convert of every frame
+          (ThemeZtDecoder.frames.decode_all)
+- encode: JPEG-encode every frame at quality 85 (the video-cut export)
+
+Usage:
+    python tools/bench_frames.py                  # 300 frames, 480x480 → 320x320
+    python tools/bench_frames.py -f 600 -s 640x640 -t 480x480
+"""
+import argparse
+import io
+import os
+import struct
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from trcc.media_player import FramePool, ThemeZtDecoder  # noqa: E402
+
+
+def synthetic_frames(width, height, count):
+    rng = np.random.default_rng(0)
+    x = np.linspace(0, 255, width, dtype=np.float32)
+    for i in range(count):
+        base = (x[None, :, None] + i * 3) % 256
+        noise = rng.normal(0, 12, (height, width, 3))
+        yield Image.fromarray(np.clip(base + noise, 0, 255).astype(np.uint8))
+
+
+def write_theme_zt(path, frames):
+    blobs = []
+    for frame in frames:
+        buf = io.BytesIO()
+        frame.save(buf, format='JPEG', quality=85)
+        blobs.append(buf.getvalue())
+    with open(path, 'wb') as f:
+        f.write(struct.pack('<Bi', 0xDC, len(blobs)))
+        f.write(struct.pack(f'<{len(blobs)}i', *(i * 42 for i in range(len(blobs)))))
+        for blob in blobs:
+            f.write(struct.pack('<i', len(blob)))
+            f.write(blob)
+
+
+def encode(frame):
+    buf = io.BytesIO()
+    frame.save(buf, format='JPEG', quality=85)
+    return buf.tell()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-f', '--frames', type=int, default=300)
+    parser.add_argument('-s', '--source', default='480x480', help='frame size in the file')
+    parser.add_argument('-t', '--target', default='320x320', help='decoded size')
+    args = parser.parse_args()
+
+    source = tuple(int(v) for v in args.source.lower().split('x'))
+    target = tuple(int(v) for v in args.target.lower().split('x'))
+    cpus = os.cpu_count() or 1
+    counts = sorted({1, 2, 4, cpus})
+
+    with tempfile.TemporaryDirectory(prefix='trcc-frames-') as tmp:
+        path = os.path.join(tmp, 'Theme.zt')
+        write_theme_zt(path, synthetic_frames(*source, args.frames))
+        print(f"{args.frames} frames, {args.source} → {args.target}, "
+              f"{os.path.getsize(path) / 1e6:.1f} MB, {cpus} CPUs")
+        print(f"{'workers':>8}  {'load s':>7}  {'speedup':>7}  {'encode s':>8}  {'speedup':>7}")
+
+        base_load = base_encode = 0.0
+        for workers in counts:
+            pool = FramePool(workers)
+            decoder = ThemeZtDecoder(path, target, pool=pool)
+            start = time.perf_counter()
+            frames = decoder.frames.decode_all()
+            load = time.perf_counter() - start
+
+            start = time.perf_counter()
+            for _ in pool.map(encode, frames):
+                pass
+            enc = time.perf_counter() - start
+
+            decoder.close()
+            pool.close()
+            base_load = base_load or load
+            base_encode = base_encode or enc
+            print(f"{workers:>8}  {load:>7.2f}  {base_load / load:>6.1f}x  "
+                  f"{enc:>8.2f}  {base_encode / enc:>6.1f}x")
+
+
+if __name__ == '__main__':
+    main()
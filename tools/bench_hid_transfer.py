@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""Benchmark: HID Type 2 frame throughput per PyUsbTransport transfer mode.
+
+Sends the same JPEG-sized frame through HidDeviceType2.send_frame in
+each mode and reports frames/s and MB/s:
+
+- chunked:      512-byte synchronous writes (Windows TRCC behaviour)
+- single:       the whole padded frame as one bulk transfer
+- single-32k:   32 KiB transfers
+- async:        16 KiB transfers, 4 in flight (libusb async API)
+
+By default the USB link is simulated: each synchronous transfer costs a
+fixed host round trip (--latency-us) plus its bytes at --mbps, while
+async transfers overlap their round trips.  With --device the frames go
+to a real Type 2 LCD (VID 0416:5302) after a handshake.
+
+Usage:
+    python tools/bench_hid_transfer.py                   # simulated full-speed link
+    python tools/bench_hid_transfer.py --mbps 280 --latency-us 125
+    python tools/bench_hid_transfer.py --device -n 50    # real device
+"""
+import argparse
+import ctypes
+import heapq
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from trcc.device_hid import (  # noqa: E402
+    TRANSFER_ASYNC,
+    TRANSFER_CHUNKED,
+    TRANSFER_SINGLE,
+    TYPE2_PID,
+    TYPE2_VID,
+    HidDeviceType2,
+    PyUsbTransport,
+    _LibusbAsyncWriter,
+)
+from trcc.libusb_async import LibusbTransfers  # noqa: E402
+
+MODES = [
+    ('chunked', dict(transfer_mode=TRANSFER_CHUNKED)),
+    ('single', dict(transfer_mode=TRANSFER_SINGLE)),
+    ('single-32k', dict(transfer_mode=TRANSFER_SINGLE, transfer_size=32 * 1024)),
+    ('async', dict(transfer_mode=TRANSFER_ASYNC, transfer_size=16 * 1024, in_flight=4)),
+]
+
+
+class Link:
+    """Simulated bulk OUT pipe: fixed per-transfer latency + bandwidth."""
+
+    def __init__(self, mbps, latency_us):
+        self.byte_s = 1.0 / (mbps * 1e6 / 8)
+        self.latency_s = latency_us / 1e6
+        self.busy_until = 0.0
+
+    def schedule(self, nbytes):
+        """Completion time of a transfer submitted now (pipe is serial)."""
+        start = max(time.perf_counter(), self.busy_until)
+        self.busy_until = start + nbytes * self.byte_s
+        return self.busy_until + self.latency_s
+
+
+def wait_until(deadline):
+    while (remaining := deadline - time.perf_counter()) > 0:
+        if remaining > 0.002:
+            time.sleep(remaining - 0.001)
+
+
+class SimulatedDevice:
+    """pyusb device double: synchronous writes over a Link."""
+
+    def __init__(self, link):
+        self.link = link
+
+    def write(self, endpoint, data, timeout=None):
+        wait_until(self.link.schedule(len(data)))
+        return len(data)
+
+
+class SimulatedLibusb:
+    """libusb async API double over a Link: transfers overlap their latency."""
+
+    def __init__(self, link):
+        from usb.backend import libusb1
+        self.link = link
+        self._struct = libusb1._libusb_transfer
+        self._pending = []
+        self._seq = 0
+
+    def libusb_alloc_transfer(self, iso_packets):
+        return ctypes.pointer(self._struct())
+
+    def libusb_free_transfer(self, transfer):
+        pass
+
+    def libusb_submit_transfer(self, transfer):
+        done = self.link.schedule(transfer.contents.length)
+        self._seq += 1
+        heapq.heappush(self._pending, (done, self._seq, transfer))
+        return 0
+
+    def libusb_handle_events(self, ctx):
+        done, _, transfer = heapq.heappop(self._pending)
+        wait_until(done)
+        t = transfer.contents
+        t.status = 0
+        t.actual_length = t.length
+        t.callback(transfer)
+        return 0
+
+
+def open_transport(args, options):
+    transport = PyUsbTransport(TYPE2_VID, TYPE2_PID, **options)
+    if args.device:
+        transport.open()
+        return transport
+    link = Link(args.mbps, args.latency_us)
+    transport._device = SimulatedDevice(link)
+    transport._is_open = True
+    if transport.transfer_mode == TRANSFER_ASYNC:
+        transport._async = _LibusbAsyncWriter(
+            LibusbTransfers(SimulatedLibusb(link), None, None), transport.in_flight)
+    return transport
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-n', '--frames', type=int, default=30)
+    parser.add_argument('-s', '--size', type=int, default=100, help='frame size in KiB')
+    parser.add_argument('--mbps', type=float, default=8.0,
+                        help='simulated link bandwidth (full speed ≈ 8)')
+    parser.add_argument('--latency-us', type=float, default=1000.0,
+                        help='simulated per-transfer round trip')
+    parser.add_argument('--device', action='store_true', help='use a real Type 2 device')
+    args = parser.parse_args()
+
+    image = bytes(range(256)) * (args.size * 4)
+    link = 'real device' if args.device else f'{args.mbps:g} Mbit/s, {args.latency_us:g} µs'
+    print(f"{args.frames} frames of {len(image) // 1024} KiB ({link})")
+    print(f"{'mode':>11}  {'transfers':>9}  {'fps':>7}  {'MB/s':>6}  {'speedup':>7}")
+
+    base = 0.0
+    for name, options in MODES:
+        transport = open_transport(args, options)
+        device = HidDeviceType2(transport)
+        if args.device:
+            device.handshake()
+        else:
+            device._initialized = True
+        packet = HidDeviceType2.build_frame_packet(image)
+        size = {TRANSFER_CHUNKED: 512}.get(transport.transfer_mode,
+                                           transport.transfer_size or len(packet))
+        transfers = -(-len(packet) // size)
+
+        with patch('trcc.device_hid.time.sleep'):  # Inter-frame Sleep(1) is the same in all modes
+            start = time.perf_counter()
+            for _ in range(args.frames):
+                device.send_frame(image)
+            elapsed = time.perf_counter() - start
+        transport.close()
+
+        fps = args.frames / elapsed
+        base = base or fps
+        print(f"{name:>11}  {transfers:>9}  {fps:>7.1f}  "
+              f"{fps * len(packet) / 1e6:>6.2f}  {fps / base:>6.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""Benchmark: bulk-device JPEG encoding, C# quality loop vs JpegEncoder.
+
+Encodes the bundled theme backgrounds (00.png) for a resolution as one
+frame stream, first with the original CompressionImage() loop (quality
+95, 90, ... until the frame fits) and then with the rate-controlled
+JpegEncoder.  Reports encodes per frame and ms per frame.
+
+The theme archives must be extracted (``trcc download-themes`` or a GUI
+run); without them, synthetic noisy gradients are used instead.
+
+Usage:
+    python tools/bench_jpeg.py                     # 480x480, 450 KB cap
+    python tools/bench_jpeg.py -r 1920x462 --max-kb 200
+    python tools/bench_jpeg.py --pillow            # skip simplejpeg
+"""
+import argparse
+import io
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from trcc.data_repository import ThemeDir  # noqa: E402
+from trcc.services.image import SIMPLEJPEG_AVAILABLE, JpegEncoder  # noqa: E402
+
+
+def legacy_to_jpeg(img, quality=95, max_size=450_000):
+    """The pre-encoder ImageService.to_jpeg loop. Returns (data, encodes)."""
+    encodes = 0
+    for q in range(quality, 4, -5):
+        buf = io.BytesIO()
+        img.save(buf, format='JPEG', quality=q)
+        encodes += 1
+        if buf.tell() < max_size:
+            return buf.getvalue(), encodes
+    buf = io.BytesIO()
+    img.save(buf, format='JPEG', quality=5)
+    return buf.getvalue(), encodes + 1
+
+
+def theme_frames(width, height):
+    """Theme backgrounds for the resolution, resized and converted to RGB."""
+    root = ThemeDir.for_resolution(width, height).path
+    frames = []
+    for bg in sorted(root.glob('*/00.png')):
+        with Image.open(bg) as img:
+            frames.append(img.convert('RGB').resize((width, height)))
+    return frames
+
+
+def synthetic_frames(width, height, count=32):
+    rng = np.random.default_rng(0)
+    x = np.linspace(0, 255, width, dtype=np.float32)
+    frames = []
+    for i in range(count):
+        base = (x[None, :, None] + i * 8) % 256
+        noise = rng.normal(0, 10 + i * 2, (height, width, 3))
+        arr = np.clip(base + noise, 0, 255).astype(np.uint8)
+        frames.append(Image.fromarray(arr))
+    return frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-r', '--resolution', default='480x480')
+    parser.add_argument('--max-kb', type=int, default=450)
+    parser.add_argument('-l', '--loops', type=int, default=3,
+                        help='passes over the frame list')
+    parser.add_argument('--pillow', action='store_true',
+                        help='encode with Pillow even if simplejpeg is installed')
+    args = parser.parse_args()
+
+    width, height = (int(v) for v in args.resolution.lower().split('x'))
+    max_size = args.max_kb * 1000
+    frames = theme_frames(width, height)
+    source = f'{len(frames)} theme backgrounds'
+    if not frames:
+        frames = synthetic_frames(width, height)
+        source = f'{len(frames)} synthetic frames (themes not extracted)'
+    stream = frames * args.loops
+
+    encoder = JpegEncoder(use_simplejpeg=not args.pillow)
+    backend = 'simplejpeg' if encoder.use_simplejpeg else 'Pillow'
+    print(f"{width}x{height}, cap {args.max_kb} KB, {source} x {args.loops}, "
+          f"backend {backend} (simplejpeg installed: {SIMPLEJPEG_AVAILABLE})")
+
+    start = time.perf_counter()
+    legacy_encodes = sum(legacy_to_jpeg(f, max_size=max_size)[1] for f in stream)
+    legacy_ms = (time.perf_counter() - start) / len(stream) * 1000
+
+    start = time.perf_counter()
+    for frame in stream:
+        encoder.encode(frame, max_size=max_size)
+    encoder_ms = (time.perf_counter() - start) / len(stream) * 1000
+
+    print(f"{'':>12}  {'encodes/frame':>13}  {'ms/frame':>9}")
+    print(f"{'legacy':>12}  {legacy_encodes / len(stream):>13.2f}  {legacy_ms:>9.2f}")
+    print(f"{'JpegEncoder':>12}  {encoder.encodes_per_frame:>13.2f}  "
+          f"{encoder_ms:>9.2f}  ({legacy_ms / encoder_ms:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
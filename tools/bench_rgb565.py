@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Microbenchmark: RGB565 encode paths at common LCD resolutions.
+
+Compares the original allocate-per-call conversion (uint16 copy, shift/OR
+temporaries, astype + tobytes) against Rgb565Encoder, which packs into a
+preallocated buffer and returns a memoryview.
+
+Usage:
+    python tools/bench_rgb565.py              # default: 200 iterations
+    python tools/bench_rgb565.py -n 1000
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from trcc.services.image import ImageService, Rgb565Encoder  # noqa: E402
+
+RESOLUTIONS = [(320, 320), (480, 480), (1920, 480)]
+
+
+def legacy_to_rgb565(img, byte_order='>'):
+    """The pre-encoder ImageService.to_rgb565 implementation."""
+    if img.mode != 'RGB':
+        img = img.convert('RGB')
+    arr = np.array(img, dtype=np.uint16)
+    r = (arr[:, :, 0] >> 3) & 0x1F
+    g = (arr[:, :, 1] >> 2) & 0x3F
+    b = (arr[:, :, 2] >> 3) & 0x1F
+    rgb565 = (r << 11) | (g << 5) | b
+    return rgb565.astype(f'{byte_order}u2').tobytes()
+
+
+def bench(fn, img, n):
+    fn(img)  # warm-up
+    start = time.perf_counter()
+    for _ in range(n):
+        fn(img)
+    return (time.perf_counter() - start) / n * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-n', '--iterations', type=int, default=200)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f"{'resolution':>10}  {'order':>5}  {'legacy ms':>10}  "
+          f"{'encoder ms':>10}  {'to_rgb565 ms':>12}  {'speedup':>7}")
+    for w, h in RESOLUTIONS:
+        img = Image.fromarray(rng.integers(0, 256, (h, w, 3), dtype=np.uint8))
+        for order in ('>', '<'):
+            enc = Rgb565Encoder(w, h, order)
+            assert bytes(enc.encode(img)) == legacy_to_rgb565(img, order)
+            legacy = bench(lambda i: legacy_to_rgb565(i, order), img, args.iterations)
+            view = bench(enc.encode, img, args.iterations)
+            copy = bench(lambda i: ImageService.to_rgb565(i, order), img, args.iterations)
+            print(f"{w:>5}x{h:<4}  {order:>5}  {legacy:>10.3f}  {view:>10.3f}  "
+                  f"{copy:>12.3f}  {legacy / view:>6.1f}x")
+
+
+if __name__ == '__main__':
+    main()
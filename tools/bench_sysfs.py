@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""Microbenchmark: sysfs sensor reads, open/read/close vs pooled pread.
+
+Builds a fake hwmon tree on tmpfs (/dev/shm when available) with the
+given number of *_input files and reads every file per "tick", first
+with SysUtils.read_sysfs() and then with a SysfsReader pool.  tmpfs
+keeps the numbers about syscall overhead, not a driver's show() cost.
+
+A second table compares full hwmon sweeps: the per-sensor ID parsing
+loop SensorEnumerator used to run against its compiled read plan.
+
+Usage:
+    python tools/bench_sysfs.py                 # 100 sensors, 500 ticks
+    python tools/bench_sysfs.py -s 40 -n 2000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from trcc.data_repository import SysfsReader, SysUtils  # noqa: E402
+from trcc.system_sensors import _HWMON_DIVISORS, SensorEnumerator  # noqa: E402
+
+
+def fake_hwmon(root, sensors):
+    """hwmon0..N/temp1_input files with millidegree values."""
+    paths = []
+    for i in range(sensors):
+        hwmon = os.path.join(root, f'hwmon{i // 8}')
+        os.makedirs(hwmon, exist_ok=True)
+        path = os.path.join(hwmon, f'temp{i % 8 + 1}_input')
+        with open(path, 'w') as f:
+            f.write(f'{30000 + i * 125}\n')
+        paths.append(path)
+    return paths
+
+
+def parsing_sweep(reader, paths):
+    """The pre-plan _read_hwmon loop: split the ID and scan divisors per read."""
+    def sweep():
+        readings = {}
+        for sid, path in paths.items():
+            val = reader.read(path)
+            if val is not None:
+                try:
+                    raw = float(val)
+                    prefix = sid.split(':')[-1]
+                    for pfx, div in _HWMON_DIVISORS.items():
+                        if prefix.startswith(pfx):
+                            readings[sid] = raw / div
+                            break
+                    else:
+                        readings[sid] = raw
+                except ValueError:
+                    pass
+        return readings
+    return sweep
+
+
+def bench_sweep(sweep, ticks):
+    sweep()
+    start = time.perf_counter()
+    for _ in range(ticks):
+        sweep()
+    return (time.perf_counter() - start) / ticks * 1e6
+
+
+def bench(read, paths, ticks):
+    for path in paths:  # warm-up (and pool fill)
+        read(path)
+    start = time.perf_counter()
+    for _ in range(ticks):
+        for path in paths:
+            read(path)
+    return (time.perf_counter() - start) / (ticks * len(paths)) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-s', '--sensors', type=int, default=100)
+    parser.add_argument('-n', '--ticks', type=int, default=500)
+    args = parser.parse_args()
+
+    base = '/dev/shm' if os.path.isdir('/dev/shm') else None
+    with tempfile.TemporaryDirectory(prefix='trcc-sysfs-', dir=base) as root:
+        paths = fake_hwmon(root, args.sensors)
+        reader = SysfsReader()
+        assert [reader.read(p) for p in paths] == [SysUtils.read_sysfs(p) for p in paths]
+
+        legacy = bench(SysUtils.read_sysfs, paths, args.ticks)
+        pooled = bench(reader.read, paths, args.ticks)
+        reader.close()
+
+        enum = SensorEnumerator()
+        enum._hwmon_paths = {f'hwmon:fake{i // 8}:temp{i % 8 + 1}': path
+                             for i, path in enumerate(paths)}
+        parsing = bench_sweep(parsing_sweep(enum._sysfs, enum._hwmon_paths), args.ticks)
+        compiled = bench_sweep(lambda: enum.read_source('hwmon', {}), args.ticks)
+
+    print(f"{args.sensors} sensors on {base or 'tmp'}, {args.ticks} ticks")
+    print(f"{'':>18}  {'us/read':>8}  {'ms/tick':>8}")
+    for name, us in (('open/read/close', legacy), ('SysfsReader', pooled)):
+        print(f"{name:>18}  {us:>8.2f}  {us * args.sensors / 1000:>8.3f}")
+    print(f"{'speedup':>18}  {legacy / pooled:>7.1f}x")
+    print()
+    print(f"{'hwmon sweep':>18}  {'us/tick':>8}")
+    for name, us in (('ID parsing', parsing), ('compiled plan', compiled)):
+        print(f"{name:>18}  {us:>8.1f}")
+    print(f"{'speedup':>18}  {parsing / compiled:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()